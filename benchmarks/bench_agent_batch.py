@@ -0,0 +1,94 @@
+"""Throughput of a batch of prompts run one agent at a time, as hand-rolled agents, and with Agent.batch_async."""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import strands
+from strands import Agent
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+class LatencyModel(MockedModelProvider):
+    """Replies to every prompt after a fixed network latency."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__([])
+        self.latency = latency
+
+    async def stream(self, messages: Any, tool_specs: Any = None, system_prompt: Any = None, **kwargs: Any) -> Any:
+        await asyncio.sleep(self.latency)
+        for event in self.map_agent_message_to_events({"role": "assistant", "content": [{"text": "done"}]}):
+            yield event
+
+
+def create_tool(index: int) -> Any:
+    def lookup(key: str) -> str:
+        """Look up a key.
+
+        Args:
+            key: Key to look up.
+        """
+        return key
+
+    lookup.__name__ = f"lookup_{index}"
+    return strands.tool(lookup)
+
+
+async def sequential(model: LatencyModel, tools: list[Any], prompts: list[str]) -> None:
+    for prompt in prompts:
+        await Agent(model=model, tools=tools, callback_handler=None).invoke_async(prompt)
+
+
+async def hand_rolled(model: LatencyModel, tools: list[Any], prompts: list[str], concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(prompt: str) -> None:
+        async with semaphore:
+            await Agent(model=model, tools=tools, callback_handler=None).invoke_async(prompt)
+
+    await asyncio.gather(*(run(prompt) for prompt in prompts))
+
+
+async def batch(model: LatencyModel, tools: list[Any], prompts: list[str], concurrency: int) -> None:
+    agent = Agent(model=model, tools=tools, callback_handler=None)
+    async for _ in agent.batch_async(prompts, concurrency=concurrency):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--prompts", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--tools", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per model call")
+    args = parser.parse_args()
+
+    model = LatencyModel(args.latency)
+    tools = [create_tool(index) for index in range(args.tools)]
+    prompts = [f"prompt {index}" for index in range(args.prompts)]
+
+    start = time.perf_counter()
+    asyncio.run(sequential(model, tools, prompts))
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    asyncio.run(hand_rolled(model, tools, prompts, args.concurrency))
+    hand_rolled_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    asyncio.run(batch(model, tools, prompts, args.concurrency))
+    batch_time = time.perf_counter() - start
+
+    print(f"sequential agents     : {sequential_time * 1000:8.1f}ms ({args.prompts / sequential_time:7.0f} prompts/s)")
+    print(
+        f"hand-rolled agents    : {hand_rolled_time * 1000:8.1f}ms ({args.prompts / hand_rolled_time:7.0f} prompts/s)"
+    )
+    print(f"Agent.batch_async     : {batch_time * 1000:8.1f}ms ({args.prompts / batch_time:7.0f} prompts/s)")
+    print(f"speedup vs sequential : {sequential_time / batch_time:.2f}x")
+    print(f"speedup vs hand-rolled: {hand_rolled_time / batch_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Per-token overhead of Agent event dispatch with all events materialized versus filtered by event_keys."""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Optional
+
+from strands import Agent
+from strands.agent import AgentResult
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+class TokenModel(MockedModelProvider):
+    """Streams a reply one text delta per token."""
+
+    def __init__(self, tokens: int) -> None:
+        super().__init__([])
+        self.tokens = tokens
+
+    async def stream(self, messages: Any, tool_specs: Any = None, system_prompt: Any = None, **kwargs: Any) -> Any:
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockStart": {"start": {}}}
+        for _ in range(self.tokens):
+            yield {"contentBlockDelta": {"delta": {"text": "token "}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+
+class MaterializingAgent(Agent):
+    """Agent materializing every event in invoke_async, as it did before event_keys."""
+
+    async def invoke_async(
+        self, prompt: Any = None, *, invocation_state: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> AgentResult:
+        async for event in self.stream_async(prompt, invocation_state=invocation_state, **kwargs):
+            _ = event
+
+        return event["result"]  # type: ignore[no-any-return]
+
+
+async def consume(agent: Agent, runs: int, event_keys: Optional[set[str]]) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        agent.messages.clear()
+        async for _ in agent.stream_async("hi", event_keys=event_keys):
+            pass
+
+    return time.perf_counter() - start
+
+
+async def invoke(agent: Agent, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        agent.messages.clear()
+        await agent.invoke_async("hi")
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    model = TokenModel(args.tokens)
+    tokens = args.tokens * args.runs
+
+    agent = Agent(model=model, callback_handler=None)
+    all_events_time = asyncio.run(consume(agent, args.runs, None))
+    result_only_time = asyncio.run(consume(agent, args.runs, {"result"}))
+    materializing_time = asyncio.run(invoke(MaterializingAgent(model=model, callback_handler=None), args.runs))
+    invoke_time = asyncio.run(invoke(agent, args.runs))
+
+    def per_token(seconds: float) -> str:
+        return f"{seconds / tokens * 1e6:6.2f}us/token"
+
+    print(f"stream_async, all events        : {per_token(all_events_time)}")
+    print(f"stream_async, event_keys=result : {per_token(result_only_time)}")
+    print(f"invoke_async, all events        : {per_token(materializing_time)}")
+    print(f"invoke_async, no callback events: {per_token(invoke_time)}")
+    print(f"speedup stream_async: {all_events_time / result_only_time:.2f}x")
+    print(f"speedup invoke_async: {materializing_time / invoke_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Agents constructed per second with 50 tools, directly versus from an AgentTemplate."""
+
+import argparse
+import time
+from typing import Any, Callable
+
+import strands
+from strands import Agent, AgentTemplate
+from strands.hooks import BeforeInvocationEvent, BeforeToolCallEvent, HookProvider, HookRegistry
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+def create_tool(index: int) -> Any:
+    def search(query: str, limit: int = 10, include_archived: bool = False) -> str:
+        """Search a collection.
+
+        Args:
+            query: Text to search for.
+            limit: Maximum number of results.
+            include_archived: Whether to include archived entries.
+        """
+        return query
+
+    search.__name__ = f"search_{index}"
+    return strands.tool(search)
+
+
+class AuditHooks(HookProvider):
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(BeforeInvocationEvent, lambda event: None)
+        registry.add_callback(BeforeToolCallEvent, lambda event: None)
+
+
+def bench(create: Callable[[], Agent], seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        create()
+        count += 1
+
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    model = MockedModelProvider([])
+    tools = [create_tool(index) for index in range(args.tools)]
+    hooks = [AuditHooks()]
+    system_prompt = "You search collections."
+
+    def direct() -> Agent:
+        return Agent(model=model, tools=tools, system_prompt=system_prompt, hooks=hooks, callback_handler=None)
+
+    template = AgentTemplate(model=model, tools=tools, system_prompt=system_prompt, hooks=hooks, callback_handler=None)
+
+    direct_rate = bench(direct, args.seconds)
+    template_rate = bench(template.create, args.seconds)
+
+    print(f"Agent(...)       : {direct_rate:9.0f} agents/s")
+    print(f"template.create(): {template_rate:9.0f} agents/s")
+    print(f"speedup: {template_rate / direct_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
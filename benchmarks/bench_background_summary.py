@@ -0,0 +1,78 @@
+"""Turn latency of a long conversation when summarizing on context overflow versus in the background."""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from strands import Agent
+from strands.agent.conversation_manager import SummarizingConversationManager
+from strands.types.exceptions import ContextWindowOverflowException
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+class MessageLimitedModel(MockedModelProvider):
+    """Rejects requests over its message limit after a full round trip and takes longer to write summaries."""
+
+    def __init__(self, max_messages: int, latency: float, summary_latency: float) -> None:
+        super().__init__([])
+        self.max_messages = max_messages
+        self.latency = latency
+        self.summary_latency = summary_latency
+
+    async def stream(self, messages: Any, tool_specs: Any = None, system_prompt: Any = None, **kwargs: Any) -> Any:
+        summarizing = messages[-1]["content"][0].get("text", "").startswith("Please summarize")
+        await asyncio.sleep(self.summary_latency if summarizing else self.latency)
+
+        if len(messages) > self.max_messages:
+            raise ContextWindowOverflowException(f"{len(messages)} messages is too long")
+
+        for event in self.map_agent_message_to_events({"role": "assistant", "content": [{"text": "answer"}]}):
+            yield event
+
+
+def run(conversation_manager: SummarizingConversationManager, args: argparse.Namespace) -> list[float]:
+    model = MessageLimitedModel(args.max_messages, args.latency, args.summary_latency)
+    agent = Agent(model=model, conversation_manager=conversation_manager, callback_handler=None)
+
+    latencies = []
+    for turn in range(args.turns):
+        start = time.perf_counter()
+        agent(f"question {turn}")
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(
+        f"{name}: total {sum(latencies) * 1000:7.0f}ms, median {statistics.median(latencies) * 1000:5.0f}ms, "
+        f"p99 {p99 * 1000:5.0f}ms, max {max(latencies) * 1000:5.0f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--max-messages", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per model round trip")
+    parser.add_argument("--summary-latency", type=float, default=0.2, help="seconds per summarization round trip")
+    args = parser.parse_args()
+
+    overflow = run(SummarizingConversationManager(summary_ratio=0.5, preserve_recent_messages=10), args)
+    background = run(
+        SummarizingConversationManager(
+            summary_ratio=0.5, preserve_recent_messages=10, background_threshold=args.max_messages // 2
+        ),
+        args,
+    )
+
+    report("on overflow", overflow)
+    report("background ", background)
+    print(f"max turn latency speedup: {max(overflow) / max(background):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
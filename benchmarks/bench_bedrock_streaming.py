@@ -0,0 +1,89 @@
+"""Throughput of concurrent BedrockModel streams on the default executor versus a dedicated pool and batching."""
+
+import argparse
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Iterator, Optional
+
+from strands.models.bedrock import BedrockModel
+
+
+class FakeClient:
+    """Bedrock runtime client streaming text deltas in network sized bursts."""
+
+    def __init__(self, chunks: int, burst: int, latency: float) -> None:
+        self.chunks = chunks
+        self.burst = burst
+        self.latency = latency
+        self.meta = type("Meta", (), {"region_name": "us-west-2"})()
+
+    def converse_stream(self, **kwargs: Any) -> dict[str, Any]:
+        return {"stream": self._stream()}
+
+    def _stream(self) -> Iterator[dict[str, Any]]:
+        yield {"messageStart": {"role": "assistant"}}
+        for index in range(self.chunks):
+            if index % self.burst == 0:
+                time.sleep(self.latency)
+            yield {"contentBlockDelta": {"delta": {"text": "token "}}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+
+class PerEventHandoffModel(BedrockModel):
+    """BedrockModel streaming on the default executor with one event loop callback per event, as it did before."""
+
+    async def stream(
+        self, messages: Any, tool_specs: Optional[Any] = None, *args: Any, **kwargs: Any
+    ) -> AsyncGenerator[Any, None]:
+        def callback(event: Optional[Any] = None) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        task = asyncio.create_task(asyncio.to_thread(self._stream, callback, messages, tool_specs, None, None))
+
+        while (event := await queue.get()) is not None:
+            yield event
+
+        await task
+
+
+async def bench(model: BedrockModel, streams: int) -> tuple[float, int]:
+    messages = [{"role": "user", "content": [{"text": "hi"}]}]
+
+    async def consume() -> int:
+        return sum([1 async for _ in model.stream(messages)])  # type: ignore[arg-type]
+
+    start = time.perf_counter()
+    events = sum(await asyncio.gather(*(consume() for _ in range(streams))))
+    return time.perf_counter() - start, events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--chunks", type=int, default=500)
+    parser.add_argument("--burst", type=int, default=25, help="chunks received per network read")
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds per network read")
+    args = parser.parse_args()
+
+    client = FakeClient(args.chunks, args.burst, args.latency)
+
+    per_event = PerEventHandoffModel(model_id="m1", region_name="us-west-2")
+    dedicated = BedrockModel(model_id="m1", region_name="us-west-2", max_stream_workers=args.streams)
+    per_event.client = dedicated.client = client  # type: ignore[assignment]
+
+    per_event_time, events = asyncio.run(bench(per_event, args.streams))
+    dedicated_time, _ = asyncio.run(bench(dedicated, args.streams))
+
+    stats = dedicated.stream_executor_stats
+    print(f"default executor, per event hand-off: {per_event_time * 1000:8.1f}ms ({events} events, {events} wakeups)")
+    print(
+        f"dedicated pool, batched hand-off    : {dedicated_time * 1000:8.1f}ms ({stats.events} events, "
+        f"{stats.wakeups} wakeups, average queue wait {stats.average_queue_wait * 1000:.2f}ms)"
+    )
+    print(f"speedup: {per_event_time / dedicated_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Per-call overhead of synchronous `Agent.__call__` with and without a long-lived event loop runner."""
+
+import argparse
+import time
+
+from strands import Agent, EventLoopRunner
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+def bench(calls: int, runner: EventLoopRunner | None) -> float:
+    model = MockedModelProvider([{"role": "assistant", "content": [{"text": "hi"}]}] * calls)
+    agent = Agent(model=model, callback_handler=None, event_loop_runner=runner)
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        agent.messages = []
+        agent("hello")
+
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    fresh = bench(args.calls, None)
+    runner = EventLoopRunner()
+    try:
+        reused = bench(args.calls, runner)
+    finally:
+        runner.close()
+
+    print(f"new loop per call: {fresh * 1e6:10.1f} us/call")
+    print(f"event loop runner: {reused * 1e6:10.1f} us/call ({fresh / reused:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
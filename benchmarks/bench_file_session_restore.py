@@ -0,0 +1,48 @@
+"""Time to restore long sessions from FileSessionManager with each message format."""
+
+import argparse
+import tempfile
+import time
+
+from strands.session.file_session_manager import FileSessionManager
+from strands.types.session import SessionAgent, SessionMessage
+
+
+def populate(storage_dir: str, message_format: str, count: int) -> FileSessionManager:
+    manager = FileSessionManager(session_id="bench", storage_dir=storage_dir, message_format=message_format)  # type: ignore[arg-type]
+    manager.create_agent("bench", SessionAgent(agent_id="agent", state={}, conversation_manager_state={}))
+
+    for i in range(count):
+        role = "user" if i % 2 == 0 else "assistant"
+        message = SessionMessage(message={"role": role, "content": [{"text": f"message {i} " * 20}]}, message_id=i)
+        manager.create_message("bench", "agent", message)
+
+    return manager
+
+
+def bench(manager: FileSessionManager, offset: int) -> float:
+    start = time.perf_counter()
+    manager.list_messages("bench", "agent", offset=offset)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--tail", type=int, default=50)
+    args = parser.parse_args()
+
+    for message_format in ("json", "jsonl"):
+        with tempfile.TemporaryDirectory() as storage_dir:
+            manager = populate(storage_dir, message_format, args.messages)
+            full = bench(manager, offset=0)
+            tail = bench(manager, offset=args.messages - args.tail)
+
+        print(
+            f"{message_format:<6} full restore={full * 1000:8.1f} ms  "
+            f"last {args.tail} messages={tail * 1000:8.1f} ms  ({args.messages} messages)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Wall time of a Graph of parallel chains with uneven node latencies under the batch and dataflow schedulers."""
+
+import argparse
+import asyncio
+import time
+from typing import Any, AsyncGenerator
+
+from strands import Agent
+from strands.multiagent.graph import GraphBuilder, GraphScheduler
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+class DelayedModel(MockedModelProvider):
+    """Mocked model that takes a fixed time to respond."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__([{"role": "assistant", "content": [{"text": "done"}]}])
+        self.delay = delay
+
+    async def stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
+        await asyncio.sleep(self.delay)
+        async for event in super().stream(*args, **kwargs):
+            yield event
+
+
+async def bench(scheduler: GraphScheduler, branches: int, depth: int, delay: float) -> float:
+    builder = GraphBuilder()
+    for branch in range(branches):
+        for level in range(depth):
+            # Every level has a slow node, on a different branch each time
+            node_delay = delay * (1 + 4 * ((branch + level) % branches == 0))
+            builder.add_node(Agent(model=DelayedModel(node_delay), callback_handler=None), f"n{branch}_{level}")
+            if level:
+                builder.add_edge(f"n{branch}_{level - 1}", f"n{branch}_{level}")
+
+    graph = builder.set_scheduler(scheduler).build()
+
+    start = time.perf_counter()
+    await graph.invoke_async("task")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--branches", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.02, help="seconds taken by a fast node")
+    args = parser.parse_args()
+
+    batch = asyncio.run(bench("batch", args.branches, args.depth, args.delay))
+    dataflow = asyncio.run(bench("dataflow", args.branches, args.depth, args.delay))
+
+    print(f"batch   : {batch * 1000:8.1f}ms")
+    print(f"dataflow: {dataflow * 1000:8.1f}ms")
+    print(f"speedup: {batch / dataflow:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Scheduling overhead of 1k node graphs with indexed edge lookups versus scanning every edge."""
+
+import argparse
+import time
+from typing import Any, Callable, Collection
+
+from strands import Agent
+from strands.agent import AgentResult
+from strands.multiagent.base import NodeResult
+from strands.multiagent.graph import Graph, GraphBuilder, GraphEdge, GraphNode, GraphState
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+RESULT = NodeResult(
+    result=AgentResult(
+        stop_reason="end_turn",
+        message={"role": "assistant", "content": [{"text": "done"}]},
+        metrics=None,  # type: ignore[arg-type]
+        state={},
+    )
+)
+
+
+class ScanningEdges(dict):
+    """Edge lookup scanning every edge, as the graph did before edges were indexed."""
+
+    def __init__(self, edges: set[GraphEdge], endpoint: Callable[[GraphEdge], GraphNode]) -> None:
+        super().__init__()
+        self.edges = edges
+        self.endpoint = endpoint
+
+    def get(self, node: Any, default: Any = None) -> list[GraphEdge]:
+        return [edge for edge in self.edges if self.endpoint(edge) == node]
+
+
+class ScanningGraph(Graph):
+    """Graph checking every node for readiness and scanning every edge on lookups."""
+
+    def _index_edges(self) -> None:
+        super()._index_edges()
+        self._incoming_edges = ScanningEdges(self.edges, lambda edge: edge.to_node)
+        self._outgoing_edges = ScanningEdges(self.edges, lambda edge: edge.from_node)
+
+    def _find_newly_ready_nodes(self, completed_batch: list[GraphNode]) -> list[GraphNode]:
+        return [node for node in self.nodes.values() if self._is_node_ready_with_conditions(node, completed_batch)]
+
+    def _is_node_ready_with_conditions(self, node: GraphNode, completed_batch: Collection[GraphNode]) -> bool:
+        return super()._is_node_ready_with_conditions(node, list(completed_batch))
+
+
+def fan_out(builder: GraphBuilder, nodes: int) -> None:
+    """One node fanning out to mappers that are reduced by one node."""
+    for index in range(nodes - 2):
+        builder.add_edge("source", f"n{index}")
+        builder.add_edge(f"n{index}", "sink")
+
+
+def layered(builder: GraphBuilder, nodes: int) -> None:
+    """Layers of 50 nodes, each node feeding two nodes of the next layer."""
+    width = 50
+    for index in range(nodes - 2):
+        layer, position = divmod(index, width)
+        if layer == 0:
+            builder.add_edge("source", f"n{index}")
+        for target in [(layer + 1) * width + position, (layer + 1) * width + (position + 1) % width]:
+            builder.add_edge(f"n{index}", f"n{target}" if target < nodes - 2 else "sink")
+
+
+def build(shape: Callable[[GraphBuilder, int], None], nodes: int) -> GraphBuilder:
+    builder = GraphBuilder()
+    for node_id in ["source", "sink", *(f"n{index}" for index in range(nodes - 2))]:
+        builder.add_node(Agent(model=MockedModelProvider([]), callback_handler=None), node_id)
+    shape(builder, nodes)
+    builder.set_entry_point("source")
+    return builder
+
+
+def bench(graph_class: type[Graph], builder: GraphBuilder) -> float:
+    graph = graph_class(nodes=builder.nodes, edges=builder.edges, entry_points=builder.entry_points)
+    graph.state = GraphState(task="task")
+
+    start = time.perf_counter()
+    ready = list(graph.entry_points)
+    while ready:
+        for node in ready:
+            graph._build_node_input(node)
+            graph.state.completed_nodes.add(node)
+            graph.state.results[node.node_id] = RESULT
+        ready = graph._find_newly_ready_nodes(ready)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=1000)
+    args = parser.parse_args()
+
+    for shape in [fan_out, layered]:
+        builder = build(shape, args.nodes)
+        scanning = bench(ScanningGraph, builder)
+        indexed = bench(Graph, builder)
+        print(
+            f"{shape.__name__:8}: {len(builder.edges)} edges, scanning {scanning * 1000:8.1f}ms "
+            f"indexed {indexed * 1000:6.1f}ms speedup {scanning / indexed:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Hook dispatch time per event, with per-call callback inspection versus precomputed dispatch plans."""
+
+import argparse
+import asyncio
+import inspect
+import time
+import unittest.mock
+from typing import Any
+
+from strands.hooks import HookRegistry, MessageAddedEvent
+
+
+class SequentialHookRegistry(HookRegistry):
+    """Inspects every callback on every event and awaits async callbacks one after another."""
+
+    async def invoke_callbacks_async(self, event: Any) -> Any:
+        for callback in self.get_callbacks_for(event):
+            if inspect.iscoroutinefunction(callback):
+                await callback(event)
+            else:
+                callback(event)
+
+        return event, []
+
+
+async def bench(registry: HookRegistry, events: int, check: bool) -> float:
+    agent = unittest.mock.Mock()
+    message = {"role": "assistant", "content": [{"text": "hello"}]}
+
+    start = time.perf_counter()
+    for _ in range(events):
+        if not check or registry.has_callbacks_for(MessageAddedEvent):
+            await registry.invoke_callbacks_async(MessageAddedEvent(agent=agent, message=message))
+
+    return (time.perf_counter() - start) / events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--sync-callbacks", type=int, default=4)
+    parser.add_argument("--observers", type=int, default=3, help="async observers, e.g. telemetry and persistence")
+    parser.add_argument("--observer-latency", type=float, default=0.002, help="seconds each observer awaits")
+    args = parser.parse_args()
+
+    async def observer(event: MessageAddedEvent) -> None:
+        await asyncio.sleep(args.observer_latency)
+
+    def register(registry: HookRegistry) -> HookRegistry:
+        for _ in range(args.sync_callbacks):
+            registry.add_callback(MessageAddedEvent, lambda event: None)
+        for _ in range(args.observers):
+            registry.add_callback(MessageAddedEvent, observer, parallel_safe=True)
+        return registry
+
+    empty_before = asyncio.run(bench(SequentialHookRegistry(), args.events * 100, check=False))
+    empty_after = asyncio.run(bench(HookRegistry(), args.events * 100, check=True))
+    before = asyncio.run(bench(register(SequentialHookRegistry()), args.events, check=False))
+    after = asyncio.run(bench(register(HookRegistry()), args.events, check=True))
+
+    print(f"no callbacks, sequential: {empty_before * 1e6:8.2f}us/event")
+    print(f"no callbacks, planned   : {empty_after * 1e6:8.2f}us/event")
+    print(f"observers, sequential   : {before * 1e6:8.0f}us/event")
+    print(f"observers, planned      : {after * 1e6:8.0f}us/event")
+    print(f"speedup: {empty_before / empty_after:.2f}x without callbacks, {before / after:.2f}x with observers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Cold start time of an agent with an MCP server that is slow to start, without and with a tool spec cache."""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import anyio
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_client_server_memory_streams
+
+from strands import Agent
+from strands.tools.mcp import MCPClient, MCPToolSpecCache
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+def create_server(tools: int) -> FastMCP:
+    server = FastMCP("bench", log_level="WARNING")
+    for index in range(tools):
+
+        def lookup(key: str, index: int = index) -> str:
+            return f"{index}:{key}"
+
+        server.add_tool(lookup, name=f"lookup_{index}", description=f"Look up a key in table {index}.")
+    return server
+
+
+def create_transport(server: FastMCP, latency: float) -> Any:
+    @asynccontextmanager
+    async def transport() -> AsyncIterator[Any]:
+        # Stands in for spawning the server process or opening the connection
+        await asyncio.sleep(latency)
+
+        async with create_client_server_memory_streams() as (client_streams, server_streams):
+            async with anyio.create_task_group() as task_group:
+                mcp_server = server._mcp_server
+                task_group.start_soon(
+                    lambda: mcp_server.run(*server_streams, mcp_server.create_initialization_options())
+                )
+                yield client_streams
+                task_group.cancel_scope.cancel()
+
+    return transport
+
+
+def run(args: argparse.Namespace, tool_spec_cache: Optional[MCPToolSpecCache]) -> float:
+    transport = create_transport(create_server(args.tools), args.latency)
+    client = MCPClient(transport, tool_spec_cache=tool_spec_cache)
+
+    start = time.perf_counter()
+    agent = Agent(model=MockedModelProvider([]), tools=[client], callback_handler=None)
+    elapsed = time.perf_counter() - start
+
+    assert len(agent.tool_names) == args.tools
+    agent.cleanup()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds to start the server")
+    args = parser.parse_args()
+
+    uncached_time = run(args, None)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Without revalidation the cached run never connects, like a short-lived serverless invocation
+        cache = MCPToolSpecCache(directory, "bench", revalidate=False)
+        run(args, cache)
+        cached_time = run(args, cache)
+
+    print(f"no cache: {uncached_time * 1000:7.0f}ms")
+    print(f"cache   : {cached_time * 1000:7.0f}ms")
+    print(f"speedup: {uncached_time / cached_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Cost of formatting a growing conversation with images for each model call, with and without the message cache."""
+
+import argparse
+import os
+import time
+from typing import Any
+
+from strands.models.anthropic import AnthropicModel
+from strands.models.bedrock import BedrockModel
+from strands.models.openai import OpenAIModel
+
+
+def create_turn(turn: int, image_every: int, image_size: int) -> list[dict[str, Any]]:
+    content: list[dict[str, Any]] = [{"text": f"question {turn}"}]
+    if turn % image_every == 0:
+        content.append({"image": {"format": "png", "source": {"bytes": os.urandom(image_size)}}})
+
+    return [
+        {"role": "user", "content": content},
+        {"role": "assistant", "content": [{"text": f"answer {turn} " * 20}]},
+    ]
+
+
+def bench(model: Any, turns: int, image_every: int, image_size: int, cached: bool) -> float:
+    # BedrockModel only exposes its request formatting privately
+    format_request = getattr(model, "format_request", None) or model._format_request
+    messages: list[dict[str, Any]] = []
+
+    duration = 0.0
+    for turn in range(turns):
+        messages.extend(create_turn(turn, image_every, image_size))
+        if not cached:
+            model._message_cache.clear()
+
+        start = time.perf_counter()
+        format_request(messages)
+        duration += time.perf_counter() - start
+
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--image-every", type=int, default=5, help="attach an image to every n-th user message")
+    parser.add_argument("--image-size", type=int, default=500_000)
+    args = parser.parse_args()
+
+    models = {
+        "anthropic": AnthropicModel(model_id="m1", max_tokens=1, client_args={"api_key": "test"}),
+        "openai": OpenAIModel(model_id="m1", client_args={"api_key": "test"}),
+        "bedrock": BedrockModel(model_id="m1", region_name="us-east-1"),
+    }
+
+    for name, model in models.items():
+        uncached = bench(model, args.turns, args.image_every, args.image_size, cached=False)
+        cached = bench(model, args.turns, args.image_every, args.image_size, cached=True)
+        print(f"{name:9}: uncached {uncached:7.3f}s cached {cached:7.3f}s ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Latency of sequential OpenAIModel requests with per-request clients versus the per event loop client pool."""
+
+import argparse
+import asyncio
+import http.server
+import json
+import statistics
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import openai
+
+from strands.models.openai import OpenAIModel
+
+CHUNKS = [
+    {"choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hello"}, "finish_reason": None}]},
+    {"choices": [{"index": 0, "delta": {"content": " world"}, "finish_reason": None}]},
+    {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+    {"choices": [], "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}},
+]
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connect_delay = 0.0
+
+    def setup(self) -> None:
+        # Stands in for DNS, TCP and TLS setup, which is only paid on new connections
+        time.sleep(self.connect_delay)
+        super().setup()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+
+        body = b"".join(
+            f"data: {json.dumps({'id': 'c1', 'object': 'chat.completion.chunk', 'created': 0, 'model': 'm1', **chunk})}"
+            f"\n\n".encode()
+            for chunk in CHUNKS
+        )
+        body += b"data: [DONE]\n\n"
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class PerRequestClientModel(OpenAIModel):
+    """OpenAIModel creating a new client on every request, as it did before pooling."""
+
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncIterator[Any]:
+        async with openai.AsyncOpenAI(**self.client_args) as client:
+            yield client
+
+
+async def bench(model: OpenAIModel, requests: int) -> list[float]:
+    messages = [{"role": "user", "content": [{"text": "hi"}]}]
+
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        async for _ in model.stream(messages):  # type: ignore[arg-type]
+            pass
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--connect-delay", type=float, default=0.005, help="seconds added to each new connection")
+    args = parser.parse_args()
+
+    Handler.connect_delay = args.connect_delay
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client_args = {"api_key": "test", "base_url": f"http://127.0.0.1:{server.server_address[1]}/v1"}
+    try:
+        per_request = asyncio.run(bench(PerRequestClientModel(client_args=client_args, model_id="m1"), args.requests))
+        pooled = asyncio.run(bench(OpenAIModel(client_args=client_args, model_id="m1"), args.requests))
+    finally:
+        server.shutdown()
+
+    for name, latencies in [("per request", per_request), ("pooled", pooled)]:
+        print(
+            f"{name:11}: mean {statistics.mean(latencies) * 1000:6.2f}ms "
+            f"p50 {statistics.median(latencies) * 1000:6.2f}ms "
+            f"p99 {sorted(latencies)[int(len(latencies) * 0.99)] * 1000:6.2f}ms"
+        )
+    print(f"speedup: {statistics.mean(per_request) / statistics.mean(pooled):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Time to process tools from several slow-starting tool providers, one at a time and concurrently."""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Sequence
+
+import strands
+from strands._async import run_async
+from strands.experimental.tools import ToolProvider
+from strands.tools.registry import ToolProviderFailurePolicy, ToolRegistry
+from strands.types.tools import AgentTool
+
+
+class SlowProvider(ToolProvider):
+    """Provider that blocks like an MCP client: a handshake, then one round trip per page of tools."""
+
+    def __init__(self, index: int, latency: float, pages: int) -> None:
+        self.index = index
+        self.latency = latency
+        self.pages = pages
+
+    async def load_tools(self, **kwargs: Any) -> Sequence[AgentTool]:
+        await asyncio.to_thread(time.sleep, self.latency)
+
+        tools = []
+        for page in range(self.pages):
+            await asyncio.to_thread(time.sleep, self.latency / 4)
+            tools.append(create_tool(f"server{self.index}_tool{page}"))
+        return tools
+
+    def add_consumer(self, consumer_id: Any, **kwargs: Any) -> None:
+        pass
+
+    def remove_consumer(self, consumer_id: Any, **kwargs: Any) -> None:
+        pass
+
+
+def create_tool(name: str) -> AgentTool:
+    def func() -> str:
+        """Return a value."""
+        return name
+
+    return strands.tool(name=name)(func)
+
+
+class SerialToolRegistry(ToolRegistry):
+    """Loads each provider on its own thread and event loop, one after the other."""
+
+    def _load_tool_providers(
+        self, providers: List[ToolProvider], failure_policy: ToolProviderFailurePolicy
+    ) -> Dict[int, Sequence[AgentTool]]:
+        provider_tools: Dict[int, Sequence[AgentTool]] = {}
+        for provider in providers:
+            self._tool_providers.append(provider)
+            provider.add_consumer(self._registry_id)
+            provider_tools[id(provider)] = run_async(provider.load_tools)
+        return provider_tools
+
+
+def run(args: argparse.Namespace, registry: ToolRegistry) -> float:
+    providers = [SlowProvider(index, args.latency, args.pages) for index in range(args.providers)]
+
+    start = time.perf_counter()
+    registry.process_tools(providers)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--providers", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=3, help="tool pages per provider")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per provider handshake")
+    args = parser.parse_args()
+
+    serial_time = run(args, SerialToolRegistry())
+    registry = ToolRegistry()
+    concurrent_time = run(args, registry)
+
+    print(f"serial    : {serial_time * 1000:7.0f}ms")
+    print(f"concurrent: {concurrent_time * 1000:7.0f}ms")
+    for startup in registry.provider_startups:
+        print(f"  server{startup.provider.index}: {startup.duration * 1000:5.0f}ms, {startup.tool_count} tools")
+    print(f"speedup: {serial_time / concurrent_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Time to restore long sessions from S3SessionManager against moto with injected request latency."""
+
+import argparse
+import time
+from typing import Any
+
+import boto3
+from moto import mock_aws
+
+from strands.session.s3_session_manager import S3SessionManager
+from strands.types.session import SessionAgent, SessionMessage
+
+BUCKET = "bench-sessions"
+REGION = "us-west-2"
+
+
+def create_manager(session_id: str, latency: float, **kwargs: Any) -> S3SessionManager:
+    manager = S3SessionManager(session_id=session_id, bucket=BUCKET, region_name=REGION, **kwargs)
+
+    def delay(**_: Any) -> None:
+        time.sleep(latency)
+
+    manager.client.meta.events.register("before-send.s3", delay)
+    return manager
+
+
+def populate(session_id: str, count: int, **kwargs: Any) -> None:
+    manager = create_manager(session_id, latency=0, **kwargs)
+    manager.create_agent(session_id, SessionAgent(agent_id="agent", state={}, conversation_manager_state={}))
+
+    for i in range(count):
+        role = "user" if i % 2 == 0 else "assistant"
+        message = SessionMessage(message={"role": role, "content": [{"text": f"message {i} " * 20}]}, message_id=i)
+        manager.create_message(session_id, "agent", message)
+
+
+def bench(session_id: str, latency: float, **kwargs: Any) -> float:
+    manager = create_manager(session_id, latency, **kwargs)
+    start = time.perf_counter()
+    manager.list_messages(session_id, "agent")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=10)
+    parser.add_argument("--snapshot-interval", type=int, default=50)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    with mock_aws():
+        boto3.client("s3", region_name=REGION).create_bucket(
+            Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": REGION}
+        )
+        populate("plain", args.messages)
+        # Leave a tail of messages created after the last snapshot
+        populate("snapshot", args.messages + args.snapshot_interval // 2, snapshot_interval=args.snapshot_interval)
+
+        sequential = bench("plain", latency, max_read_workers=1)
+        parallel = bench("plain", latency)
+        snapshot = bench("snapshot", latency, snapshot_interval=args.snapshot_interval)
+
+    print(f"messages={args.messages} latency={args.latency_ms}ms")
+    print(f"sequential: {sequential * 1000:8.1f} ms")
+    print(f"parallel:   {parallel * 1000:8.1f} ms ({sequential / parallel:.1f}x)")
+    print(f"snapshot:   {snapshot * 1000:8.1f} ms ({sequential / snapshot:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Cost of the telemetry JSON serializer on payloads recorded by the tracer and tool executor."""
+
+import argparse
+import json
+import os
+import time
+from datetime import date, datetime
+from typing import Any, Callable
+
+from strands.telemetry import tracer
+from strands.telemetry.tracer import serialize
+
+
+def legacy_process_value(value: Any) -> Any:
+    """Replace unserializable values by probing every leaf with json.dumps, as the encoder did previously."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    elif isinstance(value, dict):
+        return {k: legacy_process_value(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [legacy_process_value(item) for item in value]
+    else:
+        try:
+            json.dumps(value)
+            return value
+        except (TypeError, OverflowError, ValueError):
+            return "<replaced>"
+
+
+def legacy_serialize(obj: Any) -> str:
+    return json.dumps(legacy_process_value(obj), ensure_ascii=False)
+
+
+def create_payloads() -> dict[str, Any]:
+    tool_result = [{"text": f"line {i}: " + "lorem ipsum " * 8} for i in range(500)]
+    image_message = [
+        {"text": "describe this image"},
+        {"image": {"format": "png", "source": {"bytes": os.urandom(512 * 1024)}}},
+    ]
+    tool_schema = {
+        "type": "object",
+        "properties": {f"param_{i}": {"type": "string", "description": f"Parameter {i}"} for i in range(50)},
+        "required": [f"param_{i}" for i in range(25)],
+    }
+    messages = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": [{"text": f"message {i} " * 20}]} for i in range(200)
+    ]
+
+    return {
+        "tool result (tracer)": tool_result,
+        "image message (tracer)": image_message,
+        "tool schema (executor)": tool_schema,
+        "messages (tracer)": messages,
+    }
+
+
+def bench(func: Callable[[Any], str], payload: Any, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(payload)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    for name, payload in create_payloads().items():
+        legacy = bench(legacy_serialize, payload, args.iterations)
+        single_pass = bench(serialize, payload, args.iterations)
+        line = f"{name:<24} legacy={legacy * 1000:8.1f} ms  single-pass={single_pass * 1000:8.1f} ms "
+        line += f"({legacy / single_pass:.1f}x)"
+
+        if orjson is not None:
+            tracer._orjson = orjson
+            try:
+                fast = bench(serialize, payload, args.iterations)
+            finally:
+                tracer._orjson = None
+            line += f"  orjson={fast * 1000:8.1f} ms ({legacy / fast:.1f}x)"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Model calls and time spent on a long conversation with reactive sliding window versus proactive token budget."""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from strands import Agent
+from strands.agent.conversation_manager import (
+    ConversationManager,
+    SlidingWindowConversationManager,
+    TokenBudgetConversationManager,
+)
+from strands.types.exceptions import ContextWindowOverflowException
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+class ContextLimitedModel(MockedModelProvider):
+    """Replies with long messages and rejects requests over its context window after a full round trip."""
+
+    def __init__(self, context_window: int, reply_tokens: int, latency: float) -> None:
+        super().__init__([])
+        self.context_window = context_window
+        self.reply = "word " * reply_tokens
+        self.latency = latency
+        self.calls = 0
+        self.rejected = 0
+
+    async def stream(self, messages: Any, tool_specs: Any = None, system_prompt: Any = None, **kwargs: Any) -> Any:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+        input_tokens = sum(len(block.get("text", "")) // 5 for message in messages for block in message["content"])
+        if input_tokens > self.context_window:
+            self.rejected += 1
+            raise ContextWindowOverflowException(f"input of {input_tokens} tokens is too long")
+
+        for event in self.map_agent_message_to_events({"role": "assistant", "content": [{"text": self.reply}]}):
+            yield event
+
+
+def run(conversation_manager: ConversationManager, args: argparse.Namespace) -> tuple[float, int, int]:
+    model = ContextLimitedModel(args.context_window, args.reply_tokens, args.latency)
+    agent = Agent(model=model, conversation_manager=conversation_manager, callback_handler=None)
+
+    start = time.perf_counter()
+    for turn in range(args.turns):
+        agent(f"question {turn} " + "detail " * args.prompt_tokens)
+
+    return time.perf_counter() - start, model.calls, model.rejected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--context-window", type=int, default=20_000)
+    parser.add_argument("--prompt-tokens", type=int, default=500)
+    parser.add_argument("--reply-tokens", type=int, default=1_500)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per model round trip")
+    args = parser.parse_args()
+
+    reactive_time, reactive_calls, reactive_rejected = run(SlidingWindowConversationManager(), args)
+    budget_time, budget_calls, budget_rejected = run(
+        TokenBudgetConversationManager(max_tokens=int(args.context_window * 0.9)), args
+    )
+
+    print(f"sliding window: {reactive_time * 1000:8.1f}ms, {reactive_calls} model calls, {reactive_rejected} rejected")
+    print(f"token budget  : {budget_time * 1000:8.1f}ms, {budget_calls} model calls, {budget_rejected} rejected")
+    print(f"speedup: {reactive_time / budget_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
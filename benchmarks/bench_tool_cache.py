@@ -0,0 +1,66 @@
+"""Time spent on repeated calls of a slow read-only tool, without and with a tool result cache."""
+
+import argparse
+import time
+
+import strands
+from strands import Agent
+from strands.tools.cache import ToolCache
+from strands.tools.decorator import DecoratedFunctionTool
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+def create_lookup(latency: float, cache: bool) -> DecoratedFunctionTool:
+    def lookup(key: str) -> str:
+        """Look up a key.
+
+        Args:
+            key: Key to look up.
+        """
+        time.sleep(latency)
+        return f"value of {key}"
+
+    return strands.tool(cache=ToolCache(ttl=300) if cache else None)(lookup)
+
+
+def run(args: argparse.Namespace, cache: bool) -> tuple[float, float]:
+    responses = [
+        {
+            "role": "assistant",
+            "content": [
+                {"toolUse": {"toolUseId": f"t{call}", "name": "lookup", "input": {"key": f"k{call % args.keys}"}}}
+            ],
+        }
+        for call in range(args.calls)
+    ]
+    responses.append({"role": "assistant", "content": [{"text": "done"}]})
+
+    agent = Agent(
+        model=MockedModelProvider(responses), tools=[create_lookup(args.latency, cache)], callback_handler=None
+    )
+
+    start = time.perf_counter()
+    result = agent("look things up")
+    elapsed = time.perf_counter() - start
+
+    stats = result.metrics.get_summary()["tool_usage"]["lookup"]["execution_stats"]
+    return elapsed, stats["cache_hit_rate"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--keys", type=int, default=8, help="distinct inputs among the calls")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per tool call")
+    args = parser.parse_args()
+
+    uncached_time, _ = run(args, cache=False)
+    cached_time, hit_rate = run(args, cache=True)
+
+    print(f"no cache: {uncached_time * 1000:7.0f}ms")
+    print(f"cache   : {cached_time * 1000:7.0f}ms, hit rate {hit_rate:.0%}")
+    print(f"speedup: {uncached_time / cached_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
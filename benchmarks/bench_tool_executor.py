@@ -0,0 +1,81 @@
+"""Event loop stalls and throughput of CPU-heavy tool calls on the default thread pool versus a process pool."""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any
+
+import strands
+from strands.tools._function_executor import shutdown_pools
+
+
+def count_primes(limit: int) -> int:
+    """Count primes below the limit.
+
+    Args:
+        limit: Upper bound.
+    """
+    return sum(1 for n in range(2, limit) if all(n % d for d in range(2, int(n**0.5) + 1)))
+
+
+default_count_primes = strands.tool(name="count_primes")(count_primes)
+process_count_primes = strands.tool(name="count_primes", executor="process", max_workers=os.cpu_count())(count_primes)
+
+
+async def ticker(stop: asyncio.Event, interval: float) -> float:
+    """Stand in for another agent streaming tokens, returning the longest gap between ticks."""
+    longest = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(interval)
+        now = time.perf_counter()
+        longest = max(longest, now - last - interval)
+        last = now
+
+    return longest
+
+
+async def bench(tool: Any, calls: int, limit: int) -> tuple[float, float]:
+    stop = asyncio.Event()
+    ticks = asyncio.create_task(ticker(stop, 0.001))
+
+    async def call() -> None:
+        tool_use = {"toolUseId": "t1", "name": "count_primes", "input": {"limit": limit}}
+        async for _ in tool.stream(tool_use, {}):
+            pass
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    return elapsed, await ticks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=200_000)
+    args = parser.parse_args()
+
+    # Warm up the process pool so worker start up is not measured
+    asyncio.run(bench(process_count_primes, os.cpu_count() or 1, 10))
+
+    default_time, default_stall = asyncio.run(bench(default_count_primes, args.calls, args.limit))
+    process_time, process_stall = asyncio.run(bench(process_count_primes, args.calls, args.limit))
+    shutdown_pools()
+
+    print(
+        f"default threads: {default_time * 1000:7.0f}ms total, longest event loop stall {default_stall * 1000:6.1f}ms"
+    )
+    print(
+        f"process pool   : {process_time * 1000:7.0f}ms total, longest event loop stall {process_stall * 1000:6.1f}ms"
+    )
+    print(
+        f"speedup: {default_time / process_time:.2f}x throughput, {default_stall / process_stall:.2f}x shorter stalls"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Cost of accumulating a large streamed tool use input in each tool input streaming mode."""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator
+
+from strands.event_loop._tool_use_input import TOOL_INPUT_STREAMING_MODES, ToolInputStreaming
+from strands.event_loop.streaming import process_stream
+
+
+def create_chunks(size: int, fragment_size: int) -> list[dict[str, Any]]:
+    tool_input = json.dumps({"path": "notes.md", "content": "x" * size, "lines": list(range(size // 100))})
+    fragments = [tool_input[i : i + fragment_size] for i in range(0, len(tool_input), fragment_size)]
+
+    return [
+        {"messageStart": {"role": "assistant"}},
+        {"contentBlockStart": {"start": {"toolUse": {"toolUseId": "t1", "name": "write"}}}},
+        *({"contentBlockDelta": {"delta": {"toolUse": {"input": fragment}}}} for fragment in fragments),
+        {"contentBlockStop": {}},
+        {"messageStop": {"stopReason": "tool_use"}},
+    ]
+
+
+async def bench(chunks: list[dict[str, Any]], mode: ToolInputStreaming) -> float:
+    async def stream() -> AsyncIterator[Any]:
+        for chunk in chunks:
+            yield chunk
+
+    start = time.perf_counter()
+    async for _ in process_stream(stream(), tool_input_streaming=mode):
+        pass
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000, help="approximate size of the input in characters")
+    parser.add_argument("--fragment-size", type=int, default=20)
+    args = parser.parse_args()
+
+    chunks = create_chunks(args.size, args.fragment_size)
+    print(f"deltas per run: {len(chunks) - 4}")
+
+    baseline = None
+    for mode in TOOL_INPUT_STREAMING_MODES:
+        duration = asyncio.run(bench(chunks, mode))
+        baseline = baseline or duration
+        print(f"{mode:9}: {duration:8.3f}s ({baseline / duration:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
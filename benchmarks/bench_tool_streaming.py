@@ -0,0 +1,69 @@
+"""Throughput of ConcurrentToolExecutor for generator tools that stream many events."""
+
+import argparse
+import asyncio
+import time
+import unittest.mock
+
+import strands
+from strands import Agent
+from strands.hooks import HookRegistry
+from strands.interrupt import _InterruptState
+from strands.tools.executors import ConcurrentToolExecutor
+from strands.tools.registry import ToolRegistry
+
+
+@strands.tool
+async def stream_tool(count: int):
+    """Stream progress events."""
+    for i in range(count):
+        yield i
+
+    yield "done"
+
+
+def create_agent() -> Agent:
+    registry = ToolRegistry()
+    registry.register_tool(stream_tool)
+
+    agent = unittest.mock.Mock()
+    agent.__class__ = Agent
+    agent.tool_registry = registry
+    agent.hooks = HookRegistry()
+    agent._interrupt_state = _InterruptState()
+    agent.trace_attributes = {}
+    return agent
+
+
+async def bench(executor: ConcurrentToolExecutor, tools: int, events: int) -> tuple[float, int]:
+    agent = create_agent()
+    tool_uses = [{"name": "stream_tool", "toolUseId": str(i), "input": {"count": events}} for i in range(tools)]
+
+    received = 0
+    start = time.perf_counter()
+    stream = executor._execute(agent, tool_uses, [], unittest.mock.Mock(), unittest.mock.Mock(), {"agent": agent}, None)
+    async for _ in stream:
+        received += 1
+
+    return time.perf_counter() - start, received
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=4)
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--buffer-size", type=int, default=64)
+    args = parser.parse_args()
+
+    lockstep, received = asyncio.run(bench(ConcurrentToolExecutor(), args.tools, args.events))
+    buffered, _ = asyncio.run(
+        bench(ConcurrentToolExecutor(stream_buffer_size=args.buffer_size), args.tools, args.events)
+    )
+
+    print(f"events per run: {received}")
+    print(f"lockstep:          {received / lockstep:12.0f} events/s")
+    print(f"buffered (size={args.buffer_size}): {received / buffered:12.0f} events/s ({lockstep / buffered:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Cost of recording conversation history on model invoke spans across long conversations."""
+
+import argparse
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from strands.telemetry.tracer import Tracer
+from strands.types.content import Messages
+
+
+def create_tracer(incremental: bool, recording: bool) -> Tracer:
+    tracer = Tracer()
+    tracer.incremental_messages = incremental
+
+    if recording:
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(InMemorySpanExporter()))
+        tracer.tracer_provider = provider
+        tracer.tracer = provider.get_tracer(__name__)
+
+    return tracer
+
+
+def bench(tracer: Tracer, turns: int) -> float:
+    messages: Messages = []
+    parent_span = tracer.start_agent_span(messages=[], agent_name="agent")
+    elapsed = 0.0
+    for turn in range(turns):
+        messages.append({"role": "user", "content": [{"text": f"question {turn} " * 20}]})
+        messages.append(
+            {
+                "role": "assistant",
+                "content": [{"toolUse": {"toolUseId": str(turn), "name": "lookup", "input": {"query": str(turn)}}}],
+            }
+        )
+        messages.append(
+            {
+                "role": "user",
+                "content": [{"toolResult": {"toolUseId": str(turn), "status": "success", "content": [{"text": "x"}]}}],
+            }
+        )
+
+        start = time.perf_counter()
+        span = tracer.start_model_invoke_span(messages=messages, parent_span=parent_span, model_id="model")
+        elapsed += time.perf_counter() - start
+        span.end()
+
+    parent_span.end()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    full = bench(create_tracer(incremental=False, recording=True), args.turns)
+    incremental = bench(create_tracer(incremental=True, recording=True), args.turns)
+    non_recording = bench(create_tracer(incremental=False, recording=False), args.turns)
+
+    print(f"turns={args.turns}")
+    print(f"full:          {full * 1000:8.1f} ms")
+    print(f"incremental:   {incremental * 1000:8.1f} ms ({full / incremental:.1f}x)")
+    print(f"non-recording: {non_recording * 1000:8.1f} ms ({full / non_recording:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
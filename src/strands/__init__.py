@@ -1,13 +1,17 @@
 """A framework for building, deploying, and managing AI agents."""
 
 from . import agent, models, telemetry, types
+from ._async import EventLoopRunner
 from .agent.agent import Agent
+from .agent.template import AgentTemplate
 from .tools.decorator import tool
 from .types.tools import ToolContext
 
 __all__ = [
     "Agent",
+    "AgentTemplate",
     "agent",
+    "EventLoopRunner",
     "models",
     "tool",
     "ToolContext",
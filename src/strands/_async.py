@@ -2,13 +2,120 @@
 
 import asyncio
 import contextvars
+import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Awaitable, Callable, TypeVar
+from typing import Awaitable, Callable, Optional, TypeVar
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
 
-def run_async(async_func: Callable[[], Awaitable[T]]) -> T:
+
+class EventLoopRunner:
+    """Long-lived event loop running on a dedicated background thread.
+
+    Synchronous entry points (e.g., `Agent.__call__`) can submit work to a runner instead of spinning up a new thread
+    and event loop for every call. Resources bound to the loop, such as HTTP connection pools held by model clients,
+    are then reused across calls.
+
+    A runner can be shared process wide through `EventLoopRunner.shared()` or created per agent. Calls made from the
+    runner's own thread (e.g., an agent invoked synchronously from inside a hook or async tool) cannot block on the
+    loop they are running in, and so fall back to a fresh event loop on a separate thread.
+
+    Example:
+        ```python
+        runner = EventLoopRunner.shared()
+        agent = Agent(event_loop_runner=runner)
+        ```
+    """
+
+    _shared: Optional["EventLoopRunner"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, name: str = "strands-event-loop") -> None:
+        """Initialize the runner.
+
+        The background thread and event loop are started lazily on first use.
+
+        Args:
+            name: Name of the background thread.
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "EventLoopRunner":
+        """Get the process wide runner.
+
+        Returns:
+            The runner shared by all callers in this process.
+        """
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.is_closed:
+                cls._shared = cls()
+            return cls._shared
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the runner has been closed."""
+        return self._loop is not None and self._loop.is_closed()
+
+    def run(self, async_func: Callable[[], Awaitable[T]]) -> T:
+        """Run an async function on the background event loop and wait for its result.
+
+        The caller's context variables are propagated to the task running on the loop.
+
+        Args:
+            async_func: A callable that returns an awaitable.
+
+        Returns:
+            The result of the async function.
+        """
+        if self._thread is not None and threading.get_ident() == self._thread.ident:
+            logger.debug("runner=<%s> | called from runner thread, falling back to a new event loop", self.name)
+            return run_async(async_func)
+
+        loop = self._ensure_loop()
+
+        async def execute_async() -> T:
+            return await async_func()
+
+        future = asyncio.run_coroutine_threadsafe(execute_async(), loop)
+        return future.result()
+
+    def close(self) -> None:
+        """Stop the background event loop and wait for its thread to exit."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None or loop.is_closed():
+                return
+
+            async def shutdown() -> None:
+                await loop.shutdown_asyncgens()
+                loop.stop()
+
+            loop.call_soon_threadsafe(lambda: loop.create_task(shutdown()))
+            thread.join()
+            loop.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._loop.is_closed():
+                raise RuntimeError(f"event loop runner '{self.name}' is closed")
+
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name=self.name, daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+
+            return self._loop
+
+
+def run_async(async_func: Callable[[], Awaitable[T]], runner: Optional[EventLoopRunner] = None) -> T:
     """Run an async function in a separate thread to avoid event loop conflicts.
 
     This utility handles the common pattern of running async code from sync contexts
@@ -16,10 +123,13 @@ def run_async(async_func: Callable[[], Awaitable[T]]) -> T:
 
     Args:
         async_func: A callable that returns an awaitable
+        runner: Optional long-lived runner to execute on instead of a new thread and event loop.
 
     Returns:
         The result of the async function
     """
+    if runner is not None:
+        return runner.run(async_func)
 
     async def execute_async() -> T:
         return await async_func()
@@ -3,23 +3,29 @@
 It includes:
 
 - Agent: The main interface for interacting with AI models and tools
+- AgentTemplate: Shares the configuration prepared once between many agents
 - ConversationManager: Classes for managing conversation history and context windows
 """
 
 from .agent import Agent
-from .agent_result import AgentResult
+from .agent_result import AgentBatchResult, AgentResult
 from .conversation_manager import (
     ConversationManager,
     NullConversationManager,
     SlidingWindowConversationManager,
     SummarizingConversationManager,
+    TokenBudgetConversationManager,
 )
+from .template import AgentTemplate
 
 __all__ = [
     "Agent",
+    "AgentBatchResult",
     "AgentResult",
+    "AgentTemplate",
     "ConversationManager",
     "NullConversationManager",
     "SlidingWindowConversationManager",
     "SummarizingConversationManager",
+    "TokenBudgetConversationManager",
 ]
@@ -9,6 +9,9 @@ The Agent interface supports two complementary interaction patterns:
 2. Method-style for direct tool access: `agent.tool.tool_name(param1="value")`
 """
 
+import asyncio
+import copy
+import itertools
 import logging
 import warnings
 from typing import (
@@ -17,6 +20,8 @@ from typing import (
     AsyncGenerator,
     AsyncIterator,
     Callable,
+    Collection,
+    Iterable,
     Mapping,
     Optional,
     Type,
@@ -29,7 +34,8 @@ from opentelemetry import trace as trace_api
 from pydantic import BaseModel
 
 from .. import _identifier
-from .._async import run_async
+from .._async import EventLoopRunner, run_async
+from ..event_loop._tool_use_input import TOOL_INPUT_STREAMING_MODES, ToolInputStreaming
 from ..event_loop.event_loop import event_loop_cycle
 from ..tools._tool_helpers import generate_missing_tool_result_content
 
@@ -45,6 +51,7 @@ from ..hooks import (
     MessageAddedEvent,
 )
 from ..interrupt import _InterruptState
+from ..models._message_cache import invalidate_formatted_messages
 from ..models.bedrock import BedrockModel
 from ..models.model import Model
 from ..session.session_manager import SessionManager
@@ -53,7 +60,7 @@ from ..telemetry.tracer import get_tracer, serialize
 from ..tools._caller import _ToolCaller
 from ..tools.executors import ConcurrentToolExecutor
 from ..tools.executors._executor import ToolExecutor
-from ..tools.registry import ToolRegistry
+from ..tools.registry import ToolProviderFailurePolicy, ToolRegistry
 from ..tools.structured_output._structured_output_context import StructuredOutputContext
 from ..tools.watcher import ToolWatcher
 from ..types._events import AgentResultEvent, EventLoopStopEvent, InitEventLoopEvent, ModelStreamChunkEvent, TypedEvent
@@ -61,7 +68,7 @@ from ..types.agent import AgentInput
 from ..types.content import ContentBlock, Message, Messages, SystemContentBlock
 from ..types.exceptions import ContextWindowOverflowException
 from ..types.traces import AttributeValue
-from .agent_result import AgentResult
+from .agent_result import AgentBatchResult, AgentResult
 from .conversation_manager import (
     ConversationManager,
     SlidingWindowConversationManager,
@@ -124,6 +131,9 @@ class Agent:
         hooks: Optional[list[HookProvider]] = None,
         session_manager: Optional[SessionManager] = None,
         tool_executor: Optional[ToolExecutor] = None,
+        event_loop_runner: Optional[EventLoopRunner] = None,
+        tool_input_streaming: ToolInputStreaming = "string",
+        tool_provider_failure_policy: ToolProviderFailurePolicy = "fail_fast",
     ):
         """Initialize the Agent with the specified configuration.
 
@@ -173,9 +183,24 @@ class Agent:
             session_manager: Manager for handling agent sessions including conversation history and state.
                 If provided, enables session-based persistence and state management.
             tool_executor: Definition of tool execution strategy (e.g., sequential, concurrent, etc.).
+            event_loop_runner: Long-lived event loop used by synchronous calls such as `agent("...")`.
+                Use `EventLoopRunner.shared()` to share one loop per process or pass a dedicated runner per agent.
+                Defaults to None, which runs each synchronous call on a new thread and event loop.
+            tool_input_streaming: How tool use input streamed by the model is accumulated.
+                "string" stores the raw input received so far in `current_tool_use["input"]` on every stream event,
+                which copies the input on every delta. "buffered" joins the streamed fragments once the tool use
+                completes. "parsed" additionally parses the input as it arrives and exposes it as `partial_input` on
+                tool use stream events. The partial input is shared by the events and updated in place, so it must be
+                treated as read-only.
+                Defaults to "string".
+            tool_provider_failure_policy: How tool providers such as MCP clients that fail to start are handled.
+                Providers start concurrently. "fail_fast" raises on the first failure, "partial" logs failed
+                providers and continues with the tools of the others. Startup times are recorded in
+                `tool_registry.provider_startups`.
+                Defaults to "fail_fast".
 
         Raises:
-            ValueError: If agent id contains path separators.
+            ValueError: If agent id contains path separators or tool_input_streaming is not a supported mode.
         """
         self.model = BedrockModel() if not model else BedrockModel(model_id=model) if isinstance(model, str) else model
         self.messages = messages if messages is not None else []
@@ -215,7 +240,7 @@ class Agent:
 
         # Process tool list if provided
         if tools is not None:
-            self.tool_registry.process_tools(tools)
+            self.tool_registry.process_tools(tools, provider_failure_policy=tool_provider_failure_policy)
 
         # Initialize tools and configuration
         self.tool_registry.initialize_tools(self.load_tools_from_directory)
@@ -255,9 +280,15 @@ class Agent:
 
         self.tool_executor = tool_executor or ConcurrentToolExecutor()
 
-        if hooks:
-            for hook in hooks:
-                self.hooks.add_hook(hook)
+        self.event_loop_runner = event_loop_runner
+
+        if tool_input_streaming not in TOOL_INPUT_STREAMING_MODES:
+            raise ValueError(f"tool_input_streaming=<{tool_input_streaming}> | unsupported tool input streaming mode")
+        self.tool_input_streaming: ToolInputStreaming = tool_input_streaming
+
+        # The hook providers passed to the agent are kept so they can be added to the isolated agents of a batch
+        self._hook_providers: list[HookProvider] = []
+        self._add_hook_providers(hooks or [], notify=False)
         self.hooks.invoke_callbacks(AgentInitializedEvent(agent=self))
 
     @property
@@ -320,6 +351,7 @@ class Agent:
         *,
         invocation_state: dict[str, Any] | None = None,
         structured_output_model: Type[BaseModel] | None = None,
+        event_keys: Collection[str] | None = None,
         **kwargs: Any,
     ) -> AgentResult:
         """Process a natural language prompt through the agent's event loop.
@@ -338,6 +370,7 @@ class Agent:
                 - None: Use existing conversation history
             invocation_state: Additional parameters to pass through the event loop.
             structured_output_model: Pydantic model type(s) for structured output (overrides agent default).
+            event_keys: Keys of the events passed to the callback handler, see `stream_async`.
             **kwargs: Additional parameters to pass through the event loop.[Deprecating]
 
         Returns:
@@ -351,8 +384,13 @@ class Agent:
         """
         return run_async(
             lambda: self.invoke_async(
-                prompt, invocation_state=invocation_state, structured_output_model=structured_output_model, **kwargs
-            )
+                prompt,
+                invocation_state=invocation_state,
+                structured_output_model=structured_output_model,
+                event_keys=event_keys,
+                **kwargs,
+            ),
+            self.event_loop_runner,
         )
 
     async def invoke_async(
@@ -361,6 +399,7 @@ class Agent:
         *,
         invocation_state: dict[str, Any] | None = None,
         structured_output_model: Type[BaseModel] | None = None,
+        event_keys: Collection[str] | None = None,
         **kwargs: Any,
     ) -> AgentResult:
         """Process a natural language prompt through the agent's event loop.
@@ -379,6 +418,8 @@ class Agent:
                 - None: Use existing conversation history
             invocation_state: Additional parameters to pass through the event loop.
             structured_output_model: Pydantic model type(s) for structured output (overrides agent default).
+            event_keys: Keys of the events passed to the callback handler, see `stream_async`.
+                Defaults to all events, or to none when the callback handler is null_callback_handler.
             **kwargs: Additional parameters to pass through the event loop.[Deprecating]
 
         Returns:
@@ -389,8 +430,16 @@ class Agent:
                 - metrics: Performance metrics from the event loop
                 - state: The final state of the event loop
         """
+        # Without a callback handler nothing consumes the events, so only the result needs to be materialized
+        if event_keys is None and self.callback_handler is null_callback_handler and "callback_handler" not in kwargs:
+            event_keys = ()
+
         events = self.stream_async(
-            prompt, invocation_state=invocation_state, structured_output_model=structured_output_model, **kwargs
+            prompt,
+            invocation_state=invocation_state,
+            structured_output_model=structured_output_model,
+            event_keys=event_keys,
+            **kwargs,
         )
         async for event in events:
             _ = event
@@ -426,7 +475,7 @@ class Agent:
             stacklevel=2,
         )
 
-        return run_async(lambda: self.structured_output_async(output_model, prompt))
+        return run_async(lambda: self.structured_output_async(output_model, prompt), self.event_loop_runner)
 
     async def structured_output_async(self, output_model: Type[T], prompt: AgentInput = None) -> T:
         """This method allows you to get structured output from the agent.
@@ -524,6 +573,7 @@ class Agent:
         *,
         invocation_state: dict[str, Any] | None = None,
         structured_output_model: Type[BaseModel] | None = None,
+        event_keys: Collection[str] | None = None,
         **kwargs: Any,
     ) -> AsyncIterator[Any]:
         """Process a natural language prompt and yield events as an async iterator.
@@ -542,6 +592,11 @@ class Agent:
                 - None: Use existing conversation history
             invocation_state: Additional parameters to pass through the event loop.
             structured_output_model: Pydantic model type(s) for structured output (overrides agent default).
+            event_keys: Keys of the events to yield and pass to the callback handler, such as `{"data", "result"}`.
+                An event is delivered if it has one of these keys, and events that are not delivered are never
+                materialized, which saves a dictionary copy and a callback per streamed token. The final event with
+                the "result" key is always delivered.
+                Defaults to None, which delivers all events.
             **kwargs: Additional parameters to pass to the event loop.[Deprecating]
 
         Yields:
@@ -551,6 +606,7 @@ class Agent:
                 - data: Text content being generated
                 - complete: Whether this is the final chunk
                 - current_tool_use: Information about tools being executed
+                - result: The AgentResult of the invocation, in the final event
                 - And other event data provided by the callback handler
 
         Raises:
@@ -586,11 +642,17 @@ class Agent:
 
         self.trace_span = self._start_agent_trace_span(messages)
 
+        # Events are filtered on their own keys, before prepare adds the invocation state to some of them
+        subscribed_keys = frozenset(event_keys) if event_keys is not None else None
+
         with trace_api.use_span(self.trace_span):
             try:
                 events = self._run_loop(messages, merged_state, structured_output_model)
 
                 async for event in events:
+                    if subscribed_keys is not None and subscribed_keys.isdisjoint(event.keys()):
+                        continue
+
                     event.prepare(invocation_state=merged_state)
 
                     if event.is_callback_event:
@@ -608,6 +670,136 @@ class Agent:
                 self._end_agent_trace_span(error=e)
                 raise
 
+    async def batch_async(
+        self,
+        prompts: Iterable[AgentInput],
+        *,
+        concurrency: int = 8,
+        invocation_state: dict[str, Any] | None = None,
+        structured_output_model: Type[BaseModel] | None = None,
+        callback_handler: Optional[Callable[..., Any]] = None,
+    ) -> AsyncIterator[AgentBatchResult]:
+        """Process independent prompts concurrently and yield their results as they finish.
+
+        Each prompt runs on its own agent that starts from a copy of this agent's messages and state, so the prompts
+        do not see each other's conversation and this agent's conversation is left unchanged. These agents share this
+        agent's model, tools, and tool executor, and run the callbacks of the hooks passed to this agent. They get a
+        deep copy of the conversation manager and do not use the session manager.
+
+        The metrics of each prompt are added to this agent's `event_loop_metrics` when the prompt finishes.
+
+        Args:
+            prompts: Prompts in any form accepted by `invoke_async`. The prompts are read as processing capacity
+                becomes available, so a generator can feed a large batch.
+            concurrency: Maximum number of prompts processed at the same time.
+            invocation_state: Additional parameters to pass through the event loop. Each prompt gets a shallow copy.
+            structured_output_model: Pydantic model type(s) for structured output (overrides agent default).
+            callback_handler: Callback handler of the agents processing the prompts.
+                Defaults to null_callback_handler, as the events of concurrent prompts would otherwise interleave.
+
+        Yields:
+            A result for each prompt, in the order the prompts finish. The exception raised while processing a prompt
+            is reported on its result rather than raised.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+
+        Example:
+            ```python
+            async for item in agent.batch_async(documents, concurrency=16):
+                summaries[item.index] = str(item.result) if item.result else None
+            ```
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency=<{concurrency}> | must be at least 1")
+
+        async def run(index: int, prompt: AgentInput) -> AgentBatchResult:
+            agent = self._create_batch_agent(callback_handler)
+            batch_result = AgentBatchResult(index=index, prompt=prompt, agent=agent)
+            try:
+                batch_result.result = await agent.invoke_async(
+                    prompt,
+                    invocation_state=dict(invocation_state) if invocation_state is not None else None,
+                    structured_output_model=structured_output_model,
+                )
+            except Exception as e:
+                logger.debug("index=<%d>, error=<%s> | batch prompt failed", index, e)
+                batch_result.exception = e
+            finally:
+                agent.cleanup()
+                self.event_loop_metrics.merge(agent.event_loop_metrics)
+
+            return batch_result
+
+        indexed_prompts = enumerate(prompts)
+        running: set[asyncio.Task[AgentBatchResult]] = set()
+        try:
+            while True:
+                for index, prompt in itertools.islice(indexed_prompts, concurrency - len(running)):
+                    running.add(asyncio.create_task(run(index, prompt)))
+
+                if not running:
+                    break
+
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # The caller stopped consuming the results early
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    def _create_batch_agent(self, callback_handler: Optional[Callable[..., Any]]) -> "Agent":
+        """Create an agent that processes one prompt of a batch in isolation from this agent's conversation.
+
+        Args:
+            callback_handler: Callback handler of the new agent.
+
+        Returns:
+            The new agent.
+        """
+        agent = Agent(
+            model=self.model,
+            messages=copy.deepcopy(self.messages),
+            system_prompt=self._system_prompt_content,
+            structured_output_model=self._default_structured_output_model,
+            callback_handler=callback_handler,
+            conversation_manager=copy.deepcopy(self.conversation_manager),
+            record_direct_tool_call=self.record_direct_tool_call,
+            trace_attributes=self.trace_attributes,
+            agent_id=self.agent_id,
+            name=self.name,
+            description=self.description,
+            state=AgentState(self.state.get()),
+            tool_executor=self.tool_executor,
+            tool_input_streaming=self.tool_input_streaming,
+        )
+        agent.tool_registry = self.tool_registry.copy()
+
+        agent._add_hook_providers(self._hook_providers)
+
+        return agent
+
+    def _add_hook_providers(self, hooks: list[HookProvider], notify: bool = True) -> None:
+        """Register hook providers with the agent's hook registry.
+
+        Args:
+            hooks: The hook providers to register.
+            notify: Whether to invoke the AgentInitializedEvent callbacks added by the providers, for agents that
+                were initialized before the providers were added. Callbacks registered before are not invoked again.
+        """
+        event = AgentInitializedEvent(agent=self)
+        initialized_callback_count = len(list(self.hooks.get_callbacks_for(event)))
+
+        for hook in hooks:
+            self.hooks.add_hook(hook)
+        self._hook_providers.extend(hooks)
+
+        if notify:
+            for callback in list(self.hooks.get_callbacks_for(event))[initialized_callback_count:]:
+                callback(event)
+
     async def _run_loop(
         self,
         messages: Messages,
@@ -650,6 +842,7 @@ class Agent:
                     self.messages[-1]["content"] = self._redact_user_content(
                         self.messages[-1]["content"], str(event.chunk["redactContent"]["redactUserContentMessage"])
                     )
+                    invalidate_formatted_messages(self.messages[-1:])
                     if self._session_manager:
                         self._session_manager.redact_latest_message(self.messages[-1], self)
                 yield event
@@ -824,7 +1017,8 @@ class Agent:
         """Appends messages to history and invoke the callbacks for the MessageAddedEvent."""
         for message in messages:
             self.messages.append(message)
-            await self.hooks.invoke_callbacks_async(MessageAddedEvent(agent=self, message=message))
+            if self.hooks.has_callbacks_for(MessageAddedEvent):
+                await self.hooks.invoke_callbacks_async(MessageAddedEvent(agent=self, message=message))
 
     def _redact_user_content(self, content: list[ContentBlock], redact_message: str) -> list[ContentBlock]:
         """Redact user content preserving toolResult blocks.
@@ -1,18 +1,23 @@
 """Agent result handling for SDK.
 
-This module defines the AgentResult class which encapsulates the complete response from an agent's processing cycle.
+This module defines the AgentResult class which encapsulates the complete response from an agent's processing cycle,
+and the AgentBatchResult class which reports the outcome of each prompt of a batch.
 """
 
 from dataclasses import dataclass
-from typing import Any, Sequence, cast
+from typing import TYPE_CHECKING, Any, Sequence, cast
 
 from pydantic import BaseModel
 
 from ..interrupt import Interrupt
 from ..telemetry.metrics import EventLoopMetrics
+from ..types.agent import AgentInput
 from ..types.content import Message
 from ..types.streaming import StopReason
 
+if TYPE_CHECKING:
+    from .agent import Agent
+
 
 @dataclass
 class AgentResult:
@@ -86,3 +91,22 @@ class AgentResult:
             "message": self.message,
             "stop_reason": self.stop_reason,
         }
+
+
+@dataclass
+class AgentBatchResult:
+    """Represents the outcome of one prompt of an agent batch.
+
+    Attributes:
+        index: Position of the prompt in the batch.
+        prompt: The prompt that was processed.
+        agent: The isolated agent that processed the prompt, holding its conversation and state.
+        result: The result of the invocation, or None if it failed.
+        exception: The exception raised by the invocation, or None if it succeeded.
+    """
+
+    index: int
+    prompt: AgentInput
+    agent: "Agent"
+    result: AgentResult | None = None
+    exception: Exception | None = None
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from ...agent.agent import Agent
 
 from ...hooks import BeforeModelCallEvent, HookRegistry
+from ...models._message_cache import invalidate_formatted_messages
 from ...types.content import Messages
 from ...types.exceptions import ContextWindowOverflowException
 from .conversation_manager import ConversationManager
@@ -14,6 +15,37 @@ from .conversation_manager import ConversationManager
 logger = logging.getLogger(__name__)
 
 
+def _find_valid_trim_index(messages: Messages, trim_index: int) -> Optional[int]:
+    """Find the first index at or after trim_index where the conversation can start.
+
+    The oldest message kept cannot be a toolResult, as it needs the toolUse preceding it, and can only be a toolUse if
+    a toolResult immediately follows it.
+
+    Args:
+        messages: The conversation message history.
+        trim_index: The smallest number of messages to remove.
+
+    Returns:
+        The number of messages to remove, or None if no valid index leaves a message in the conversation.
+    """
+    while trim_index < len(messages):
+        if (
+            # Oldest message cannot be a toolResult because it needs a toolUse preceding it
+            any("toolResult" in content for content in messages[trim_index]["content"])
+            or (
+                # Oldest message can be a toolUse only if a toolResult immediately follows it.
+                any("toolUse" in content for content in messages[trim_index]["content"])
+                and trim_index + 1 < len(messages)
+                and not any("toolResult" in content for content in messages[trim_index + 1]["content"])
+            )
+        ):
+            trim_index += 1
+        else:
+            return trim_index
+
+    return None
+
+
 class SlidingWindowConversationManager(ConversationManager):
     """Implements a sliding window strategy for managing conversation history.
 
@@ -172,28 +204,17 @@ class SlidingWindowConversationManager(ConversationManager):
         trim_index = 2 if len(messages) <= self.window_size else len(messages) - self.window_size
 
         # Find the next valid trim_index
-        while trim_index < len(messages):
-            if (
-                # Oldest message cannot be a toolResult because it needs a toolUse preceding it
-                any("toolResult" in content for content in messages[trim_index]["content"])
-                or (
-                    # Oldest message can be a toolUse only if a toolResult immediately follows it.
-                    any("toolUse" in content for content in messages[trim_index]["content"])
-                    and trim_index + 1 < len(messages)
-                    and not any("toolResult" in content for content in messages[trim_index + 1]["content"])
-                )
-            ):
-                trim_index += 1
-            else:
-                break
-        else:
+        valid_trim_index = _find_valid_trim_index(messages, trim_index)
+        if valid_trim_index is None:
             # If we didn't find a valid trim_index, then we throw
             raise ContextWindowOverflowException("Unable to trim conversation context!") from e
+        trim_index = valid_trim_index
 
         # trim_index represents the number of messages being removed from the agents messages array
         self.removed_message_count += trim_index
 
         # Overwrite message history
+        invalidate_formatted_messages(messages[:trim_index])
         messages[:] = messages[trim_index:]
 
     def _truncate_tool_results(self, messages: Messages, msg_idx: int) -> bool:
@@ -233,6 +254,9 @@ class SlidingWindowConversationManager(ConversationManager):
                 message["content"][i]["toolResult"]["content"] = [{"text": tool_result_too_large_message}]
                 changes_made = True
 
+        if changes_made:
+            invalidate_formatted_messages([message])
+
         return changes_made
 
     def _find_last_message_with_tool_results(self, messages: Messages) -> Optional[int]:
@@ -1,10 +1,15 @@
 """Summarizing conversation history management with configurable options."""
 
+import asyncio
+import concurrent.futures
+import copy
 import logging
 from typing import TYPE_CHECKING, Any, List, Optional, cast
 
 from typing_extensions import override
 
+from ...hooks import BeforeModelCallEvent, HookRegistry
+from ...models._message_cache import invalidate_formatted_messages
 from ...tools._tool_helpers import noop_tool
 from ...tools.registry import ToolRegistry
 from ...types.content import Message
@@ -63,6 +68,8 @@ class SummarizingConversationManager(ConversationManager):
         preserve_recent_messages: int = 10,
         summarization_agent: Optional["Agent"] = None,
         summarization_system_prompt: Optional[str] = None,
+        *,
+        background_threshold: Optional[int] = None,
     ):
         """Initialize the summarizing conversation manager.
 
@@ -75,6 +82,15 @@ class SummarizingConversationManager(ConversationManager):
                 If provided, this agent can use tools as part of the summarization process.
             summarization_system_prompt: Optional system prompt override for summarization.
                 If None, uses the default summarization prompt.
+            background_threshold: Number of messages at which the oldest messages start being summarized in the
+                background. The summary replaces them at the next model call or end of invocation after it is ready,
+                so the agent never waits for it. Summarization runs on its own agent that shares the model and tools
+                of the summarization agent, or of the parent agent, without changing them.
+                Defaults to None, which only summarizes when the context window overflows.
+
+        Raises:
+            ValueError: If both summarization_agent and summarization_system_prompt are provided, or
+                background_threshold is not greater than preserve_recent_messages.
         """
         super().__init__()
         if summarization_agent is not None and summarization_system_prompt is not None:
@@ -82,13 +98,74 @@ class SummarizingConversationManager(ConversationManager):
                 "Cannot provide both summarization_agent and summarization_system_prompt. "
                 "Agents come with their own system prompt."
             )
+        if background_threshold is not None and background_threshold <= preserve_recent_messages:
+            raise ValueError(
+                f"background_threshold=<{background_threshold}> | must be greater than preserve_recent_messages"
+            )
 
         self.summary_ratio = max(0.1, min(0.8, summary_ratio))
         self.preserve_recent_messages = preserve_recent_messages
         self.summarization_agent = summarization_agent
         self.summarization_system_prompt = summarization_system_prompt
+        self.background_threshold = background_threshold
         self._summary_message: Optional[Message] = None
 
+        # Summary being generated in the background, along with the messages it replaces
+        self._pending_summary: Optional[concurrent.futures.Future[Message]] = None
+        self._pending_summarized_messages: list[Message] = []
+
+    def __copy__(self) -> "SummarizingConversationManager":
+        """Copy the manager without the background summary of the conversation it currently manages.
+
+        The copy gets its own summarization agent, sharing the model and tools of this manager's summarization agent,
+        since summarizing replaces the messages of the summarization agent.
+
+        Returns:
+            A copy of the manager.
+        """
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        copied._pending_summary = None
+        copied._pending_summarized_messages = []
+        if self.summarization_agent is not None:
+            copied.summarization_agent = self.summarization_agent._create_batch_agent(None)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "SummarizingConversationManager":
+        """Copy the manager for another agent, with its own summary message and summarization agent.
+
+        Args:
+            memo: Objects already copied.
+
+        Returns:
+            A copy of the manager.
+        """
+        copied = self.__copy__()
+        memo[id(self)] = copied
+        copied._summary_message = copy.deepcopy(self._summary_message, memo)
+        return copied
+
+    def register_hooks(self, registry: "HookRegistry", **kwargs: Any) -> None:
+        """Register hook callbacks for background summarization.
+
+        Args:
+            registry: The hook registry to register callbacks with.
+            **kwargs: Additional keyword arguments for future extensibility.
+        """
+        super().register_hooks(registry, **kwargs)
+
+        # Always register the callback - background_threshold check happens in the callback
+        registry.add_callback(BeforeModelCallEvent, self._on_before_model_call)
+
+    def _on_before_model_call(self, event: BeforeModelCallEvent) -> None:
+        """Swap in a finished background summary and start the next one if needed.
+
+        Args:
+            event: The before model call event.
+        """
+        if self.background_threshold is not None:
+            self._manage_in_background(event.agent)
+
     @override
     def restore_from_session(self, state: dict[str, Any]) -> Optional[list[Message]]:
         """Restores the Summarizing Conversation manager from its previous state in a session.
@@ -110,20 +187,23 @@ class SummarizingConversationManager(ConversationManager):
     def apply_management(self, agent: "Agent", **kwargs: Any) -> None:
         """Apply management strategy to conversation history.
 
-        For the summarizing conversation manager, no proactive management is performed.
-        Summarization only occurs when there's a context overflow that triggers reduce_context.
+        Without a background_threshold no proactive management is performed and summarization only occurs when
+        there's a context overflow that triggers reduce_context. With a background_threshold, a finished background
+        summary is swapped in and the next one is started if the conversation reached the threshold.
 
         Args:
             agent: The agent whose conversation history will be managed.
                 The agent's messages list is modified in-place.
             **kwargs: Additional keyword arguments for future extensibility.
         """
-        # No proactive management - summarization only happens on context overflow
-        pass
+        if self.background_threshold is not None:
+            self._manage_in_background(agent)
 
     def reduce_context(self, agent: "Agent", e: Optional[Exception] = None, **kwargs: Any) -> None:
         """Reduce context using summarization.
 
+        A background summary that is still being generated is awaited and used instead of starting another one.
+
         Args:
             agent: The agent whose conversation history will be reduced.
                 The agent's messages list is modified in-place.
@@ -133,46 +213,207 @@ class SummarizingConversationManager(ConversationManager):
         Raises:
             ContextWindowOverflowException: If the context cannot be summarized.
         """
-        try:
-            # Calculate how many messages to summarize
-            messages_to_summarize_count = max(1, int(len(agent.messages) * self.summary_ratio))
-
-            # Ensure we don't summarize recent messages
-            messages_to_summarize_count = min(
-                messages_to_summarize_count, len(agent.messages) - self.preserve_recent_messages
-            )
-
-            if messages_to_summarize_count <= 0:
-                raise ContextWindowOverflowException("Cannot summarize: insufficient messages for summarization")
+        # A background summary reduces the context sooner than starting another summarization round trip
+        if self._pending_summary is not None:
+            concurrent.futures.wait([self._pending_summary])
+        if self._apply_background_summary(agent):
+            return
+        self._discard_background_summary()
 
-            # Adjust split point to avoid breaking ToolUse/ToolResult pairs
-            messages_to_summarize_count = self._adjust_split_point_for_tool_pairs(
-                agent.messages, messages_to_summarize_count
-            )
-
-            if messages_to_summarize_count <= 0:
-                raise ContextWindowOverflowException("Cannot summarize: insufficient messages for summarization")
+        try:
+            messages_to_summarize_count = self._find_messages_to_summarize_count(agent.messages)
 
             # Extract messages to summarize
             messages_to_summarize = agent.messages[:messages_to_summarize_count]
             remaining_messages = agent.messages[messages_to_summarize_count:]
 
-            # Keep track of the number of messages that have been summarized thus far.
-            self.removed_message_count += len(messages_to_summarize)
-            # If there is a summary message, don't count it in the removed_message_count.
-            if self._summary_message:
-                self.removed_message_count -= 1
+            # Generate summary, on a copy since the summarization agent appends its own messages to the list
+            summary_message = self._generate_summary(messages_to_summarize.copy(), agent)
 
-            # Generate summary
-            self._summary_message = self._generate_summary(messages_to_summarize, agent)
-
-            # Replace the summarized messages with the summary
-            agent.messages[:] = [self._summary_message] + remaining_messages
+            self._replace_with_summary(agent, messages_to_summarize, remaining_messages, summary_message)
 
         except Exception as summarization_error:
             logger.error("Summarization failed: %s", summarization_error)
             raise summarization_error from e
 
+    def _find_messages_to_summarize_count(self, messages: List[Message]) -> int:
+        """Find how many of the oldest messages to summarize.
+
+        Args:
+            messages: The conversation message history.
+
+        Returns:
+            The number of messages to summarize.
+
+        Raises:
+            ContextWindowOverflowException: If there are not enough messages to summarize.
+        """
+        # Calculate how many messages to summarize
+        messages_to_summarize_count = max(1, int(len(messages) * self.summary_ratio))
+
+        # Ensure we don't summarize recent messages
+        messages_to_summarize_count = min(messages_to_summarize_count, len(messages) - self.preserve_recent_messages)
+
+        if messages_to_summarize_count <= 0:
+            raise ContextWindowOverflowException("Cannot summarize: insufficient messages for summarization")
+
+        # Adjust split point to avoid breaking ToolUse/ToolResult pairs
+        messages_to_summarize_count = self._adjust_split_point_for_tool_pairs(messages, messages_to_summarize_count)
+
+        if messages_to_summarize_count <= 0:
+            raise ContextWindowOverflowException("Cannot summarize: insufficient messages for summarization")
+
+        return messages_to_summarize_count
+
+    def _replace_with_summary(
+        self,
+        agent: "Agent",
+        summarized_messages: List[Message],
+        remaining_messages: List[Message],
+        summary: Message,
+    ) -> None:
+        """Replace the oldest messages of the conversation with their summary.
+
+        Args:
+            agent: The agent whose conversation history will be reduced.
+            summarized_messages: The oldest messages of the conversation that were summarized.
+            remaining_messages: The messages that follow the summarized messages.
+            summary: The summary of the messages.
+        """
+        # Keep track of the number of messages that have been summarized thus far.
+        self.removed_message_count += len(summarized_messages)
+        # If there is a summary message, don't count it in the removed_message_count.
+        if self._summary_message:
+            self.removed_message_count -= 1
+
+        self._summary_message = summary
+
+        # Replace the summarized messages with the summary
+        agent.messages[:] = [summary] + remaining_messages
+        invalidate_formatted_messages(summarized_messages)
+
+    def _manage_in_background(self, agent: "Agent") -> None:
+        """Swap in a finished background summary, then start summarizing if the conversation reached the threshold.
+
+        Args:
+            agent: The agent whose conversation history is managed.
+        """
+        if self._pending_summary is not None:
+            if not self._pending_summary.done():
+                return
+
+            if not self._apply_background_summary(agent):
+                self._discard_background_summary()
+
+        if self.background_threshold is None or len(agent.messages) < self.background_threshold:
+            return
+
+        try:
+            messages_to_summarize_count = self._find_messages_to_summarize_count(agent.messages)
+        except ContextWindowOverflowException:
+            logger.debug("message_count=<%d> | no messages to summarize in the background", len(agent.messages))
+            return
+
+        messages_to_summarize = agent.messages[:messages_to_summarize_count]
+        summarization_agent = self._create_background_summarization_agent(messages_to_summarize, agent)
+
+        logger.debug("message_count=<%d> | summarizing messages in the background", messages_to_summarize_count)
+        self._pending_summarized_messages = messages_to_summarize
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="strands-summarization")
+        self._pending_summary = executor.submit(self._run_background_summarization, summarization_agent)
+        # The thread exits once the summary is generated, so idle managers hold no threads
+        executor.shutdown(wait=False)
+
+    def _apply_background_summary(self, agent: "Agent") -> bool:
+        """Replace the summarized messages with the finished background summary.
+
+        The summary is only used if the messages it summarizes are still the oldest messages of the conversation.
+
+        Args:
+            agent: The agent whose conversation history will be reduced.
+
+        Returns:
+            Whether the summary was applied.
+        """
+        pending_summary = self._pending_summary
+        if pending_summary is None or not pending_summary.done() or pending_summary.cancelled():
+            return False
+
+        if pending_summary.exception() is not None:
+            logger.warning("error=<%s> | background summarization failed", pending_summary.exception())
+            return False
+
+        summarized_messages = self._pending_summarized_messages
+        if len(agent.messages) < len(summarized_messages) or any(
+            message is not summarized for message, summarized in zip(agent.messages, summarized_messages, strict=False)
+        ):
+            logger.debug("background summary is outdated, the conversation changed while summarizing")
+            return False
+
+        remaining_messages = agent.messages[len(summarized_messages) :]
+        self._replace_with_summary(agent, summarized_messages, remaining_messages, pending_summary.result())
+        self._pending_summary = None
+        self._pending_summarized_messages = []
+        return True
+
+    def _discard_background_summary(self) -> None:
+        """Stop waiting for the background summary."""
+        if self._pending_summary is not None:
+            self._pending_summary.cancel()
+        self._pending_summary = None
+        self._pending_summarized_messages = []
+
+    def _create_background_summarization_agent(self, messages: List[Message], agent: "Agent") -> "Agent":
+        """Create an agent that summarizes the messages without changing the parent or summarization agent.
+
+        Args:
+            messages: The messages to summarize.
+            agent: The parent agent.
+
+        Returns:
+            The agent to generate the summary with.
+        """
+        if self.summarization_agent is not None:
+            summarization_agent = self.summarization_agent._create_batch_agent(None)
+        else:
+            from ..agent import Agent
+
+            summarization_agent = Agent(
+                model=agent.model,
+                system_prompt=(
+                    self.summarization_system_prompt
+                    if self.summarization_system_prompt is not None
+                    else DEFAULT_SUMMARIZATION_PROMPT
+                ),
+                callback_handler=None,
+            )
+            summarization_agent.tool_registry = agent.tool_registry.copy()
+
+        # Add no-op tool if agent has no tools to satisfy tool spec requirement
+        if not summarization_agent.tool_names:
+            summarization_agent.tool_registry = ToolRegistry()
+            summarization_agent.tool_registry.register_tool(cast(AgentTool, noop_tool))
+
+        # The summary is generated while the conversation continues, so the messages are copied
+        summarization_agent.messages = copy.deepcopy(messages)
+        return summarization_agent
+
+    @staticmethod
+    def _run_background_summarization(summarization_agent: "Agent") -> Message:
+        """Generate the summary on a background thread.
+
+        Args:
+            summarization_agent: The agent holding the messages to summarize.
+
+        Returns:
+            A message containing the conversation summary.
+        """
+        try:
+            result = asyncio.run(summarization_agent.invoke_async("Please summarize this conversation."))
+            return cast(Message, {**result.message, "role": "user"})
+        finally:
+            summarization_agent.cleanup()
+
     def _generate_summary(self, messages: List[Message], agent: "Agent") -> Message:
         """Generate a summary of the provided messages.
 
@@ -0,0 +1,305 @@
+"""Token budget conversation history management."""
+
+import copy
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Optional, cast
+
+if TYPE_CHECKING:
+    from ...agent.agent import Agent
+
+from ...hooks import BeforeModelCallEvent, HookRegistry
+from ...models._message_cache import FormattedMessageCache, invalidate_formatted_messages
+from ...tools.registry import ToolSpecSnapshot
+from ...types.content import ContentBlock, Message, Messages
+from ...types.exceptions import ContextWindowOverflowException
+from .conversation_manager import ConversationManager
+from .sliding_window_conversation_manager import _find_valid_trim_index
+
+logger = logging.getLogger(__name__)
+
+Tokenizer = Callable[[str], int]
+"""Counts the tokens of a text."""
+
+# Rough token counts of content the tokenizer cannot see, on the high side of what providers report
+_IMAGE_TOKENS = 1_600
+_DOCUMENT_TOKENS = 3_000
+_VIDEO_TOKENS = 10_000
+
+# Tokens providers add around each message for its role and structure
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the tokens of a text from its length, at about four characters per token.
+
+    Args:
+        text: The text to estimate.
+
+    Returns:
+        The estimated number of tokens.
+    """
+    return (len(text) + 3) // 4
+
+
+class TokenBudgetConversationManager(ConversationManager):
+    """Keeps the conversation within a token budget by trimming the oldest messages before each model call.
+
+    Unlike `SlidingWindowConversationManager`, which bounds the number of messages and otherwise waits for the model
+    to reject an oversized request, this manager estimates the input tokens of every model call and trims the
+    conversation before the call is made. Estimates are computed once per message and reused until the message
+    changes, so only new messages are tokenized on each call.
+
+    Tokens are counted with the given tokenizer, or estimated from the text length when there is none. The estimate
+    of each model call is recorded along with the input tokens the model reports, in
+    `EventLoopMetrics.input_token_estimates`, to help tune the budget and the tokenizer.
+
+    Example:
+        ```python
+        encoding = tiktoken.get_encoding("o200k_base")
+        manager = TokenBudgetConversationManager(
+            max_tokens=100_000, tokenizer=lambda text: len(encoding.encode(text))
+        )
+        agent = Agent(conversation_manager=manager)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        *,
+        target_tokens: Optional[int] = None,
+        tokenizer: Optional[Tokenizer] = None,
+    ) -> None:
+        """Initialize the token budget conversation manager.
+
+        Args:
+            max_tokens: Largest estimated input of a model call, including the system prompt and tool specs.
+            target_tokens: Estimated input to trim the conversation down to once it exceeds max_tokens. A target
+                below max_tokens trims more at once, so the conversation, and any prompt cache built on it, stays
+                stable for several calls.
+                Defaults to max_tokens.
+            tokenizer: Counts the tokens of a text. Defaults to an estimate from the text length.
+
+        Raises:
+            ValueError: If max_tokens is not positive or target_tokens is not between 1 and max_tokens.
+        """
+        super().__init__()
+
+        if max_tokens < 1:
+            raise ValueError(f"max_tokens=<{max_tokens}> | must be at least 1")
+        if target_tokens is not None and not 1 <= target_tokens <= max_tokens:
+            raise ValueError(f"target_tokens=<{target_tokens}> | must be between 1 and max_tokens")
+
+        self.max_tokens = max_tokens
+        self.target_tokens = target_tokens if target_tokens is not None else max_tokens
+        self.tokenizer: Tokenizer = tokenizer or estimate_tokens
+
+        self._message_tokens: FormattedMessageCache[int] = FormattedMessageCache()
+        self._system_prompt_tokens: tuple[Optional[str], int] = (None, 0)
+        self._tool_spec_tokens: tuple[Optional[ToolSpecSnapshot], int] = (None, 0)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "TokenBudgetConversationManager":
+        """Copy the manager for another agent, with empty token estimate caches and the same tokenizer.
+
+        Args:
+            memo: Objects already copied.
+
+        Returns:
+            A copy of the manager.
+        """
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for name, value in self.__dict__.items():
+            if name not in ("tokenizer", "_message_tokens", "_system_prompt_tokens", "_tool_spec_tokens"):
+                copied.__dict__[name] = copy.deepcopy(value, memo)
+
+        copied.tokenizer = self.tokenizer
+        copied._message_tokens = FormattedMessageCache()
+        copied._system_prompt_tokens = (None, 0)
+        copied._tool_spec_tokens = (None, 0)
+        return copied
+
+    def register_hooks(self, registry: "HookRegistry", **kwargs: Any) -> None:
+        """Register hook callbacks for trimming the conversation before each model call.
+
+        Args:
+            registry: The hook registry to register callbacks with.
+            **kwargs: Additional keyword arguments for future extensibility.
+        """
+        super().register_hooks(registry, **kwargs)
+
+        registry.add_callback(BeforeModelCallEvent, self._on_before_model_call)
+
+    def _on_before_model_call(self, event: BeforeModelCallEvent) -> None:
+        """Trim the conversation to the budget and record the estimated input of the model call.
+
+        Args:
+            event: The before model call event.
+        """
+        agent = event.agent
+        estimated_tokens = self._trim(agent, self.max_tokens)
+        agent.event_loop_metrics.set_input_token_estimate(estimated_tokens)
+
+    def apply_management(self, agent: "Agent", **kwargs: Any) -> None:
+        """Trim the conversation to the budget.
+
+        Args:
+            agent: The agent whose messages will be managed.
+                This list is modified in-place.
+            **kwargs: Additional keyword arguments for future extensibility.
+        """
+        self._trim(agent, self.max_tokens)
+
+    def reduce_context(self, agent: "Agent", e: Optional[Exception] = None, **kwargs: Any) -> None:
+        """Trim the conversation after the model rejected it despite the budget.
+
+        The estimate was too low, so the conversation is trimmed to half of its estimated size.
+
+        Args:
+            agent: The agent whose messages will be reduced.
+                This list is modified in-place.
+            e: The exception that triggered the context reduction, if any.
+            **kwargs: Additional keyword arguments for future extensibility.
+
+        Raises:
+            ContextWindowOverflowException: If the context cannot be reduced further.
+        """
+        estimated_tokens = self.estimate_input_tokens(agent)
+        if self._trim(agent, estimated_tokens // 2) == estimated_tokens:
+            raise ContextWindowOverflowException("Unable to trim conversation context!") from e
+
+    def estimate_input_tokens(self, agent: "Agent") -> int:
+        """Estimate the input tokens of the agent's next model call.
+
+        Args:
+            agent: The agent to estimate.
+
+        Returns:
+            The estimated tokens of the system prompt, tool specs, and messages.
+        """
+        return self._estimate_fixed_tokens(agent) + sum(self._estimate_messages(agent.messages))
+
+    def _trim(self, agent: "Agent", max_tokens: int) -> int:
+        """Remove the oldest messages until the estimated input is at most max_tokens.
+
+        When the input exceeds max_tokens it is trimmed down to the target, or to max_tokens if that is lower. The
+        conversation is left as is if it cannot be trimmed enough while keeping tool uses paired with their results.
+
+        Args:
+            agent: The agent whose messages will be trimmed.
+            max_tokens: Largest estimated input to keep.
+
+        Returns:
+            The estimated input tokens after trimming.
+        """
+        messages = agent.messages
+        message_tokens = self._estimate_messages(messages)
+        fixed_tokens = self._estimate_fixed_tokens(agent)
+        total_tokens = fixed_tokens + sum(message_tokens)
+
+        if total_tokens <= max_tokens:
+            return total_tokens
+
+        target_tokens = min(self.target_tokens, max_tokens)
+        trim_index = 0
+        trimmed_tokens = total_tokens
+        while trim_index < len(messages) and trimmed_tokens > target_tokens:
+            trimmed_tokens -= message_tokens[trim_index]
+            trim_index += 1
+
+        valid_trim_index = _find_valid_trim_index(messages, trim_index)
+        if valid_trim_index is None:
+            logger.debug(
+                "estimated_tokens=<%d>, max_tokens=<%d> | unable to trim conversation within budget",
+                total_tokens,
+                max_tokens,
+            )
+            return total_tokens
+
+        trimmed_tokens -= sum(message_tokens[trim_index:valid_trim_index])
+        logger.debug(
+            "estimated_tokens=<%d>, trimmed_tokens=<%d>, removed_messages=<%d> | trimmed conversation to token budget",
+            total_tokens,
+            trimmed_tokens,
+            valid_trim_index,
+        )
+
+        self.removed_message_count += valid_trim_index
+        invalidate_formatted_messages(messages[:valid_trim_index])
+        messages[:] = messages[valid_trim_index:]
+
+        return trimmed_tokens
+
+    def _estimate_messages(self, messages: Messages) -> list[int]:
+        """Estimate the tokens of each message, reusing the estimates of unchanged messages.
+
+        Args:
+            messages: The messages to estimate.
+
+        Returns:
+            The estimated tokens of each message.
+        """
+        return self._message_tokens.get_all(messages, self._estimate_message)
+
+    def _estimate_message(self, message: Message) -> int:
+        """Estimate the tokens of a message.
+
+        Args:
+            message: The message to estimate.
+
+        Returns:
+            The estimated tokens of the message.
+        """
+        return _MESSAGE_OVERHEAD_TOKENS + sum(self._estimate_content(content) for content in message["content"])
+
+    def _estimate_content(self, content: ContentBlock) -> int:
+        """Estimate the tokens of a content block.
+
+        Args:
+            content: The content block to estimate.
+
+        Returns:
+            The estimated tokens of the content block.
+        """
+        if "text" in content:
+            return self.tokenizer(content["text"])
+
+        if "toolUse" in content:
+            tool_use = content["toolUse"]
+            return self.tokenizer(tool_use["name"]) + self.tokenizer(json.dumps(tool_use["input"]))
+
+        if "toolResult" in content:
+            # Tool result content shares the text, image, and document blocks, json is counted as its serialization
+            return sum(self._estimate_content(cast(ContentBlock, item)) for item in content["toolResult"]["content"])
+
+        if "image" in content:
+            return _IMAGE_TOKENS
+
+        if "document" in content:
+            return _DOCUMENT_TOKENS
+
+        if "video" in content:
+            return _VIDEO_TOKENS
+
+        return self.tokenizer(json.dumps(content, default=str))
+
+    def _estimate_fixed_tokens(self, agent: "Agent") -> int:
+        """Estimate the tokens of the system prompt and tool specs, reusing the estimates while they are unchanged.
+
+        Args:
+            agent: The agent to estimate.
+
+        Returns:
+            The estimated tokens of the system prompt and tool specs.
+        """
+        system_prompt = agent.system_prompt
+        if self._system_prompt_tokens[0] != system_prompt:
+            self._system_prompt_tokens = (system_prompt, self.tokenizer(system_prompt) if system_prompt else 0)
+
+        snapshot = agent.tool_registry.get_tool_spec_snapshot()
+        if self._tool_spec_tokens[0] is not snapshot:
+            tool_spec_tokens = self.tokenizer(json.dumps(snapshot.tool_specs)) if snapshot.tool_specs else 0
+            self._tool_spec_tokens = (snapshot, tool_spec_tokens)
+
+        return self._system_prompt_tokens[1] + self._tool_spec_tokens[1]
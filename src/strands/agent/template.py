@@ -0,0 +1,196 @@
+"""Agent templates for constructing many agents with the same configuration.
+
+Services that create an agent per request pay for loading tools and validating their specs on every construction, even
+though these are the same for every request. A template does this work once and creates agents
+that share the prepared parts, so each agent only gets its own conversation, state, and request scoped components.
+"""
+
+import copy
+import logging
+from typing import Any, Callable, Mapping, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from .._async import EventLoopRunner
+from ..event_loop._tool_use_input import TOOL_INPUT_STREAMING_MODES, ToolInputStreaming
+from ..hooks import HookProvider
+from ..models.bedrock import BedrockModel
+from ..models.model import Model
+from ..session.session_manager import SessionManager
+from ..tools.executors._executor import ToolExecutor
+from ..tools.registry import ToolProviderFailurePolicy, ToolRegistry
+from ..types.content import Messages, SystemContentBlock
+from ..types.traces import AttributeValue
+from .agent import _DEFAULT_CALLBACK_HANDLER, Agent, _DefaultCallbackHandlerSentinel
+from .conversation_manager import ConversationManager
+from .state import AgentState
+
+logger = logging.getLogger(__name__)
+
+
+class AgentTemplate:
+    """Creates agents that share tools, hooks, model, and system prompt prepared once.
+
+    Shared between the created agents:
+
+    - The model instance.
+    - The tools, loaded and validated once. Each agent gets its own copy of the registry, so tools added to one agent
+      are not visible to the others.
+    - The template's hook providers, registered with each agent as they would be when passing the same providers to
+      several agents.
+    - The system prompt, structured output model, trace attributes, and tool executor.
+
+    Each agent gets its own messages, state, metrics, callback handler, and session manager, along with a deep copy of
+    the template's conversation manager or a new default one. Conversation managers holding objects that cannot be
+    deep copied, or that must be shared, can define `__deepcopy__`.
+
+    Example:
+        ```python
+        template = AgentTemplate(model=model, tools=[search, fetch], system_prompt="You are a researcher.")
+
+        def handle(request):
+            agent = template.create(messages=request.history, state={"user": request.user})
+            return agent(request.prompt)
+        ```
+    """
+
+    def __init__(
+        self,
+        model: Union[Model, str, None] = None,
+        tools: Optional[list[Any]] = None,
+        system_prompt: Optional[str | list[SystemContentBlock]] = None,
+        structured_output_model: Optional[Type[BaseModel]] = None,
+        callback_handler: Optional[
+            Union[Callable[..., Any], _DefaultCallbackHandlerSentinel]
+        ] = _DEFAULT_CALLBACK_HANDLER,
+        conversation_manager: Optional[ConversationManager] = None,
+        record_direct_tool_call: bool = True,
+        trace_attributes: Optional[Mapping[str, AttributeValue]] = None,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        hooks: Optional[list[HookProvider]] = None,
+        tool_executor: Optional[ToolExecutor] = None,
+        event_loop_runner: Optional[EventLoopRunner] = None,
+        tool_input_streaming: ToolInputStreaming = "string",
+        tool_provider_failure_policy: ToolProviderFailurePolicy = "fail_fast",
+    ) -> None:
+        """Prepare the shared parts of the agents.
+
+        Args:
+            model: Provider for running inference or a string representing the model-id for Bedrock to use.
+                Defaults to strands.models.BedrockModel if None. The model instance is shared by all agents.
+            tools: Tools available to the agents, in any form accepted by `Agent`. Tools are loaded once.
+            system_prompt: System prompt to guide model behavior.
+            structured_output_model: Pydantic model type for structured output.
+            callback_handler: Default callback handler of the agents, see `Agent`. The default creates a new
+                PrintingCallbackHandler for each agent.
+            conversation_manager: Conversation manager deep copied for each agent.
+                Defaults to a new strands.agent.conversation_manager.SlidingWindowConversationManager per agent.
+            record_direct_tool_call: Whether to record direct tool calls in message history.
+            trace_attributes: Custom trace attributes to apply to the agents' trace spans.
+            name: Name of the agents.
+            description: Description of what the agents do.
+            hooks: Hook providers registered with every agent.
+            tool_executor: Tool execution strategy shared by all agents.
+                Defaults to a new strands.tools.executors.ConcurrentToolExecutor per agent.
+            event_loop_runner: Long-lived event loop used by synchronous calls such as `agent("...")`.
+            tool_input_streaming: How tool use input streamed by the model is accumulated, see `Agent`.
+            tool_provider_failure_policy: How tool providers that fail to start are handled, see `Agent`.
+
+        Raises:
+            ValueError: If a tool fails to load or tool_input_streaming is not a supported mode.
+        """
+        if tool_input_streaming not in TOOL_INPUT_STREAMING_MODES:
+            raise ValueError(f"tool_input_streaming=<{tool_input_streaming}> | unsupported tool input streaming mode")
+
+        self.model = BedrockModel() if not model else BedrockModel(model_id=model) if isinstance(model, str) else model
+        self.system_prompt = system_prompt
+        self.structured_output_model = structured_output_model
+        self.callback_handler = callback_handler
+        self.conversation_manager = conversation_manager
+        self.record_direct_tool_call = record_direct_tool_call
+        self.trace_attributes = trace_attributes
+        self.name = name
+        self.description = description
+        self.tool_executor = tool_executor
+        self.event_loop_runner = event_loop_runner
+        self.tool_input_streaming = tool_input_streaming
+
+        self.tool_registry = ToolRegistry()
+        if tools is not None:
+            self.tool_registry.process_tools(tools, provider_failure_policy=tool_provider_failure_policy)
+        # Validate the tool specs once, the snapshot is shared by the registries of all agents
+        self.tool_registry.get_tool_spec_snapshot()
+
+        self.hooks = list(hooks or [])
+
+        logger.debug("tool_count=<%d> | agent template prepared", len(self.tool_registry.registry))
+
+    def create(
+        self,
+        messages: Optional[Messages] = None,
+        *,
+        state: Optional[Union[AgentState, dict]] = None,
+        agent_id: Optional[str] = None,
+        session_manager: Optional[SessionManager] = None,
+        callback_handler: Optional[
+            Union[Callable[..., Any], _DefaultCallbackHandlerSentinel]
+        ] = _DEFAULT_CALLBACK_HANDLER,
+    ) -> Agent:
+        """Create an agent from the template.
+
+        Args:
+            messages: Initial messages of the agent. Defaults to an empty conversation.
+            state: Initial state of the agent, as an AgentState object or a json serializable dict.
+            agent_id: Optional ID for the agent, useful for session management and multi-agent scenarios.
+            session_manager: Session manager of the agent.
+            callback_handler: Callback handler of the agent. Defaults to the template's callback handler.
+
+        Returns:
+            The new agent.
+        """
+        agent = Agent(
+            model=self.model,
+            messages=messages,
+            system_prompt=self.system_prompt,
+            structured_output_model=self.structured_output_model,
+            callback_handler=(
+                self.callback_handler
+                if isinstance(callback_handler, _DefaultCallbackHandlerSentinel)
+                else callback_handler
+            ),
+            conversation_manager=copy.deepcopy(self.conversation_manager) if self.conversation_manager else None,
+            record_direct_tool_call=self.record_direct_tool_call,
+            trace_attributes=self.trace_attributes,
+            agent_id=agent_id,
+            name=self.name,
+            description=self.description,
+            state=state,
+            session_manager=session_manager,
+            tool_executor=self.tool_executor,
+            event_loop_runner=self.event_loop_runner,
+            tool_input_streaming=self.tool_input_streaming,
+        )
+
+        agent.tool_registry = self.tool_registry.copy()
+
+        # The template's hooks are registered after the session and conversation managers, as they would be when
+        # passed to the agent, and are only now told about the initialized agent
+        agent._add_hook_providers(self.hooks)
+
+        return agent
+
+    def cleanup(self) -> None:
+        """Release the template's use of its tool providers.
+
+        Agents created from the template keep using the providers until they are cleaned up themselves.
+        """
+        self.tool_registry.cleanup()
+
+    def __del__(self) -> None:
+        """Clean up resources when the template is garbage collected."""
+        # __del__ is called even when an exception is thrown in the constructor,
+        # so there is no guarantee tool_registry was set
+        if hasattr(self, "tool_registry"):
+            self.tool_registry.cleanup()
@@ -0,0 +1,338 @@
+"""Accumulation and incremental parsing of streamed tool use input.
+
+Models stream the JSON input of a tool use as a sequence of text fragments. Concatenating each fragment onto the input
+received so far copies the whole input on every delta, which is quadratic in the size of the input. The classes in
+this module buffer the fragments instead, and optionally parse them as they arrive so that consumers can inspect the
+input before the tool use block completes.
+"""
+
+import json
+import re
+from typing import Any, Literal, Optional
+
+ToolInputStreaming = Literal["string", "buffered", "parsed"]
+"""How tool use input is accumulated while it is streamed.
+
+- "string": the raw input received so far is stored as a string in `current_tool_use["input"]` on every delta.
+- "buffered": fragments are buffered and joined once when the tool use block completes.
+- "parsed": like "buffered", and the input is also parsed incrementally and exposed as `partial_input` on
+  tool use stream events.
+"""
+
+TOOL_INPUT_STREAMING_MODES: tuple[ToolInputStreaming, ...] = ("string", "buffered", "parsed")
+
+_MISSING = object()
+
+# Expected next token
+_VALUE = 0
+_VALUE_OR_END = 1
+_KEY = 2
+_KEY_OR_END = 3
+_COLON = 4
+_COMMA_OR_END = 5
+
+# Kind of the token being read
+_STRING = 1
+_KEY_STRING = 2
+_NUMBER = 3
+_LITERAL = 4
+
+_STRING_SPECIAL = re.compile(r'["\\\x00-\x1f]')
+_SURROGATE = re.compile("[\ud800-\udfff]")
+_NUMBER_PATTERN = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_WHITESPACE = frozenset(" \t\n\r")
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class IncrementalJSONParser:
+    """Parses a JSON document fed in arbitrary fragments.
+
+    Containers are created as soon as they are opened and values are added to them once they are complete, so `value`
+    always reflects everything parsed so far. Strings, numbers, and literals that are still being read are not exposed.
+
+    The parser only accepts strict JSON. Once it fails, further input is ignored and `finish` raises, leaving it to the
+    caller to fall back to `json.loads`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._root: Any = _MISSING
+        self._containers: list[Any] = []
+        self._keys: list[Optional[str]] = []
+        self._expect = _VALUE
+        self._token_kind = 0
+        self._token: list[str] = []
+        self._escape = ""
+        self._has_unicode_escape = False
+        self.failed = False
+
+    @property
+    def value(self) -> Any:
+        """The value parsed so far, or None if nothing has been parsed yet.
+
+        Containers are returned live and keep being updated as more input is fed.
+        """
+        return None if self._root is _MISSING else self._root
+
+    def feed(self, text: str) -> None:
+        """Parse the next fragment of the document.
+
+        Args:
+            text: Next fragment.
+        """
+        i, length = 0, len(text)
+        while i < length and not self.failed:
+            kind = self._token_kind
+            if kind == _STRING or kind == _KEY_STRING:
+                i = self._feed_string(text, i)
+                continue
+
+            char = text[i]
+            if kind == _NUMBER:
+                if char in _NUMBER_CHARS:
+                    self._token.append(char)
+                    i += 1
+                    continue
+                self._end_number()
+            elif kind == _LITERAL:
+                if char.isalpha():
+                    self._token.append(char)
+                    i += 1
+                    continue
+                self._end_literal()
+
+            if not self.failed and char not in _WHITESPACE:
+                self._feed_structural(char)
+            i += 1
+
+    def finish(self) -> Any:
+        """Complete parsing.
+
+        Returns:
+            The parsed document.
+
+        Raises:
+            ValueError: If the input is not a complete JSON document.
+        """
+        if self._token_kind == _NUMBER:
+            self._end_number()
+        elif self._token_kind == _LITERAL:
+            self._end_literal()
+
+        if self.failed or self._token_kind or self._containers or self._root is _MISSING:
+            raise ValueError("incomplete or invalid JSON document")
+
+        return self._root
+
+    def _feed_string(self, text: str, i: int) -> int:
+        length = len(text)
+        while i < length:
+            if self._escape:
+                self._escape += text[i]
+                i += 1
+                if self._escape[1] == "u":
+                    if len(self._escape) < 6:
+                        continue
+                    try:
+                        self._token.append(chr(int(self._escape[2:], 16)))
+                    except ValueError:
+                        self.failed = True
+                        return length
+                    self._has_unicode_escape = True
+                elif self._escape[1] in _ESCAPES:
+                    self._token.append(_ESCAPES[self._escape[1]])
+                else:
+                    self.failed = True
+                    return length
+                self._escape = ""
+                continue
+
+            match = _STRING_SPECIAL.search(text, i)
+            if match is None:
+                self._token.append(text[i:])
+                return length
+
+            end = match.start()
+            if end > i:
+                self._token.append(text[i:end])
+
+            char = text[end]
+            if char == '"':
+                self._end_string()
+                return end + 1
+            if char != "\\":
+                # Unescaped control characters are not allowed in strict JSON
+                self.failed = True
+                return length
+
+            self._escape = "\\"
+            i = end + 1
+
+        return length
+
+    def _feed_structural(self, char: str) -> None:
+        expect = self._expect
+        if expect == _VALUE or expect == _VALUE_OR_END:
+            if char == "]" and expect == _VALUE_OR_END:
+                self._close()
+            elif char == "{":
+                self._open({})
+                self._expect = _KEY_OR_END
+            elif char == "[":
+                self._open([])
+                self._expect = _VALUE_OR_END
+            elif char == '"':
+                self._token_kind = _STRING
+            elif char == "-" or char.isdigit():
+                self._token_kind = _NUMBER
+                self._token.append(char)
+            elif char in "tfn":
+                self._token_kind = _LITERAL
+                self._token.append(char)
+            else:
+                self.failed = True
+
+        elif expect == _KEY or expect == _KEY_OR_END:
+            if char == '"':
+                self._token_kind = _KEY_STRING
+            elif char == "}" and expect == _KEY_OR_END:
+                self._close()
+            else:
+                self.failed = True
+
+        elif expect == _COLON:
+            if char == ":":
+                self._expect = _VALUE
+            else:
+                self.failed = True
+
+        else:
+            if not self._containers:
+                # Only whitespace may follow the document
+                self.failed = True
+                return
+
+            is_object = isinstance(self._containers[-1], dict)
+            if char == ",":
+                self._expect = _KEY if is_object else _VALUE
+            elif char == ("}" if is_object else "]"):
+                self._close()
+            else:
+                self.failed = True
+
+    def _open(self, container: Any) -> None:
+        self._add(container)
+        self._containers.append(container)
+        self._keys.append(None)
+
+    def _close(self) -> None:
+        self._containers.pop()
+        self._keys.pop()
+        self._expect = _COMMA_OR_END
+
+    def _add(self, value: Any) -> None:
+        if not self._containers:
+            self._root = value
+        elif isinstance(self._containers[-1], list):
+            self._containers[-1].append(value)
+        else:
+            self._containers[-1][self._keys[-1]] = value
+
+        self._expect = _COMMA_OR_END
+
+    def _take_token(self) -> str:
+        token = "".join(self._token)
+        self._token.clear()
+        self._token_kind = 0
+        return token
+
+    def _end_string(self) -> None:
+        is_key = self._token_kind == _KEY_STRING
+        value = self._take_token()
+        if self._has_unicode_escape and _SURROGATE.search(value):
+            # Combine escaped surrogate pairs the way json.loads does
+            value = value.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+        self._has_unicode_escape = False
+
+        if is_key:
+            self._keys[-1] = value
+            self._expect = _COLON
+        else:
+            self._add(value)
+
+    def _end_number(self) -> None:
+        token = self._take_token()
+        if _NUMBER_PATTERN.fullmatch(token) is None:
+            self.failed = True
+            return
+
+        self._add(json.loads(token))
+
+    def _end_literal(self) -> None:
+        token = self._take_token()
+        if token not in _LITERALS:
+            self.failed = True
+            return
+
+        self._add(_LITERALS[token])
+
+
+class ToolUseInputBuffer:
+    """Accumulates the streamed input of a single tool use."""
+
+    def __init__(self, parse: bool = False) -> None:
+        """Initialize the buffer.
+
+        Args:
+            parse: Whether to parse the input incrementally as fragments arrive.
+        """
+        self._fragments: list[str] = []
+        self._parser = IncrementalJSONParser() if parse else None
+
+    def append(self, fragment: str) -> None:
+        """Add the next fragment of the input.
+
+        Args:
+            fragment: Next fragment of the raw JSON input.
+        """
+        self._fragments.append(fragment)
+        if self._parser is not None and not self._parser.failed:
+            self._parser.feed(fragment)
+
+    @property
+    def parses(self) -> bool:
+        """Whether the input is parsed incrementally."""
+        return self._parser is not None
+
+    @property
+    def partial_input(self) -> Any:
+        """Input parsed so far, or None if the buffer does not parse incrementally or nothing has been parsed yet.
+
+        The value is the parser's working copy, which keeps changing as fragments arrive and is shared by every event
+        it is exposed on. It must be treated as read-only. The complete input returned by `result` is decoded
+        separately, so it does not share containers with the partial values.
+        """
+        if self._parser is None or self._parser.failed:
+            return None
+        return self._parser.value
+
+    @property
+    def text(self) -> str:
+        """Raw input received so far."""
+        return "".join(self._fragments)
+
+    def result(self) -> Any:
+        """Parse the complete input.
+
+        The raw input is decoded with `json.loads`, falling back to an empty input if it is not valid JSON. The
+        incremental parse is not reused, since its containers were handed out as partial input.
+
+        Returns:
+            The parsed input.
+        """
+        try:
+            return json.loads(self.text)
+        except ValueError:
+            return {}
@@ -326,11 +326,12 @@ async def _handle_model_execution(
             custom_trace_attributes=agent.trace_attributes,
         )
         with trace_api.use_span(model_invoke_span):
-            await agent.hooks.invoke_callbacks_async(
-                BeforeModelCallEvent(
-                    agent=agent,
+            if agent.hooks.has_callbacks_for(BeforeModelCallEvent):
+                await agent.hooks.invoke_callbacks_async(
+                    BeforeModelCallEvent(
+                        agent=agent,
+                    )
                 )
-            )
 
             if structured_output_context.forced_mode:
                 tool_spec = structured_output_context.get_tool_spec()
@@ -345,6 +346,7 @@ async def _handle_model_execution(
                     tool_specs,
                     system_prompt_content=agent._system_prompt_content,
                     tool_choice=structured_output_context.tool_choice,
+                    tool_input_streaming=agent.tool_input_streaming,
                 ):
                     yield event
 
@@ -423,7 +425,8 @@ async def _handle_model_execution(
 
         # Add the response message to the conversation
         agent.messages.append(message)
-        await agent.hooks.invoke_callbacks_async(MessageAddedEvent(agent=agent, message=message))
+        if agent.hooks.has_callbacks_for(MessageAddedEvent):
+            await agent.hooks.invoke_callbacks_async(MessageAddedEvent(agent=agent, message=message))
 
         # Update metrics
         agent.event_loop_metrics.update_usage(usage)
@@ -529,7 +532,8 @@ async def _handle_tool_execution(
     }
 
     agent.messages.append(tool_result_message)
-    await agent.hooks.invoke_callbacks_async(MessageAddedEvent(agent=agent, message=tool_result_message))
+    if agent.hooks.has_callbacks_for(MessageAddedEvent):
+        await agent.hooks.invoke_callbacks_async(MessageAddedEvent(agent=agent, message=tool_result_message))
 
     yield ToolResultMessageEvent(message=tool_result_message)
 
@@ -37,6 +37,7 @@ from ..types.streaming import (
     Usage,
 )
 from ..types.tools import ToolSpec, ToolUse
+from ._tool_use_input import ToolInputStreaming, ToolUseInputBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -209,8 +210,18 @@ def handle_content_block_delta(
         if "input" not in state["current_tool_use"]:
             state["current_tool_use"]["input"] = ""
 
-        state["current_tool_use"]["input"] += delta_content["toolUse"]["input"]
-        typed_event = ToolUseStreamEvent(delta_content, state["current_tool_use"])
+        tool_use_input: Optional[ToolUseInputBuffer] = state.get("tool_use_input")
+        if tool_use_input is None:
+            state["current_tool_use"]["input"] += delta_content["toolUse"]["input"]
+            typed_event = ToolUseStreamEvent(delta_content, state["current_tool_use"])
+        else:
+            tool_use_input.append(delta_content["toolUse"]["input"])
+            if tool_use_input.parses:
+                typed_event = ToolUseStreamEvent(
+                    delta_content, state["current_tool_use"], partial_input=tool_use_input.partial_input
+                )
+            else:
+                typed_event = ToolUseStreamEvent(delta_content, state["current_tool_use"])
 
     elif "text" in delta_content:
         state["text"] += delta_content["text"]
@@ -272,10 +283,14 @@ def handle_content_block_stop(state: dict[str, Any]) -> dict[str, Any]:
         if "input" not in current_tool_use:
             current_tool_use["input"] = ""
 
-        try:
-            current_tool_use["input"] = json.loads(current_tool_use["input"])
-        except ValueError:
-            current_tool_use["input"] = {}
+        tool_use_input: Optional[ToolUseInputBuffer] = state.pop("tool_use_input", None)
+        if tool_use_input is not None:
+            current_tool_use["input"] = tool_use_input.result()
+        else:
+            try:
+                current_tool_use["input"] = json.loads(current_tool_use["input"])
+            except ValueError:
+                current_tool_use["input"] = {}
 
         tool_use_id = current_tool_use["toolUseId"]
         tool_use_name = current_tool_use["name"]
@@ -363,13 +378,19 @@ def extract_usage_metrics(event: MetadataEvent, time_to_first_byte_ms: int | Non
 
 
 async def process_stream(
-    chunks: AsyncIterable[StreamEvent], start_time: float | None = None
+    chunks: AsyncIterable[StreamEvent],
+    start_time: float | None = None,
+    tool_input_streaming: ToolInputStreaming = "string",
 ) -> AsyncGenerator[TypedEvent, None]:
     """Processes the response stream from the API, constructing the final message and extracting usage metrics.
 
     Args:
         chunks: The chunks of the response stream from the model.
         start_time: Time when the model request is initiated
+        tool_input_streaming: How streamed tool use input is accumulated. With "string", the default,
+            `current_tool_use["input"]` holds the raw input received so far on every tool use stream event. With
+            "buffered" and "parsed", fragments are joined once when the block completes, and with "parsed" the input
+            parsed so far is added to tool use stream events as `partial_input`.
 
     Yields:
         The reason for stopping, the constructed message, and the usage metrics.
@@ -399,6 +420,8 @@ async def process_stream(
             state["message"] = handle_message_start(chunk["messageStart"], state["message"])
         elif "contentBlockStart" in chunk:
             state["current_tool_use"] = handle_content_block_start(chunk["contentBlockStart"])
+            if state["current_tool_use"] and tool_input_streaming != "string":
+                state["tool_use_input"] = ToolUseInputBuffer(parse=tool_input_streaming == "parsed")
         elif "contentBlockDelta" in chunk:
             state, typed_event = handle_content_block_delta(chunk["contentBlockDelta"], state)
             yield typed_event
@@ -425,6 +448,7 @@ async def stream_messages(
     *,
     tool_choice: Optional[Any] = None,
     system_prompt_content: Optional[list[SystemContentBlock]] = None,
+    tool_input_streaming: ToolInputStreaming = "string",
     **kwargs: Any,
 ) -> AsyncGenerator[TypedEvent, None]:
     """Streams messages to the model and processes the response.
@@ -437,6 +461,7 @@ async def stream_messages(
         tool_choice: Optional tool choice constraint for forcing specific tool usage.
         system_prompt_content: The authoritative system prompt content blocks that always contains the
             system prompt data.
+        tool_input_streaming: How streamed tool use input is accumulated. See `ToolInputStreaming`.
         **kwargs: Additional keyword arguments for future extensibility.
 
     Yields:
@@ -455,5 +480,5 @@ async def stream_messages(
         system_prompt_content=system_prompt_content,
     )
 
-    async for event in process_stream(chunks, start_time):
+    async for event in process_stream(chunks, start_time, tool_input_streaming=tool_input_streaming):
         yield event
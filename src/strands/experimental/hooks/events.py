@@ -164,6 +164,7 @@ class BidiAfterToolCallEvent(BidiHookEvent):
             or an Exception if the tool execution failed.
         exception: Exception if the tool execution failed, None if successful.
         cancel_message: The cancellation message if the user cancelled the tool call.
+        cache_hit: Whether the result came from the tool's cache instead of invoking the tool.
     """
 
     selected_tool: AgentTool | None
@@ -172,6 +173,7 @@ class BidiAfterToolCallEvent(BidiHookEvent):
     result: ToolResult
     exception: Exception | None = None
     cancel_message: str | None = None
+    cache_hit: bool = False
 
     def _can_write(self, name: str) -> bool:
         return name == "result"
@@ -155,6 +155,7 @@ class AfterToolCallEvent(HookEvent):
         result: The result of the tool invocation. Either a ToolResult on success
             or an Exception if the tool execution failed.
         cancel_message: The cancellation message if the user cancelled the tool call.
+        cache_hit: Whether the result came from the tool's cache instead of invoking the tool.
     """
 
     selected_tool: Optional[AgentTool]
@@ -163,6 +164,7 @@ class AfterToolCallEvent(HookEvent):
     result: ToolResult
     exception: Optional[Exception] = None
     cancel_message: str | None = None
+    cache_hit: bool = False
 
     def _can_write(self, name: str) -> bool:
         return name == "result"
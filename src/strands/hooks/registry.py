@@ -7,10 +7,23 @@ functions, supporting both individual callback registration and bulk registratio
 via hook provider objects.
 """
 
+import asyncio
 import inspect
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Awaitable, Generator, Generic, Protocol, Type, TypeVar, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Generator,
+    Generic,
+    Protocol,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+    runtime_checkable,
+)
 
 from ..interrupt import Interrupt, InterruptException
 
@@ -141,6 +154,32 @@ class HookCallback(Protocol, Generic[TEvent]):
         ...
 
 
+@dataclass(frozen=True)
+class _DispatchStep:
+    """Callbacks that are invoked together while dispatching an event.
+
+    Attributes:
+        callbacks: A single callback, or several parallel-safe async callbacks that are awaited concurrently.
+        is_async: Whether the callbacks are coroutine functions.
+    """
+
+    callbacks: tuple[HookCallback, ...]
+    is_async: bool
+
+
+@dataclass(frozen=True)
+class _DispatchPlan:
+    """Precomputed order and grouping of the callbacks of an event type.
+
+    Attributes:
+        steps: The callbacks grouped into the steps they are invoked in.
+        has_async: Whether any of the callbacks is a coroutine function.
+    """
+
+    steps: tuple[_DispatchStep, ...]
+    has_async: bool
+
+
 class HookRegistry:
     """Registry for managing hook callbacks associated with event types.
 
@@ -149,19 +188,29 @@ class HookRegistry:
     events occur.
 
     The registry handles callback ordering, including reverse ordering for
-    cleanup events, and provides type-safe event dispatching.
+    cleanup events, and provides type-safe event dispatching. The order of the callbacks of each event type, and
+    whether they are async, is computed once when the event type is first dispatched after a registration.
     """
 
     def __init__(self) -> None:
         """Initialize an empty hook registry."""
         self._registered_callbacks: dict[Type, list[HookCallback]] = {}
+        self._parallel_safe_callbacks: dict[Type, list[HookCallback]] = {}
+        self._dispatch_plans: dict[tuple[Type, bool], _DispatchPlan] = {}
 
-    def add_callback(self, event_type: Type[TEvent], callback: HookCallback[TEvent]) -> None:
+    def add_callback(
+        self, event_type: Type[TEvent], callback: HookCallback[TEvent], *, parallel_safe: bool = False
+    ) -> None:
         """Register a callback function for a specific event type.
 
         Args:
             event_type: The class type of events this callback should handle.
             callback: The callback function to invoke when events of this type occur.
+            parallel_safe: Whether an async callback may run concurrently with the async callbacks registered next
+                to it that are also parallel-safe. Only mark callbacks that observe the event without modifying it
+                or depending on other callbacks, such as telemetry or persistence. Synchronous callbacks always
+                run on their own.
+                Defaults to False, which runs the callback after the previous callback has finished.
 
         Example:
             ```python
@@ -177,6 +226,10 @@ class HookRegistry:
 
         callbacks = self._registered_callbacks.setdefault(event_type, [])
         callbacks.append(callback)
+        if parallel_safe:
+            self._parallel_safe_callbacks.setdefault(event_type, []).append(callback)
+
+        self._dispatch_plans.clear()
 
     def add_hook(self, hook: HookProvider) -> None:
         """Register all callbacks from a hook provider.
@@ -205,7 +258,8 @@ class HookRegistry:
 
         This method finds all callbacks registered for the event's type and
         invokes them in the appropriate order. For events with should_reverse_callbacks=True,
-        callbacks are invoked in reverse registration order. Any exceptions raised by callback
+        callbacks are invoked in reverse registration order. Consecutive async callbacks registered
+        as parallel-safe are awaited concurrently. Any exceptions raised by callback
         functions will propagate to the caller.
 
         Additionally, this method aggregates interrupts raised by the user to instantiate human-in-the-loop workflows.
@@ -227,22 +281,27 @@ class HookRegistry:
         """
         interrupts: dict[str, Interrupt] = {}
 
-        for callback in self.get_callbacks_for(event):
+        for step in self._get_dispatch_plan(event).steps:
+            if len(step.callbacks) > 1:
+                results = await asyncio.gather(
+                    *(cast(Awaitable[None], callback(event)) for callback in step.callbacks), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, InterruptException):
+                        self._add_interrupt(interrupts, result)
+                    elif isinstance(result, BaseException):
+                        raise result
+                continue
+
+            callback = step.callbacks[0]
             try:
-                if inspect.iscoroutinefunction(callback):
-                    await callback(event)
+                if step.is_async:
+                    await cast(Awaitable[None], callback(event))
                 else:
                     callback(event)
 
             except InterruptException as exception:
-                interrupt = exception.interrupt
-                if interrupt.name in interrupts:
-                    message = f"interrupt_name=<{interrupt.name}> | interrupt name used more than once"
-                    logger.error(message)
-                    raise ValueError(message) from exception
-
-                # Each callback is allowed to raise their own interrupt.
-                interrupts[interrupt.name] = interrupt
+                self._add_interrupt(interrupts, exception)
 
         return event, list(interrupts.values())
 
@@ -272,27 +331,107 @@ class HookRegistry:
             registry.invoke_callbacks(event)
             ```
         """
-        callbacks = list(self.get_callbacks_for(event))
+        plan = self._get_dispatch_plan(event)
         interrupts: dict[str, Interrupt] = {}
 
-        if any(inspect.iscoroutinefunction(callback) for callback in callbacks):
+        if plan.has_async:
             raise RuntimeError(f"event=<{event}> | use invoke_callbacks_async to invoke async callback")
 
-        for callback in callbacks:
+        for step in plan.steps:
             try:
-                callback(event)
+                step.callbacks[0](event)
             except InterruptException as exception:
-                interrupt = exception.interrupt
-                if interrupt.name in interrupts:
-                    message = f"interrupt_name=<{interrupt.name}> | interrupt name used more than once"
-                    logger.error(message)
-                    raise ValueError(message) from exception
-
-                # Each callback is allowed to raise their own interrupt.
-                interrupts[interrupt.name] = interrupt
+                self._add_interrupt(interrupts, exception)
 
         return event, list(interrupts.values())
 
+    @staticmethod
+    def _add_interrupt(interrupts: dict[str, Interrupt], exception: InterruptException) -> None:
+        """Record the interrupt raised by a callback.
+
+        Args:
+            interrupts: The interrupts raised so far, by name.
+            exception: The exception carrying the interrupt.
+
+        Raises:
+            ValueError: If interrupt name is used more than once.
+        """
+        interrupt = exception.interrupt
+        if interrupt.name in interrupts:
+            message = f"interrupt_name=<{interrupt.name}> | interrupt name used more than once"
+            logger.error(message)
+            raise ValueError(message) from exception
+
+        # Each callback is allowed to raise their own interrupt.
+        interrupts[interrupt.name] = interrupt
+
+    def _get_dispatch_plan(self, event: BaseHookEvent) -> _DispatchPlan:
+        """Get the dispatch plan for the event, computing it on first use after a registration.
+
+        Args:
+            event: The event to dispatch.
+
+        Returns:
+            The dispatch plan of the event's type and callback order.
+        """
+        key = (type(event), event.should_reverse_callbacks)
+        plan = self._dispatch_plans.get(key)
+        if plan is None:
+            plan = self._create_dispatch_plan(list(self.get_callbacks_for(event)), type(event))
+            self._dispatch_plans[key] = plan
+
+        return plan
+
+    def _create_dispatch_plan(self, callbacks: Sequence[HookCallback], event_type: Type) -> _DispatchPlan:
+        """Group ordered callbacks into steps, combining consecutive parallel-safe async callbacks.
+
+        Args:
+            callbacks: The callbacks of the event type, in invocation order.
+            event_type: The event type the callbacks are registered for.
+
+        Returns:
+            The dispatch plan.
+        """
+        parallel_safe_callbacks = self._parallel_safe_callbacks.get(event_type, [])
+        steps: list[_DispatchStep] = []
+        parallel_group: list[HookCallback] = []
+
+        def flush_parallel_group() -> None:
+            if parallel_group:
+                steps.append(_DispatchStep(callbacks=tuple(parallel_group), is_async=True))
+                parallel_group.clear()
+
+        for callback in callbacks:
+            is_async = inspect.iscoroutinefunction(callback)
+            if is_async and callback in parallel_safe_callbacks:
+                parallel_group.append(callback)
+                continue
+
+            flush_parallel_group()
+            steps.append(_DispatchStep(callbacks=(callback,), is_async=is_async))
+
+        flush_parallel_group()
+        return _DispatchPlan(steps=tuple(steps), has_async=any(step.is_async for step in steps))
+
+    def has_callbacks_for(self, event_type: Type[BaseHookEvent]) -> bool:
+        """Check if any callbacks are registered for the given event type.
+
+        Lets callers skip constructing events that no callback would receive.
+
+        Args:
+            event_type: The event type to check.
+
+        Returns:
+            True if there are callbacks registered for the event type, False otherwise.
+
+        Example:
+            ```python
+            if registry.has_callbacks_for(MessageAddedEvent):
+                await registry.invoke_callbacks_async(MessageAddedEvent(agent=agent, message=message))
+            ```
+        """
+        return bool(self._registered_callbacks.get(event_type))
+
     def has_callbacks(self) -> bool:
         """Check if the registry has any registered callbacks.
 
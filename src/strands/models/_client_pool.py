@@ -0,0 +1,87 @@
+"""Per event loop client pooling for model providers."""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import AsyncContextManager, AsyncGenerator, Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+ClientT = TypeVar("ClientT")
+
+
+class ClientPool(Generic[ClientT]):
+    """Reuses one client per running event loop.
+
+    HTTP clients such as httpx bind their connections to the event loop that opened them, so they cannot be shared
+    across loops (see https://github.com/encode/httpx/discussions/2959). Creating a client per request avoids the
+    problem but pays for connection setup (DNS, TCP, TLS) on every model call. The pool instead keeps one open client
+    per event loop, so connections are kept alive across requests made from the same loop.
+
+    Each client is entered through an async generator that the event loop tracks. When the loop shuts down its async
+    generators, as `asyncio.run` and `EventLoopRunner.close` do before closing the loop, the generator is closed and
+    the client exits its context on the loop that owns its connections.
+    """
+
+    def __init__(self, create: Callable[[], AsyncContextManager[ClientT]]) -> None:
+        """Initialize the pool.
+
+        Args:
+            create: Creates a new client. The client is used as an async context manager and exited when the event
+                loop it was created on shuts down.
+        """
+        self._create = create
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, tuple[ClientT, AsyncGenerator[ClientT, None]]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of open clients."""
+        with self._lock:
+            return len(self._clients)
+
+    async def acquire(self) -> ClientT:
+        """Get the client for the running event loop, creating it if needed.
+
+        Returns:
+            A client bound to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(loop)
+            if entry is not None:
+                return entry[0]
+
+            # Loops closed without shutting down their async generators never release their clients
+            for closed_loop in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed_loop]
+
+        lifetime = self._lifetime(weakref.ref(loop))
+        client = await lifetime.__anext__()
+
+        with self._lock:
+            entry = self._clients.get(loop)
+            if entry is None:
+                self._clients[loop] = (client, lifetime)
+                return client
+
+        # Another task on this loop created a client while this one was being entered
+        await lifetime.aclose()
+        return entry[0]
+
+    async def _lifetime(self, loop_ref: "weakref.ref[asyncio.AbstractEventLoop]") -> AsyncGenerator[ClientT, None]:
+        async with self._create() as client:
+            logger.debug("client=<%s> | opened pooled client", type(client).__name__)
+            try:
+                yield client
+            finally:
+                loop = loop_ref()
+                if loop is not None:
+                    with self._lock:
+                        entry = self._clients.get(loop)
+                        if entry is not None and entry[0] is client:
+                            del self._clients[loop]
+
+                logger.debug("client=<%s> | closing pooled client", type(client).__name__)
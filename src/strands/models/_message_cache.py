@@ -0,0 +1,203 @@
+"""Cache of provider formatted messages.
+
+Model providers convert the whole conversation history to their request format on every model call, which includes
+costly steps such as base64 encoding images and documents. The history mostly grows by appending messages, so the
+conversion of earlier messages can be reused across calls.
+
+Entries are keyed by message identity and validated by comparing the message with a copy of its containers taken
+when it was formatted. The comparison runs in C and stops at the first difference, so a lookup costs a fraction of
+formatting the message, though it still visits every nested value. Strings and bytes are shared with the message
+rather than copied, and other values are compared by type as well as value, so that replacing `1` with `True` in place
+invalidates the entry. Any in place change to the message, however deeply nested, therefore invalidates the entry.
+
+Entries do not keep the messages themselves alive. Messages are plain dictionaries that cannot be weakly referenced,
+so entries of messages that left every conversation are instead dropped once they have not been used by the last
+`max_idle_requests` requests. Code that mutates or drops messages, such as conversation managers and redaction,
+additionally calls `invalidate_formatted_messages` so that entries are released eagerly.
+"""
+
+import collections
+import threading
+import weakref
+from typing import Any, Callable, Generic, Iterable, Optional, Sequence, TypeVar
+
+from ..types.content import Message
+
+T = TypeVar("T")
+
+_caches: "weakref.WeakSet[FormattedMessageCache[Any]]" = weakref.WeakSet()
+_caches_lock = threading.Lock()
+
+_SHARED_TYPES = (str, bytes, type(None))
+
+
+class _Exact:
+    """Value of a snapshot that only equals values of the same type, unlike `1 == 1.0 == True`."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return other is self.value or (type(other) is type(self.value) and bool(other == self.value))
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _Entry(Generic[T]):
+    __slots__ = ("snapshot", "value", "request")
+
+    def __init__(self, snapshot: Any, value: T, request: int) -> None:
+        self.snapshot = snapshot
+        self.value = value
+        self.request = request
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy the containers nested in a message value so that later in place changes compare unequal."""
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_snapshot(item) for item in value)
+    if type(value) in _SHARED_TYPES:
+        return value
+    return _Exact(value)
+
+
+class FormattedMessageCache(Generic[T]):
+    """LRU cache of the provider format of individual messages."""
+
+    def __init__(self, max_entries: int = 1024, max_idle_requests: int = 32) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of formatted messages to keep. A request formatted with `get_all` that has
+                more messages keeps all of them, so that its messages do not evict each other.
+            max_idle_requests: Number of requests formatted with `get_all` after which the entries of messages none
+                of them contained are dropped. Models shared by more conversations than this reformat messages more
+                often.
+        """
+        self.max_entries = max_entries
+        self.max_idle_requests = max_idle_requests
+        self._entries: collections.OrderedDict[int, _Entry[T]] = collections.OrderedDict()
+        self._request = 0
+        self._lock = threading.Lock()
+
+        with _caches_lock:
+            _caches.add(self)
+
+    def __len__(self) -> int:
+        """Number of cached messages."""
+        return len(self._entries)
+
+    def get(self, message: Message, format_message: Callable[[Message], T]) -> T:
+        """Get the formatted message, formatting it if it is not cached or changed since it was cached.
+
+        Callers must not mutate the returned value, as it is shared across calls.
+
+        Args:
+            message: Message to format.
+            format_message: Formats the message.
+
+        Returns:
+            The formatted message.
+        """
+        value = self._get(message, format_message)
+
+        with self._lock:
+            self._evict(self.max_entries)
+
+        return value
+
+    def _get(self, message: Message, format_message: Callable[[Message], T]) -> T:
+        """Get the formatted message without evicting entries.
+
+        Args:
+            message: Message to format.
+            format_message: Formats the message.
+
+        Returns:
+            The formatted message.
+        """
+        with self._lock:
+            entry: Optional[_Entry[T]] = self._entries.get(id(message))
+
+        # The id of a garbage collected message can be reused by a new one, which is only a hit if the two are equal
+        if entry is not None and message == entry.snapshot:
+            with self._lock:
+                entry.request = self._request
+                if self._entries.get(id(message)) is entry:
+                    self._entries.move_to_end(id(message))
+            return entry.value
+
+        snapshot = _snapshot(message)
+        value = format_message(message)
+
+        with self._lock:
+            self._entries[id(message)] = _Entry(snapshot, value, self._request)
+            self._entries.move_to_end(id(message))
+
+        return value
+
+    def _evict(self, max_entries: int) -> None:
+        """Drop the least recently used entries beyond max_entries. The lock must be held."""
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def get_all(self, messages: Sequence[Message], format_message: Callable[[Message], T]) -> list[T]:
+        """Get the formatted messages of a request, then drop the entries of messages unused by recent requests.
+
+        Callers must not mutate the returned values, as they are shared across calls.
+
+        Args:
+            messages: Messages of the request.
+            format_message: Formats a message.
+
+        Returns:
+            The formatted messages.
+        """
+        with self._lock:
+            self._request += 1
+
+        values = [self._get(message, format_message) for message in messages]
+
+        with self._lock:
+            # Entries are ordered by last use, so the entries of this request are at the back and idle entries at the
+            # front
+            self._evict(max(self.max_entries, len(messages)))
+            oldest_request = self._request - self.max_idle_requests
+            while self._entries and next(iter(self._entries.values())).request <= oldest_request:
+                self._entries.popitem(last=False)
+
+        return values
+
+    def discard(self, message: Message) -> None:
+        """Remove a message from the cache.
+
+        Args:
+            message: Message to remove.
+        """
+        with self._lock:
+            self._entries.pop(id(message), None)
+
+    def clear(self) -> None:
+        """Remove all messages from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+def invalidate_formatted_messages(messages: Iterable[Message]) -> None:
+    """Remove messages from the formatted message cache of every model.
+
+    Args:
+        messages: Messages that were changed or removed from a conversation.
+    """
+    with _caches_lock:
+        caches = list(_caches)
+
+    for message in messages:
+        for cache in caches:
+            cache.discard(message)
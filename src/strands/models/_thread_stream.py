@@ -0,0 +1,236 @@
+"""Streaming of blocking model clients from worker threads.
+
+Clients such as boto3 only offer blocking streaming APIs, so the stream is consumed on a worker thread and its events
+are handed to the event loop.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextvars
+import functools
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from ..telemetry.metrics import MetricsClient
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class StreamExecutorStats:
+    """Snapshot of the load on the threads streaming model responses.
+
+    Attributes:
+        max_workers: Number of threads in the dedicated pool, or None when the event loop's default executor is used.
+        active: Streams currently running on a thread.
+        queued: Streams waiting for a free thread.
+        peak_active: Largest number of streams that were running at the same time.
+        peak_queued: Largest number of streams that were waiting for a free thread at the same time.
+        submitted: Streams submitted since the model was created.
+        total_queue_wait: Total seconds streams spent waiting for a free thread.
+        events: Events handed from the streaming threads to the event loop.
+        wakeups: Times a streaming thread woke up the event loop to receive events.
+    """
+
+    max_workers: Optional[int] = None
+    active: int = 0
+    queued: int = 0
+    peak_active: int = 0
+    peak_queued: int = 0
+    submitted: int = 0
+    total_queue_wait: float = 0.0
+    events: int = 0
+    wakeups: int = 0
+
+    @property
+    def saturation(self) -> Optional[float]:
+        """Fraction of the dedicated pool's threads that are busy, or None without a dedicated pool."""
+        if not self.max_workers:
+            return None
+        return self.active / self.max_workers
+
+    @property
+    def average_queue_wait(self) -> float:
+        """Average seconds a stream waited for a free thread."""
+        return self.total_queue_wait / self.submitted if self.submitted else 0.0
+
+
+class StreamThreadPool:
+    """Runs blocking streams on worker threads while tracking how saturated the threads are.
+
+    Without a size, streams run on the event loop's default executor like `asyncio.to_thread`, where they compete with
+    every other blocking call in the process. A sized pool dedicates threads to the owning model instead.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_name_prefix: str = "strands-model-stream") -> None:
+        """Initialize the pool.
+
+        The threads of a dedicated pool are started lazily as streams are submitted.
+
+        Args:
+            max_workers: Number of dedicated threads, or None to use the event loop's default executor.
+            thread_name_prefix: Prefix of the dedicated threads' names.
+        """
+        self._executor = (
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+            if max_workers is not None
+            else None
+        )
+        # Shuts the dedicated threads down when the pool is garbage collected without being shut down
+        self._finalizer = (
+            weakref.finalize(self, self._executor.shutdown, wait=False) if self._executor is not None else None
+        )
+        self._stats = StreamExecutorStats(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._metrics_client = MetricsClient()
+
+    @property
+    def stats(self) -> StreamExecutorStats:
+        """Copy of the current statistics."""
+        with self._lock:
+            return StreamExecutorStats(**vars(self._stats))
+
+    async def run(self, func: Callable[..., R], *args: Any, attributes: Optional[dict[str, Any]] = None) -> R:
+        """Run a blocking function on a worker thread.
+
+        The function runs in a copy of the current context, as it would with `asyncio.to_thread`.
+
+        Args:
+            func: Blocking function.
+            *args: Arguments of the function.
+            attributes: Attributes of the recorded metrics.
+
+        Returns:
+            The result of the function.
+        """
+        submitted_at = time.perf_counter()
+        started = abandoned = False
+        with self._lock:
+            self._stats.submitted += 1
+            self._stats.queued += 1
+            self._stats.peak_queued = max(self._stats.peak_queued, self._stats.queued)
+
+        def work() -> R:
+            nonlocal started
+            queue_wait = time.perf_counter() - submitted_at
+            with self._lock:
+                if abandoned:
+                    raise asyncio.CancelledError()
+
+                started = True
+                self._stats.queued -= 1
+                self._stats.active += 1
+                self._stats.peak_active = max(self._stats.peak_active, self._stats.active)
+                self._stats.total_queue_wait += queue_wait
+                active = self._stats.active
+
+            self._metrics_client.model_executor_queue_wait.record(queue_wait, attributes=attributes)
+            self._metrics_client.model_executor_active.record(active, attributes=attributes)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._stats.active -= 1
+
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, functools.partial(context.run, work))
+        except asyncio.CancelledError:
+            with self._lock:
+                if not started:
+                    # Never picked up by a thread, so it leaves the queue without running
+                    abandoned = True
+                    self._stats.queued -= 1
+            raise
+
+    def add_handoffs(self, events: int, wakeups: int) -> None:
+        """Record events handed from a streaming thread to the event loop.
+
+        Args:
+            events: Number of events handed off.
+            wakeups: Number of times the streaming thread woke up the event loop to receive them.
+        """
+        with self._lock:
+            self._stats.events += events
+            self._stats.wakeups += wakeups
+
+    def shutdown(self) -> None:
+        """Release the dedicated threads once the streams running on them complete."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+class ThreadStreamChannel(Generic[T]):
+    """Hands events produced on a worker thread to the event loop in batches.
+
+    Scheduling a callback on the event loop for every event costs a cross-thread wakeup per token. The channel instead
+    buffers events and only wakes the event loop when it is not already about to drain the buffer, so every wakeup
+    receives all events produced since the previous one.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the channel.
+
+        Args:
+            loop: Event loop consuming the events.
+        """
+        self._loop = loop
+        self._events: collections.deque[T] = collections.deque()
+        self._lock = threading.Lock()
+        self._ready = asyncio.Event()
+        self._wakeup_scheduled = False
+        self._closed = False
+        self.events = 0
+        self.wakeups = 0
+
+    def put(self, event: T) -> None:
+        """Add an event, called from the worker thread.
+
+        Args:
+            event: Event to hand off.
+        """
+        with self._lock:
+            self._events.append(event)
+            self.events += 1
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+            self.wakeups += 1
+
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    def close(self) -> None:
+        """Signal that no more events will be added, called from the worker thread."""
+        with self._lock:
+            self._closed = True
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+            self.wakeups += 1
+
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def get_batch(self) -> list[T]:
+        """Wait for events and take every event added so far.
+
+        Returns:
+            The events in the order they were added, or an empty list once the channel is closed and drained.
+        """
+        while True:
+            with self._lock:
+                if self._events or self._closed:
+                    events = list(self._events)
+                    self._events.clear()
+                    # Events added from now on need a new wakeup, a pending one only causes a spurious check
+                    self._wakeup_scheduled = False
+                    return events
+
+                self._ready.clear()
+
+            await self._ready.wait()
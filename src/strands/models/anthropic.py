@@ -15,10 +15,11 @@ from typing_extensions import Required, Unpack, override
 
 from ..event_loop.streaming import process_stream
 from ..tools.structured_output.structured_output_utils import convert_pydantic_to_tool_spec
-from ..types.content import ContentBlock, Messages
+from ..types.content import ContentBlock, Message, Messages
 from ..types.exceptions import ContextWindowOverflowException, ModelThrottledException
 from ..types.streaming import StreamEvent
 from ..types.tools import ToolChoice, ToolChoiceToolDict, ToolSpec
+from ._message_cache import FormattedMessageCache
 from ._validation import validate_config_keys
 from .model import Model
 
@@ -76,6 +77,7 @@ class AnthropicModel(Model):
 
         client_args = client_args or {}
         self.client = anthropic.AsyncAnthropic(**client_args)
+        self._message_cache: FormattedMessageCache[Optional[dict[str, Any]]] = FormattedMessageCache()
 
     @override
     def update_config(self, **model_config: Unpack[AnthropicConfig]) -> None:  # type: ignore[override]
@@ -178,22 +180,30 @@ class AnthropicModel(Model):
         Returns:
             An Anthropic messages array.
         """
-        formatted_messages = []
+        # Messages already formatted by earlier requests are reused unless they changed since
+        formatted_messages = self._message_cache.get_all(messages, self._format_request_message)
 
-        for message in messages:
-            formatted_contents: list[dict[str, Any]] = []
+        return [formatted_message for formatted_message in formatted_messages if formatted_message is not None]
 
-            for content in message["content"]:
-                if "cachePoint" in content:
-                    formatted_contents[-1]["cache_control"] = {"type": "ephemeral"}
-                    continue
+    def _format_request_message(self, message: Message) -> Optional[dict[str, Any]]:
+        """Format an Anthropic message.
 
-                formatted_contents.append(self._format_request_message_content(content))
+        Args:
+            message: Message object to be processed by the model.
+
+        Returns:
+            An Anthropic message, or None if the message has no content.
+        """
+        formatted_contents: list[dict[str, Any]] = []
+
+        for content in message["content"]:
+            if "cachePoint" in content:
+                formatted_contents[-1]["cache_control"] = {"type": "ephemeral"}
+                continue
 
-            if formatted_contents:
-                formatted_messages.append({"content": formatted_contents, "role": message["role"]})
+            formatted_contents.append(self._format_request_message_content(content))
 
-        return formatted_messages
+        return {"content": formatted_contents, "role": message["role"]} if formatted_contents else None
 
     def format_request(
         self,
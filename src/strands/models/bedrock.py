@@ -20,13 +20,15 @@ from .._exception_notes import add_exception_note
 from ..event_loop import streaming
 from ..tools import convert_pydantic_to_tool_spec
 from ..tools._tool_helpers import noop_tool
-from ..types.content import ContentBlock, Messages, SystemContentBlock
+from ..types.content import ContentBlock, Message, Messages, SystemContentBlock
 from ..types.exceptions import (
     ContextWindowOverflowException,
     ModelThrottledException,
 )
 from ..types.streaming import CitationsDelta, StreamEvent
 from ..types.tools import ToolChoice, ToolSpec
+from ._message_cache import FormattedMessageCache
+from ._thread_stream import StreamExecutorStats, StreamThreadPool, ThreadStreamChannel
 from ._validation import validate_config_keys
 from .model import Model
 
@@ -120,6 +122,7 @@ class BedrockModel(Model):
         boto_client_config: Optional[BotocoreConfig] = None,
         region_name: Optional[str] = None,
         endpoint_url: Optional[str] = None,
+        max_stream_workers: Optional[int] = None,
         **model_config: Unpack[BedrockConfig],
     ):
         """Initialize provider instance.
@@ -130,13 +133,22 @@ class BedrockModel(Model):
             region_name: AWS region to use for the Bedrock service.
                 Defaults to the AWS_REGION environment variable if set, or "us-west-2" if not set.
             endpoint_url: Custom endpoint URL for VPC endpoints (PrivateLink)
+            max_stream_workers: Size of a thread pool dedicated to this model for consuming the blocking Bedrock
+                streams. Defaults to running streams on the event loop's default executor, which is shared with every
+                other blocking call in the process. With the default client configuration, the client's connection
+                pool is sized to match.
             **model_config: Configuration options for the Bedrock model.
         """
         if region_name and boto_session:
             raise ValueError("Cannot specify both `region_name` and `boto_session`.")
+        if max_stream_workers is not None and max_stream_workers < 1:
+            raise ValueError(f"max_stream_workers=<{max_stream_workers}> | must be at least 1")
 
         session = boto_session or boto3.Session()
         resolved_region = region_name or session.region_name or os.environ.get("AWS_REGION") or DEFAULT_BEDROCK_REGION
+        self._message_cache: FormattedMessageCache[tuple[Optional[dict[str, Any]], bool, bool]] = (
+            FormattedMessageCache()
+        )
         self.config = BedrockModel.BedrockConfig(
             model_id=BedrockModel._get_default_model_with_warning(resolved_region, model_config),
             include_tool_result_status="auto",
@@ -158,6 +170,9 @@ class BedrockModel(Model):
             client_config = boto_client_config.merge(BotocoreConfig(user_agent_extra=new_user_agent))
         else:
             client_config = BotocoreConfig(user_agent_extra="strands-agents", read_timeout=DEFAULT_READ_TIMEOUT)
+            if max_stream_workers is not None:
+                # Each concurrent stream holds a connection for its whole duration
+                client_config = client_config.merge(BotocoreConfig(max_pool_connections=max_stream_workers))
 
         self.client = session.client(
             service_name="bedrock-runtime",
@@ -168,6 +183,25 @@ class BedrockModel(Model):
 
         logger.debug("region=<%s> | bedrock client created", self.client.meta.region_name)
 
+        self._stream_pool = StreamThreadPool(max_stream_workers, thread_name_prefix="strands-bedrock-stream")
+
+    @property
+    def stream_executor_stats(self) -> StreamExecutorStats:
+        """Load on the threads consuming Bedrock streams for this model.
+
+        A high `queued` count or `average_queue_wait` means streams wait for a free thread, in which case a larger
+        `max_stream_workers` increases throughput.
+        """
+        return self._stream_pool.stats
+
+    def close(self) -> None:
+        """Release the threads dedicated to consuming streams once the running streams complete.
+
+        The threads are also released when the model is garbage collected. Streams started after closing fail. Models
+        without `max_stream_workers` have no dedicated threads, so closing them has no effect.
+        """
+        self._stream_pool.shutdown()
+
     @override
     def update_config(self, **model_config: Unpack[BedrockConfig]) -> None:  # type: ignore
         """Update the Bedrock Model configuration with the provided arguments.
@@ -177,6 +211,8 @@ class BedrockModel(Model):
         """
         validate_config_keys(model_config, self.BedrockConfig)
         self.config.update(model_config)
+        # The message format depends on the model id and tool result status settings
+        self._message_cache.clear()
 
     @override
     def get_config(self) -> BedrockConfig:
@@ -321,28 +357,14 @@ class BedrockModel(Model):
         filtered_unknown_members = False
         dropped_deepseek_reasoning_content = False
 
-        for message in messages:
-            cleaned_content: list[dict[str, Any]] = []
-
-            for content_block in message["content"]:
-                # Filter out SDK_UNKNOWN_MEMBER content blocks
-                if "SDK_UNKNOWN_MEMBER" in content_block:
-                    filtered_unknown_members = True
-                    continue
+        # Messages already formatted by earlier requests are reused unless they changed since
+        for cleaned_message, filtered, dropped in self._message_cache.get_all(messages, self._format_bedrock_message):
+            filtered_unknown_members |= filtered
+            dropped_deepseek_reasoning_content |= dropped
 
-                # DeepSeek models have issues with reasoningContent
-                # TODO: Replace with systematic model configuration registry (https://github.com/strands-agents/sdk-python/issues/780)
-                if "deepseek" in self.config["model_id"].lower() and "reasoningContent" in content_block:
-                    dropped_deepseek_reasoning_content = True
-                    continue
-
-                # Format content blocks for Bedrock API compatibility
-                formatted_content = self._format_request_message_content(content_block)
-                cleaned_content.append(formatted_content)
-
-            # Create new message with cleaned content (skip if empty)
-            if cleaned_content:
-                cleaned_messages.append({"content": cleaned_content, "role": message["role"]})
+            # Skip messages left without content
+            if cleaned_message is not None:
+                cleaned_messages.append(cleaned_message)
 
         if filtered_unknown_members:
             logger.warning(
@@ -355,6 +377,40 @@ class BedrockModel(Model):
 
         return cleaned_messages
 
+    def _format_bedrock_message(self, message: Message) -> tuple[Optional[dict[str, Any]], bool, bool]:
+        """Format a single message for Bedrock API compatibility.
+
+        Args:
+            message: Message to format.
+
+        Returns:
+            The formatted message, or None if no content is left after filtering, along with whether
+            SDK_UNKNOWN_MEMBER content blocks were filtered and whether DeepSeek reasoning content was dropped.
+        """
+        cleaned_content: list[dict[str, Any]] = []
+
+        filtered_unknown_members = False
+        dropped_deepseek_reasoning_content = False
+
+        for content_block in message["content"]:
+            # Filter out SDK_UNKNOWN_MEMBER content blocks
+            if "SDK_UNKNOWN_MEMBER" in content_block:
+                filtered_unknown_members = True
+                continue
+
+            # DeepSeek models have issues with reasoningContent
+            # TODO: Replace with systematic model configuration registry (https://github.com/strands-agents/sdk-python/issues/780)
+            if "deepseek" in self.config["model_id"].lower() and "reasoningContent" in content_block:
+                dropped_deepseek_reasoning_content = True
+                continue
+
+            # Format content blocks for Bedrock API compatibility
+            formatted_content = self._format_request_message_content(content_block)
+            cleaned_content.append(formatted_content)
+
+        cleaned_message = {"content": cleaned_content, "role": message["role"]} if cleaned_content else None
+        return cleaned_message, filtered_unknown_members, dropped_deepseek_reasoning_content
+
     def _should_include_tool_result_status(self) -> bool:
         """Determine whether to include tool result status based on current config."""
         include_status = self.config.get("include_tool_result_status", "auto")
@@ -612,28 +668,36 @@ class BedrockModel(Model):
             ContextWindowOverflowException: If the input exceeds the model's context window.
             ModelThrottledException: If the model service is throttling requests.
         """
+        # Events are handed over in batches, so a busy stream wakes up the event loop once per batch, not per token
+        channel: ThreadStreamChannel[StreamEvent] = ThreadStreamChannel(asyncio.get_running_loop())
 
         def callback(event: Optional[StreamEvent] = None) -> None:
-            loop.call_soon_threadsafe(queue.put_nowait, event)
             if event is None:
-                return
-
-        loop = asyncio.get_event_loop()
-        queue: asyncio.Queue[Optional[StreamEvent]] = asyncio.Queue()
+                channel.close()
+            else:
+                channel.put(event)
 
         # Handle backward compatibility: if system_prompt is provided but system_prompt_content is None
         if system_prompt and system_prompt_content is None:
             system_prompt_content = [{"text": system_prompt}]
 
-        thread = asyncio.to_thread(self._stream, callback, messages, tool_specs, system_prompt_content, tool_choice)
+        thread = self._stream_pool.run(
+            self._stream,
+            callback,
+            messages,
+            tool_specs,
+            system_prompt_content,
+            tool_choice,
+            attributes={"model_id": self.config["model_id"]},
+        )
         task = asyncio.create_task(thread)
 
-        while True:
-            event = await queue.get()
-            if event is None:
-                break
-
-            yield event
+        try:
+            while events := await channel.get_batch():
+                for event in events:
+                    yield event
+        finally:
+            self._stream_pool.add_handoffs(channel.events, channel.wakeups)
 
         await task
 
@@ -16,6 +16,7 @@ from ..types.content import ContentBlock, Messages
 from ..types.exceptions import ContextWindowOverflowException, ModelThrottledException
 from ..types.streaming import StreamEvent
 from ..types.tools import ToolChoice, ToolSpec
+from ._client_pool import ClientPool
 from ._validation import validate_config_keys
 from .model import Model
 
@@ -85,6 +86,7 @@ class GeminiModel(Model):
 
         self._custom_client = client
         self.client_args = client_args or {}
+        self._client_pool = ClientPool(lambda: genai.Client(**self.client_args).aio)
 
         # Validate gemini_tools if provided
         if "gemini_tools" in self.config:
@@ -114,23 +116,23 @@ class GeminiModel(Model):
         """
         return self.config
 
-    def _get_client(self) -> genai.Client:
-        """Get a Gemini client for making requests.
+    async def _get_client(self) -> genai.client.AsyncClient:
+        """Get an async Gemini client for making requests.
 
         This method handles client lifecycle management:
         - If an injected client was provided during initialization, it returns that client
           without managing its lifecycle (caller is responsible for cleanup).
-        - Otherwise, creates a new genai.Client from client_args.
+        - Otherwise, returns the pooled client of the running event loop. The client is created from client_args on
+          first use and closed when the event loop shuts down.
 
         Returns:
-            genai.Client: A Gemini client instance.
+            genai.client.AsyncClient: An async Gemini client instance.
         """
         if self._custom_client is not None:
             # Use the injected client (caller manages lifecycle)
-            return self._custom_client
+            return self._custom_client.aio
         else:
-            # Create a new client from client_args
-            return genai.Client(**self.client_args)
+            return await self._client_pool.acquire()
 
     def _format_request_content_part(self, content: ContentBlock) -> genai.types.Part:
         """Format content block into a Gemini part instance.
@@ -417,7 +419,7 @@ class GeminiModel(Model):
         """
         request = self._format_request(messages, tool_specs, system_prompt, self.config.get("params"))
 
-        client = self._get_client().aio
+        client = await self._get_client()
 
         try:
             response = await client.models.generate_content_stream(**request)
@@ -501,7 +503,7 @@ class GeminiModel(Model):
             "response_schema": output_model.model_json_schema(),
         }
         request = self._format_request(prompt, None, system_prompt, params)
-        client = self._get_client().aio
+        client = await self._get_client()
         response = await client.models.generate_content(**request)
         yield {"output": output_model.model_validate(response.parsed)}
 
@@ -19,6 +19,7 @@ from ..types.event_loop import Usage
 from ..types.exceptions import ContextWindowOverflowException
 from ..types.streaming import MetadataEvent, StreamEvent
 from ..types.tools import ToolChoice, ToolSpec
+from ._message_cache import FormattedMessageCache
 from ._validation import validate_config_keys
 from .openai import OpenAIModel
 
@@ -54,6 +55,7 @@ class LiteLLMModel(OpenAIModel):
             **model_config: Configuration options for the LiteLLM model.
         """
         self.client_args = client_args or {}
+        self._message_cache: FormattedMessageCache[list[dict[str, Any]]] = FormattedMessageCache()
         validate_config_keys(model_config, self.LiteLLMConfig)
         self.config = dict(model_config)
         self._apply_proxy_prefix()
@@ -191,7 +193,7 @@ class LiteLLMModel(OpenAIModel):
             A LiteLLM compatible messages array.
         """
         formatted_messages = cls._format_system_messages(system_prompt, system_prompt_content=system_prompt_content)
-        formatted_messages.extend(cls._format_regular_messages(messages))
+        formatted_messages.extend(cls._format_regular_messages(messages, message_cache=kwargs.get("message_cache")))
 
         return [message for message in formatted_messages if message["content"] or "tool_calls" in message]
 
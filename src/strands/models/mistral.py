@@ -6,7 +6,8 @@
 import base64
 import json
 import logging
-from typing import Any, AsyncGenerator, Iterable, Optional, Type, TypeVar, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Iterable, Optional, Type, TypeVar, Union
 
 import mistralai
 from pydantic import BaseModel
@@ -16,6 +17,7 @@ from ..types.content import ContentBlock, Messages
 from ..types.exceptions import ModelThrottledException
 from ..types.streaming import StopReason, StreamEvent
 from ..types.tools import ToolChoice, ToolResult, ToolSpec, ToolUse
+from ._client_pool import ClientPool
 from ._validation import validate_config_keys, warn_on_tool_choice_not_supported
 from .model import Model
 
@@ -95,6 +97,7 @@ class MistralModel(Model):
         self.client_args = client_args or {}
         if api_key:
             self.client_args["api_key"] = api_key
+        self._client_pool = ClientPool(lambda: mistralai.Mistral(**self.client_args))
 
     @override
     def update_config(self, **model_config: Unpack[MistralConfig]) -> None:  # type: ignore
@@ -391,6 +394,18 @@ class MistralModel(Model):
         if hasattr(response, "usage") and response.usage:
             yield {"chunk_type": "metadata", "data": response.usage}
 
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncIterator[mistralai.Mistral]:
+        """Get the Mistral client of the running event loop.
+
+        The client is created from client_args on first use in each event loop and reused by later requests on the
+        same loop, so connections are kept alive across requests. It is closed when the event loop shuts down.
+
+        Yields:
+            A Mistral client instance.
+        """
+        yield await self._client_pool.acquire()
+
     @override
     async def stream(
         self,
@@ -428,7 +443,7 @@ class MistralModel(Model):
             logger.debug("got response from model")
             if not self.config.get("stream", True):
                 # Use non-streaming API
-                async with mistralai.Mistral(**self.client_args) as client:
+                async with self._get_client() as client:
                     response = await client.chat.complete_async(**request)
                     for event in self._handle_non_streaming_response(response):
                         yield self.format_chunk(event)
@@ -436,7 +451,7 @@ class MistralModel(Model):
                 return
 
             # Use the streaming API
-            async with mistralai.Mistral(**self.client_args) as client:
+            async with self._get_client() as client:
                 stream_response = await client.chat.stream_async(**request)
 
                 yield self.format_chunk({"chunk_type": "message_start"})
@@ -529,7 +544,7 @@ class MistralModel(Model):
         formatted_request["tool_choice"] = "any"
         formatted_request["parallel_tool_calls"] = False
 
-        async with mistralai.Mistral(**self.client_args) as client:
+        async with self._get_client() as client:
             response = await client.chat.complete_async(**formatted_request)
 
         if response.choices and response.choices[0].message.tool_calls:
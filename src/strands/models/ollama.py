@@ -14,6 +14,7 @@ from typing_extensions import TypedDict, Unpack, override
 from ..types.content import ContentBlock, Messages
 from ..types.streaming import StopReason, StreamEvent
 from ..types.tools import ToolChoice, ToolSpec
+from ._client_pool import ClientPool
 from ._validation import validate_config_keys, warn_on_tool_choice_not_supported
 from .model import Model
 
@@ -71,6 +72,7 @@ class OllamaModel(Model):
         """
         self.host = host
         self.client_args = ollama_client_args or {}
+        self._client_pool = ClientPool(lambda: ollama.AsyncClient(self.host, **self.client_args))
         validate_config_keys(model_config, self.OllamaConfig)
         self.config = OllamaModel.OllamaConfig(**model_config)
 
@@ -313,7 +315,7 @@ class OllamaModel(Model):
         logger.debug("invoking model")
         tool_requested = False
 
-        client = ollama.AsyncClient(self.host, **self.client_args)
+        client = await self._client_pool.acquire()
         response = await client.chat(**request)
 
         logger.debug("got response from model")
@@ -356,7 +358,7 @@ class OllamaModel(Model):
         formatted_request["format"] = output_model.model_json_schema()
         formatted_request["stream"] = False
 
-        client = ollama.AsyncClient(self.host, **self.client_args)
+        client = await self._client_pool.acquire()
         response = await client.chat(**formatted_request)
 
         try:
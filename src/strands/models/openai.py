@@ -15,10 +15,12 @@ from openai.types.chat.parsed_chat_completion import ParsedChatCompletion
 from pydantic import BaseModel
 from typing_extensions import Unpack, override
 
-from ..types.content import ContentBlock, Messages, SystemContentBlock
+from ..types.content import ContentBlock, Message, Messages, SystemContentBlock
 from ..types.exceptions import ContextWindowOverflowException, ModelThrottledException
 from ..types.streaming import StreamEvent
 from ..types.tools import ToolChoice, ToolResult, ToolSpec, ToolUse
+from ._client_pool import ClientPool
+from ._message_cache import FormattedMessageCache
 from ._validation import validate_config_keys
 from .model import Model
 
@@ -90,6 +92,8 @@ class OpenAIModel(Model):
 
         self._custom_client = client
         self.client_args = client_args or {}
+        self._client_pool = ClientPool(lambda: openai.AsyncOpenAI(**self.client_args))
+        self._message_cache: FormattedMessageCache[list[dict[str, Any]]] = FormattedMessageCache()
 
         logger.debug("config=<%s> | initializing", self.config)
 
@@ -318,55 +322,79 @@ class OpenAIModel(Model):
         ]
 
     @classmethod
-    def _format_regular_messages(cls, messages: Messages, **kwargs: Any) -> list[dict[str, Any]]:
+    def _format_regular_messages(
+        cls,
+        messages: Messages,
+        *,
+        message_cache: Optional[FormattedMessageCache[list[dict[str, Any]]]] = None,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
         """Format regular messages for OpenAI-compatible providers.
 
         Args:
             messages: List of message objects to be processed by the model.
+            message_cache: Cache of previously formatted messages to reuse.
             **kwargs: Additional keyword arguments for future extensibility.
 
         Returns:
             List of formatted messages.
         """
+        if message_cache is not None:
+            message_formats = message_cache.get_all(messages, cls._format_regular_message)
+        else:
+            message_formats = [cls._format_regular_message(message) for message in messages]
+
         formatted_messages = []
+        for message_format in message_formats:
+            formatted_messages.extend(message_format)
 
-        for message in messages:
-            contents = message["content"]
+        return formatted_messages
 
-            # Check for reasoningContent and warn user
-            if any("reasoningContent" in content for content in contents):
-                logger.warning(
-                    "reasoningContent is not supported in multi-turn conversations with the Chat Completions API."
-                )
+    @classmethod
+    def _format_regular_message(cls, message: Message) -> list[dict[str, Any]]:
+        """Format a regular message for OpenAI-compatible providers.
 
-            formatted_contents = [
-                cls.format_request_message_content(content)
-                for content in contents
-                if not any(block_type in content for block_type in ["toolResult", "toolUse", "reasoningContent"])
-            ]
-            formatted_tool_calls = [
-                cls.format_request_message_tool_call(content["toolUse"]) for content in contents if "toolUse" in content
-            ]
-            formatted_tool_messages = [
-                cls.format_request_tool_message(content["toolResult"])
-                for content in contents
-                if "toolResult" in content
-            ]
-
-            formatted_message = {
-                "role": message["role"],
-                "content": formatted_contents,
-                **({"tool_calls": formatted_tool_calls} if formatted_tool_calls else {}),
-            }
-            formatted_messages.append(formatted_message)
+        Args:
+            message: Message object to be processed by the model.
+
+        Returns:
+            The formatted message, followed by a message for each tool result and for the images they contain.
+        """
+        formatted_messages = []
+        contents = message["content"]
+
+        # Check for reasoningContent and warn user
+        if any("reasoningContent" in content for content in contents):
+            logger.warning(
+                "reasoningContent is not supported in multi-turn conversations with the Chat Completions API."
+            )
+
+        formatted_contents = [
+            cls.format_request_message_content(content)
+            for content in contents
+            if not any(block_type in content for block_type in ["toolResult", "toolUse", "reasoningContent"])
+        ]
+        formatted_tool_calls = [
+            cls.format_request_message_tool_call(content["toolUse"]) for content in contents if "toolUse" in content
+        ]
+        formatted_tool_messages = [
+            cls.format_request_tool_message(content["toolResult"]) for content in contents if "toolResult" in content
+        ]
+
+        formatted_message = {
+            "role": message["role"],
+            "content": formatted_contents,
+            **({"tool_calls": formatted_tool_calls} if formatted_tool_calls else {}),
+        }
+        formatted_messages.append(formatted_message)
 
-            # Process tool messages to extract images into separate user messages
-            # OpenAI API requires images to be in user role messages only
-            for tool_msg in formatted_tool_messages:
-                tool_msg_clean, user_msg_with_images = cls._split_tool_message_images(tool_msg)
-                formatted_messages.append(tool_msg_clean)
-                if user_msg_with_images:
-                    formatted_messages.append(user_msg_with_images)
+        # Process tool messages to extract images into separate user messages
+        # OpenAI API requires images to be in user role messages only
+        for tool_msg in formatted_tool_messages:
+            tool_msg_clean, user_msg_with_images = cls._split_tool_message_images(tool_msg)
+            formatted_messages.append(tool_msg_clean)
+            if user_msg_with_images:
+                formatted_messages.append(user_msg_with_images)
 
         return formatted_messages
 
@@ -391,7 +419,7 @@ class OpenAIModel(Model):
             An OpenAI compatible messages array.
         """
         formatted_messages = cls._format_system_messages(system_prompt, system_prompt_content=system_prompt_content)
-        formatted_messages.extend(cls._format_regular_messages(messages))
+        formatted_messages.extend(cls._format_regular_messages(messages, message_cache=kwargs.get("message_cache")))
 
         return [message for message in formatted_messages if message["content"] or "tool_calls" in message]
 
@@ -424,7 +452,7 @@ class OpenAIModel(Model):
         """
         return {
             "messages": self.format_request_messages(
-                messages, system_prompt, system_prompt_content=system_prompt_content
+                messages, system_prompt, system_prompt_content=system_prompt_content, message_cache=self._message_cache
             ),
             "model": self.config["model_id"],
             "stream": True,
@@ -524,12 +552,12 @@ class OpenAIModel(Model):
         This context manager handles client lifecycle management:
         - If an injected client was provided during initialization, it yields that client
           without closing it (caller manages lifecycle).
-        - Otherwise, creates a new AsyncOpenAI client from client_args and automatically
-          closes it when the context exits.
+        - Otherwise, yields the pooled AsyncOpenAI client of the running event loop. The client is created from
+          client_args on first use and closed when the event loop shuts down.
 
-        Note: We create a new client per request to avoid connection sharing in the underlying
-        httpx client, as the asyncio event loop does not allow connections to be shared.
-        For more details, see https://github.com/encode/httpx/discussions/2959.
+        Note: Pooled clients are never shared across event loops, as the asyncio event loop does not allow the
+        connections of the underlying httpx client to be shared. For more details, see
+        https://github.com/encode/httpx/discussions/2959.
 
         Yields:
             Client: An OpenAI-compatible client instance.
@@ -538,12 +566,7 @@ class OpenAIModel(Model):
             # Use the injected client (caller manages lifecycle)
             yield self._custom_client
         else:
-            # Create a new client from client_args
-            # We initialize an OpenAI context on every request so as to avoid connection sharing in the underlying
-            # httpx client. The asyncio event loop does not allow connections to be shared. For more details, please
-            # refer to https://github.com/encode/httpx/discussions/2959.
-            async with openai.AsyncOpenAI(**self.client_args) as client:
-                yield client
+            yield await self._client_pool.acquire()
 
     @override
     async def stream(
@@ -577,9 +600,6 @@ class OpenAIModel(Model):
 
         logger.debug("invoking model")
 
-        # We initialize an OpenAI context on every request so as to avoid connection sharing in the underlying httpx
-        # client. The asyncio event loop does not allow connections to be shared. For more details, please refer to
-        # https://github.com/encode/httpx/discussions/2959.
         async with self._get_client() as client:
             try:
                 response = await client.chat.completions.create(**request)
@@ -696,9 +716,6 @@ class OpenAIModel(Model):
             ContextWindowOverflowException: If the input exceeds the model's context window.
             ModelThrottledException: If the request is throttled by OpenAI (rate limits).
         """
-        # We initialize an OpenAI context on every request so as to avoid connection sharing in the underlying httpx
-        # client. The asyncio event loop does not allow connections to be shared. For more details, please refer to
-        # https://github.com/encode/httpx/discussions/2959.
         async with self._get_client() as client:
             try:
                 response: ParsedChatCompletion = await client.beta.chat.completions.parse(
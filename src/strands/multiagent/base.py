@@ -8,9 +8,9 @@ import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, AsyncIterator, Mapping, Union
+from typing import Any, AsyncIterator, Mapping, Optional, Union
 
-from .._async import run_async
+from .._async import EventLoopRunner, run_async
 from ..agent import AgentResult
 from ..interrupt import Interrupt
 from ..types.event_loop import Metrics, Usage
@@ -182,9 +182,11 @@ class MultiAgentBase(ABC):
 
     Attributes:
         id: Unique MultiAgent id for session management,etc.
+        event_loop_runner: Long-lived event loop used by synchronous calls, or None to use a new loop per call.
     """
 
     id: str
+    event_loop_runner: Optional[EventLoopRunner] = None
 
     @abstractmethod
     async def invoke_async(
@@ -243,7 +245,7 @@ class MultiAgentBase(ABC):
             invocation_state.update(kwargs)
             warnings.warn("`**kwargs` parameter is deprecating, use `invocation_state` instead.", stacklevel=2)
 
-        return run_async(lambda: self.invoke_async(task, invocation_state))
+        return run_async(lambda: self.invoke_async(task, invocation_state), self.event_loop_runner)
 
     def serialize_state(self) -> dict[str, Any]:
         """Return a JSON-serializable snapshot of the orchestrator state."""
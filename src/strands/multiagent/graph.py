@@ -12,18 +12,20 @@ Key Features:
 - Support for cyclic graphs (feedback loops)
 - Clear dependency management
 - Supports nested graphs (Graph as a node in another Graph)
+- Batch or dataflow scheduling with an optional cap on concurrently executing nodes
 """
 
 import asyncio
+import collections
 import copy
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Callable, Mapping, Optional, Tuple, cast
+from typing import Any, AsyncIterator, Callable, Collection, Literal, Mapping, Optional, Tuple, cast
 
 from opentelemetry import trace as trace_api
 
-from .._async import run_async
+from .._async import EventLoopRunner, run_async
 from ..agent import Agent
 from ..agent.state import AgentState
 from ..experimental.hooks.multiagent import (
@@ -54,6 +56,15 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_GRAPH_ID = "default_graph"
 
+GraphScheduler = Literal["batch", "dataflow"]
+"""How the graph decides when to execute nodes.
+
+- "batch": ready nodes execute together and the next batch starts once the whole batch has completed.
+- "dataflow": each node starts as soon as the nodes it depends on have completed, without waiting for unrelated nodes.
+"""
+
+GRAPH_SCHEDULERS: tuple[GraphScheduler, ...] = ("batch", "dataflow")
+
 
 @dataclass
 class GraphState:
@@ -240,6 +251,9 @@ class GraphBuilder:
         self._id: str = _DEFAULT_GRAPH_ID
         self._session_manager: Optional[SessionManager] = None
         self._hooks: Optional[list[HookProvider]] = None
+        self._event_loop_runner: Optional[EventLoopRunner] = None
+        self._scheduler: GraphScheduler = "batch"
+        self._max_parallelism: Optional[int] = None
 
     def add_node(self, executor: Agent | MultiAgentBase, node_id: str | None = None) -> GraphNode:
         """Add an Agent or MultiAgentBase instance as a node to the graph."""
@@ -357,6 +371,34 @@ class GraphBuilder:
         self._hooks = hooks
         return self
 
+    def set_event_loop_runner(self, event_loop_runner: EventLoopRunner) -> "GraphBuilder":
+        """Set the long-lived event loop used when the graph is invoked synchronously.
+
+        Args:
+            event_loop_runner: EventLoopRunner instance, e.g. `EventLoopRunner.shared()`
+        """
+        self._event_loop_runner = event_loop_runner
+        return self
+
+    def set_scheduler(self, scheduler: GraphScheduler) -> "GraphBuilder":
+        """Set how the graph schedules node execution.
+
+        Args:
+            scheduler: "batch" to execute ready nodes in lock-step batches, or "dataflow" to start each node as soon
+                as the nodes it depends on have completed
+        """
+        self._scheduler = scheduler
+        return self
+
+    def set_max_parallelism(self, max_parallelism: Optional[int]) -> "GraphBuilder":
+        """Set the maximum number of nodes executing concurrently.
+
+        Args:
+            max_parallelism: Maximum concurrently executing nodes (None for no limit)
+        """
+        self._max_parallelism = max_parallelism
+        return self
+
     def build(self) -> "Graph":
         """Build and validate the graph with configured settings."""
         if not self.nodes:
@@ -385,6 +427,9 @@ class GraphBuilder:
             session_manager=self._session_manager,
             hooks=self._hooks,
             id=self._id,
+            event_loop_runner=self._event_loop_runner,
+            scheduler=self._scheduler,
+            max_parallelism=self._max_parallelism,
         )
 
     def _validate_graph(self) -> None:
@@ -416,6 +461,9 @@ class Graph(MultiAgentBase):
         hooks: Optional[list[HookProvider]] = None,
         id: str = _DEFAULT_GRAPH_ID,
         trace_attributes: Optional[Mapping[str, AttributeValue]] = None,
+        event_loop_runner: Optional[EventLoopRunner] = None,
+        scheduler: GraphScheduler = "batch",
+        max_parallelism: Optional[int] = None,
     ) -> None:
         """Initialize Graph with execution limits and reset behavior.
 
@@ -431,22 +479,40 @@ class Graph(MultiAgentBase):
             hooks: List of hook providers for monitoring and extending graph execution behavior (default: None)
             id: Unique graph id (default: None)
             trace_attributes: Custom trace attributes to apply to the agent's trace span (default: None)
+            event_loop_runner: Long-lived event loop used by synchronous calls (default: None - new loop per call)
+            scheduler: "batch" to execute ready nodes in lock-step batches, or "dataflow" to start each node as soon
+                as the nodes it depends on have completed (default: "batch")
+            max_parallelism: Maximum number of nodes executing concurrently (default: None - no limit)
+
+        Raises:
+            ValueError: If the scheduler is unknown or max_parallelism is less than 1.
         """
         super().__init__()
 
+        if scheduler not in GRAPH_SCHEDULERS:
+            raise ValueError(
+                f"Scheduler '{scheduler}' is not supported, expected one of: {', '.join(GRAPH_SCHEDULERS)}"
+            )
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(f"max_parallelism must be at least 1, got {max_parallelism}")
+
         # Validate nodes for duplicate instances
         self._validate_graph(nodes)
 
         self.nodes = nodes
         self.edges = edges
+        self._index_edges()
         self.entry_points = entry_points
         self.max_node_executions = max_node_executions
         self.execution_timeout = execution_timeout
         self.node_timeout = node_timeout
         self.reset_on_revisit = reset_on_revisit
+        self.scheduler = scheduler
+        self.max_parallelism = max_parallelism
         self.state = GraphState()
         self.tracer = get_tracer()
         self.trace_attributes: dict[str, AttributeValue] = self._parse_trace_attributes(trace_attributes)
+        self.event_loop_runner = event_loop_runner
         self.session_manager = session_manager
         self.hooks = HookRegistry()
         if self.session_manager:
@@ -459,7 +525,7 @@ class Graph(MultiAgentBase):
         self._resume_from_session = False
         self.id = id
 
-        run_async(lambda: self.hooks.invoke_callbacks_async(MultiAgentInitializedEvent(self)))
+        run_async(lambda: self.hooks.invoke_callbacks_async(MultiAgentInitializedEvent(self)), self.event_loop_runner)
 
     def __call__(
         self, task: MultiAgentInput, invocation_state: dict[str, Any] | None = None, **kwargs: Any
@@ -475,7 +541,7 @@ class Graph(MultiAgentBase):
         if invocation_state is None:
             invocation_state = {}
 
-        return run_async(lambda: self.invoke_async(task, invocation_state))
+        return run_async(lambda: self.invoke_async(task, invocation_state), self.event_loop_runner)
 
     async def invoke_async(
         self, task: MultiAgentInput, invocation_state: dict[str, Any] | None = None, **kwargs: Any
@@ -591,8 +657,22 @@ class Graph(MultiAgentBase):
             # Validate Agent-specific constraints for each node
             _validate_node_executor(node.executor)
 
+    def _index_edges(self) -> None:
+        """Index edges by node so that traversals only visit the edges of the nodes involved."""
+        self._node_order = {node: index for index, node in enumerate(self.nodes.values())}
+        self._incoming_edges: dict[GraphNode, list[GraphEdge]] = {node: [] for node in self.nodes.values()}
+        self._outgoing_edges: dict[GraphNode, list[GraphEdge]] = {node: [] for node in self.nodes.values()}
+        for edge in self.edges:
+            self._outgoing_edges.setdefault(edge.from_node, []).append(edge)
+            self._incoming_edges.setdefault(edge.to_node, []).append(edge)
+
     async def _execute_graph(self, invocation_state: dict[str, Any]) -> AsyncIterator[Any]:
         """Execute graph and yield TypedEvent objects."""
+        if self.scheduler == "dataflow":
+            async for event in self._execute_graph_dataflow(invocation_state):
+                yield event
+            return
+
         ready_nodes = self._resume_next_nodes if self._resume_from_session else list(self.entry_points)
 
         while ready_nodes:
@@ -633,6 +713,104 @@ class Graph(MultiAgentBase):
 
             ready_nodes.extend(newly_ready)
 
+    async def _execute_graph_dataflow(self, invocation_state: dict[str, Any]) -> AsyncIterator[Any]:
+        """Execute graph starting each node as soon as its inputs are available and yield TypedEvent objects.
+
+        A completed node triggers the targets of its outgoing edges whose conditions are satisfied. A triggered node
+        starts once none of its dependencies is executing or waiting to execute, so nodes fed by several concurrently
+        executing nodes run once with all of their outputs, as they would in batch mode, while nodes on independent
+        branches do not wait for each other.
+        """
+        ready_nodes = collections.deque(self._resume_next_nodes if self._resume_from_session else self.entry_points)
+        # Triggered nodes waiting on executing dependencies, with the nodes that triggered them
+        triggered_nodes: dict[GraphNode, list[GraphNode]] = {}
+        running: dict[GraphNode, asyncio.Task[None]] = {}
+        event_queue: asyncio.Queue[Any | None | Exception] = asyncio.Queue()
+        stopped = False
+
+        try:
+            while True:
+                while (
+                    ready_nodes
+                    and not stopped
+                    and (self.max_parallelism is None or len(running) < self.max_parallelism)
+                ):
+                    # Check execution limits before starting each node
+                    should_continue, reason = self.state.should_continue(
+                        max_node_executions=self.max_node_executions,
+                        execution_timeout=self.execution_timeout,
+                    )
+                    if not should_continue:
+                        self.state.status = Status.FAILED
+                        logger.debug("reason=<%s> | stopping execution", reason)
+                        # Nodes already executing are allowed to complete, as they would be in batch mode
+                        stopped = True
+                        break
+
+                    node = ready_nodes.popleft()
+                    running[node] = asyncio.create_task(
+                        self._stream_node_to_queue(node, event_queue, invocation_state, done_marker=node)
+                    )
+
+                if not running:
+                    return
+
+                event = await event_queue.get()
+                if isinstance(event, Exception):
+                    raise event
+
+                if not isinstance(event, GraphNode):
+                    yield event
+                    continue
+
+                # The node completed, a failure would have been raised before its done marker
+                completed_node = event
+                del running[completed_node]
+
+                for edge in self._outgoing_edges.get(completed_node, ()):
+                    if edge.should_traverse(self.state):
+                        logger.debug(
+                            "from=<%s>, to=<%s> | edge ready via satisfied condition",
+                            completed_node.node_id,
+                            edge.to_node.node_id,
+                        )
+                        if edge.to_node in ready_nodes:
+                            # Not started yet, so it will read this output when it starts
+                            continue
+                        triggered_nodes.setdefault(edge.to_node, []).append(completed_node)
+                    else:
+                        logger.debug(
+                            "from=<%s>, to=<%s> | edge condition not satisfied",
+                            completed_node.node_id,
+                            edge.to_node.node_id,
+                        )
+
+                newly_ready = [
+                    node
+                    for node in triggered_nodes
+                    if node not in running
+                    and not any(dependency in running or dependency in ready_nodes for dependency in node.dependencies)
+                ]
+                if not newly_ready:
+                    continue
+
+                from_node_ids: list[str] = []
+                for node in newly_ready:
+                    for source in triggered_nodes.pop(node):
+                        if source.node_id not in from_node_ids:
+                            from_node_ids.append(source.node_id)
+                to_node_ids = [node.node_id for node in newly_ready]
+
+                yield MultiAgentHandoffEvent(from_node_ids=from_node_ids, to_node_ids=to_node_ids)
+                logger.debug("from_node_ids=<%s>, to_node_ids=<%s> | dataflow transition", from_node_ids, to_node_ids)
+
+                ready_nodes.extend(newly_ready)
+        finally:
+            remaining_tasks = [task for task in running.values() if not task.done()]
+            for task in remaining_tasks:
+                task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+
     async def _execute_nodes_parallel(
         self, nodes: list["GraphNode"], invocation_state: dict[str, Any]
     ) -> AsyncIterator[Any]:
@@ -640,24 +818,30 @@ class Graph(MultiAgentBase):
 
         Uses a shared queue where each node's stream runs independently and pushes events
         as they occur, enabling true real-time event propagation without round-robin delays.
+        Each stream pushes a final None once it is done, so the queue is consumed until every
+        stream has finished without polling the tasks.
         """
         event_queue: asyncio.Queue[Any | None | Exception] = asyncio.Queue()
+        slots = asyncio.Semaphore(self.max_parallelism) if self.max_parallelism is not None else None
+
+        async def stream_node(node: GraphNode) -> None:
+            if slots is None:
+                await self._stream_node_to_queue(node, event_queue, invocation_state)
+                return
+
+            async with slots:
+                await self._stream_node_to_queue(node, event_queue, invocation_state)
 
         # Start all node streams as independent tasks
-        tasks = [asyncio.create_task(self._stream_node_to_queue(node, event_queue, invocation_state)) for node in nodes]
+        tasks = [asyncio.create_task(stream_node(node)) for node in nodes]
 
         try:
-            # Consume events from the queue as they arrive
-            # Continue until all tasks are done
-            while any(not task.done() for task in tasks):
-                try:
-                    # Use timeout to avoid race condition: if all tasks complete between
-                    # checking task.done() and calling queue.get(), we'd hang forever.
-                    # The 0.1s timeout allows us to periodically re-check task completion
-                    # while still being responsive to incoming events.
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    # No event available, continue checking tasks
+            # Consume events from the queue as they arrive until every stream has finished
+            pending_streams = len(tasks)
+            while pending_streams:
+                event = await event_queue.get()
+                if event is None:
+                    pending_streams -= 1
                     continue
 
                 # Check if it's an exception - fail fast
@@ -668,16 +852,7 @@ class Graph(MultiAgentBase):
                             task.cancel()
                     raise event
 
-                if event is not None:
-                    yield event
-
-            # Process any remaining events in the queue after all tasks complete
-            while not event_queue.empty():
-                event = await event_queue.get()
-                if isinstance(event, Exception):
-                    raise event
-                if event is not None:
-                    yield event
+                yield event
         finally:
             # Cancel any remaining tasks
             remaining_tasks = [task for task in tasks if not task.done()]
@@ -695,8 +870,12 @@ class Graph(MultiAgentBase):
         node: GraphNode,
         event_queue: asyncio.Queue[Any | None | Exception],
         invocation_state: dict[str, Any],
+        done_marker: Any = None,
     ) -> None:
-        """Stream events from a node to the shared queue with optional timeout."""
+        """Stream events from a node to the shared queue with optional timeout.
+
+        The done marker is pushed once the node has finished, after any exception it raised.
+        """
         try:
             # Apply timeout to the entire streaming process if configured
             if self.node_timeout is not None:
@@ -719,7 +898,7 @@ class Graph(MultiAgentBase):
             # Send exception through queue for fail-fast behavior
             await event_queue.put(e)
         finally:
-            await event_queue.put(None)
+            await event_queue.put(done_marker)
 
     async def _handle_node_timeout(self, node: GraphNode, event_queue: asyncio.Queue[Any | None]) -> Exception:
         """Handle a node timeout by creating a failed result and emitting events.
@@ -755,19 +934,20 @@ class Graph(MultiAgentBase):
 
     def _find_newly_ready_nodes(self, completed_batch: list["GraphNode"]) -> list["GraphNode"]:
         """Find nodes that became ready after the last execution."""
+        # Only targets of edges leaving the completed batch can have become ready
+        candidates = {edge.to_node for node in completed_batch for edge in self._outgoing_edges.get(node, ())}
+        completed = set(completed_batch)
+
         newly_ready = []
-        for _node_id, node in self.nodes.items():
-            if self._is_node_ready_with_conditions(node, completed_batch):
+        for node in sorted(candidates, key=lambda candidate: self._node_order.get(candidate, len(self._node_order))):
+            if self._is_node_ready_with_conditions(node, completed):
                 newly_ready.append(node)
         return newly_ready
 
-    def _is_node_ready_with_conditions(self, node: GraphNode, completed_batch: list["GraphNode"]) -> bool:
+    def _is_node_ready_with_conditions(self, node: GraphNode, completed_batch: Collection["GraphNode"]) -> bool:
         """Check if a node is ready considering conditional edges."""
-        # Get incoming edges to this node
-        incoming_edges = [edge for edge in self.edges if edge.to_node == node]
-
         # Check if at least one incoming edge condition is satisfied
-        for edge in incoming_edges:
+        for edge in self._incoming_edges.get(node, ()):
             if edge.from_node in completed_batch:
                 if edge.should_traverse(self.state):
                     logger.debug(
@@ -965,12 +1145,8 @@ class Graph(MultiAgentBase):
         """
         # Get satisfied dependencies
         dependency_results = {}
-        for edge in self.edges:
-            if (
-                edge.to_node == node
-                and edge.from_node in self.state.completed_nodes
-                and edge.from_node.node_id in self.state.results
-            ):
+        for edge in self._incoming_edges.get(node, ()):
+            if edge.from_node in self.state.completed_nodes and edge.from_node.node_id in self.state.results:
                 if edge.should_traverse(self.state):
                     dependency_results[edge.from_node.node_id] = self.state.results[edge.from_node.node_id]
 
@@ -1072,7 +1248,7 @@ class Graph(MultiAgentBase):
         for node in self.nodes.values():
             if node in completed_nodes:
                 continue
-            incoming = [e for e in self.edges if e.to_node is node]
+            incoming = self._incoming_edges.get(node, [])
             if not incoming:
                 ready_nodes.append(node)
             elif all(e.from_node in completed_nodes and e.should_traverse(self.state) for e in incoming):
@@ -23,7 +23,7 @@ from typing import Any, AsyncIterator, Callable, Mapping, Optional, Tuple, cast
 
 from opentelemetry import trace as trace_api
 
-from .._async import run_async
+from .._async import EventLoopRunner, run_async
 from ..agent import Agent
 from ..agent.state import AgentState
 from ..experimental.hooks.multiagent import (
@@ -243,6 +243,7 @@ class Swarm(MultiAgentBase):
         hooks: Optional[list[HookProvider]] = None,
         id: str = _DEFAULT_SWARM_ID,
         trace_attributes: Optional[Mapping[str, AttributeValue]] = None,
+        event_loop_runner: Optional[EventLoopRunner] = None,
     ) -> None:
         """Initialize Swarm with agents and configuration.
 
@@ -261,6 +262,7 @@ class Swarm(MultiAgentBase):
             session_manager: Session manager for persisting graph state and execution history (default: None)
             hooks: List of hook providers for monitoring and extending graph execution behavior (default: None)
             trace_attributes: Custom trace attributes to apply to the agent's trace span (default: None)
+            event_loop_runner: Long-lived event loop used by synchronous calls (default: None - new loop per call)
         """
         super().__init__()
         self.id = id
@@ -284,6 +286,7 @@ class Swarm(MultiAgentBase):
 
         self.tracer = get_tracer()
         self.trace_attributes: dict[str, AttributeValue] = self._parse_trace_attributes(trace_attributes)
+        self.event_loop_runner = event_loop_runner
 
         self.session_manager = session_manager
         self.hooks = HookRegistry()
@@ -297,7 +300,7 @@ class Swarm(MultiAgentBase):
 
         self._setup_swarm(nodes)
         self._inject_swarm_tools()
-        run_async(lambda: self.hooks.invoke_callbacks_async(MultiAgentInitializedEvent(self)))
+        run_async(lambda: self.hooks.invoke_callbacks_async(MultiAgentInitializedEvent(self)), self.event_loop_runner)
 
     def __call__(
         self, task: MultiAgentInput, invocation_state: dict[str, Any] | None = None, **kwargs: Any
@@ -312,7 +315,7 @@ class Swarm(MultiAgentBase):
         """
         if invocation_state is None:
             invocation_state = {}
-        return run_async(lambda: self.invoke_async(task, invocation_state))
+        return run_async(lambda: self.invoke_async(task, invocation_state), self.event_loop_runner)
 
     async def invoke_async(
         self, task: MultiAgentInput, invocation_state: dict[str, Any] | None = None, **kwargs: Any
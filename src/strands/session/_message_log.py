@@ -0,0 +1,300 @@
+"""Append-only message log used by the file session manager.
+
+Messages of an agent are stored in a single segment file, one JSON document per line, with a fixed width binary index
+alongside it:
+
+```bash
+messages/
+├── index                   # Header (magic, segment generation) followed by one record per message
+└── segment_<generation>.jsonl
+```
+
+Each index record holds the message id along with the byte offset and length of the latest version of the message in
+the segment. Records are ordered by message id, so the n-th message is found by seeking to the n-th record.
+
+Appending a message writes the JSON line to the segment before appending the index record. The index record is the
+commit point: a crash in between leaves an unreferenced line in the segment, which is dropped on the next compaction.
+Updates append a new line and overwrite the record in place. Compaction writes a new generation of the segment and
+atomically replaces the index to point at it.
+
+With `sync` enabled, the segment is synced to disk before the index record is written, so a record never points at
+data lost in a crash of the machine, and the index is synced before returning, so committed messages survive it. This
+costs a few milliseconds per write on most disks, so it is disabled by default.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Iterable, Iterator, Optional
+
+from ..types.exceptions import SessionException
+
+INDEX_FILE = "index"
+SEGMENT_PREFIX = "segment_"
+
+_MAGIC = b"SMLG"
+_HEADER = struct.Struct("<4sQ")
+_RECORD = struct.Struct("<QQQ")
+
+
+class MessageLog:
+    """Append-only log of messages for a single agent."""
+
+    def __init__(self, path: str, sync: bool = False) -> None:
+        """Initialize the log.
+
+        Args:
+            path: Directory holding the index and segment files.
+            sync: Whether appends and updates are synced to disk before returning.
+        """
+        self.path = path
+        self.index_path = os.path.join(path, INDEX_FILE)
+        self.sync = sync
+
+        # Generation and latest message id of the index, valid while its inode, size, and modification time are the
+        # same
+        self._cached_state: Optional[tuple[tuple[int, int, int], int, Optional[int]]] = None
+
+    @property
+    def exists(self) -> bool:
+        """Whether the log has been created."""
+        return os.path.exists(self.index_path)
+
+    def create(self, messages: Iterable[tuple[int, dict[str, Any]]] = ()) -> None:
+        """Create the log, replacing any existing one.
+
+        The index is written last, so the log only becomes visible once all messages are written.
+
+        Args:
+            messages: Initial messages as (id, serialized message) pairs in increasing id order.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        self._write_generation(0, messages)
+
+    def __len__(self) -> int:
+        """Number of messages in the log."""
+        # A partially written trailing record is not committed and so is ignored
+        return (os.path.getsize(self.index_path) - _HEADER.size) // _RECORD.size
+
+    def append(self, message_id: int, data: dict[str, Any]) -> None:
+        """Append a new message to the log.
+
+        Args:
+            message_id: Id of the message, which must be greater than the id of every message already in the log.
+            data: Serialized message.
+
+        Raises:
+            SessionException: If the message id is not greater than the latest message id.
+        """
+        count, generation, latest_id = self._state()
+        if latest_id is not None and message_id <= latest_id:
+            raise SessionException(f"message_id=<{message_id}> | message ids must be appended in increasing order")
+
+        offset, length = self._write_segment(generation, data)
+
+        with open(self.index_path, "r+b") as f:
+            f.truncate(_HEADER.size + count * _RECORD.size)
+            f.seek(0, os.SEEK_END)
+            f.write(_RECORD.pack(message_id, offset, length))
+            self._flush(f)
+            self._cache_state(os.fstat(f.fileno()), generation, message_id)
+
+    def update(self, message_id: int, data: dict[str, Any]) -> bool:
+        """Replace an existing message.
+
+        Args:
+            message_id: Id of the message.
+            data: Serialized message.
+
+        Returns:
+            False if the message does not exist.
+        """
+        position = self._find(message_id)
+        if position is None:
+            return False
+
+        _, generation, latest_id = self._state()
+        offset, length = self._write_segment(generation, data)
+
+        with open(self.index_path, "r+b") as f:
+            f.seek(_HEADER.size + position * _RECORD.size)
+            f.write(_RECORD.pack(message_id, offset, length))
+            self._flush(f)
+            self._cache_state(os.fstat(f.fileno()), generation, latest_id)
+
+        return True
+
+    def read(self, message_id: int) -> Optional[dict[str, Any]]:
+        """Read a message.
+
+        Args:
+            message_id: Id of the message.
+
+        Returns:
+            The serialized message, or None if it does not exist.
+        """
+        position = self._find(message_id)
+        if position is None:
+            return None
+
+        return next(self.read_range(offset=position, limit=1))
+
+    def read_range(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[dict[str, Any]]:
+        """Read messages in id order.
+
+        Only the index records in the requested range are read, so the cost does not depend on the number of messages
+        before the offset.
+
+        Args:
+            offset: Number of messages to skip.
+            limit: Maximum number of messages to read.
+
+        Yields:
+            The serialized messages.
+        """
+        count = len(self)
+        end = count if limit is None else min(count, offset + limit)
+        if offset >= end:
+            return
+
+        with open(self.index_path, "rb") as index:
+            generation = self._read_generation(index)
+            index.seek(_HEADER.size + offset * _RECORD.size)
+            records = index.read((end - offset) * _RECORD.size)
+
+        entries = list(_RECORD.iter_unpack(records))
+        start = min(message_offset for _, message_offset, _ in entries)
+        end = max(message_offset + length for _, message_offset, length in entries)
+
+        # Read the range spanning all requested messages at once rather than seeking to each of them
+        with open(self._segment_path(generation), "rb") as segment:
+            segment.seek(start)
+            data = segment.read(end - start)
+
+        for _, message_offset, length in entries:
+            yield json.loads(data[message_offset - start : message_offset - start + length])
+
+    def compact(self) -> None:
+        """Rewrite the segment with only the latest version of each message."""
+        _, generation, _ = self._state()
+        self._write_generation(generation + 1, self._iter_with_ids())
+
+    def _iter_with_ids(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        with open(self.index_path, "rb") as index:
+            generation = self._read_generation(index)
+            records = index.read(len(self) * _RECORD.size)
+
+        with open(self._segment_path(generation), "rb") as segment:
+            for message_id, offset, length in _RECORD.iter_unpack(records):
+                segment.seek(offset)
+                yield message_id, json.loads(segment.read(length))
+
+    def _write_generation(self, generation: int, messages: Iterable[tuple[int, dict[str, Any]]]) -> None:
+        """Write a new segment with the given messages and atomically point the index at it."""
+        records: list[tuple[int, int, int]] = []
+        with open(self._segment_path(generation), "wb") as segment:
+            for message_id, data in messages:
+                line = self._encode(data)
+                records.append((message_id, segment.tell(), len(line)))
+                segment.write(line)
+            segment.flush()
+            os.fsync(segment.fileno())
+
+        self._write_index(generation, records)
+        self._remove_stale_segments(generation)
+
+    def _find(self, message_id: int) -> Optional[int]:
+        """Find the index position of a message.
+
+        Message ids are usually contiguous from 0, in which case the position is the id. Otherwise, the position is
+        found by binary search over the ordered records.
+        """
+        count = len(self)
+        if 0 <= message_id < count and self._read_record(message_id)[0] == message_id:
+            return message_id
+
+        low, high = 0, count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            middle_id = self._read_record(middle)[0]
+            if middle_id == message_id:
+                return middle
+            if middle_id < message_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+
+        return None
+
+    def _read_record(self, position: int) -> tuple[int, int, int]:
+        with open(self.index_path, "rb") as f:
+            f.seek(_HEADER.size + position * _RECORD.size)
+            return _RECORD.unpack(f.read(_RECORD.size))
+
+    def _write_segment(self, generation: int, data: dict[str, Any]) -> tuple[int, int]:
+        line = self._encode(data)
+        with open(self._segment_path(generation), "ab") as f:
+            offset = f.tell()
+            f.write(line)
+            self._flush(f)
+
+        return offset, len(line)
+
+    def _flush(self, f: Any) -> None:
+        """Flush a file written by an append or update, syncing it to disk if enabled."""
+        f.flush()
+        if self.sync:
+            os.fsync(f.fileno())
+
+    def _write_index(self, generation: int, records: list[tuple[int, int, int]]) -> None:
+        tmp = f"{self.index_path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, generation))
+            for record in records:
+                f.write(_RECORD.pack(*record))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.index_path)
+
+    def _state(self) -> tuple[int, int, Optional[int]]:
+        """Get the number of messages, the segment generation, and the latest message id.
+
+        The generation and latest id are cached, and only read from the index again when it was written by another
+        writer, such as another log instance, or replaced by a compaction.
+        """
+        stat = os.stat(self.index_path)
+        count = (stat.st_size - _HEADER.size) // _RECORD.size
+        if self._cached_state is not None and self._cached_state[0] == (stat.st_ino, stat.st_size, stat.st_mtime_ns):
+            return count, self._cached_state[1], self._cached_state[2]
+
+        with open(self.index_path, "rb") as f:
+            generation = self._read_generation(f)
+            latest_id: Optional[int] = None
+            if count:
+                f.seek(_HEADER.size + (count - 1) * _RECORD.size)
+                latest_id = _RECORD.unpack(f.read(_RECORD.size))[0]
+
+        self._cache_state(stat, generation, latest_id)
+        return count, generation, latest_id
+
+    def _cache_state(self, stat: os.stat_result, generation: int, latest_id: Optional[int]) -> None:
+        self._cached_state = ((stat.st_ino, stat.st_size, stat.st_mtime_ns), generation, latest_id)
+
+    def _read_generation(self, index: Any) -> int:
+        magic, generation = _HEADER.unpack(index.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise SessionException(f"path=<{self.index_path}> | invalid message log index")
+        return int(generation)
+
+    def _segment_path(self, generation: int) -> str:
+        return os.path.join(self.path, f"{SEGMENT_PREFIX}{generation}.jsonl")
+
+    def _remove_stale_segments(self, generation: int) -> None:
+        current = os.path.basename(self._segment_path(generation))
+        for filename in os.listdir(self.path):
+            if filename.startswith(SEGMENT_PREFIX) and filename != current:
+                os.remove(os.path.join(self.path, filename))
+
+    @staticmethod
+    def _encode(data: dict[str, Any]) -> bytes:
+        return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
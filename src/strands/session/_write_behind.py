@@ -0,0 +1,122 @@
+"""Write-behind queue used to move session repository I/O off the event loop."""
+
+import collections
+import logging
+import threading
+from typing import Callable, Hashable, Optional
+
+from ..types.exceptions import SessionException
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindQueue:
+    """Executes writes in submission order on a dedicated worker thread.
+
+    Writes submitted with a coalescing key replace any write with the same key that has not started yet. The
+    replacement is queued behind the writes submitted in the meantime, so it never overtakes them.
+
+    Failures are logged and raised as a SessionException by the next call to `flush`.
+    """
+
+    def __init__(self, name: str = "strands-session-writer") -> None:
+        """Initialize the queue.
+
+        The worker thread is started lazily on the first submitted write.
+
+        Args:
+            name: Name of the worker thread.
+        """
+        self.name = name
+        self._writes: collections.deque[tuple[Optional[Hashable], Callable[[], None]]] = collections.deque()
+        self._condition = threading.Condition()
+        self._in_flight = False
+        self._closed = False
+        self._error: Optional[Exception] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, write: Callable[[], None], key: Optional[Hashable] = None) -> None:
+        """Queue a write.
+
+        Args:
+            write: Function performing the write.
+            key: Optional coalescing key. A pending write with the same key is dropped in favor of this one.
+
+        Raises:
+            SessionException: If the queue is closed.
+        """
+        with self._condition:
+            if self._closed:
+                raise SessionException("session write-behind queue is closed")
+
+            if key is not None:
+                self._writes = collections.deque(entry for entry in self._writes if entry[0] != key)
+
+            self._writes.append((key, write))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+            self._condition.notify_all()
+
+    @property
+    def pending(self) -> int:
+        """Number of writes that have not completed yet."""
+        with self._condition:
+            return len(self._writes) + int(self._in_flight)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for all queued writes to complete.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Raises:
+            SessionException: If a write failed since the last flush, or the timeout expired.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: not self._writes and not self._in_flight, timeout):
+                raise SessionException(f"timeout=<{timeout}> | timed out flushing session writes")
+
+            error, self._error = self._error, None
+
+        if error is not None:
+            raise SessionException(f"failed to persist session: {error}") from error
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush queued writes and stop the worker thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait for queued writes.
+        """
+        try:
+            self.flush(timeout)
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+
+            if self._thread is not None:
+                self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._writes or self._closed)
+                if not self._writes:
+                    return
+
+                _, write = self._writes.popleft()
+                self._in_flight = True
+
+            try:
+                write()
+            except Exception as e:
+                logger.exception("thread=<%s> | failed to persist session write", self.name)
+                with self._condition:
+                    self._error = self._error or e
+            finally:
+                with self._condition:
+                    self._in_flight = False
+                    self._condition.notify_all()
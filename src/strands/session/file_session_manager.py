@@ -5,11 +5,12 @@ import logging
 import os
 import shutil
 import tempfile
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, cast
 
 from .. import _identifier
 from ..types.exceptions import SessionException
 from ..types.session import Session, SessionAgent, SessionMessage
+from ._message_log import MessageLog
 from .repository_session_manager import RepositorySessionManager
 from .session_repository import SessionRepository
 
@@ -39,12 +40,24 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
                     ├── message_<id1>.json
                     └── message_<id2>.json
     ```
+
+    With `message_format="jsonl"`, the messages of an agent are instead stored in an append-only segment log with an
+    index, which avoids a file per message and lets `list_messages` seek directly to the requested offset:
+    ```bash
+                └── messages/
+                    ├── index                   # Offsets of the messages in the segment
+                    └── segment_<generation>.jsonl
+    ```
+    Existing message files are migrated to the log the first time an agent's messages are accessed. Updated messages
+    are appended to the log, and `compact_messages` reclaims the space of the versions they replace.
     """
 
     def __init__(
         self,
         session_id: str,
         storage_dir: Optional[str] = None,
+        message_format: Literal["json", "jsonl"] = "json",
+        sync_messages: bool = False,
         **kwargs: Any,
     ):
         """Initialize FileSession with filesystem storage.
@@ -53,12 +66,25 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
             session_id: ID for the session.
                 ID is not allowed to contain path separators (e.g., a/b).
             storage_dir: Directory for local filesystem storage (defaults to temp dir).
-            **kwargs: Additional keyword arguments for future extensibility.
+            message_format: How messages are stored; "json" for a file per message or "jsonl" for an append-only
+                segment log.
+            sync_messages: Whether the message log is synced to disk before message writes return, so that written
+                messages survive a crash of the machine. Only applies to the "jsonl" format.
+            **kwargs: Additional keyword arguments passed to RepositorySessionManager (e.g., write_behind).
+
+        Raises:
+            ValueError: If message_format is not supported.
         """
+        if message_format not in ("json", "jsonl"):
+            raise ValueError(f"message_format=<{message_format}> | unsupported message format")
+
+        self.message_format = message_format
+        self.sync_messages = sync_messages
+        self._message_logs: dict[str, MessageLog] = {}
         self.storage_dir = storage_dir or os.path.join(tempfile.gettempdir(), "strands/sessions")
         os.makedirs(self.storage_dir, exist_ok=True)
 
-        super().__init__(session_id=session_id, session_repository=self)
+        super().__init__(session_id=session_id, session_repository=self, **kwargs)
 
     def _get_session_path(self, session_id: str) -> str:
         """Get session directory path.
@@ -105,6 +131,70 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
         agent_path = self._get_agent_path(session_id, agent_id)
         return os.path.join(agent_path, "messages", f"{MESSAGE_PREFIX}{message_id}.json")
 
+    def _get_message_log(self, session_id: str, agent_id: str) -> MessageLog:
+        """Get the message log of an agent, migrating existing message files to it if needed.
+
+        Args:
+            session_id: ID of the session
+            agent_id: ID of the agent
+
+        Raises:
+            SessionException: If the messages directory is missing.
+        """
+        messages_dir = os.path.join(self._get_agent_path(session_id, agent_id), "messages")
+        if not os.path.exists(messages_dir):
+            raise SessionException(f"Messages directory missing from agent: {agent_id} in session {session_id}")
+
+        # Logs are kept, as they cache the state of their index between writes
+        message_log = self._message_logs.get(messages_dir)
+        if message_log is None:
+            message_log = self._message_logs[messages_dir] = MessageLog(messages_dir, sync=self.sync_messages)
+
+        if not message_log.exists:
+            self._migrate_message_files(messages_dir, message_log)
+
+        return message_log
+
+    def _migrate_message_files(self, messages_dir: str, message_log: MessageLog) -> None:
+        """Move message files into a new message log.
+
+        Message files are only removed once the log is fully written, so an interrupted migration is restarted on the
+        next access.
+
+        Args:
+            messages_dir: Directory holding the message files.
+            message_log: Log to create.
+        """
+        message_files = self._list_message_files(messages_dir)
+        message_log.create(
+            (message_id, self._read_file(os.path.join(messages_dir, filename)))
+            for message_id, filename in message_files
+        )
+
+        for _, filename in message_files:
+            os.remove(os.path.join(messages_dir, filename))
+
+        if message_files:
+            logger.debug("messages_dir=<%s>, count=<%d> | migrated message files", messages_dir, len(message_files))
+
+    def _list_message_files(self, messages_dir: str) -> list[tuple[int, str]]:
+        """List message files sorted by index.
+
+        Args:
+            messages_dir: Directory holding the message files.
+
+        Returns:
+            Pairs of message index and filename.
+        """
+        message_index_files: list[tuple[int, str]] = []
+        for filename in os.listdir(messages_dir):
+            if filename.startswith(MESSAGE_PREFIX) and filename.endswith(".json"):
+                # Extract index from message_<index>.json format
+                index = int(filename[len(MESSAGE_PREFIX) : -5])  # Remove prefix and .json suffix
+                message_index_files.append((index, filename))
+
+        return sorted(message_index_files)
+
     def _read_file(self, path: str) -> dict[str, Any]:
         """Read JSON file."""
         try:
@@ -191,6 +281,11 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
 
     def create_message(self, session_id: str, agent_id: str, session_message: SessionMessage, **kwargs: Any) -> None:
         """Create a new message for the agent."""
+        if self.message_format == "jsonl":
+            message_log = self._get_message_log(session_id, agent_id)
+            message_log.append(session_message.message_id, session_message.to_dict())
+            return
+
         message_file = self._get_message_path(
             session_id,
             agent_id,
@@ -201,6 +296,12 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
 
     def read_message(self, session_id: str, agent_id: str, message_id: int, **kwargs: Any) -> Optional[SessionMessage]:
         """Read message data."""
+        if self.message_format == "jsonl":
+            if not os.path.exists(os.path.join(self._get_agent_path(session_id, agent_id), "messages")):
+                return None
+            message_data = self._get_message_log(session_id, agent_id).read(message_id)
+            return SessionMessage.from_dict(message_data) if message_data is not None else None
+
         message_path = self._get_message_path(session_id, agent_id, message_id)
         if not os.path.exists(message_path):
             return None
@@ -216,6 +317,10 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
 
         # Preserve the original created_at timestamp
         session_message.created_at = previous_message.created_at
+        if self.message_format == "jsonl":
+            self._get_message_log(session_id, agent_id).update(message_id, session_message.to_dict())
+            return
+
         message_file = self._get_message_path(session_id, agent_id, message_id)
         self._write_file(message_file, session_message.to_dict())
 
@@ -223,20 +328,16 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
         self, session_id: str, agent_id: str, limit: Optional[int] = None, offset: int = 0, **kwargs: Any
     ) -> list[SessionMessage]:
         """List messages for an agent with pagination."""
+        if self.message_format == "jsonl":
+            message_log = self._get_message_log(session_id, agent_id)
+            return [SessionMessage.from_dict(data) for data in message_log.read_range(offset=offset, limit=limit)]
+
         messages_dir = os.path.join(self._get_agent_path(session_id, agent_id), "messages")
         if not os.path.exists(messages_dir):
             raise SessionException(f"Messages directory missing from agent: {agent_id} in session {session_id}")
 
-        # Read all message files, and record the index
-        message_index_files: list[tuple[int, str]] = []
-        for filename in os.listdir(messages_dir):
-            if filename.startswith(MESSAGE_PREFIX) and filename.endswith(".json"):
-                # Extract index from message_<index>.json format
-                index = int(filename[len(MESSAGE_PREFIX) : -5])  # Remove prefix and .json suffix
-                message_index_files.append((index, filename))
-
-        # Sort by index and extract just the filenames
-        message_files = [f for _, f in sorted(message_index_files)]
+        # Read all message files sorted by index, and extract just the filenames
+        message_files = [f for _, f in self._list_message_files(messages_dir)]
 
         # Apply pagination to filenames
         if limit is not None:
@@ -253,6 +354,19 @@ class FileSessionManager(RepositorySessionManager, SessionRepository):
 
         return messages
 
+    def compact_messages(self, agent_id: str) -> None:
+        """Reclaim the space of replaced message versions in an agent's message log.
+
+        Only applies to the "jsonl" message format.
+
+        Args:
+            agent_id: ID of the agent in this session.
+        """
+        if self.message_format != "jsonl":
+            return
+
+        self._get_message_log(self.session_id, agent_id).compact()
+
     def _get_multi_agent_path(self, session_id: str, multi_agent_id: str) -> str:
         """Get multi-agent state file path."""
         session_path = self._get_session_path(session_id)
@@ -1,9 +1,15 @@
 """Repository session manager implementation."""
 
+import asyncio
+import copy
+import dataclasses
 import logging
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar
 
 from ..agent.state import AgentState
+from ..experimental.hooks.events import BidiAfterInvocationEvent
+from ..hooks.events import AfterInvocationEvent
+from ..hooks.registry import HookRegistry
 from ..tools._tool_helpers import generate_missing_tool_result_content
 from ..types.content import Message
 from ..types.exceptions import SessionException
@@ -13,6 +19,7 @@ from ..types.session import (
     SessionMessage,
     SessionType,
 )
+from ._write_behind import WriteBehindQueue
 from .session_manager import SessionManager
 from .session_repository import SessionRepository
 
@@ -23,14 +30,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class RepositorySessionManager(SessionManager):
-    """Session manager for persisting agents in a SessionRepository."""
+    """Session manager for persisting agents in a SessionRepository.
+
+    By default, messages and agent state are written to the repository as soon as they change, on the thread that
+    changed them. With `write_behind=True`, writes are instead queued and performed by a worker thread, so that slow
+    repositories do not block the event loop while the agent is streaming:
+
+    - `ordering="relaxed"` coalesces repeated agent syncs into a single write of the latest agent state.
+      `ordering="strict"` performs every write in the order it was made.
+    - `durability="invocation"` waits for queued writes at the end of each agent invocation, so the session is
+      persisted by the time the invocation returns. `durability="eventual"` does not wait; call `flush` to wait for
+      queued writes, and `close` before exiting the process.
+    """
 
     def __init__(
         self,
         session_id: str,
         session_repository: SessionRepository,
+        write_behind: bool = False,
+        ordering: Literal["strict", "relaxed"] = "relaxed",
+        durability: Literal["invocation", "eventual"] = "invocation",
         **kwargs: Any,
     ):
         """Initialize the RepositorySessionManager.
@@ -42,9 +65,25 @@ class RepositorySessionManager(SessionManager):
             session_id: ID to use for the session. A new session with this id will be created if it does
                 not exist in the repository yet
             session_repository: Underlying session repository to use to store the sessions state.
+            write_behind: Whether to queue writes and perform them on a worker thread.
+            ordering: With write-behind, "relaxed" to coalesce repeated agent syncs or "strict" to perform every write
+                in order.
+            durability: With write-behind, "invocation" to wait for queued writes at the end of each invocation or
+                "eventual" to only wait on an explicit flush.
             **kwargs: Additional keyword arguments for future extensibility.
 
+        Raises:
+            ValueError: If ordering or durability is not supported.
         """
+        if ordering not in ("strict", "relaxed"):
+            raise ValueError(f"ordering=<{ordering}> | unsupported session write ordering")
+        if durability not in ("invocation", "eventual"):
+            raise ValueError(f"durability=<{durability}> | unsupported session write durability")
+
+        self.ordering = ordering
+        self.durability = durability
+        self._write_queue = WriteBehindQueue() if write_behind else None
+
         self.session_repository = session_repository
         self.session_id = session_id
         session = session_repository.read_session(session_id)
@@ -59,6 +98,71 @@ class RepositorySessionManager(SessionManager):
         # Keep track of the latest message of each agent in case we need to redact it.
         self._latest_agent_message: dict[str, Optional[SessionMessage]] = {}
 
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        """Register hooks for persisting the agent to the session."""
+        if self._write_queue is not None and self.durability == "invocation":
+            # After invocation callbacks run in reverse order, so registering first flushes after the final agent sync
+            registry.add_callback(AfterInvocationEvent, self._flush_async)
+            registry.add_callback(BidiAfterInvocationEvent, self._flush_async)
+
+        super().register_hooks(registry, **kwargs)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for queued session writes to complete.
+
+        Does nothing unless write-behind is enabled.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Raises:
+            SessionException: If a queued write failed, or the timeout expired.
+        """
+        if self._write_queue is not None:
+            self._write_queue.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush queued session writes and stop the write-behind worker.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Raises:
+            SessionException: If a queued write failed, or the timeout expired.
+        """
+        if self._write_queue is not None:
+            self._write_queue.close(timeout)
+
+    async def _flush_async(self, event: Any) -> None:
+        await asyncio.to_thread(self.flush)
+
+    def _write(self, write: Callable[[], None], key: Optional[str] = None) -> None:
+        """Perform a repository write, or queue it with write-behind enabled.
+
+        Args:
+            write: Function performing the write.
+            key: Coalescing key for writes that only need their latest version persisted.
+        """
+        if self._write_queue is None:
+            write()
+            return
+
+        self._write_queue.submit(write, key=key if self.ordering == "relaxed" else None)
+
+    def _snapshot(self, value: T) -> T:
+        """Copy a value written to the repository when the write is queued.
+
+        Queued writes run later on the worker thread, so they must not see changes the agent makes to the value in
+        the meantime, such as edits to a message by hooks or conversation managers.
+
+        Args:
+            value: The value to write.
+
+        Returns:
+            A deep copy of the value with write-behind enabled, otherwise the value itself.
+        """
+        return copy.deepcopy(value) if self._write_queue is not None else value
+
     def append_message(self, message: Message, agent: "Agent", **kwargs: Any) -> None:
         """Append a message to the agent's session.
 
@@ -74,9 +178,9 @@ class RepositorySessionManager(SessionManager):
         else:
             next_index = 0
 
-        session_message = SessionMessage.from_message(message, next_index)
+        session_message = SessionMessage.from_message(self._snapshot(message), next_index)
         self._latest_agent_message[agent.agent_id] = session_message
-        self.session_repository.create_message(self.session_id, agent.agent_id, session_message)
+        self._write(lambda: self.session_repository.create_message(self.session_id, agent.agent_id, session_message))
 
     def redact_latest_message(self, redact_message: Message, agent: "Agent", **kwargs: Any) -> None:
         """Redact the latest message appended to the session.
@@ -89,8 +193,10 @@ class RepositorySessionManager(SessionManager):
         latest_agent_message = self._latest_agent_message[agent.agent_id]
         if latest_agent_message is None:
             raise SessionException("No message to redact.")
-        latest_agent_message.redact_message = redact_message
-        return self.session_repository.update_message(self.session_id, agent.agent_id, latest_agent_message)
+        # Replace rather than modify the latest message, which a queued create_message may still be writing
+        redacted_message = dataclasses.replace(latest_agent_message, redact_message=self._snapshot(redact_message))
+        self._latest_agent_message[agent.agent_id] = redacted_message
+        self._write(lambda: self.session_repository.update_message(self.session_id, agent.agent_id, redacted_message))
 
     def sync_agent(self, agent: "Agent", **kwargs: Any) -> None:
         """Serialize and update the agent into the session repository.
@@ -99,9 +205,10 @@ class RepositorySessionManager(SessionManager):
             agent: Agent to sync to the session.
             **kwargs: Additional keyword arguments for future extensibility.
         """
-        self.session_repository.update_agent(
-            self.session_id,
-            SessionAgent.from_agent(agent),
+        session_agent = SessionAgent.from_agent(agent)
+        self._write(
+            lambda: self.session_repository.update_agent(self.session_id, session_agent),
+            key=f"agent:{agent.agent_id}",
         )
 
     def initialize(self, agent: "Agent", **kwargs: Any) -> None:
@@ -115,6 +222,7 @@ class RepositorySessionManager(SessionManager):
             raise SessionException("The `agent_id` of an agent must be unique in a session.")
         self._latest_agent_message[agent.agent_id] = None
 
+        self.flush()
         session_agent = self.session_repository.read_agent(self.session_id, agent.agent_id)
 
         if session_agent is None:
@@ -262,6 +370,7 @@ class RepositorySessionManager(SessionManager):
             raise SessionException("The `agent_id` of an agent must be unique in a session.")
         self._latest_agent_message[agent.agent_id] = None
 
+        self.flush()
         session_agent = self.session_repository.read_agent(self.session_id, agent.agent_id)
 
         if session_agent is None:
@@ -319,9 +428,9 @@ class RepositorySessionManager(SessionManager):
         else:
             next_index = 0
 
-        session_message = SessionMessage.from_message(message, next_index)
+        session_message = SessionMessage.from_message(self._snapshot(message), next_index)
         self._latest_agent_message[agent.agent_id] = session_message
-        self.session_repository.create_message(self.session_id, agent.agent_id, session_message)
+        self._write(lambda: self.session_repository.create_message(self.session_id, agent.agent_id, session_message))
 
     def sync_bidi_agent(self, agent: "BidiAgent", **kwargs: Any) -> None:
         """Serialize and update the bidirectional agent into the session repository.
@@ -330,7 +439,8 @@ class RepositorySessionManager(SessionManager):
             agent: BidiAgent to sync to the session.
             **kwargs: Additional keyword arguments for future extensibility.
         """
-        self.session_repository.update_agent(
-            self.session_id,
-            SessionAgent.from_bidi_agent(agent),
+        session_agent = SessionAgent.from_bidi_agent(agent)
+        self._write(
+            lambda: self.session_repository.update_agent(self.session_id, session_agent),
+            key=f"agent:{agent.agent_id}",
         )
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import boto3
@@ -22,6 +23,7 @@ logger = logging.getLogger(__name__)
 SESSION_PREFIX = "session_"
 AGENT_PREFIX = "agent_"
 MESSAGE_PREFIX = "message_"
+SNAPSHOT_PREFIX = "snapshot_"
 MULTI_AGENT_PREFIX = "multi_agent_"
 
 
@@ -36,10 +38,16 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
         └── agents/
             └── agent_<agent_id>/
                 ├── agent.json          # Agent metadata
-                └── messages/
-                    ├── message_<id1>.json
-                    └── message_<id2>.json
+                ├── messages/
+                │   ├── message_<id1>.json
+                │   └── message_<id2>.json
+                └── snapshots/          # Optional consolidated copies of the messages
+                    └── snapshot_<first id>_<last id>.json
     ```
+
+    Messages are fetched in parallel when restoring an agent. With `snapshot_interval` set, the messages created since
+    the previous snapshot are also consolidated into a snapshot object every `snapshot_interval` messages, so that a
+    restore only needs to fetch the snapshots and the messages created after the last one.
     """
 
     def __init__(
@@ -50,6 +58,8 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
         boto_session: Optional[boto3.Session] = None,
         boto_client_config: Optional[BotocoreConfig] = None,
         region_name: Optional[str] = None,
+        max_read_workers: int = 8,
+        snapshot_interval: Optional[int] = None,
         **kwargs: Any,
     ):
         """Initialize S3SessionManager with S3 storage.
@@ -62,10 +72,27 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
             boto_session: Optional boto3 session
             boto_client_config: Optional boto3 client configuration
             region_name: AWS region for S3 storage
-            **kwargs: Additional keyword arguments for future extensibility.
+            max_read_workers: Maximum number of messages fetched concurrently when listing messages.
+            snapshot_interval: Number of messages after which the messages created since the previous snapshot are
+                consolidated into a new snapshot object. Up to this many serialized messages, including their image and
+                document payloads, are held in memory per agent until they are written. Snapshots are disabled if None.
+            **kwargs: Additional keyword arguments passed to RepositorySessionManager (e.g., write_behind).
+
+        Raises:
+            ValueError: If max_read_workers or snapshot_interval is less than 1.
         """
+        if max_read_workers < 1:
+            raise ValueError(f"max_read_workers=<{max_read_workers}> | must be at least 1")
+        if snapshot_interval is not None and snapshot_interval < 1:
+            raise ValueError(f"snapshot_interval=<{snapshot_interval}> | must be at least 1")
+
         self.bucket = bucket
         self.prefix = prefix
+        self.max_read_workers = max_read_workers
+        self.snapshot_interval = snapshot_interval
+
+        # Serialized messages of each (session id, agent id) created since its last snapshot
+        self._pending_snapshot_messages: dict[tuple[str, str], list[dict[str, Any]]] = {}
 
         session = boto_session or boto3.Session(region_name=region_name)
 
@@ -82,7 +109,7 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
             client_config = BotocoreConfig(user_agent_extra="strands-agents")
 
         self.client = session.client(service_name="s3", config=client_config)
-        super().__init__(session_id=session_id, session_repository=self)
+        super().__init__(session_id=session_id, session_repository=self, **kwargs)
 
     def _get_session_path(self, session_id: str) -> str:
         """Get session S3 prefix.
@@ -130,6 +157,15 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
         agent_path = self._get_agent_path(session_id, agent_id)
         return f"{agent_path}messages/{MESSAGE_PREFIX}{message_id}.json"
 
+    def _get_snapshots_path(self, session_id: str, agent_id: str) -> str:
+        """Get the S3 prefix of an agent's message snapshots."""
+        return f"{self._get_agent_path(session_id, agent_id)}snapshots/"
+
+    def _get_snapshot_path(self, session_id: str, agent_id: str, first_message_id: int, last_message_id: int) -> str:
+        """Get the S3 key of the snapshot of an agent's messages from first_message_id to last_message_id."""
+        snapshots_path = self._get_snapshots_path(session_id, agent_id)
+        return f"{snapshots_path}{SNAPSHOT_PREFIX}{first_message_id}_{last_message_id}.json"
+
     def _read_s3_object(self, key: str) -> Optional[Dict[str, Any]]:
         """Read JSON object from S3."""
         try:
@@ -236,6 +272,17 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
         message_key = self._get_message_path(session_id, agent_id, message_id)
         self._write_s3_object(message_key, message_dict)
 
+        if self.snapshot_interval is None:
+            return
+
+        # Messages created before the first snapshot of an agent that was not restored by this manager stay in their
+        # own objects, which a restore reads along with the snapshots
+        pending_messages = self._pending_snapshot_messages.setdefault((session_id, agent_id), [])
+        pending_messages.append(message_dict)
+        if len(pending_messages) >= self.snapshot_interval:
+            self._write_snapshot(session_id, agent_id, pending_messages)
+            pending_messages.clear()
+
     def read_message(self, session_id: str, agent_id: str, message_id: int, **kwargs: Any) -> Optional[SessionMessage]:
         """Read message data from S3."""
         message_key = self._get_message_path(session_id, agent_id, message_id)
@@ -254,7 +301,73 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
         # Preserve creation timestamp
         session_message.created_at = previous_message.created_at
         message_key = self._get_message_path(session_id, agent_id, message_id)
-        self._write_s3_object(message_key, session_message.to_dict())
+        message_dict = session_message.to_dict()
+        self._write_s3_object(message_key, message_dict)
+
+        if self.snapshot_interval is None:
+            return
+
+        pending_messages = self._pending_snapshot_messages.get((session_id, agent_id), [])
+        for i, pending_message in enumerate(pending_messages):
+            if pending_message["message_id"] == message_id:
+                pending_messages[i] = message_dict
+                return
+
+        # Keep the snapshot holding the message consistent with the updated message
+        for first_message_id, last_message_id, snapshot_key in self._list_snapshot_keys(session_id, agent_id):
+            if first_message_id <= message_id <= last_message_id:
+                snapshot = self._read_s3_object(snapshot_key)
+                if snapshot is None:
+                    break
+
+                snapshot["messages"] = [
+                    message_dict if snapshot_message["message_id"] == message_id else snapshot_message
+                    for snapshot_message in snapshot["messages"]
+                ]
+                self._write_s3_object(snapshot_key, snapshot)
+                break
+
+    def _write_snapshot(self, session_id: str, agent_id: str, messages: list[dict[str, Any]]) -> None:
+        """Write serialized messages of an agent to a new snapshot object."""
+        snapshot_key = self._get_snapshot_path(
+            session_id, agent_id, messages[0]["message_id"], messages[-1]["message_id"]
+        )
+        self._write_s3_object(snapshot_key, {"messages": messages})
+
+    def _list_snapshot_keys(self, session_id: str, agent_id: str) -> list[tuple[int, int, str]]:
+        """List the snapshot objects of an agent.
+
+        Returns:
+            The first message id, last message id, and key of each snapshot, sorted by message id.
+        """
+        snapshots_prefix = self._get_snapshots_path(session_id, agent_id)
+        try:
+            paginator = self.client.get_paginator("list_objects_v2")
+            pages = paginator.paginate(Bucket=self.bucket, Prefix=snapshots_prefix)
+
+            snapshot_keys: list[tuple[int, int, str]] = []
+            for page in pages:
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    filename = key.split("/")[-1]
+                    if filename.startswith(SNAPSHOT_PREFIX) and filename.endswith(".json"):
+                        # Extract the message ids from snapshot_<first id>_<last id>.json format
+                        first_message_id, last_message_id = filename[len(SNAPSHOT_PREFIX) : -5].split("_")
+                        snapshot_keys.append((int(first_message_id), int(last_message_id), key))
+
+        except ClientError as e:
+            raise SessionException(f"S3 error listing snapshots: {e}") from e
+
+        snapshot_keys.sort()
+        return snapshot_keys
+
+    def _read_s3_objects(self, keys: list[str]) -> list[Optional[Dict[str, Any]]]:
+        """Read JSON objects from S3 concurrently, preserving the order of the keys."""
+        if len(keys) <= 1:
+            return [self._read_s3_object(key) for key in keys]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_read_workers, len(keys))) as executor:
+            return list(executor.map(self._read_s3_object, keys))
 
     def list_messages(
         self, session_id: str, agent_id: str, limit: Optional[int] = None, offset: int = 0, **kwargs: Any
@@ -278,27 +391,63 @@ class S3SessionManager(RepositorySessionManager, SessionRepository):
                             index = int(filename[len(MESSAGE_PREFIX) : -5])  # Remove prefix and .json suffix
                             message_index_keys.append((index, key))
 
-            # Sort by index and extract just the keys
-            message_keys = [k for _, k in sorted(message_index_keys)]
+            # Sort by index
+            message_index_keys.sort()
+
+            if self.snapshot_interval is not None:
+                return self._list_messages_from_snapshot(session_id, agent_id, message_index_keys, limit, offset)
 
             # Apply pagination to keys before loading content
             if limit is not None:
-                message_keys = message_keys[offset : offset + limit]
+                message_keys = [k for _, k in message_index_keys[offset : offset + limit]]
             else:
-                message_keys = message_keys[offset:]
+                message_keys = [k for _, k in message_index_keys[offset:]]
 
             # Load only the required message objects
-            messages: List[SessionMessage] = []
-            for key in message_keys:
-                message_data = self._read_s3_object(key)
-                if message_data:
-                    messages.append(SessionMessage.from_dict(message_data))
-
-            return messages
+            return [
+                SessionMessage.from_dict(message_data)
+                for message_data in self._read_s3_objects(message_keys)
+                if message_data
+            ]
 
         except ClientError as e:
             raise SessionException(f"S3 error reading messages: {e}") from e
 
+    def _list_messages_from_snapshot(
+        self,
+        session_id: str,
+        agent_id: str,
+        message_index_keys: list[tuple[int, str]],
+        limit: Optional[int],
+        offset: int,
+    ) -> List[SessionMessage]:
+        """List messages by reading the agent's snapshots and only fetching the messages not covered by them.
+
+        All messages are loaded, regardless of the pagination, so that the messages not covered by a snapshot are
+        known and included in the next snapshot.
+        """
+        snapshot_keys = [key for _, _, key in self._list_snapshot_keys(session_id, agent_id)]
+        snapshot_messages = [
+            message for snapshot in self._read_s3_objects(snapshot_keys) if snapshot for message in snapshot["messages"]
+        ]
+        snapshot_ids = {message["message_id"] for message in snapshot_messages}
+
+        tail_keys = [key for index, key in message_index_keys if index not in snapshot_ids]
+        tail_messages = [message for message in self._read_s3_objects(tail_keys) if message]
+        self._pending_snapshot_messages[(session_id, agent_id)] = list(tail_messages)
+
+        all_messages = sorted(snapshot_messages + tail_messages, key=lambda message: message["message_id"])
+
+        logger.debug(
+            "agent_id=<%s>, snapshot_messages=<%d>, tail_messages=<%d> | listed messages from snapshot",
+            agent_id,
+            len(snapshot_messages),
+            len(tail_messages),
+        )
+
+        page = all_messages[offset : offset + limit] if limit is not None else all_messages[offset:]
+        return [SessionMessage.from_dict(message) for message in page]
+
     def _get_multi_agent_path(self, session_id: str, multi_agent_id: str) -> str:
         """Get multi-agent S3 prefix."""
         session_path = self._get_session_path(session_id)
@@ -113,6 +113,10 @@ class ToolMetrics:
         success_count: Number of successful tool calls.
         error_count: Number of failed tool calls.
         total_time: Total execution time across all calls in seconds.
+        total_queue_time: Total time calls spent waiting for a concurrency slot, rate limit token, or executor worker
+            in seconds.
+        cache_hit_count: Number of calls answered from the tool's result cache.
+        cache_miss_count: Number of calls of a cached tool that had no cached result.
     """
 
     tool: ToolUse
@@ -120,6 +124,9 @@ class ToolMetrics:
     success_count: int = 0
     error_count: int = 0
     total_time: float = 0.0
+    total_queue_time: float = 0.0
+    cache_hit_count: int = 0
+    cache_miss_count: int = 0
 
     def add_call(
         self,
@@ -179,6 +186,19 @@ class AgentInvocation:
     usage: Usage = field(default_factory=lambda: Usage(inputTokens=0, outputTokens=0, totalTokens=0))
 
 
+@dataclass
+class InputTokenEstimate:
+    """Estimated and actual input tokens of a model call.
+
+    Attributes:
+        estimated: Input tokens estimated before the model call.
+        actual: Input tokens reported by the model, including tokens read from or written to the prompt cache.
+    """
+
+    estimated: int
+    actual: int
+
+
 @dataclass
 class EventLoopMetrics:
     """Aggregated metrics for an event loop's execution.
@@ -191,6 +211,8 @@ class EventLoopMetrics:
         traces: List of execution traces.
         accumulated_usage: Accumulated token usage across all model invocations (across all requests).
         accumulated_metrics: Accumulated performance metrics across all model invocations.
+        max_tool_queue_depth: Largest number of tool calls observed waiting to be admitted by the tool executor.
+        input_token_estimates: Estimated and actual input tokens of the model calls that were estimated.
     """
 
     cycle_count: int = 0
@@ -200,6 +222,9 @@ class EventLoopMetrics:
     traces: list[Trace] = field(default_factory=list)
     accumulated_usage: Usage = field(default_factory=lambda: Usage(inputTokens=0, outputTokens=0, totalTokens=0))
     accumulated_metrics: Metrics = field(default_factory=lambda: Metrics(latencyMs=0))
+    max_tool_queue_depth: int = 0
+    input_token_estimates: list[InputTokenEstimate] = field(default_factory=list)
+    _pending_input_token_estimate: Optional[int] = field(default=None, repr=False)
 
     @property
     def _metrics_client(self) -> "MetricsClient":
@@ -299,6 +324,51 @@ class EventLoopMetrics:
         )
         tool_trace.end()
 
+    def add_tool_queue_wait(self, tool: ToolUse, wait_time: float, queue_depth: Optional[int] = None) -> None:
+        """Record the time a tool call waited before the tool executor or the tool's own executor admitted it.
+
+        Args:
+            tool: The tool that was queued.
+            wait_time: How long the call waited in seconds.
+            queue_depth: Number of tool calls waiting, including this one, when the call was queued, if known.
+        """
+        tool_name = tool.get("name", "unknown_tool")
+        attributes = {"tool_name": tool_name, "tool_use_id": tool.get("toolUseId", "unknown")}
+
+        self.tool_metrics.setdefault(tool_name, ToolMetrics(tool)).total_queue_time += wait_time
+        self._metrics_client.tool_queue_wait.record(wait_time, attributes=attributes)
+        if queue_depth is not None:
+            self.max_tool_queue_depth = max(self.max_tool_queue_depth, queue_depth)
+            self._metrics_client.tool_queue_depth.record(queue_depth, attributes=attributes)
+
+    def add_tool_cache_lookup(self, tool: ToolUse, hit: bool) -> None:
+        """Record a lookup of a tool call in the tool's result cache.
+
+        Args:
+            tool: The tool that was called.
+            hit: Whether a cached result was found.
+        """
+        tool_name = tool.get("name", "unknown_tool")
+        attributes = {"tool_name": tool_name}
+        tool_metrics = self.tool_metrics.setdefault(tool_name, ToolMetrics(tool))
+
+        if hit:
+            tool_metrics.cache_hit_count += 1
+            self._metrics_client.tool_cache_hit_count.add(1, attributes=attributes)
+        else:
+            tool_metrics.cache_miss_count += 1
+            self._metrics_client.tool_cache_miss_count.add(1, attributes=attributes)
+
+    def set_input_token_estimate(self, estimated_tokens: int) -> None:
+        """Set the estimated input tokens of the next model call.
+
+        The estimate is compared with the input tokens reported in the usage of the call.
+
+        Args:
+            estimated_tokens: Estimated input tokens of the call.
+        """
+        self._pending_input_token_estimate = estimated_tokens
+
     def _accumulate_usage(self, target: Usage, source: Usage) -> None:
         """Helper method to accumulate usage from source to target.
 
@@ -332,6 +402,14 @@ class EventLoopMetrics:
         if "cacheWriteInputTokens" in usage:
             self._metrics_client.event_loop_cache_write_input_tokens.record(usage["cacheWriteInputTokens"])
 
+        if self._pending_input_token_estimate is not None:
+            estimated = self._pending_input_token_estimate
+            actual = usage["inputTokens"] + usage.get("cacheReadInputTokens", 0) + usage.get("cacheWriteInputTokens", 0)
+            self._pending_input_token_estimate = None
+            self.input_token_estimates.append(InputTokenEstimate(estimated=estimated, actual=actual))
+            self._metrics_client.event_loop_estimated_input_tokens.record(estimated)
+            self._metrics_client.event_loop_input_tokens_estimate_error.record(estimated - actual)
+
         self._accumulate_usage(self.accumulated_usage, usage)
         self._accumulate_usage(self.agent_invocations[-1].usage, usage)
 
@@ -358,6 +436,35 @@ class EventLoopMetrics:
             self._metrics_client.model_time_to_first_token.record(metrics["timeToFirstByteMs"])
         self.accumulated_metrics["latencyMs"] += metrics["latencyMs"]
 
+    def merge(self, other: "EventLoopMetrics") -> None:
+        """Add the metrics collected by another event loop to these metrics.
+
+        The other metrics were already recorded to OpenTelemetry when they were collected, so they are only added to
+        the totals here.
+
+        Args:
+            other: The metrics to add.
+        """
+        self.cycle_count += other.cycle_count
+        self.cycle_durations.extend(other.cycle_durations)
+        self.agent_invocations.extend(other.agent_invocations)
+        self.traces.extend(other.traces)
+        self._accumulate_usage(self.accumulated_usage, other.accumulated_usage)
+        self.accumulated_metrics["latencyMs"] += other.accumulated_metrics["latencyMs"]
+        self.max_tool_queue_depth = max(self.max_tool_queue_depth, other.max_tool_queue_depth)
+        self.input_token_estimates.extend(other.input_token_estimates)
+
+        for tool_name, other_tool_metrics in other.tool_metrics.items():
+            tool_metrics = self.tool_metrics.setdefault(tool_name, ToolMetrics(other_tool_metrics.tool))
+            tool_metrics.tool = other_tool_metrics.tool
+            tool_metrics.call_count += other_tool_metrics.call_count
+            tool_metrics.success_count += other_tool_metrics.success_count
+            tool_metrics.error_count += other_tool_metrics.error_count
+            tool_metrics.total_time += other_tool_metrics.total_time
+            tool_metrics.total_queue_time += other_tool_metrics.total_queue_time
+            tool_metrics.cache_hit_count += other_tool_metrics.cache_hit_count
+            tool_metrics.cache_miss_count += other_tool_metrics.cache_miss_count
+
     def get_summary(self) -> Dict[str, Any]:
         """Generate a comprehensive summary of all collected metrics.
 
@@ -381,8 +488,16 @@ class EventLoopMetrics:
                         "success_count": metrics.success_count,
                         "error_count": metrics.error_count,
                         "total_time": metrics.total_time,
+                        "total_queue_time": metrics.total_queue_time,
                         "average_time": (metrics.total_time / metrics.call_count if metrics.call_count > 0 else 0),
                         "success_rate": (metrics.success_count / metrics.call_count if metrics.call_count > 0 else 0),
+                        "cache_hit_count": metrics.cache_hit_count,
+                        "cache_miss_count": metrics.cache_miss_count,
+                        "cache_hit_rate": (
+                            metrics.cache_hit_count / (metrics.cache_hit_count + metrics.cache_miss_count)
+                            if metrics.cache_hit_count + metrics.cache_miss_count > 0
+                            else 0
+                        ),
                     },
                 }
                 for tool_name, metrics in self.tool_metrics.items()
@@ -390,6 +505,9 @@ class EventLoopMetrics:
             "traces": [trace.to_dict() for trace in self.traces],
             "accumulated_usage": self.accumulated_usage,
             "accumulated_metrics": self.accumulated_metrics,
+            "input_token_estimates": [
+                {"estimated": estimate.estimated, "actual": estimate.actual} for estimate in self.input_token_estimates
+            ],
             "agent_invocations": [
                 {
                     "usage": invocation.usage,
@@ -448,6 +566,11 @@ def _metrics_summary_to_lines(event_loop_metrics: EventLoopMetrics, allowed_name
         yield f"      ├─ Stats: calls={exec_stats['call_count']}, success={exec_stats['success_count']}"
         yield f"      │         errors={exec_stats['error_count']}, success_rate={exec_stats['success_rate']:.1%}"
         yield f"      ├─ Timing: avg={exec_stats['average_time']:.3f}s, total={exec_stats['total_time']:.3f}s"
+        if exec_stats["cache_hit_count"] or exec_stats["cache_miss_count"]:
+            yield (
+                f"      ├─ Cache: hits={exec_stats['cache_hit_count']}, misses={exec_stats['cache_miss_count']}, "
+                f"hit_rate={exec_stats['cache_hit_rate']:.1%}"
+            )
         # All tool calls with their inputs
         yield "      └─ Tool Calls:"
         # Show tool use ID and input for each call from the traces
@@ -528,11 +651,19 @@ class MetricsClient:
     event_loop_output_tokens: Histogram
     event_loop_cache_read_input_tokens: Histogram
     event_loop_cache_write_input_tokens: Histogram
+    event_loop_estimated_input_tokens: Histogram
+    event_loop_input_tokens_estimate_error: Histogram
     model_time_to_first_token: Histogram
+    model_executor_queue_wait: Histogram
+    model_executor_active: Histogram
     tool_call_count: Counter
     tool_success_count: Counter
     tool_error_count: Counter
     tool_duration: Histogram
+    tool_queue_wait: Histogram
+    tool_queue_depth: Histogram
+    tool_cache_hit_count: Counter
+    tool_cache_miss_count: Counter
 
     def __new__(cls) -> "MetricsClient":
         """Create or return the singleton instance of MetricsClient.
@@ -575,6 +706,12 @@ class MetricsClient:
         self.tool_success_count = self.meter.create_counter(name=constants.STRANDS_TOOL_SUCCESS_COUNT, unit="Count")
         self.tool_error_count = self.meter.create_counter(name=constants.STRANDS_TOOL_ERROR_COUNT, unit="Count")
         self.tool_duration = self.meter.create_histogram(name=constants.STRANDS_TOOL_DURATION, unit="s")
+        self.tool_queue_wait = self.meter.create_histogram(name=constants.STRANDS_TOOL_QUEUE_WAIT, unit="s")
+        self.tool_queue_depth = self.meter.create_histogram(name=constants.STRANDS_TOOL_QUEUE_DEPTH, unit="Count")
+        self.tool_cache_hit_count = self.meter.create_counter(name=constants.STRANDS_TOOL_CACHE_HIT_COUNT, unit="Count")
+        self.tool_cache_miss_count = self.meter.create_counter(
+            name=constants.STRANDS_TOOL_CACHE_MISS_COUNT, unit="Count"
+        )
         self.event_loop_input_tokens = self.meter.create_histogram(
             name=constants.STRANDS_EVENT_LOOP_INPUT_TOKENS, unit="token"
         )
@@ -587,6 +724,18 @@ class MetricsClient:
         self.event_loop_cache_write_input_tokens = self.meter.create_histogram(
             name=constants.STRANDS_EVENT_LOOP_CACHE_WRITE_INPUT_TOKENS, unit="token"
         )
+        self.event_loop_estimated_input_tokens = self.meter.create_histogram(
+            name=constants.STRANDS_EVENT_LOOP_ESTIMATED_INPUT_TOKENS, unit="token"
+        )
+        self.event_loop_input_tokens_estimate_error = self.meter.create_histogram(
+            name=constants.STRANDS_EVENT_LOOP_INPUT_TOKENS_ESTIMATE_ERROR, unit="token"
+        )
         self.model_time_to_first_token = self.meter.create_histogram(
             name=constants.STRANDS_MODEL_TIME_TO_FIRST_TOKEN, unit="ms"
         )
+        self.model_executor_queue_wait = self.meter.create_histogram(
+            name=constants.STRANDS_MODEL_EXECUTOR_QUEUE_WAIT, unit="s"
+        )
+        self.model_executor_active = self.meter.create_histogram(
+            name=constants.STRANDS_MODEL_EXECUTOR_ACTIVE, unit="Count"
+        )
@@ -6,13 +6,21 @@ STRANDS_EVENT_LOOP_END_CYCLE = "strands.event_loop.end_cycle"
 STRANDS_TOOL_CALL_COUNT = "strands.tool.call_count"
 STRANDS_TOOL_SUCCESS_COUNT = "strands.tool.success_count"
 STRANDS_TOOL_ERROR_COUNT = "strands.tool.error_count"
+STRANDS_TOOL_CACHE_HIT_COUNT = "strands.tool.cache.hit_count"
+STRANDS_TOOL_CACHE_MISS_COUNT = "strands.tool.cache.miss_count"
 
 # Histograms
 STRANDS_EVENT_LOOP_LATENCY = "strands.event_loop.latency"
 STRANDS_TOOL_DURATION = "strands.tool.duration"
+STRANDS_TOOL_QUEUE_WAIT = "strands.tool.queue_wait"
+STRANDS_TOOL_QUEUE_DEPTH = "strands.tool.queue_depth"
 STRANDS_EVENT_LOOP_CYCLE_DURATION = "strands.event_loop.cycle_duration"
 STRANDS_EVENT_LOOP_INPUT_TOKENS = "strands.event_loop.input.tokens"
 STRANDS_EVENT_LOOP_OUTPUT_TOKENS = "strands.event_loop.output.tokens"
 STRANDS_EVENT_LOOP_CACHE_READ_INPUT_TOKENS = "strands.event_loop.cache_read.input.tokens"
 STRANDS_EVENT_LOOP_CACHE_WRITE_INPUT_TOKENS = "strands.event_loop.cache_write.input.tokens"
+STRANDS_EVENT_LOOP_ESTIMATED_INPUT_TOKENS = "strands.event_loop.estimated.input.tokens"
+STRANDS_EVENT_LOOP_INPUT_TOKENS_ESTIMATE_ERROR = "strands.event_loop.input.tokens.estimate_error"
 STRANDS_MODEL_TIME_TO_FIRST_TOKEN = "strands.model.time_to_first_token"
+STRANDS_MODEL_EXECUTOR_QUEUE_WAIT = "strands.model.executor.queue_wait"
+STRANDS_MODEL_EXECUTOR_ACTIVE = "strands.model.executor.active"
@@ -7,12 +7,16 @@ enabling trace data to be sent to OTLP endpoints.
 import json
 import logging
 import os
+import threading
+import uuid
+from collections import OrderedDict
 from datetime import date, datetime, timezone
+from enum import Enum
 from typing import Any, Dict, Mapping, Optional, cast
 
 import opentelemetry.trace as trace_api
 from opentelemetry.instrumentation.threading import ThreadingInstrumentor
-from opentelemetry.trace import Span, StatusCode
+from opentelemetry.trace import Span, SpanContext, StatusCode
 
 from ..agent.agent_result import AgentResult
 from ..types.content import ContentBlock, Message, Messages
@@ -24,9 +28,52 @@ from ..types.traces import Attributes, AttributeValue
 
 logger = logging.getLogger(__name__)
 
+_MAX_MESSAGE_CURSORS = 1024
+_TRUNCATED_MARKER = "...<truncated>"
+
+
+def _default(value: Any) -> Any:
+    """Convert a value the JSON encoder does not natively support.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The ISO format of dates and datetimes, the string form of UUIDs, the value of enum members, or a placeholder for
+        all other values.
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+
+    return "<replaced>"
+
 
 class JSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles non-serializable types."""
+    """Custom JSON encoder that handles non-serializable types.
+
+    Values are encoded in a single pass, with datetimes converted to ISO format, UUIDs to strings, enum members to
+    their values, and all other unsupported values, such as bytes, dataclasses, and arbitrary objects, replaced with a
+    placeholder. Values the encoder rejects mid-pass (e.g., integers too large to convert) fall back to a slower pass
+    that replaces them individually.
+
+    Tuples are encoded like lists, replacing only their unsupported items. Before the single pass, a tuple with any
+    unsupported item was replaced as a whole, and UUIDs and enum members were replaced as well.
+    """
+
+    def default(self, o: Any) -> Any:
+        """Convert a value the JSON encoder does not natively support.
+
+        Args:
+            o: The value to convert.
+
+        Returns:
+            JSON serializable representation of the value.
+        """
+        return _default(o)
 
     def encode(self, obj: Any) -> str:
         """Recursively encode objects, preserving structure and only replacing unserializable values.
@@ -37,10 +84,12 @@ class JSONEncoder(json.JSONEncoder):
         Returns:
             JSON string representation of the object
         """
-        # Process the object to handle non-serializable values
-        processed_obj = self._process_value(obj)
-        # Use the parent class to encode the processed object
-        return super().encode(processed_obj)
+        try:
+            return super().encode(obj)
+        except (OverflowError, ValueError):
+            # Process the object to handle values that fail during encoding
+            processed_obj = self._process_value(obj)
+            return super().encode(processed_obj)
 
     def _process_value(self, value: Any) -> Any:
         """Process any value, handling containers recursively.
@@ -67,7 +116,7 @@ class JSONEncoder(json.JSONEncoder):
         else:
             try:
                 # Test if the value is JSON serializable
-                json.dumps(value)
+                json.dumps(value, default=_default)
                 return value
             except (TypeError, OverflowError, ValueError):
                 return "<replaced>"
@@ -84,6 +133,13 @@ class Tracer:
 
     Both attributes are controlled by including "gen_ai_latest_experimental" or "gen_ai_tool_definitions",
     respectively, in the OTEL_SEMCONV_STABILITY_OPT_IN environment variable.
+
+    Message history recorded on model invoke spans is controlled by the STRANDS_TRACE_MESSAGES environment variable.
+    With "full" (the default), every span records the entire conversation. With "incremental", a span only records the
+    messages appended since the previous model invoke span of the same conversation and trace, and references that span
+    through the "strands.messages.previous_span_id" attribute. STRANDS_TRACE_MAX_MESSAGE_SIZE caps the number of
+    characters recorded per message event. Longer content is recorded as valid JSON with its strings shortened and
+    suffixed with "...<truncated>", and the event gets the "strands.truncated" attribute.
     """
 
     def __init__(self) -> None:
@@ -100,6 +156,16 @@ class Tracer:
         self.use_latest_genai_conventions = "gen_ai_latest_experimental" in opt_in_values
         self._include_tool_definitions = "gen_ai_tool_definitions" in opt_in_values
 
+        self.incremental_messages = os.getenv("STRANDS_TRACE_MESSAGES", "full").strip().lower() == "incremental"
+        self.max_message_event_size = self._parse_max_message_event_size()
+
+        # (trace id, conversation id) -> (number of messages recorded, first and last recorded message, context of the
+        # recording span). The messages are compared by identity to detect histories reduced in place.
+        self._message_cursors: OrderedDict[
+            tuple[int, int], tuple[int, Optional[Message], Optional[Message], SpanContext]
+        ] = OrderedDict()
+        self._message_cursors_lock = threading.Lock()
+
     def _parse_semconv_opt_in(self) -> set[str]:
         """Parse the OTEL_SEMCONV_STABILITY_OPT_IN environment variable.
 
@@ -109,6 +175,24 @@ class Tracer:
         opt_in_env = os.getenv("OTEL_SEMCONV_STABILITY_OPT_IN", "")
         return {value.strip() for value in opt_in_env.split(",")}
 
+    def _parse_max_message_event_size(self) -> Optional[int]:
+        """Parse the STRANDS_TRACE_MAX_MESSAGE_SIZE environment variable.
+
+        Returns:
+            The maximum number of characters recorded per message event, or None if uncapped.
+        """
+        max_size_env = os.getenv("STRANDS_TRACE_MAX_MESSAGE_SIZE")
+        if not max_size_env:
+            return None
+
+        try:
+            max_size = int(max_size_env)
+        except ValueError:
+            logger.warning("max_message_size=<%s> | ignoring invalid STRANDS_TRACE_MAX_MESSAGE_SIZE", max_size_env)
+            return None
+
+        return max_size if max_size > 0 else None
+
     def _start_span(
         self,
         span_name: str,
@@ -304,7 +388,10 @@ class Tracer:
         attributes.update({k: v for k, v in kwargs.items() if isinstance(v, (str, int, float, bool))})
 
         span = self._start_span("chat", parent_span, attributes=attributes, span_kind=trace_api.SpanKind.INTERNAL)
-        self._add_event_messages(span, messages)
+        if self.incremental_messages:
+            self._add_incremental_event_messages(span, messages)
+        else:
+            self._add_event_messages(span, messages)
 
         return span
 
@@ -794,13 +881,74 @@ class Tracer:
             )
         return dict(common_attributes)
 
+    def _add_incremental_event_messages(self, span: Span, messages: Messages) -> None:
+        """Adds only the messages appended since the previous span recorded for the same conversation.
+
+        Conversations are identified by the trace of the span and the identity of the messages list. If the previously
+        recorded messages are no longer the head of the history (e.g., the conversation manager reduced the context in
+        place), it is recorded in full.
+
+        Args:
+            span: The span to which events will be added.
+            messages: List of messages being sent to the model.
+        """
+        if not span or not span.is_recording():
+            return
+
+        span_context = span.get_span_context()
+        key = (span_context.trace_id, id(messages))
+
+        with self._message_cursors_lock:
+            cursor = self._message_cursors.pop(key, None)
+            self._message_cursors[key] = (
+                len(messages),
+                messages[0] if messages else None,
+                messages[-1] if messages else None,
+                span_context,
+            )
+            if len(self._message_cursors) > _MAX_MESSAGE_CURSORS:
+                self._message_cursors.popitem(last=False)
+
+        start_index = 0
+        if cursor is not None and self._is_history_extended(messages, cursor[0], cursor[1], cursor[2]):
+            start_index = cursor[0]
+            span.set_attribute("strands.messages.previous_span_id", trace_api.format_span_id(cursor[3].span_id))
+
+        span.set_attribute("strands.messages.start_index", start_index)
+        span.set_attribute("strands.messages.total_count", len(messages))
+        self._add_event_messages(span, messages[start_index:])
+
+    @staticmethod
+    def _is_history_extended(messages: Messages, count: int, first: Optional[Message], last: Optional[Message]) -> bool:
+        """Whether messages only had messages appended since the previous recording.
+
+        Args:
+            messages: Current conversation history.
+            count: Number of messages previously recorded.
+            first: First message previously recorded.
+            last: Last message previously recorded.
+
+        Returns:
+            True if the previously recorded messages are still the head of the history.
+        """
+        if count == 0:
+            return True
+        if count > len(messages):
+            return False
+        return messages[0] is first and messages[count - 1] is last
+
     def _add_event_messages(self, span: Span, messages: Messages) -> None:
         """Adds messages as event to the provided span based on the current GenAI conventions.
 
+        Nothing is serialized if the span is not recording.
+
         Args:
             span: The span to which events will be added.
             messages: List of messages being sent to the agent.
         """
+        if not span or not span.is_recording():
+            return
+
         if self.use_latest_genai_conventions:
             input_messages: list = []
             for message in messages:
@@ -808,16 +956,37 @@ class Tracer:
                     {"role": message["role"], "parts": self._map_content_blocks_to_otel_parts(message["content"])}
                 )
             self._add_event(
-                span, "gen_ai.client.inference.operation.details", {"gen_ai.input.messages": serialize(input_messages)}
+                span,
+                "gen_ai.client.inference.operation.details",
+                self._message_event_attributes("gen_ai.input.messages", input_messages),
             )
         else:
             for message in messages:
                 self._add_event(
                     span,
                     self._get_event_name_for_message(message),
-                    {"content": serialize(message["content"])},
+                    self._message_event_attributes("content", message["content"]),
                 )
 
+    def _message_event_attributes(self, name: str, value: Any) -> Attributes:
+        """Serialize message content into event attributes, capped to the configured maximum size.
+
+        Content exceeding the maximum size is shortened while remaining valid JSON, and the event is flagged with the
+        "strands.truncated" attribute.
+
+        Args:
+            name: Name of the attribute holding the content.
+            value: The message content.
+
+        Returns:
+            The event attributes.
+        """
+        serialized = serialize(value)
+        if self.max_message_event_size is None or len(serialized) <= self.max_message_event_size:
+            return {name: serialized}
+
+        return {name: _truncate_json(serialized, self.max_message_event_size), "strands.truncated": True}
+
     def _map_content_blocks_to_otel_parts(
         self, content_blocks: list[ContentBlock] | list[InterruptResponseContent]
     ) -> list[dict[str, Any]]:
@@ -869,6 +1038,66 @@ class Tracer:
 _tracer_instance = None
 
 
+def _truncate_strings(value: Any, limit: int) -> Any:
+    """Cut the strings nested in a JSON value to limit characters, marking the ones that were cut.
+
+    Strings are only cut if that makes them shorter including the marker, so the result only grows with the limit.
+    """
+    if isinstance(value, str):
+        return value[:limit] + _TRUNCATED_MARKER if len(value) > limit + len(_TRUNCATED_MARKER) else value
+    if isinstance(value, list):
+        return [_truncate_strings(item, limit) for item in value]
+    if isinstance(value, dict):
+        return {key: _truncate_strings(item, limit) for key, item in value.items()}
+    return value
+
+
+def _longest_string(value: Any) -> int:
+    """Get the length of the longest string nested in a JSON value."""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, list):
+        return max((_longest_string(item) for item in value), default=0)
+    if isinstance(value, dict):
+        return max((_longest_string(item) for item in value.values()), default=0)
+    return 0
+
+
+def _truncate_json(serialized: str, max_size: int) -> str:
+    """Shorten a serialized JSON value to at most max_size characters while keeping it valid JSON.
+
+    The strings of the value are cut to the longest length that fits, found by binary search. If the value does not
+    fit even with empty strings, the trailing items of a top level list are dropped as well.
+
+    Args:
+        serialized: The serialized value, longer than max_size.
+        max_size: Maximum number of characters.
+
+    Returns:
+        The shortened serialized value.
+    """
+    data = json.loads(serialized)
+
+    low, high = 0, _longest_string(data) - 1
+    best: Optional[str] = None
+    while low <= high:
+        limit = (low + high) // 2
+        candidate = serialize(_truncate_strings(data, limit))
+        if len(candidate) <= max_size:
+            best, low = candidate, limit + 1
+        else:
+            high = limit - 1
+
+    if best is not None:
+        return best
+
+    data = _truncate_strings(data, 0)
+    if isinstance(data, list):
+        while data and len(serialize(data)) > max_size:
+            data.pop()
+    return serialize(data)
+
+
 def get_tracer() -> Tracer:
     """Get or create the global tracer.
 
@@ -886,10 +1115,44 @@ def get_tracer() -> Tracer:
 def serialize(obj: Any) -> str:
     """Serialize an object to JSON with consistent settings.
 
+    Uses orjson when it is installed and selected through STRANDS_TRACE_JSON_BACKEND=orjson. Both backends convert
+    values the same way, as described in `JSONEncoder`, except that orjson emits compact JSON without whitespace
+    between separators.
+
     Args:
         obj: The object to serialize
 
     Returns:
         JSON string representation of the object
     """
+    if _orjson is not None:
+        try:
+            # Dataclasses and datetimes are left to _default, as orjson would otherwise serialize them natively
+            options = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATACLASS | _orjson.OPT_PASSTHROUGH_DATETIME
+            return cast(str, _orjson.dumps(obj, default=_default, option=options).decode())
+        except TypeError:
+            # orjson rejects values such as integers above 64 bits, which the standard encoder supports
+            pass
+
     return json.dumps(obj, ensure_ascii=False, cls=JSONEncoder)
+
+
+def _load_orjson() -> Any:
+    """Load orjson if it is selected as the JSON backend.
+
+    Returns:
+        The orjson module, or None if the standard library backend is used.
+    """
+    if os.getenv("STRANDS_TRACE_JSON_BACKEND", "json").strip().lower() != "orjson":
+        return None
+
+    try:
+        import orjson
+    except ImportError:
+        logger.warning("orjson is not installed, falling back to the standard library json backend")
+        return None
+
+    return orjson
+
+
+_orjson = _load_orjson()
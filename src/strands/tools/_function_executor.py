@@ -0,0 +1,222 @@
+"""Dedicated thread and process pools for running synchronous @tool functions."""
+
+import asyncio
+import contextvars
+import functools
+import importlib
+import inspect
+import logging
+import pickle
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ToolExecutorOption = Union[Literal["thread", "process"], Executor]
+"""Where a synchronous tool function runs: a dedicated thread pool, a dedicated process pool, or a given executor."""
+
+# Pools shared by tools that use the same pool name, created on their first tool call
+_pools: dict[tuple[str, str], Executor] = {}
+_pool_max_workers: dict[tuple[str, str], Optional[int]] = {}
+_pools_lock = threading.Lock()
+
+
+def _call_in_thread(func: Callable[..., Any], kwargs: dict[str, Any]) -> tuple[float, Any]:
+    """Call the tool function on an executor thread.
+
+    Returns:
+        The time the call started and the function result.
+    """
+    return time.time(), func(**kwargs)
+
+
+def _call_in_process(module_name: str, qualname: str, pickled_kwargs: bytes) -> tuple[float, bytes]:
+    """Call the tool function in a worker process.
+
+    The function is looked up by name since @tool replaces it in its module, so it cannot be pickled by reference.
+
+    Returns:
+        The time the call started and the pickled function result.
+
+    Raises:
+        TypeError: If the result cannot be pickled.
+    """
+    started_at = time.time()
+
+    target: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    func = getattr(target, "_tool_func", target)
+
+    result = func(**pickle.loads(pickled_kwargs))
+    try:
+        return started_at, pickle.dumps(result)
+    except Exception as e:
+        raise TypeError(
+            f"result of type {type(result).__name__} cannot be pickled to return it from the process"
+        ) from e
+
+
+class FunctionExecutor:
+    """Runs a synchronous tool function on a dedicated executor and measures how long calls wait for a worker."""
+
+    def __init__(
+        self,
+        executor: ToolExecutorOption,
+        func: Callable[..., Any],
+        tool_name: str,
+        pool: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        context_param: Optional[str] = None,
+    ) -> None:
+        """Initialize the function executor.
+
+        Args:
+            executor: "thread" or "process" to run on a pool created for the tool, or the executor to run on.
+            func: The synchronous tool function.
+            tool_name: The name of the tool.
+            pool: Name of the pool, to share one pool between tools. Defaults to the tool name.
+            max_workers: Size limit of the pool. Defaults to the default of the pool type.
+            context_param: Name of the parameter the tool context is injected into, if the tool uses it.
+
+        Raises:
+            ValueError: If the function or options cannot be used with the executor.
+        """
+        if inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func):
+            raise ValueError(f"tool_name=<{tool_name}> | executor only applies to synchronous functions")
+
+        if isinstance(executor, Executor):
+            if pool is not None or max_workers is not None:
+                raise ValueError(f"tool_name=<{tool_name}> | pool and max_workers only apply to executor names")
+            self._executor: Optional[Executor] = executor
+            self._pool_key: Optional[tuple[str, str]] = None
+            self._in_process = isinstance(executor, ProcessPoolExecutor)
+        elif executor in ("thread", "process"):
+            if max_workers is not None and max_workers < 1:
+                raise ValueError(f"max_workers=<{max_workers}> | must be at least 1")
+            self._executor = None
+            self._pool_key = (executor, pool or tool_name)
+            self._in_process = executor == "process"
+            _register_pool(self._pool_key, max_workers)
+        else:
+            raise ValueError(f"executor=<{executor}> | must be 'thread', 'process', or an Executor")
+
+        if self._in_process:
+            parameters = inspect.signature(func).parameters
+            # The agent and tool context cannot be pickled
+            if context_param is not None:
+                raise ValueError(f"tool_name=<{tool_name}> | tool context cannot be sent to a process")
+            if "agent" in parameters:
+                raise ValueError(f"tool_name=<{tool_name}> | agent cannot be sent to a process")
+            if "<locals>" in func.__qualname__ or "self" in parameters:
+                raise ValueError(
+                    f"tool_name=<{tool_name}> | process execution requires a function defined at module level"
+                )
+
+        self._module_name = func.__module__
+        self._qualname = func.__qualname__
+
+    async def run(self, func: Callable[..., Any], kwargs: dict[str, Any]) -> tuple[Any, float]:
+        """Run the tool function on the executor.
+
+        Args:
+            func: The tool function, bound to its instance for methods.
+            kwargs: The arguments of the call.
+
+        Returns:
+            The function result and the seconds the call waited for a worker.
+
+        Raises:
+            TypeError: If the arguments or the result cannot be pickled for process execution.
+        """
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+
+        # Wall clock time, since calls may start in another process
+        submitted_at = time.time()
+
+        if self._in_process:
+            try:
+                pickled_kwargs = pickle.dumps(kwargs)
+            except Exception as e:
+                raise TypeError("arguments cannot be pickled to send them to the process") from e
+
+            started_at, pickled_result = await loop.run_in_executor(
+                executor, _call_in_process, self._module_name, self._qualname, pickled_kwargs
+            )
+            result = pickle.loads(pickled_result)
+        else:
+            # Run in a copy of the caller's context, as asyncio.to_thread does, so the tool sees its context variables
+            # such as the current tool span
+            context = contextvars.copy_context()
+            started_at, result = await loop.run_in_executor(
+                executor, functools.partial(context.run, _call_in_thread, func, kwargs)
+            )
+
+        return result, max(0.0, started_at - submitted_at)
+
+    def _get_executor(self) -> Executor:
+        """Get the executor, creating the named pool on first use.
+
+        Returns:
+            The executor to run the tool function on.
+        """
+        if self._executor is not None:
+            return self._executor
+
+        assert self._pool_key is not None
+        with _pools_lock:
+            executor = _pools.get(self._pool_key)
+            if executor is None:
+                kind, name = self._pool_key
+                max_workers = _pool_max_workers.get(self._pool_key)
+                logger.debug("pool=<%s>, kind=<%s>, max_workers=<%s> | creating tool pool", name, kind, max_workers)
+                executor = (
+                    ThreadPoolExecutor(max_workers, thread_name_prefix=f"strands-tool-{name}")
+                    if kind == "thread"
+                    else ProcessPoolExecutor(max_workers)
+                )
+                _pools[self._pool_key] = executor
+
+        return executor
+
+
+def _register_pool(key: tuple[str, str], max_workers: Optional[int]) -> None:
+    """Record the size limit of a named pool.
+
+    Args:
+        key: The pool kind and name.
+        max_workers: Size limit of the pool, or None for the default.
+
+    Raises:
+        ValueError: If the pool was registered with another size limit.
+    """
+    with _pools_lock:
+        if key in _pool_max_workers and max_workers is not None:
+            registered_max_workers = _pool_max_workers[key]
+            if registered_max_workers is not None and registered_max_workers != max_workers:
+                raise ValueError(
+                    f"pool=<{key[1]}>, max_workers=<{max_workers}> | "
+                    f"pool is already registered with max_workers={registered_max_workers}"
+                )
+
+        if _pool_max_workers.get(key) is None:
+            _pool_max_workers[key] = max_workers
+
+
+def shutdown_pools(wait: bool = True) -> None:
+    """Shut down the named tool pools.
+
+    Pools are created again on the next call of a tool that uses them.
+
+    Args:
+        wait: Whether to wait for running calls to finish.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.shutdown(wait=wait)
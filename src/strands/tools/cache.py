@@ -0,0 +1,444 @@
+"""Result caching for idempotent tools.
+
+Tools that return the same result for the same input, such as lookups, file reads, or searches, can cache their
+results so repeated calls skip the tool. Results are cached by tool name and input, expire after a time to live, and
+the least recently used results are evicted once the cache is full.
+
+Example:
+    ```python
+    from strands import Agent, tool
+    from strands.tools.cache import DiskToolCacheBackend, ToolCache
+
+    @tool(cache=ToolCache(ttl=300))
+    def lookup_order(order_id: str) -> dict:
+        ...
+
+    # Shared across sessions
+    search_cache = ToolCache(ttl=3600, backend=DiskToolCacheBackend("~/.cache/my-agent/tools"))
+    mcp_client = MCPClient(transport, tool_caches={"search": search_cache})
+    ```
+"""
+
+import abc
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union, cast
+
+from ..types.tools import ToolResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ToolCacheEntry:
+    """A cached tool result.
+
+    Attributes:
+        result: The tool result.
+        expires_at: Time, in seconds since the epoch, after which the result is stale, or None if it does not expire.
+    """
+
+    result: ToolResult
+    expires_at: Optional[float] = None
+
+
+class ToolCacheBackend(abc.ABC):
+    """Storage for cached tool results.
+
+    Backends are responsible for evicting entries when they are full. Keys start with the tool name followed by a
+    period, which tool names cannot contain.
+
+    Attributes:
+        blocking: Whether the backend does I/O, in which case tool executors access it from a worker thread so the
+            event loop is not blocked.
+    """
+
+    blocking: bool = True
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[ToolCacheEntry]:
+        """Get the entry stored under the key, marking it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The entry, or None if there is none.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: ToolCacheEntry) -> None:
+        """Store the entry under the key.
+
+        Args:
+            key: The cache key.
+            entry: The entry to store.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under the key, if any.
+
+        Args:
+            key: The cache key.
+        """
+
+    @abc.abstractmethod
+    def keys(self) -> Iterable[str]:
+        """Get the keys of all stored entries.
+
+        Returns:
+            The cache keys.
+        """
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for key in list(self.keys()):
+            self.delete(key)
+
+
+class MemoryToolCacheBackend(ToolCacheBackend):
+    """Stores tool results in memory, evicting the least recently used results once full."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the memory backend.
+
+        Args:
+            max_entries: Number of results to keep.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries=<{max_entries}> | must be at least 1")
+
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, ToolCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ToolCacheEntry]:
+        """Get the entry stored under the key, marking it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The entry, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: ToolCacheEntry) -> None:
+        """Store the entry under the key, evicting the least recently used entry if full.
+
+        Args:
+            key: The cache key.
+            entry: The entry to store.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under the key, if any.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def keys(self) -> Iterable[str]:
+        """Get the keys of all stored entries.
+
+        Returns:
+            The cache keys.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskToolCacheBackend(ToolCacheBackend):
+    """Stores tool results as JSON files in a directory, evicting the least recently used results once full.
+
+    Results survive restarts and can be shared by processes using the same directory. Results that cannot be
+    serialized to JSON, such as results with image bytes, are not cached.
+
+    The backend counts the results it stores instead of listing the directory on every write. Once the count passes
+    max_entries, it lists the directory, which also picks up results written by other processes, and removes the least
+    recently used results until a tenth of max_entries is free, so the directory is listed at most once every
+    max_entries / 10 new results.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_entries: int = 10_000) -> None:
+        """Initialize the disk backend.
+
+        Args:
+            directory: Directory to store results in. It is created if it does not exist.
+            max_entries: Number of results to keep.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries=<{max_entries}> | must be at least 1")
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._entry_count: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[ToolCacheEntry]:
+        """Get the entry stored under the key, marking it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The entry, or None if there is none or it cannot be read.
+        """
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            # The modification time orders entries for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("key=<%s>, error=<%s> | failed to read cached tool result", key, e)
+            return None
+
+        return ToolCacheEntry(result=cast(ToolResult, data["result"]), expires_at=data.get("expires_at"))
+
+    def set(self, key: str, entry: ToolCacheEntry) -> None:
+        """Store the entry under the key, evicting the least recently used entries if full.
+
+        Args:
+            key: The cache key.
+            entry: The entry to store.
+        """
+        try:
+            data = json.dumps({"result": entry.result, "expires_at": entry.expires_at})
+        except (TypeError, ValueError) as e:
+            logger.debug("key=<%s>, error=<%s> | tool result cannot be cached on disk", key, e)
+            return
+
+        path = self._path(key)
+        replaced = False
+        try:
+            is_new = not path.exists()
+            # Write to a temporary file first so readers never see a partial result
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    file.write(data)
+                os.replace(temp_path, path)
+                replaced = True
+            finally:
+                if not replaced:
+                    Path(temp_path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("key=<%s>, error=<%s> | failed to write cached tool result", key, e)
+            return
+
+        with self._lock:
+            if self._entry_count is None:
+                self._entry_count = sum(1 for _ in self.directory.glob("*.json"))
+            elif is_new:
+                self._entry_count += 1
+
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until a tenth of max_entries is free.
+
+        Must be called with the lock held.
+        """
+        paths = list(self.directory.glob("*.json"))
+        keep = self.max_entries - self.max_entries // 10
+        self._entry_count = len(paths)
+        if len(paths) <= keep:
+            return
+
+        def modified_at(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        paths.sort(key=modified_at)
+        for path in paths[: len(paths) - keep]:
+            path.unlink(missing_ok=True)
+        self._entry_count = keep
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under the key, if any.
+
+        Args:
+            key: The cache key.
+        """
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            return
+
+        with self._lock:
+            if self._entry_count is not None:
+                self._entry_count = max(self._entry_count - 1, 0)
+
+    def keys(self) -> Iterable[str]:
+        """Get the keys of all stored entries.
+
+        Returns:
+            The cache keys.
+        """
+        return [path.stem for path in self.directory.glob("*.json")]
+
+
+class ToolCache:
+    """Caches the successful results of tools by tool name and input.
+
+    A cache can be shared by several tools. Error results are never cached. The input is canonicalized before it is
+    used as a key, so inputs that differ only in key order share a result.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, *, backend: Optional[ToolCacheBackend] = None) -> None:
+        """Initialize the tool cache.
+
+        Args:
+            ttl: Seconds a result stays fresh. Defaults to None, which keeps results until they are evicted or
+                invalidated.
+            backend: Storage for the results. Defaults to a `MemoryToolCacheBackend` with 1024 entries.
+
+        Raises:
+            ValueError: If ttl is not positive.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl=<{ttl}> | must be positive")
+
+        self.ttl = ttl
+        self.backend = backend if backend is not None else MemoryToolCacheBackend()
+
+    @staticmethod
+    def key(tool_name: str, tool_input: Any) -> str:
+        """Build the cache key of a tool call.
+
+        Args:
+            tool_name: The name of the tool.
+            tool_input: The input of the tool call.
+
+        Returns:
+            The tool name and a hash of the canonicalized input.
+        """
+        canonical_input = json.dumps(tool_input, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{tool_name}.{hashlib.sha256(canonical_input.encode()).hexdigest()}"
+
+    def get(self, tool_name: str, tool_input: Any) -> Optional[ToolResult]:
+        """Get the cached result of a tool call.
+
+        Args:
+            tool_name: The name of the tool.
+            tool_input: The input of the tool call.
+
+        Returns:
+            A copy of the cached result, or None if there is no fresh result.
+        """
+        key = self.key(tool_name, tool_input)
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= time.time():
+            self.backend.delete(key)
+            return None
+
+        return copy.deepcopy(entry.result)
+
+    def put(self, tool_name: str, tool_input: Any, result: ToolResult) -> None:
+        """Cache the result of a tool call.
+
+        Args:
+            tool_name: The name of the tool.
+            tool_input: The input of the tool call.
+            result: The result of the tool call.
+        """
+        if result.get("status") != "success":
+            return
+
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        self.backend.set(self.key(tool_name, tool_input), ToolCacheEntry(copy.deepcopy(result), expires_at))
+
+    async def get_async(self, tool_name: str, tool_input: Any) -> Optional[ToolResult]:
+        """Get the cached result of a tool call, reading blocking backends from a worker thread.
+
+        Args:
+            tool_name: The name of the tool.
+            tool_input: The input of the tool call.
+
+        Returns:
+            A copy of the cached result, or None if there is no fresh result.
+        """
+        if self.backend.blocking:
+            return await asyncio.to_thread(self.get, tool_name, tool_input)
+        return self.get(tool_name, tool_input)
+
+    async def put_async(self, tool_name: str, tool_input: Any, result: ToolResult) -> None:
+        """Cache the result of a tool call, writing to blocking backends from a worker thread.
+
+        Args:
+            tool_name: The name of the tool.
+            tool_input: The input of the tool call.
+            result: The result of the tool call.
+        """
+        if self.backend.blocking:
+            await asyncio.to_thread(self.put, tool_name, tool_input, result)
+        else:
+            self.put(tool_name, tool_input, result)
+
+    def invalidate(self, tool_name: str, tool_input: Optional[Any] = None) -> None:
+        """Remove cached results of a tool.
+
+        Args:
+            tool_name: The name of the tool.
+            tool_input: The input of the tool call to remove the result of. Defaults to None, which removes all
+                results of the tool.
+        """
+        if tool_input is not None:
+            self.backend.delete(self.key(tool_name, tool_input))
+            return
+
+        prefix = f"{tool_name}."
+        for key in list(self.backend.keys()):
+            if key.startswith(prefix):
+                self.backend.delete(key)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self.backend.clear()
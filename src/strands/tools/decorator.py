@@ -69,6 +69,8 @@ from typing_extensions import override
 from ..interrupt import InterruptException
 from ..types._events import ToolInterruptEvent, ToolResultEvent, ToolStreamEvent
 from ..types.tools import AgentTool, JSONSchema, ToolContext, ToolGenerator, ToolResult, ToolSpec, ToolUse
+from ._function_executor import FunctionExecutor, ToolExecutorOption
+from .cache import ToolCache
 
 logger = logging.getLogger(__name__)
 
@@ -445,6 +447,8 @@ class DecoratedFunctionTool(AgentTool, Generic[P, R]):
         tool_spec: ToolSpec,
         tool_func: Callable[P, R],
         metadata: FunctionToolMetadata,
+        executor: Optional[FunctionExecutor] = None,
+        cache: Optional[ToolCache] = None,
     ):
         """Initialize the decorated function tool.
 
@@ -453,6 +457,8 @@ class DecoratedFunctionTool(AgentTool, Generic[P, R]):
             tool_spec: The tool specification containing metadata for Agent integration.
             tool_func: The original function being decorated.
             metadata: The FunctionToolMetadata object with extracted function information.
+            executor: Runs the function on a dedicated executor. Defaults to the default thread pool of the event loop.
+            cache: Cache of the tool's results. Defaults to None, which does not cache results.
         """
         super().__init__()
 
@@ -460,6 +466,8 @@ class DecoratedFunctionTool(AgentTool, Generic[P, R]):
         self._tool_spec = tool_spec
         self._tool_func = tool_func
         self._metadata = metadata
+        self._executor = executor
+        self._cache = cache
 
         functools.update_wrapper(wrapper=self, wrapped=self._tool_func)
 
@@ -492,7 +500,9 @@ class DecoratedFunctionTool(AgentTool, Generic[P, R]):
         if instance is not None and not inspect.ismethod(self._tool_func):
             # Create a bound method
             tool_func = self._tool_func.__get__(instance, instance.__class__)
-            return DecoratedFunctionTool(self._tool_name, self._tool_spec, tool_func, self._metadata)
+            return DecoratedFunctionTool(
+                self._tool_name, self._tool_spec, tool_func, self._metadata, self._executor, self._cache
+            )
 
         return self
 
@@ -538,6 +548,15 @@ class DecoratedFunctionTool(AgentTool, Generic[P, R]):
         """
         return "function"
 
+    @property
+    def cache(self) -> Optional[ToolCache]:
+        """Get the cache of the tool's results.
+
+        Returns:
+            The cache configured with @tool(cache=...), or None if results are not cached.
+        """
+        return self._cache
+
     @override
     async def stream(self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any) -> ToolGenerator:
         """Stream the tool with a tool use specification.
@@ -589,6 +608,15 @@ class DecoratedFunctionTool(AgentTool, Generic[P, R]):
                 result = await self._tool_func(**validated_input)  # type: ignore
                 yield self._wrap_tool_result(tool_use_id, result)
 
+            # Other functions on a dedicated executor, yield only the result
+            elif self._executor is not None:
+                result, queue_time = await self._executor.run(self._tool_func, validated_input)
+                event_loop_metrics = getattr(invocation_state.get("agent"), "event_loop_metrics", None)
+                if event_loop_metrics is not None:
+                    event_loop_metrics.add_tool_queue_wait(tool_use, queue_time)
+
+                yield self._wrap_tool_result(tool_use_id, result)
+
             # Other functions, yield only the result
             else:
                 result = await asyncio.to_thread(self._tool_func, **validated_input)  # type: ignore
@@ -670,6 +698,10 @@ def tool(
     inputSchema: Optional[JSONSchema] = None,
     name: Optional[str] = None,
     context: bool | str = False,
+    executor: Optional[ToolExecutorOption] = None,
+    pool: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache: Union[ToolCache, bool, None] = None,
 ) -> Callable[[Callable[P, R]], DecoratedFunctionTool[P, R]]: ...
 # Suppressing the type error because we want callers to be able to use both `tool` and `tool()` at the
 # call site, but the actual implementation handles that and it's not representable via the type-system
@@ -679,6 +711,10 @@ def tool(  # type: ignore
     inputSchema: Optional[JSONSchema] = None,
     name: Optional[str] = None,
     context: bool | str = False,
+    executor: Optional[ToolExecutorOption] = None,
+    pool: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache: Union[ToolCache, bool, None] = None,
 ) -> Union[DecoratedFunctionTool[P, R], Callable[[Callable[P, R]], DecoratedFunctionTool[P, R]]]:
     """Decorator that transforms a Python function into a Strands tool.
 
@@ -707,6 +743,17 @@ def tool(  # type: ignore
         context: When provided, places an object in the designated parameter. If True, the param name
             defaults to 'tool_context', or if an override is needed, set context equal to a string to designate
             the param name.
+        executor: Where a synchronous function runs when the tool is used by an agent. "thread" runs it on a
+            dedicated thread pool, for blocking I/O that should not compete for the default pool. "process" runs it
+            on a dedicated process pool, for CPU-heavy work that would otherwise hold the GIL; the function must be
+            defined at module level and its arguments and result must be picklable. An Executor instance runs it
+            on that executor. Time spent waiting for a worker is recorded in the tool's metrics.
+            Defaults to None, which runs it on the default thread pool of the event loop.
+        pool: Name of the thread or process pool, to share one pool between tools. Defaults to the tool name.
+        max_workers: Size limit of the thread or process pool. Defaults to the default of the pool type.
+        cache: Caches successful results by input so repeated calls skip the function, for tools whose result only
+            depends on their input. True caches them in memory without expiry, or pass a `ToolCache` to set a time to
+            live, a size limit, or a disk backend. Defaults to None, which does not cache results.
 
     Returns:
         An AgentTool that also mimics the original function when invoked
@@ -741,6 +788,20 @@ def tool(  # type: ignore
             tool_id = tool_context["tool_use"]["toolUseId"]
             return f"Processed {name} {count} times with tool ID {tool_id}"
         ```
+
+    Example with a cache:
+        ```python
+        @tool(cache=ToolCache(ttl=300))
+        def lookup_order(order_id: str) -> dict:
+            return orders_api.get(order_id)
+        ```
+
+    Example with a dedicated process pool:
+        ```python
+        @tool(executor="process", max_workers=4)
+        def parse_report(path: str) -> str:
+            return summarize(parse(path))
+        ```
     """
 
     def decorator(f: T) -> "DecoratedFunctionTool[P, R]":
@@ -767,7 +828,15 @@ def tool(  # type: ignore
         if not isinstance(tool_name, str):
             raise ValueError(f"Tool name must be a string, got {type(tool_name)}")
 
-        return DecoratedFunctionTool(tool_name, tool_spec, f, tool_meta)
+        function_executor = None
+        if executor is not None:
+            function_executor = FunctionExecutor(executor, f, tool_name, pool, max_workers, context_param)
+        elif pool is not None or max_workers is not None:
+            raise ValueError(f"tool_name=<{tool_name}> | pool and max_workers require an executor")
+
+        tool_cache = ToolCache() if cache is True else cache or None
+
+        return DecoratedFunctionTool(tool_name, tool_spec, f, tool_meta, function_executor, tool_cache)
 
     # Handle both @tool and @tool() syntax
     if func is None:
@@ -18,7 +18,7 @@ from ...telemetry.tracer import get_tracer, serialize
 from ...types._events import ToolCancelEvent, ToolInterruptEvent, ToolResultEvent, ToolStreamEvent, TypedEvent
 from ...types.content import Message
 from ...types.interrupt import Interrupt
-from ...types.tools import ToolChoice, ToolChoiceAuto, ToolConfig, ToolResult, ToolUse
+from ...types.tools import ToolResult, ToolUse
 from ..structured_output._structured_output_context import StructuredOutputContext
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -71,6 +71,7 @@ class ToolExecutor(abc.ABC):
         result: ToolResult,
         exception: Exception | None = None,
         cancel_message: str | None = None,
+        cache_hit: bool = False,
     ) -> tuple[AfterToolCallEvent | BidiAfterToolCallEvent, list[Interrupt]]:
         """Invoke the appropriate after tool call hook based on agent type."""
         kwargs = {
@@ -80,6 +81,7 @@ class ToolExecutor(abc.ABC):
             "result": result,
             "exception": exception,
             "cancel_message": cancel_message,
+            "cache_hit": cache_hit,
         }
         event = (
             AfterToolCallEvent(agent=cast("Agent", agent), **kwargs)
@@ -104,6 +106,7 @@ class ToolExecutor(abc.ABC):
 
         - Tool lookup and validation
         - Before/after hook execution
+        - Result caching for tools with a cache
         - Tracing and metrics collection
         - Error handling and recovery
         - Interrupt handling for human-in-the-loop workflows
@@ -140,10 +143,7 @@ class ToolExecutor(abc.ABC):
                 "model": agent.model,
                 "messages": agent.messages,
                 "system_prompt": agent.system_prompt,
-                "tool_config": ToolConfig(  # for backwards compatibility
-                    tools=[{"toolSpec": tool_spec} for tool_spec in agent.tool_registry.get_all_tool_specs()],
-                    toolChoice=cast(ToolChoice, {"auto": ToolChoiceAuto()}),
-                ),
+                "tool_config": agent.tool_registry.get_tool_spec_snapshot().tool_config,  # for backwards compatibility
             }
         )
 
@@ -205,6 +205,24 @@ class ToolExecutor(abc.ABC):
                 yield ToolResultEvent(after_event.result)
                 tool_results.append(after_event.result)
                 return
+            # Looked up after the before hooks, which may change the tool or its input
+            cache = selected_tool.cache
+            if cache is not None:
+                cached_result = await cache.get_async(selected_tool.tool_name, tool_use["input"])
+                if ToolExecutor._is_agent(agent):
+                    cast("Agent", agent).event_loop_metrics.add_tool_cache_lookup(tool_use, cached_result is not None)
+
+                if cached_result is not None:
+                    logger.debug("tool_name=<%s> | using cached tool result", tool_name)
+                    cached_result["toolUseId"] = str(tool_use.get("toolUseId"))
+
+                    after_event, _ = await ToolExecutor._invoke_after_tool_call_hook(
+                        agent, selected_tool, tool_use, invocation_state, cached_result, cache_hit=True
+                    )
+                    yield ToolResultEvent(after_event.result)
+                    tool_results.append(after_event.result)
+                    return
+
             if structured_output_context.is_enabled:
                 kwargs["structured_output_context"] = structured_output_context
             async for event in selected_tool.stream(tool_use, invocation_state, **kwargs):
@@ -229,6 +247,8 @@ class ToolExecutor(abc.ABC):
                     yield ToolStreamEvent(tool_use, event)
 
             result = cast(ToolResult, event)
+            if cache is not None:
+                await cache.put_async(selected_tool.tool_name, tool_use["input"], result)
 
             after_event, _ = await ToolExecutor._invoke_after_tool_call_hook(
                 agent, selected_tool, tool_use, invocation_state, result
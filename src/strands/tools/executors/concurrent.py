@@ -1,7 +1,9 @@
 """Concurrent tool executor implementation."""
 
 import asyncio
-from typing import TYPE_CHECKING, Any, AsyncGenerator
+import time
+from contextlib import asynccontextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, Callable, Mapping, Optional
 
 from typing_extensions import override
 
@@ -15,8 +17,188 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..structured_output._structured_output_context import StructuredOutputContext
 
 
+class _TokenBucket:
+    """Token bucket rate limiter that is not bound to a specific event loop."""
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second. The bucket holds at most one second worth of tokens (minimum of 1).
+        """
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _ToolLimiter:
+    """Admission control for the tool uses of a single `_execute` call."""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int],
+        tool_concurrency: Mapping[str, int],
+        tool_rate_limits: Mapping[str, _TokenBucket],
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        self._tool_semaphores = {name: asyncio.Semaphore(limit) for name, limit in tool_concurrency.items()}
+        self._tool_rate_limits = tool_rate_limits
+        self.waiting = 0
+
+    @asynccontextmanager
+    async def acquire(self, agent: "Agent", tool_use: ToolUse) -> AsyncIterator[None]:
+        """Wait for the tool use to be admitted and hold its slots while it runs.
+
+        The per-tool slot is acquired before the rate limit token and the global slot so that a tool waiting on its
+        own limits does not hold up unrelated tools.
+
+        Args:
+            agent: The agent executing the tool, used to record queue metrics.
+            tool_use: The tool use to admit.
+        """
+        tool_name = tool_use["name"]
+        tool_semaphore = self._tool_semaphores.get(tool_name)
+        tool_rate_limit = self._tool_rate_limits.get(tool_name)
+
+        self.waiting += 1
+        queue_depth = self.waiting
+        start_time = time.perf_counter()
+        acquired: list[asyncio.Semaphore] = []
+        try:
+            if tool_semaphore is not None:
+                await tool_semaphore.acquire()
+                acquired.append(tool_semaphore)
+
+            if tool_rate_limit is not None:
+                await tool_rate_limit.acquire()
+
+            if self._semaphore is not None:
+                await self._semaphore.acquire()
+                acquired.append(self._semaphore)
+        except BaseException:
+            for semaphore in acquired:
+                semaphore.release()
+            raise
+        finally:
+            self.waiting -= 1
+
+        if ToolExecutor._is_agent(agent):
+            agent.event_loop_metrics.add_tool_queue_wait(tool_use, time.perf_counter() - start_time, queue_depth)
+
+        try:
+            yield
+        finally:
+            for semaphore in acquired:
+                semaphore.release()
+
+
+class _ToolEventBuffers:
+    """Bounded per-tool event buffers drained in batches by a single consumer."""
+
+    def __init__(self, count: int, size: int) -> None:
+        self._queues: list[asyncio.Queue[TypedEvent]] = [asyncio.Queue(maxsize=size) for _ in range(count)]
+        self._done = [False] * count
+        self._ready = asyncio.Event()
+
+    async def put(self, task_id: int, event: TypedEvent) -> None:
+        """Buffer an event, waiting for the consumer if the tool's buffer is full."""
+        await self._queues[task_id].put(event)
+        self._ready.set()
+
+    def close(self, task_id: int) -> None:
+        """Mark a tool as finished producing events."""
+        self._done[task_id] = True
+        self._ready.set()
+
+    async def drain(self) -> AsyncGenerator[TypedEvent, None]:
+        """Yield buffered events until every tool has finished.
+
+        Each wakeup drains the events buffered at that moment across all tools, preserving per-tool order.
+        """
+        pending = list(range(len(self._queues)))
+        while pending:
+            await self._ready.wait()
+            self._ready.clear()
+
+            for task_id in list(pending):
+                queue = self._queues[task_id]
+                done = self._done[task_id]
+
+                for _ in range(queue.qsize()):
+                    yield queue.get_nowait()
+
+                if done and queue.empty():
+                    pending.remove(task_id)
+
+
 class ConcurrentToolExecutor(ToolExecutor):
-    """Concurrent tool executor."""
+    """Concurrent tool executor.
+
+    By default, every tool use requested by the model starts immediately. Admission can be limited globally, per tool
+    name, and with per tool rate limits. Concurrency limits apply to the tool uses of a single model response, while
+    rate limits are shared across all executions using this executor.
+
+    By default, each tool waits for its previous event to be consumed before producing the next one. Setting
+    `stream_buffer_size` lets every tool buffer up to that many events instead, which greatly increases throughput
+    for tools that stream many events. Events from the same tool are always yielded in order.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: Optional[int] = None,
+        tool_concurrency: Optional[Mapping[str, int]] = None,
+        tool_rate_limits: Optional[Mapping[str, float]] = None,
+        priority: Optional[Callable[[ToolUse], Any]] = None,
+        stream_buffer_size: Optional[int] = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_concurrency: Maximum number of tools running at once. Defaults to None (unbounded).
+            tool_concurrency: Maximum number of concurrent calls keyed by tool name.
+            tool_rate_limits: Maximum calls per second keyed by tool name.
+            priority: Sort key for tool uses. Tool uses with lower keys are admitted first when slots are limited.
+                Defaults to the order requested by the model.
+            stream_buffer_size: Number of events each tool may buffer ahead of the consumer.
+                Defaults to None (each event is handed off and consumed one at a time).
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency=<{max_concurrency}> | must be at least 1")
+
+        for tool_name, limit in (tool_concurrency or {}).items():
+            if limit < 1:
+                raise ValueError(f"tool_name=<{tool_name}>, limit=<{limit}> | tool concurrency must be at least 1")
+
+        for tool_name, rate in (tool_rate_limits or {}).items():
+            if rate <= 0:
+                raise ValueError(f"tool_name=<{tool_name}>, rate=<{rate}> | tool rate limit must be positive")
+
+        if stream_buffer_size is not None and stream_buffer_size < 1:
+            raise ValueError(f"stream_buffer_size=<{stream_buffer_size}> | must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.tool_concurrency = dict(tool_concurrency or {})
+        self.priority = priority
+        self.stream_buffer_size = stream_buffer_size
+        self._tool_rate_limits = {name: _TokenBucket(rate) for name, rate in (tool_rate_limits or {}).items()}
 
     @override
     async def _execute(
@@ -43,6 +225,42 @@ class ConcurrentToolExecutor(ToolExecutor):
         Yields:
             Events from the tool execution stream.
         """
+        limiter = None
+        if self.max_concurrency is not None or self.tool_concurrency or self._tool_rate_limits:
+            limiter = _ToolLimiter(self.max_concurrency, self.tool_concurrency, self._tool_rate_limits)
+
+        # Tasks wait on the limiter in creation order, so creating them in priority order admits them by priority.
+        ordered_tool_uses = list(enumerate(tool_uses))
+        if self.priority is not None:
+            priority = self.priority
+            ordered_tool_uses.sort(key=lambda item: priority(item[1]))
+
+        if self.stream_buffer_size is not None:
+            buffers = _ToolEventBuffers(len(tool_uses), self.stream_buffer_size)
+            buffered_tasks = [
+                asyncio.create_task(
+                    self._buffered_task(
+                        agent,
+                        tool_use,
+                        tool_results,
+                        cycle_trace,
+                        cycle_span,
+                        invocation_state,
+                        task_id,
+                        buffers,
+                        structured_output_context,
+                        limiter,
+                    )
+                )
+                for task_id, tool_use in ordered_tool_uses
+            ]
+
+            async for event in buffers.drain():
+                yield event
+
+            await asyncio.gather(*buffered_tasks)
+            return
+
         task_queue: asyncio.Queue[tuple[int, Any]] = asyncio.Queue()
         task_events = [asyncio.Event() for _ in tool_uses]
         stop_event = object()
@@ -61,9 +279,10 @@ class ConcurrentToolExecutor(ToolExecutor):
                     task_events[task_id],
                     stop_event,
                     structured_output_context,
+                    limiter,
                 )
             )
-            for task_id, tool_use in enumerate(tool_uses)
+            for task_id, tool_use in ordered_tool_uses
         ]
 
         task_count = len(tasks)
@@ -89,6 +308,7 @@ class ConcurrentToolExecutor(ToolExecutor):
         task_event: asyncio.Event,
         stop_event: object,
         structured_output_context: "StructuredOutputContext | None",
+        limiter: Optional[_ToolLimiter] = None,
     ) -> None:
         """Execute a single tool and put results in the task queue.
 
@@ -104,15 +324,57 @@ class ConcurrentToolExecutor(ToolExecutor):
             task_event: Event to signal when task can continue.
             stop_event: Sentinel object to signal task completion.
             structured_output_context: Context for structured output handling.
+            limiter: Admission control for the tool use, if any limits are configured.
         """
         try:
-            events = ToolExecutor._stream_with_trace(
-                agent, tool_use, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
-            )
-            async for event in events:
-                task_queue.put_nowait((task_id, event))
-                await task_event.wait()
-                task_event.clear()
+            admission = limiter.acquire(agent, tool_use) if limiter is not None else nullcontext()
+            async with admission:
+                events = ToolExecutor._stream_with_trace(
+                    agent, tool_use, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+                )
+                async for event in events:
+                    task_queue.put_nowait((task_id, event))
+                    await task_event.wait()
+                    task_event.clear()
 
         finally:
             task_queue.put_nowait((task_id, stop_event))
+
+    async def _buffered_task(
+        self,
+        agent: "Agent",
+        tool_use: ToolUse,
+        tool_results: list[ToolResult],
+        cycle_trace: Trace,
+        cycle_span: Any,
+        invocation_state: dict[str, Any],
+        task_id: int,
+        buffers: _ToolEventBuffers,
+        structured_output_context: "StructuredOutputContext | None",
+        limiter: Optional[_ToolLimiter] = None,
+    ) -> None:
+        """Execute a single tool and put results in its bounded event buffer.
+
+        Args:
+            agent: The agent executing the tool.
+            tool_use: Tool use metadata and inputs.
+            tool_results: List of tool results from each tool execution.
+            cycle_trace: Trace object for the current event loop cycle.
+            cycle_span: Span object for tracing the cycle.
+            invocation_state: Context for tool execution.
+            task_id: Unique identifier for this task.
+            buffers: Event buffers shared by the tasks of this execution.
+            structured_output_context: Context for structured output handling.
+            limiter: Admission control for the tool use, if any limits are configured.
+        """
+        try:
+            admission = limiter.acquire(agent, tool_use) if limiter is not None else nullcontext()
+            async with admission:
+                events = ToolExecutor._stream_with_trace(
+                    agent, tool_use, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+                )
+                async for event in events:
+                    await buffers.put(task_id, event)
+
+        finally:
+            buffers.close(task_id)
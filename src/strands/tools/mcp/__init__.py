@@ -8,6 +8,7 @@ servers.
 
 from .mcp_agent_tool import MCPAgentTool
 from .mcp_client import MCPClient, ToolFilters
+from .mcp_tool_spec_cache import MCPToolSpecCache, MCPToolSpecCacheEntry
 from .mcp_types import MCPTransport
 
-__all__ = ["MCPAgentTool", "MCPClient", "MCPTransport", "ToolFilters"]
+__all__ = ["MCPAgentTool", "MCPClient", "MCPToolSpecCache", "MCPToolSpecCacheEntry", "MCPTransport", "ToolFilters"]
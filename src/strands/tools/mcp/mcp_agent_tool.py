@@ -14,6 +14,7 @@ from typing_extensions import override
 
 from ...types._events import ToolResultEvent
 from ...types.tools import AgentTool, ToolGenerator, ToolSpec, ToolUse
+from ..cache import ToolCache
 
 if TYPE_CHECKING:
     from .mcp_client import MCPClient
@@ -35,6 +36,7 @@ class MCPAgentTool(AgentTool):
         mcp_client: "MCPClient",
         name_override: str | None = None,
         timeout: timedelta | None = None,
+        cache: ToolCache | None = None,
     ) -> None:
         """Initialize a new MCPAgentTool instance.
 
@@ -44,6 +46,7 @@ class MCPAgentTool(AgentTool):
             name_override: Optional name to use for the agent tool (for disambiguation)
                            If None, uses the original MCP tool name
             timeout: Optional timeout duration for tool execution
+            cache: Optional cache of the tool's results
         """
         super().__init__()
         logger.debug("tool_name=<%s> | creating mcp agent tool", mcp_tool.name)
@@ -51,6 +54,7 @@ class MCPAgentTool(AgentTool):
         self.mcp_client = mcp_client
         self._agent_tool_name = name_override or mcp_tool.name
         self.timeout = timeout
+        self._cache = cache
 
     @property
     def tool_name(self) -> str:
@@ -93,6 +97,15 @@ class MCPAgentTool(AgentTool):
         """
         return "python"
 
+    @property
+    def cache(self) -> ToolCache | None:
+        """Get the cache of the tool's results.
+
+        Returns:
+            ToolCache | None: The cache configured for the tool on its MCP client, or None if results are not cached
+        """
+        return self._cache
+
     @override
     async def stream(self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any) -> ToolGenerator:
         """Stream the MCP tool.
@@ -21,11 +21,20 @@ from typing import Any, Callable, Coroutine, Dict, Optional, Pattern, Sequence,
 import anyio
 from mcp import ClientSession, ListToolsResult
 from mcp.client.session import ElicitationFnT
-from mcp.types import BlobResourceContents, GetPromptResult, ListPromptsResult, TextResourceContents
+from mcp.types import (
+    BlobResourceContents,
+    GetPromptResult,
+    Implementation,
+    ListPromptsResult,
+    ServerNotification,
+    TextResourceContents,
+    ToolListChangedNotification,
+)
 from mcp.types import CallToolResult as MCPCallToolResult
 from mcp.types import EmbeddedResource as MCPEmbeddedResource
 from mcp.types import ImageContent as MCPImageContent
 from mcp.types import TextContent as MCPTextContent
+from mcp.types import Tool as MCPTool
 from typing_extensions import Protocol, TypedDict
 
 from ...experimental.tools import ToolProvider
@@ -33,8 +42,10 @@ from ...types import PaginatedList
 from ...types.exceptions import MCPClientInitializationError, ToolProviderException
 from ...types.media import ImageFormat
 from ...types.tools import AgentTool, ToolResultContent, ToolResultStatus
+from ..cache import ToolCache
 from .mcp_agent_tool import MCPAgentTool
 from .mcp_instrumentation import mcp_instrumentation
+from .mcp_tool_spec_cache import MCPToolSpecCache
 from .mcp_types import MCPToolResult, MCPTransport
 
 logger = logging.getLogger(__name__)
@@ -108,6 +119,8 @@ class MCPClient(ToolProvider):
         tool_filters: ToolFilters | None = None,
         prefix: str | None = None,
         elicitation_callback: Optional[ElicitationFnT] = None,
+        tool_caches: Optional[Dict[str, ToolCache]] = None,
+        tool_spec_cache: Optional[MCPToolSpecCache] = None,
     ) -> None:
         """Initialize a new MCP Server connection.
 
@@ -118,11 +131,18 @@ class MCPClient(ToolProvider):
             tool_filters: Optional filters to apply to tools.
             prefix: Optional prefix for tool names.
             elicitation_callback: Optional callback function to handle elicitation requests from the MCP server.
+            tool_caches: Optional caches of tool results, by the tool's name on the MCP server (without prefix).
+                Only configure caches for tools whose result only depends on their input.
+            tool_spec_cache: Optional on-disk cache of the server's tool list. When it has the tools, `load_tools`
+                returns them without connecting, and the client connects on its first tool call or to revalidate the
+                cache in the background.
         """
         self._startup_timeout = startup_timeout
         self._tool_filters = tool_filters
         self._prefix = prefix
         self._elicitation_callback = elicitation_callback
+        self._tool_caches = tool_caches or {}
+        self._tool_spec_cache = tool_spec_cache
 
         mcp_instrumentation()
         self._session_id = uuid.uuid4()
@@ -141,6 +161,10 @@ class MCPClient(ToolProvider):
         self._loaded_tools: list[MCPAgentTool] | None = None
         self._tool_provider_started = False
         self._consumers: set[Any] = set()
+        self._server_info: Implementation | None = None
+        # Serializes starting the client for tools loaded from the tool spec cache with removing its consumers
+        self._lazy_start_lock = threading.RLock()
+        self._tool_refresh_tasks: set[asyncio.Task[Any]] = set()
 
     def __enter__(self) -> "MCPClient":
         """Context manager entry point which initializes the MCP server connection.
@@ -196,7 +220,9 @@ class MCPClient(ToolProvider):
         """Load and return tools from the MCP server.
 
         This method implements the ToolProvider interface by loading tools
-        from the MCP server and caching them for reuse.
+        from the MCP server and caching them for reuse. The blocking client startup and tool listing run on a
+        worker thread, so several clients can load concurrently on one event loop. With a tool spec cache, cached
+        tools are returned without connecting to the server.
 
         Args:
             **kwargs: Additional arguments for future compatibility.
@@ -210,38 +236,51 @@ class MCPClient(ToolProvider):
             self._loaded_tools is not None,
         )
 
-        if not self._tool_provider_started:
-            try:
-                logger.debug("starting MCP client")
+        if self._tool_spec_cache is not None and self._loaded_tools is None and not self._tool_provider_started:
+            cached_tools = await self._load_cached_tools(self._tool_spec_cache)
+            if cached_tools is not None:
+                return cached_tools
+
+        if not self._tool_provider_started and self._loaded_tools is None:
+
+            def start() -> None:
                 self.start()
+                # Set on the worker thread so a cancelled load still stops the client when its consumers are removed
                 self._tool_provider_started = True
+
+            try:
+                logger.debug("starting MCP client")
+                await asyncio.to_thread(start)
                 logger.debug("MCP client started successfully")
             except Exception as e:
                 logger.error("error=<%s> | failed to start MCP client", e)
                 raise ToolProviderException(f"Failed to start MCP client: {e}") from e
 
+        if self._loaded_tools is None and self._tool_spec_cache is not None:
+            logger.debug("loading tools from MCP server into the tool spec cache")
+            await asyncio.to_thread(self._refresh_tool_specs)
+
         if self._loaded_tools is None:
             logger.debug("loading tools from MCP server")
-            self._loaded_tools = []
+            loaded_tools: list[MCPAgentTool] = []
             pagination_token = None
             page_count = 0
 
             while True:
                 logger.debug("page=<%d>, token=<%s> | fetching tools page", page_count, pagination_token)
                 # Use constructor defaults for prefix and filters in load_tools
-                paginated_tools = self.list_tools_sync(
-                    pagination_token, prefix=self._prefix, tool_filters=self._tool_filters
+                paginated_tools = await asyncio.to_thread(
+                    self.list_tools_sync, pagination_token, prefix=self._prefix, tool_filters=self._tool_filters
                 )
 
                 # Tools are already filtered by list_tools_sync, so add them all
-                for tool in paginated_tools:
-                    self._loaded_tools.append(tool)
+                loaded_tools.extend(paginated_tools)
 
                 logger.debug(
                     "page=<%d>, page_tools=<%d>, total_filtered=<%d> | processed page",
                     page_count,
                     len(paginated_tools),
-                    len(self._loaded_tools),
+                    len(loaded_tools),
                 )
 
                 pagination_token = paginated_tools.pagination_token
@@ -250,10 +289,114 @@ class MCPClient(ToolProvider):
                 if pagination_token is None:
                     break
 
+            # Only cache complete listings, so a failed or cancelled load starts over
+            self._loaded_tools = loaded_tools
             logger.debug("final_tools=<%d> | loading complete", len(self._loaded_tools))
 
         return self._loaded_tools
 
+    async def _load_cached_tools(self, tool_spec_cache: MCPToolSpecCache) -> list[MCPAgentTool] | None:
+        """Load the tools from the tool spec cache without connecting to the server.
+
+        Args:
+            tool_spec_cache: The cache to load the tools from.
+
+        Returns:
+            The cached tools, or None if the cache has no tools.
+        """
+        entry = await asyncio.to_thread(tool_spec_cache.load)
+        if entry is None:
+            return None
+
+        logger.debug(
+            "server_id=<%s>, tools=<%d> | loaded tools from tool spec cache",
+            tool_spec_cache.server_id,
+            len(entry.tools),
+        )
+        self._loaded_tools = self._create_agent_tools(entry.tools, self._prefix, self._tool_filters)
+
+        if tool_spec_cache.revalidate:
+            threading.Thread(target=self._revalidate_tool_specs, name="strands-mcp-revalidate", daemon=True).start()
+
+        return self._loaded_tools
+
+    def _start_lazily(self) -> None:
+        """Start the client if its tools were loaded from the tool spec cache without connecting.
+
+        Raises:
+            MCPClientInitializationError: If the client fails to start.
+        """
+        if self._tool_spec_cache is None:
+            return
+
+        with self._lazy_start_lock:
+            if self._tool_provider_started or self._loaded_tools is None or self._is_session_active():
+                return
+
+            logger.debug("server_id=<%s> | connecting to MCP server", self._tool_spec_cache.server_id)
+            self.start()
+            self._tool_provider_started = True
+
+    def _revalidate_tool_specs(self) -> None:
+        """Connect to the server and refresh the tool spec cache, on a background thread."""
+        try:
+            self._start_lazily()
+            if self._tool_provider_started:
+                self._refresh_tool_specs()
+        except Exception as e:
+            logger.warning("error=<%s> | failed to revalidate cached MCP tool specs", e)
+
+    def _refresh_tool_specs(self) -> None:
+        """List the tools of the connected server and update the tool spec cache and the loaded tools."""
+        self._invoke_on_background_thread(self._refresh_tool_specs_async()).result()
+
+    async def _refresh_tool_specs_async(self) -> None:
+        """List the tools of the connected server and update the tool spec cache and the loaded tools.
+
+        Runs on the background thread's event loop.
+        """
+        session = cast(ClientSession, self._background_thread_session)
+
+        mcp_tools: list[MCPTool] = []
+        cursor: str | None = None
+        while True:
+            list_tools_response = await session.list_tools(cursor=cursor)
+            mcp_tools.extend(list_tools_response.tools)
+            cursor = list_tools_response.nextCursor
+            if cursor is None:
+                break
+
+        previous_tools = self._loaded_tools
+        self._loaded_tools = self._create_agent_tools(mcp_tools, self._prefix, self._tool_filters)
+
+        if previous_tools is not None and [tool.tool_spec for tool in previous_tools] != [
+            tool.tool_spec for tool in self._loaded_tools
+        ]:
+            # Agents keep the tools they registered, tools loaded from now on use the new list
+            logger.info("tools=<%d> | MCP server tools changed", len(self._loaded_tools))
+
+        if self._tool_spec_cache is not None:
+            await asyncio.to_thread(self._tool_spec_cache.save, mcp_tools, self._server_info)
+
+    def _on_tool_list_changed(self) -> None:
+        """Refresh the tool spec cache after the server notified that its tools changed.
+
+        Runs on the background thread's event loop, which must keep processing messages while the tools are listed.
+        """
+        if self._tool_spec_cache is None or self._background_thread_session is None:
+            return
+
+        self._log_debug_with_thread("tool list changed, refreshing tool spec cache")
+        task = asyncio.create_task(self._refresh_tool_specs_async())
+        self._tool_refresh_tasks.add(task)
+
+        def on_done(task: asyncio.Task[None]) -> None:
+            self._tool_refresh_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning("error=<%s> | failed to refresh MCP tool specs", task.exception())
+
+        task.add_done_callback(on_done)
+
     def add_consumer(self, consumer_id: Any, **kwargs: Any) -> None:
         """Add a consumer to this tool provider.
 
@@ -271,18 +414,22 @@ class MCPClient(ToolProvider):
         Synchronous to prevent GC deadlocks when called from Agent finalizers.
         Uses existing synchronous stop() method for safe cleanup.
         """
-        self._consumers.discard(consumer_id)
-        logger.debug("removed provider consumer, count=%d", len(self._consumers))
+        with self._lazy_start_lock:
+            self._consumers.discard(consumer_id)
+            logger.debug("removed provider consumer, count=%d", len(self._consumers))
 
-        if not self._consumers and self._tool_provider_started:
-            logger.debug("no consumers remaining, cleaning up")
-            try:
-                self.stop(None, None, None)  # Existing sync method - safe for finalizers
-                self._tool_provider_started = False
+            if not self._consumers and self._tool_provider_started:
+                logger.debug("no consumers remaining, cleaning up")
+                try:
+                    self.stop(None, None, None)  # Existing sync method - safe for finalizers
+                    self._tool_provider_started = False
+                    self._loaded_tools = None
+                except Exception as e:
+                    logger.error("error=<%s> | failed to cleanup MCP client", e)
+                    raise ToolProviderException(f"Failed to cleanup MCP client: {e}") from e
+            elif not self._consumers:
+                # Tools loaded from the tool spec cache no longer connect once nothing uses them
                 self._loaded_tools = None
-            except Exception as e:
-                logger.error("error=<%s> | failed to cleanup MCP client", e)
-                raise ToolProviderException(f"Failed to cleanup MCP client: {e}") from e
 
     # MCP-specific methods
 
@@ -384,22 +531,42 @@ class MCPClient(ToolProvider):
         list_tools_response: ListToolsResult = self._invoke_on_background_thread(_list_tools_async()).result()
         self._log_debug_with_thread("received %d tools from MCP server", len(list_tools_response.tools))
 
+        mcp_tools = self._create_agent_tools(list_tools_response.tools, effective_prefix, effective_filters)
+
+        self._log_debug_with_thread("successfully adapted %d MCP tools", len(mcp_tools))
+        return PaginatedList[MCPAgentTool](mcp_tools, token=list_tools_response.nextCursor)
+
+    def _create_agent_tools(
+        self, tools: Sequence[MCPTool], prefix: str | None, tool_filters: ToolFilters | None
+    ) -> list[MCPAgentTool]:
+        """Adapt MCP tools to agent tools, applying the prefix and filters.
+
+        Args:
+            tools: The tools listed by the server.
+            prefix: Prefix to apply to tool names.
+            tool_filters: Filters to apply to the tools.
+
+        Returns:
+            The agent tools that pass the filters.
+        """
         mcp_tools = []
-        for tool in list_tools_response.tools:
+        for tool in tools:
+            cache = self._tool_caches.get(tool.name)
+            tool_kwargs: Dict[str, Any] = {"cache": cache} if cache is not None else {}
+
             # Apply prefix if specified
-            if effective_prefix:
-                prefixed_name = f"{effective_prefix}_{tool.name}"
-                mcp_tool = MCPAgentTool(tool, self, name_override=prefixed_name)
+            if prefix:
+                prefixed_name = f"{prefix}_{tool.name}"
+                mcp_tool = MCPAgentTool(tool, self, name_override=prefixed_name, **tool_kwargs)
                 logger.debug("tool_rename=<%s->%s> | renamed tool", tool.name, prefixed_name)
             else:
-                mcp_tool = MCPAgentTool(tool, self)
+                mcp_tool = MCPAgentTool(tool, self, **tool_kwargs)
 
             # Apply filters if specified
-            if self._should_include_tool_with_filters(mcp_tool, effective_filters):
+            if self._should_include_tool_with_filters(mcp_tool, tool_filters):
                 mcp_tools.append(mcp_tool)
 
-        self._log_debug_with_thread("successfully adapted %d MCP tools", len(mcp_tools))
-        return PaginatedList[MCPAgentTool](mcp_tools, token=list_tools_response.nextCursor)
+        return mcp_tools
 
     def list_prompts_sync(self, pagination_token: Optional[str] = None) -> ListPromptsResult:
         """Synchronously retrieves the list of available prompts from the MCP server.
@@ -473,6 +640,7 @@ class MCPClient(ToolProvider):
             MCPToolResult: The result of the tool call
         """
         self._log_debug_with_thread("calling MCP tool '%s' synchronously with tool_use_id=%s", name, tool_use_id)
+        self._start_lazily()
         if not self._is_session_active():
             raise MCPClientInitializationError(CLIENT_SESSION_NOT_RUNNING_ERROR_MESSAGE)
 
@@ -510,6 +678,8 @@ class MCPClient(ToolProvider):
             MCPToolResult: The result of the tool call
         """
         self._log_debug_with_thread("calling MCP tool '%s' asynchronously with tool_use_id=%s", name, tool_use_id)
+        if self._tool_spec_cache is not None:
+            await asyncio.to_thread(self._start_lazily)
         if not self._is_session_active():
             raise MCPClientInitializationError(CLIENT_SESSION_NOT_RUNNING_ERROR_MESSAGE)
 
@@ -592,7 +762,8 @@ class MCPClient(ToolProvider):
                     elicitation_callback=self._elicitation_callback,
                 ) as session:
                     self._log_debug_with_thread("initializing MCP session")
-                    await session.initialize()
+                    initialize_result = await session.initialize()
+                    self._server_info = initialize_result.serverInfo
 
                     self._log_debug_with_thread("session initialized successfully")
                     # Store the session for use while we await the close event
@@ -625,7 +796,9 @@ class MCPClient(ToolProvider):
     # Raise an exception if the underlying client raises an exception in a message
     # This happens when the underlying client has an http timeout error
     async def _handle_error_message(self, message: Exception | Any) -> None:
-        if isinstance(message, Exception):
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            self._on_tool_list_changed()
+        elif isinstance(message, Exception):
             error_msg = str(message).lower()
             if any(pattern in error_msg for pattern in _NON_FATAL_ERROR_PATTERNS):
                 self._log_debug_with_thread("ignoring non-fatal MCP session error", message)
@@ -0,0 +1,171 @@
+"""On-disk cache of the tool lists of MCP servers.
+
+An `MCPClient` with a tool spec cache loads its tools from the cache instead of connecting to the server, so agents
+start without waiting for the server's initialization and tool listing. The client connects on its first tool call,
+or in the background to revalidate the cached tools, and updates the cache when the server's tools change.
+
+Example:
+    ```python
+    from strands import Agent
+    from strands.tools.mcp import MCPClient, MCPToolSpecCache
+
+    cache = MCPToolSpecCache("/tmp/mcp-tools", server_id="github")
+    github = MCPClient(transport, tool_spec_cache=cache)
+    agent = Agent(tools=[github])
+    ```
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from mcp.types import Implementation
+from mcp.types import Tool as MCPTool
+
+from ... import _identifier
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MCPToolSpecCacheEntry:
+    """The cached tool list of an MCP server.
+
+    Attributes:
+        tools: The tools the server listed, before the client's prefix and filters are applied.
+        server_name: Name the server reported when the tools were listed.
+        server_version: Version the server reported when the tools were listed.
+        saved_at: Time, in seconds since the epoch, the tools were listed.
+    """
+
+    tools: list[MCPTool]
+    server_name: Optional[str] = None
+    server_version: Optional[str] = None
+    saved_at: float = 0.0
+
+
+class MCPToolSpecCache:
+    """Stores the tool list of one MCP server as a JSON file.
+
+    The file is named after the server id, which identifies the server across processes, and records the name and
+    version the server reported. Pinning `server_version` ignores tool lists saved for other versions of the server,
+    so deploying a new server version does not start agents with stale tools.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        server_id: str,
+        *,
+        server_version: Optional[str] = None,
+        max_age: Optional[float] = None,
+        revalidate: bool = True,
+    ) -> None:
+        """Initialize the tool spec cache.
+
+        Args:
+            directory: Directory to store the tool list in. It is created if it does not exist.
+            server_id: Identifier of the server, used as the file name. Clients of the same server can share it.
+            server_version: Server version the cached tool list must have been saved for. Defaults to None, which
+                accepts tool lists of any version.
+            max_age: Seconds a cached tool list is used for before the tools are listed again on startup. Defaults to
+                None, which uses cached tool lists regardless of their age.
+            revalidate: Whether clients connect in the background after loading cached tools, to list the tools again
+                and update the cache. When False, clients connect on their first tool call and the cache is updated
+                when the server notifies that its tools changed.
+                Defaults to True.
+
+        Raises:
+            ValueError: If server_id contains path separators or max_age is not positive.
+        """
+        if max_age is not None and max_age <= 0:
+            raise ValueError(f"max_age=<{max_age}> | must be positive")
+
+        self.directory = Path(directory).expanduser()
+        self.server_id = _identifier.validate(server_id, _identifier.Identifier.SERVER)
+        self.server_version = server_version
+        self.max_age = max_age
+        self.revalidate = revalidate
+
+    @property
+    def path(self) -> Path:
+        """Path of the file the tool list is stored in."""
+        return self.directory / f"{self.server_id}.json"
+
+    def load(self) -> Optional[MCPToolSpecCacheEntry]:
+        """Load the cached tool list.
+
+        Returns:
+            The cached tool list, or None if there is none, it cannot be read, it was saved for another server
+            version, or it is older than max_age.
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            entry = MCPToolSpecCacheEntry(
+                tools=[MCPTool.model_validate(tool) for tool in data["tools"]],
+                server_name=data.get("server_name"),
+                server_version=data.get("server_version"),
+                saved_at=data.get("saved_at", 0.0),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("server_id=<%s>, error=<%s> | failed to read cached MCP tool specs", self.server_id, e)
+            return None
+
+        if self.server_version is not None and entry.server_version != self.server_version:
+            logger.debug(
+                "server_id=<%s>, cached_version=<%s>, server_version=<%s> | ignoring MCP tool specs of other version",
+                self.server_id,
+                entry.server_version,
+                self.server_version,
+            )
+            return None
+
+        if self.max_age is not None and time.time() - entry.saved_at > self.max_age:
+            logger.debug("server_id=<%s> | ignoring expired MCP tool specs", self.server_id)
+            return None
+
+        return entry
+
+    def save(self, tools: list[MCPTool], server_info: Optional[Implementation] = None) -> MCPToolSpecCacheEntry:
+        """Save the tool list of the server.
+
+        Args:
+            tools: The tools the server listed.
+            server_info: The name and version the server reported on initialization.
+
+        Returns:
+            The saved entry.
+        """
+        entry = MCPToolSpecCacheEntry(
+            tools=tools,
+            server_name=server_info.name if server_info else None,
+            server_version=server_info.version if server_info else None,
+            saved_at=time.time(),
+        )
+        data = {
+            "server_name": entry.server_name,
+            "server_version": entry.server_version,
+            "saved_at": entry.saved_at,
+            "tools": [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools],
+        }
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so other processes never read a partial tool list
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, self.path)
+
+        logger.debug("server_id=<%s>, tools=<%d> | saved MCP tool specs", self.server_id, len(tools))
+        return entry
+
+    def clear(self) -> None:
+        """Remove the cached tool list."""
+        self.path.unlink(missing_ok=True)
@@ -4,28 +4,74 @@ This module provides the central registry for all tools available to the agent,
 invocation capabilities.
 """
 
+import asyncio
 import inspect
 import logging
 import os
 import sys
+import time
 import uuid
 import warnings
+from dataclasses import dataclass
 from importlib import import_module, util
 from os.path import expanduser
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
 
 from typing_extensions import TypedDict, cast
 
 from .._async import run_async
 from ..experimental.tools import ToolProvider
 from ..tools.decorator import DecoratedFunctionTool
-from ..types.tools import AgentTool, ToolSpec
+from ..types.tools import AgentTool, ToolChoice, ToolChoiceAuto, ToolConfig, ToolSpec
 from .loader import load_tool_from_string, load_tools_from_module
 from .tools import _COMPOSITION_KEYWORDS, PythonAgentTool, normalize_schema, normalize_tool_spec
 
 logger = logging.getLogger(__name__)
 
+ToolProviderFailurePolicy = Literal["fail_fast", "partial"]
+"""How tool provider failures are handled while processing tools.
+
+- "fail_fast": The first failure cancels the providers still loading and raises.
+- "partial": Failed providers are logged and released, and the tools of the other providers are registered.
+"""
+
+
+@dataclass(frozen=True)
+class ToolProviderStartup:
+    """Startup of a tool provider while processing tools.
+
+    Attributes:
+        provider: The tool provider.
+        duration: Seconds spent loading the tools of the provider.
+        tool_count: Number of tools the provider loaded.
+        error: The exception the provider failed with, or None if it loaded its tools.
+    """
+
+    provider: ToolProvider
+    duration: float
+    tool_count: int
+    error: Optional[BaseException] = None
+
+
+@dataclass(frozen=True)
+class ToolSpecSnapshot:
+    """Validated tool specs for a specific version of a tool registry.
+
+    Snapshots are shared between callers and must be treated as read-only.
+
+    Attributes:
+        version: Registry version the snapshot was built for.
+        tools_config: Mapping of tool name to normalized and validated tool spec.
+        tool_specs: Tool specs in registration order.
+        tool_config: Prebuilt tool configuration with automatic tool choice.
+    """
+
+    version: int
+    tools_config: Dict[str, ToolSpec]
+    tool_specs: tuple[ToolSpec, ...]
+    tool_config: ToolConfig
+
 
 class ToolRegistry:
     """Central registry for all tools available to the agent.
@@ -39,14 +85,27 @@ class ToolRegistry:
         self.dynamic_tools: Dict[str, AgentTool] = {}
         self.tool_config: Optional[Dict[str, Any]] = None
         self._tool_providers: List[ToolProvider] = []
+        self.provider_startups: List[ToolProviderStartup] = []
         self._registry_id = str(uuid.uuid4())
+        self._version = 0
+        self._snapshot: Optional[ToolSpecSnapshot] = None
 
-    def process_tools(self, tools: List[Any]) -> List[str]:
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever the set of registered tools changes."""
+        return self._version
+
+    def process_tools(
+        self, tools: List[Any], *, provider_failure_policy: ToolProviderFailurePolicy = "fail_fast"
+    ) -> List[str]:
         """Process tools list.
 
         Process list of tools that can contain local file path string, module import path string,
         imported modules, @tool decorated functions, or instances of AgentTool.
 
+        Tool providers are started concurrently before the tools are registered, so the startup latency of several
+        providers such as MCP servers overlaps. Their startup times are recorded in `provider_startups`.
+
         Args:
             tools: List of tool specifications. Can be:
 
@@ -61,11 +120,23 @@ class ToolRegistry:
                 3. A module for a module based tool
                 4. Instances of AgentTool (@tool decorated functions)
                 5. Dictionaries with name/path keys (deprecated)
+                6. Instances of ToolProvider
 
+            provider_failure_policy: How tool provider failures are handled. Defaults to "fail_fast".
 
         Returns:
             List of tool names that were processed.
+
+        Raises:
+            ValueError: If a tool cannot be loaded, or a tool provider fails with the "fail_fast" policy.
         """
+        if provider_failure_policy not in ("fail_fast", "partial"):
+            raise ValueError(f"provider_failure_policy=<{provider_failure_policy}> | must be 'fail_fast' or 'partial'")
+
+        # Iterate nested iterables once, as the providers are found before the tools are registered
+        tools = _materialize_tools(tools)
+        provider_tools = self._load_tool_providers(_find_tool_providers(tools), provider_failure_policy)
+
         tool_names = []
 
         def add_tool(tool: Any) -> None:
@@ -126,17 +197,9 @@ class ToolRegistry:
                     for t in tool:
                         add_tool(t)
 
-                # Case 5: ToolProvider
+                # Case 5: ToolProvider, loaded in advance
                 elif isinstance(tool, ToolProvider):
-                    self._tool_providers.append(tool)
-                    tool.add_consumer(self._registry_id)
-
-                    async def get_tools() -> Sequence[AgentTool]:
-                        return await tool.load_tools()
-
-                    provider_tools = run_async(get_tools)
-
-                    for provider_tool in provider_tools:
+                    for provider_tool in provider_tools.get(id(tool), []):
                         self.register_tool(provider_tool)
                         tool_names.append(provider_tool.tool_name)
                 else:
@@ -151,6 +214,109 @@ class ToolRegistry:
             add_tool(tool)
         return tool_names
 
+    def _load_tool_providers(
+        self, providers: List[ToolProvider], failure_policy: ToolProviderFailurePolicy
+    ) -> Dict[int, Sequence[AgentTool]]:
+        """Load the tools of the tool providers concurrently.
+
+        Providers are tracked for cleanup and gain this registry as a consumer before they load, so providers that
+        fail or are cancelled can still release their resources.
+
+        Args:
+            providers: The tool providers to load.
+            failure_policy: How tool provider failures are handled.
+
+        Returns:
+            The tools of each provider that loaded, by provider id.
+
+        Raises:
+            ValueError: If a tool provider fails with the "fail_fast" policy.
+        """
+        if not providers:
+            return {}
+
+        for provider in providers:
+            self._tool_providers.append(provider)
+            provider.add_consumer(self._registry_id)
+
+        async def load(provider: ToolProvider) -> Sequence[AgentTool]:
+            start_time = time.perf_counter()
+            try:
+                provider_tools = await provider.load_tools()
+            except BaseException as e:
+                duration = time.perf_counter() - start_time
+                self.provider_startups.append(ToolProviderStartup(provider, duration, 0, e))
+                raise
+
+            duration = time.perf_counter() - start_time
+            logger.debug(
+                "provider=<%s>, duration=<%.3f>, tool_count=<%d> | tool provider started",
+                type(provider).__name__,
+                duration,
+                len(provider_tools),
+            )
+            self.provider_startups.append(ToolProviderStartup(provider, duration, len(provider_tools)))
+            return provider_tools
+
+        async def load_all() -> List[Any]:
+            tasks = [asyncio.create_task(load(provider)) for provider in providers]
+            if failure_policy == "fail_fast":
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in tasks:
+                    task.cancel()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = run_async(load_all)
+
+        provider_tools: Dict[int, Sequence[AgentTool]] = {}
+        for provider, result in zip(providers, results, strict=True):
+            if isinstance(result, asyncio.CancelledError):
+                continue
+
+            if isinstance(result, BaseException):
+                logger.error(
+                    "provider=<%s>, error=<%s> | failed to load tools from tool provider",
+                    type(provider).__name__,
+                    result,
+                )
+                if failure_policy == "fail_fast":
+                    raise ValueError(f"Failed to load tool {provider}: {result}") from result
+
+                self._tool_providers.remove(provider)
+                try:
+                    provider.remove_consumer(self._registry_id)
+                except Exception as e:
+                    logger.warning("provider=<%s>, error=<%s> | failed to release tool provider", provider, e)
+                continue
+
+            provider_tools[id(provider)] = result
+
+        return provider_tools
+
+    def copy(self) -> "ToolRegistry":
+        """Create a registry with the same tools without processing them again.
+
+        Tools, tool providers, and the validated tool spec snapshot are shared with this registry, while registering
+        or removing tools on the copy does not affect this registry. The copy is a separate consumer of the tool
+        providers, so cleaning it up does not release providers still used by this registry.
+
+        Returns:
+            The new registry.
+        """
+        registry = ToolRegistry()
+        registry.registry = dict(self.registry)
+        registry.dynamic_tools = dict(self.dynamic_tools)
+        registry.tool_config = dict(self.tool_config) if self.tool_config is not None else None
+        registry._version = self._version
+        registry._snapshot = self._snapshot
+
+        registry._tool_providers = list(self._tool_providers)
+        registry.provider_startups = list(self.provider_startups)
+        for provider in registry._tool_providers:
+            provider.add_consumer(registry._registry_id)
+
+        return registry
+
     def load_tool_from_filepath(self, tool_name: str, tool_path: str) -> None:
         """DEPRECATED: Load a tool from a file path.
 
@@ -192,6 +358,37 @@ class ToolRegistry:
         Returns:
             Dictionary containing all tool configurations.
         """
+        return dict(self.get_tool_spec_snapshot().tools_config)
+
+    def get_tool_spec_snapshot(self) -> ToolSpecSnapshot:
+        """Get the validated tool specs for the current registry version.
+
+        The snapshot is built once and reused until a tool is registered, replaced, reloaded, or removed.
+
+        Returns:
+            The tool spec snapshot for the current registry version.
+        """
+        if self._snapshot is None or self._snapshot.version != self._version:
+            tools_config = self._build_tools_config()
+            tool_specs = tuple(tools_config.values())
+            self._snapshot = ToolSpecSnapshot(
+                version=self._version,
+                tools_config=tools_config,
+                tool_specs=tool_specs,
+                tool_config=ToolConfig(
+                    tools=[{"toolSpec": tool_spec} for tool_spec in tool_specs],
+                    toolChoice=cast(ToolChoice, {"auto": ToolChoiceAuto()}),
+                ),
+            )
+
+        return self._snapshot
+
+    def _build_tools_config(self) -> Dict[str, ToolSpec]:
+        """Normalize and validate the specs of all built-in and dynamic tools.
+
+        Returns:
+            Mapping of tool name to tool spec.
+        """
         tool_config = {}
         logger.debug("getting tool configurations")
 
@@ -263,6 +460,7 @@ class ToolRegistry:
 
         # Register in main registry
         self.registry[tool.tool_name] = tool
+        self._version += 1
 
         # Register in dynamic tools if applicable
         if tool.is_dynamic:
@@ -298,6 +496,7 @@ class ToolRegistry:
 
         # Update main registry
         self.registry[tool_name] = new_tool
+        self._version += 1
 
         # Update dynamic_tools to match new tool's dynamic status
         if new_tool.is_dynamic:
@@ -567,9 +766,7 @@ class ToolRegistry:
         Returns:
             A list of ToolSpecs.
         """
-        all_tools = self.get_all_tools_config()
-        tools: List[ToolSpec] = [tool_spec for tool_spec in all_tools.values()]
-        return tools
+        return list(self.get_tool_spec_snapshot().tool_specs)
 
     def register_dynamic_tool(self, tool: AgentTool) -> None:
         """Register a tool dynamically for temporary use.
@@ -584,8 +781,19 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.tool_name}' already exists")
 
         self.dynamic_tools[tool.tool_name] = tool
+        self._version += 1
         logger.debug("Registered dynamic tool: %s", tool.tool_name)
 
+    def unregister_dynamic_tool(self, tool_name: str) -> None:
+        """Remove a tool that was registered dynamically for temporary use.
+
+        Args:
+            tool_name: Name of the dynamic tool to remove.
+        """
+        if self.dynamic_tools.pop(tool_name, None) is not None:
+            self._version += 1
+            logger.debug("Unregistered dynamic tool: %s", tool_name)
+
     def validate_tool_spec(self, tool_spec: ToolSpec) -> None:
         """Validate tool specification against required schema.
 
@@ -720,3 +928,48 @@ class ToolRegistry:
 
         if exceptions:
             raise exceptions[0]
+
+
+def _is_nested_tools(tool: Any) -> bool:
+    """Whether process_tools handles a tool specification as an iterable of tools."""
+    # Skip the tool specifications that process_tools checks before iterables
+    if isinstance(tool, (str, bytes, bytearray, dict, AgentTool)) or inspect.ismodule(tool):
+        return False
+    return isinstance(tool, Iterable)
+
+
+def _materialize_tools(tools: Iterable[Any]) -> List[Any]:
+    """Copy a tools list and its nested iterables into lists, so that generators can be iterated more than once.
+
+    Args:
+        tools: The tools list passed to `ToolRegistry.process_tools`.
+
+    Returns:
+        The tools, with nested iterables replaced by lists.
+    """
+    return [_materialize_tools(tool) if _is_nested_tools(tool) else tool for tool in tools]
+
+
+def _find_tool_providers(tools: Iterable[Any]) -> List[ToolProvider]:
+    """Find the tool providers in a tools list, including nested iterables.
+
+    Args:
+        tools: The tools list passed to `ToolRegistry.process_tools`, with nested iterables materialized.
+
+    Returns:
+        The distinct tool providers in the order they appear.
+    """
+    providers: List[ToolProvider] = []
+    for tool in tools:
+        if _is_nested_tools(tool):
+            nested_providers = _find_tool_providers(tool)
+        elif isinstance(tool, ToolProvider):
+            nested_providers = [tool]
+        else:
+            continue
+
+        for provider in nested_providers:
+            if not any(provider is found for found in providers):
+                providers.append(provider)
+
+    return providers
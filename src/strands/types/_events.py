@@ -140,12 +140,25 @@ class ModelStreamEvent(TypedEvent):
             self.update(invocation_state)
 
 
+_MISSING_INPUT = object()
+
+
 class ToolUseStreamEvent(ModelStreamEvent):
     """Event emitted during tool use input streaming."""
 
-    def __init__(self, delta: ContentBlockDelta, current_tool_use: dict[str, Any]) -> None:
-        """Initialize with delta and current tool use state."""
+    def __init__(
+        self, delta: ContentBlockDelta, current_tool_use: dict[str, Any], partial_input: Any = _MISSING_INPUT
+    ) -> None:
+        """Initialize with delta and current tool use state.
+
+        Args:
+            delta: The tool use input delta.
+            current_tool_use: The tool use being streamed.
+            partial_input: Input parsed so far, set when tool input is parsed incrementally.
+        """
         super().__init__({"type": "tool_use_stream", "delta": delta, "current_tool_use": current_tool_use})
+        if partial_input is not _MISSING_INPUT:
+            self["partial_input"] = partial_input
 
 
 class TextStreamEvent(ModelStreamEvent):
@@ -25,6 +25,17 @@ class SessionType(str, Enum):
     AGENT = "AGENT"
 
 
+_parameters_cache: dict[type, frozenset[str]] = {}
+
+
+def _get_parameters(cls: type) -> frozenset[str]:
+    """Get the names of the constructor parameters of a class."""
+    parameters = _parameters_cache.get(cls)
+    if parameters is None:
+        parameters = _parameters_cache[cls] = frozenset(inspect.signature(cls).parameters)
+    return parameters
+
+
 def encode_bytes_values(obj: Any) -> Any:
     """Recursively encode any bytes values in an object to base64.
 
@@ -96,7 +107,8 @@ class SessionMessage:
     @classmethod
     def from_dict(cls, env: dict[str, Any]) -> "SessionMessage":
         """Initialize a SessionMessage from a dictionary, ignoring keys that are not class parameters."""
-        extracted_relevant_parameters = {k: v for k, v in env.items() if k in inspect.signature(cls).parameters}
+        parameters = _get_parameters(cls)
+        extracted_relevant_parameters = {k: v for k, v in env.items() if k in parameters}
         return cls(**decode_bytes_values(extracted_relevant_parameters))
 
     def to_dict(self) -> dict[str, Any]:
@@ -165,7 +177,8 @@ class SessionAgent:
     @classmethod
     def from_dict(cls, env: dict[str, Any]) -> "SessionAgent":
         """Initialize a SessionAgent from a dictionary, ignoring keys that are not class parameters."""
-        return cls(**{k: v for k, v in env.items() if k in inspect.signature(cls).parameters})
+        parameters = _get_parameters(cls)
+        return cls(**{k: v for k, v in env.items() if k in parameters})
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the SessionAgent to a dictionary representation."""
@@ -200,7 +213,8 @@ class Session:
     @classmethod
     def from_dict(cls, env: dict[str, Any]) -> "Session":
         """Initialize a Session from a dictionary, ignoring keys that are not class parameters."""
-        return cls(**{k: v for k, v in env.items() if k in inspect.signature(cls).parameters})
+        parameters = _get_parameters(cls)
+        return cls(**{k: v for k, v in env.items() if k in parameters})
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the Session to a dictionary representation."""
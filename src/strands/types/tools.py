@@ -8,13 +8,16 @@ These types are modeled after the Bedrock API.
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Awaitable, Callable, Literal, Protocol, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, Literal, Optional, Protocol, Union
 
 from typing_extensions import NotRequired, TypedDict
 
 from .interrupt import _Interruptible
 from .media import DocumentContent, ImageContent
 
+if TYPE_CHECKING:
+    from ..tools.cache import ToolCache
+
 JSONSchema = dict
 """Type alias for JSON Schema dictionaries."""
 
@@ -261,6 +264,15 @@ class AgentTool(ABC):
         """
         return False
 
+    @property
+    def cache(self) -> Optional["ToolCache"]:
+        """Cache of the tool's results, used by the tool executor to skip repeated calls with the same input.
+
+        Returns:
+            None by default, which means results are not cached.
+        """
+        return None
+
     @abstractmethod
     # pragma: no cover
     def stream(self, tool_use: ToolUse, invocation_state: dict[str, Any], **kwargs: Any) -> ToolGenerator:
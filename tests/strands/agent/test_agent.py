@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import importlib
 import json
@@ -11,18 +12,20 @@ import pytest
 from pydantic import BaseModel
 
 import strands
-from strands import Agent
+from strands import Agent, EventLoopRunner
 from strands.agent import AgentResult
 from strands.agent.conversation_manager.null_conversation_manager import NullConversationManager
 from strands.agent.conversation_manager.sliding_window_conversation_manager import SlidingWindowConversationManager
+from strands.agent.conversation_manager.summarizing_conversation_manager import SummarizingConversationManager
+from strands.agent.conversation_manager.token_budget_conversation_manager import TokenBudgetConversationManager
 from strands.agent.state import AgentState
 from strands.handlers.callback_handler import PrintingCallbackHandler, null_callback_handler
-from strands.hooks import BeforeToolCallEvent
+from strands.hooks import AgentInitializedEvent, BeforeToolCallEvent, HookProvider
 from strands.interrupt import Interrupt
 from strands.models.bedrock import DEFAULT_BEDROCK_MODEL_ID, BedrockModel
 from strands.session.repository_session_manager import RepositorySessionManager
 from strands.telemetry.tracer import serialize
-from strands.types._events import EventLoopStopEvent, ModelStreamEvent
+from strands.types._events import AgentResultEvent, EventLoopStopEvent, ModelStreamEvent, TypedEvent
 from strands.types.content import Messages
 from strands.types.exceptions import ContextWindowOverflowException, EventLoopException
 from strands.types.session import Session, SessionAgent, SessionMessage, SessionType
@@ -1057,6 +1060,62 @@ async def test_stream_async_returns_all_events(mock_event_loop_cycle, alist):
     mock_callback.assert_has_calls(exp_calls)
 
 
+@pytest.mark.asyncio
+async def test_stream_async_event_keys(mock_event_loop_cycle, alist):
+    agent = Agent()
+
+    async def test_event_loop(*args, **kwargs):
+        yield ModelStreamEvent({"data": "First chunk", "delta": {"text": "First chunk"}})
+        yield ModelStreamEvent({"message": {"role": "assistant", "content": []}})
+        yield EventLoopStopEvent("stop", {"role": "assistant", "content": [{"text": "Response"}]}, {}, {})
+
+    mock_event_loop_cycle.side_effect = test_event_loop
+    mock_callback = unittest.mock.Mock()
+    agent.callback_handler = mock_callback
+
+    # "some_value" is only added to events by the invocation state, so it does not select any event
+    stream = agent.stream_async("test message", invocation_state={"some_value": 1}, event_keys={"data", "some_value"})
+
+    tru_events = await alist(stream)
+    exp_result = AgentResult(
+        stop_reason="stop",
+        message={"role": "assistant", "content": [{"text": "Response"}]},
+        metrics={},
+        state={},
+    )
+    exp_events = [
+        {"data": "First chunk", "delta": {"text": "First chunk"}, "some_value": 1, "agent": agent},
+        {"result": exp_result},
+    ]
+    assert tru_events == exp_events
+    assert mock_callback.call_args_list == [unittest.mock.call(**event) for event in exp_events]
+
+
+@pytest.mark.asyncio
+async def test_invoke_async_materializes_only_result_without_callback_handler():
+    model = MockedModelProvider([{"role": "assistant", "content": [{"text": "Response"}]}])
+    agent = Agent(model=model, callback_handler=None)
+
+    with unittest.mock.patch.object(TypedEvent, "as_dict", autospec=True, side_effect=dict) as mock_as_dict:
+        result = await agent.invoke_async("test message")
+
+    assert str(result) == "Response\n"
+    assert [type(call.args[0]) for call in mock_as_dict.call_args_list] == [AgentResultEvent]
+
+
+@pytest.mark.asyncio
+async def test_invoke_async_event_keys():
+    model = MockedModelProvider([{"role": "assistant", "content": [{"text": "Response"}]}])
+    mock_callback = unittest.mock.Mock()
+    agent = Agent(model=model, callback_handler=mock_callback)
+
+    result = await agent.invoke_async("test message", event_keys={"data"})
+
+    tru_calls = [call.kwargs for call in mock_callback.call_args_list]
+    assert [call["data"] for call in tru_calls[:-1]] == ["Response"]
+    assert tru_calls[-1] == {"result": result}
+
+
 @pytest.mark.asyncio
 async def test_stream_async_multi_modal_input(mock_model, agent, agenerator, alist):
     mock_model.mock_stream.return_value = agenerator(
@@ -2182,3 +2241,214 @@ def test_agent_skips_fix_for_valid_conversation(mock_model, agenerator):
     # Should not have added any toolResult messages
     # Only the new user message and assistant response should be added
     assert len(agent.messages) == original_length + 2
+
+
+def test_agent__call__with_event_loop_runner():
+    runner = EventLoopRunner()
+    model = MockedModelProvider(
+        [
+            {"role": "assistant", "content": [{"text": "first"}]},
+            {"role": "assistant", "content": [{"text": "second"}]},
+        ]
+    )
+    agent = Agent(model=model, callback_handler=None, event_loop_runner=runner)
+
+    try:
+        first = agent("Hello!")
+        first_loop = runner._loop
+        second = agent("Hello again!")
+    finally:
+        runner.close()
+
+    assert str(first) == "first\n"
+    assert str(second) == "second\n"
+    assert runner._loop is first_loop
+
+
+def test_agent_tool_input_streaming_parsed(tool_decorated):
+    model = MockedModelProvider(
+        [
+            {
+                "role": "assistant",
+                "content": [
+                    {"toolUse": {"toolUseId": "t1", "name": "tool_decorated", "input": {"random_string": "x"}}},
+                ],
+            },
+            {"role": "assistant", "content": [{"text": "done"}]},
+        ]
+    )
+    partial_inputs = []
+
+    def callback_handler(**kwargs):
+        if "partial_input" in kwargs:
+            partial_inputs.append(kwargs["partial_input"])
+
+    agent = Agent(model=model, tools=[tool_decorated], callback_handler=callback_handler, tool_input_streaming="parsed")
+    result = agent("Hello!")
+
+    assert str(result) == "done\n"
+    assert partial_inputs == [{"random_string": "x"}]
+    assert agent.messages[1]["content"][0]["toolUse"]["input"] == {"random_string": "x"}
+
+
+def test_agent_tool_input_streaming_invalid():
+    with pytest.raises(ValueError, match="tool_input_streaming"):
+        Agent(tool_input_streaming="invalid")
+
+
+class EchoModel(MockedModelProvider):
+    """Replies with the last user text after a delay, tracking how many requests run at once."""
+
+    def __init__(self, delays=None):
+        super().__init__([])
+        self.delays = delays or {}
+        self.active = 0
+        self.max_active = 0
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, tool_choice=None, **kwargs):
+        text = messages[-1]["content"][0]["text"]
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(text, 0))
+        finally:
+            self.active -= 1
+
+        events = self.map_agent_message_to_events({"role": "assistant", "content": [{"text": f"{text}!"}]})
+        for event in events:
+            yield event
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_isolates_prompts():
+    initialized_agents = []
+
+    class Hooks(HookProvider):
+        def register_hooks(self, registry, **kwargs):
+            registry.add_callback(AgentInitializedEvent, lambda event: initialized_agents.append(event.agent))
+
+    model = EchoModel(delays={"slow": 0.05})
+    messages = [
+        {"role": "user", "content": [{"text": "context"}]},
+        {"role": "assistant", "content": [{"text": "ok"}]},
+    ]
+    agent = Agent(model=model, messages=messages, callback_handler=None, hooks=[Hooks()], state={"user": "a"})
+
+    tru_results = [result async for result in agent.batch_async(["slow", "fast"])]
+
+    assert [(result.index, str(result.result)) for result in tru_results] == [(1, "fast!\n"), (0, "slow!\n")]
+    assert [result.prompt for result in tru_results] == ["fast", "slow"]
+    assert all(result.exception is None for result in tru_results)
+
+    slow_agent = tru_results[1].agent
+    assert slow_agent.messages[:2] == messages
+    assert slow_agent.messages[2:] == [
+        {"role": "user", "content": [{"text": "slow"}]},
+        {"role": "assistant", "content": [{"text": "slow!"}]},
+    ]
+    assert slow_agent.state.get("user") == "a"
+    assert slow_agent.model is agent.model
+    assert slow_agent.callback_handler is null_callback_handler
+    assert slow_agent.conversation_manager is not agent.conversation_manager
+    assert agent.messages == messages
+    assert initialized_agents == [agent, tru_results[1].agent, tru_results[0].agent]
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_registers_hooks_with_batch_agents():
+    class Hooks(HookProvider):
+        def __init__(self):
+            self.registries = []
+
+        def register_hooks(self, registry, **kwargs):
+            self.registries.append(registry)
+
+    hooks = Hooks()
+    agent = Agent(model=EchoModel(), callback_handler=None, hooks=[hooks])
+
+    tru_results = [result async for result in agent.batch_async(["a"])]
+
+    assert hooks.registries == [agent.hooks, tru_results[0].agent.hooks]
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_isolates_conversation_managers():
+    summarization_agent = Agent(model=EchoModel(), callback_handler=None)
+    conversation_manager = SummarizingConversationManager(summarization_agent=summarization_agent)
+    agent = Agent(model=EchoModel(), conversation_manager=conversation_manager, callback_handler=None)
+
+    tru_results = [result async for result in agent.batch_async(["a", "b"])]
+
+    managers = [result.agent.conversation_manager for result in tru_results]
+    assert managers[0] is not managers[1]
+    assert managers[0].summarization_agent is not managers[1].summarization_agent
+    assert all(manager.summarization_agent is not summarization_agent for manager in managers)
+
+    agent = Agent(model=EchoModel(), conversation_manager=TokenBudgetConversationManager(1000), callback_handler=None)
+
+    tru_results = [result async for result in agent.batch_async(["a", "b"])]
+
+    caches = [result.agent.conversation_manager._message_tokens for result in tru_results]
+    assert caches[0] is not caches[1]
+    assert all(cache is not agent.conversation_manager._message_tokens for cache in caches)
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_concurrency():
+    model = EchoModel(delays={str(index): 0.01 for index in range(10)})
+    agent = Agent(model=model, callback_handler=None)
+
+    tru_results = [result async for result in agent.batch_async((str(index) for index in range(10)), concurrency=3)]
+
+    assert sorted(result.index for result in tru_results) == list(range(10))
+    assert model.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_aggregates_metrics(tool_decorated):
+    model = EchoModel()
+    agent = Agent(model=model, tools=[tool_decorated], callback_handler=None)
+
+    tru_results = [result async for result in agent.batch_async(["a", "b", "c"])]
+
+    assert len(agent.event_loop_metrics.agent_invocations) == 3
+    assert agent.event_loop_metrics.cycle_count == 3
+    assert agent.event_loop_metrics.accumulated_usage["totalTokens"] == sum(
+        result.result.metrics.accumulated_usage["totalTokens"] for result in tru_results
+    )
+    assert all(result.agent.tool_names == ["tool_decorated"] for result in tru_results)
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_reports_exceptions():
+    model = EchoModel()
+    agent = Agent(model=model, callback_handler=None)
+
+    tru_results = sorted(
+        [result async for result in agent.batch_async(["ok", {"invalid": "prompt"}])], key=lambda r: r.index
+    )
+
+    assert str(tru_results[0].result) == "ok!\n"
+    assert tru_results[1].result is None
+    assert isinstance(tru_results[1].exception, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_cancels_on_early_exit():
+    model = EchoModel(delays={"fast": 0, "slow": 10})
+    agent = Agent(model=model, callback_handler=None)
+
+    results = agent.batch_async(["fast", "slow"])
+    first = await anext(results)
+    await results.aclose()
+
+    assert first.prompt == "fast"
+    assert model.active == 0
+
+
+@pytest.mark.asyncio
+async def test_agent_batch_async_invalid_concurrency():
+    agent = Agent(model=EchoModel(), callback_handler=None)
+
+    with pytest.raises(ValueError, match="concurrency"):
+        await anext(agent.batch_async(["a"], concurrency=0))
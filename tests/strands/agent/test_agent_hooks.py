@@ -13,6 +13,7 @@ from strands.hooks import (
     BeforeInvocationEvent,
     BeforeModelCallEvent,
     BeforeToolCallEvent,
+    HookProvider,
     MessageAddedEvent,
 )
 from strands.types.content import Messages
@@ -120,6 +121,27 @@ def test_agent__init__hooks():
     assert next(events) == AgentInitializedEvent(agent=agent)
 
 
+def test_agent__init__hooks_registered_with_agent_registry():
+    """Verify that hook providers get the agent's registry, so callbacks they add later are invoked."""
+    calls = []
+
+    class LateHooks(HookProvider):
+        def register_hooks(self, registry, **kwargs):
+            self.registry = registry
+            registry.add_callback(BeforeInvocationEvent, self.before)
+
+        def before(self, event):
+            calls.append("before")
+            self.registry.add_callback(AfterInvocationEvent, lambda event: calls.append("after"))
+
+    hooks = LateHooks()
+    agent = Agent(model=MockedModelProvider([{"role": "assistant", "content": [{"text": "hi"}]}]), hooks=[hooks])
+    agent("hello")
+
+    assert hooks.registry is agent.hooks
+    assert calls == ["before", "after"]
+
+
 def test_agent_tool_call(agent, hook_provider, agent_tool):
     agent.tool.tool_decorated(random_string="a string")
 
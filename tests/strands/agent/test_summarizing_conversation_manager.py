@@ -1,3 +1,5 @@
+import copy
+import threading
 from typing import cast
 from unittest.mock import Mock, patch
 
@@ -637,3 +639,167 @@ def test_summarizing_conversation_manager_generate_summary_with_tools(mock_regis
     summarizing_manager._generate_summary(messages, agent)
 
     mock_registry.register_tool.assert_not_called()
+
+
+def _background_messages() -> Messages:
+    return [
+        {"role": "user", "content": [{"text": "Message 1"}]},
+        {"role": "assistant", "content": [{"text": "Response 1"}]},
+        {"role": "user", "content": [{"text": "Message 2"}]},
+        {"role": "assistant", "content": [{"text": "Response 2"}]},
+        {"role": "user", "content": [{"text": "Message 3"}]},
+        {"role": "assistant", "content": [{"text": "Response 3"}]},
+    ]
+
+
+@pytest.fixture
+def background_summarization_agent():
+    model = MockedModelProvider(
+        [
+            {"role": "assistant", "content": [{"text": "Summary"}]},
+            {"role": "assistant", "content": [{"text": "Summary 2"}]},
+        ]
+    )
+    return Agent(model=model, system_prompt="Summarize.", callback_handler=None)
+
+
+@pytest.fixture
+def background_manager(background_summarization_agent):
+    return SummarizingConversationManager(
+        summary_ratio=0.4,
+        preserve_recent_messages=2,
+        summarization_agent=background_summarization_agent,
+        background_threshold=6,
+    )
+
+
+def test_background_summary_swapped_in_at_next_turn_boundary(background_manager, background_summarization_agent):
+    agent = Agent(
+        model=MockedModelProvider([]),
+        messages=_background_messages(),
+        conversation_manager=background_manager,
+        callback_handler=None,
+    )
+    original_messages = list(agent.messages)
+
+    background_manager.apply_management(agent)
+
+    # The summary is generated in the background, the conversation is unchanged until the next boundary
+    assert agent.messages == original_messages
+    background_manager._pending_summary.result(timeout=5)
+
+    # The summarization thread exits once the summary is generated
+    for thread in threading.enumerate():
+        if thread.name.startswith("strands-summarization"):
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+    agent.messages.append({"role": "user", "content": [{"text": "Message 4"}]})
+    background_manager.apply_management(agent)
+
+    assert agent.messages == [
+        {"role": "user", "content": [{"text": "Summary"}]},
+        *original_messages[2:],
+        {"role": "user", "content": [{"text": "Message 4"}]},
+    ]
+    assert background_manager.removed_message_count == 2
+    assert background_manager.get_state()["summary_message"] == agent.messages[0]
+    # The summarization agent itself is left untouched
+    assert background_summarization_agent.messages == []
+
+
+def test_background_summary_started_before_model_call(background_manager, monkeypatch):
+    # Hold the summary until the invocation ends, so it is not swapped in at the end of the invocation
+    release = threading.Event()
+    run_background_summarization = background_manager._run_background_summarization
+
+    def run_after_release(summarization_agent):
+        release.wait(timeout=5)
+        return run_background_summarization(summarization_agent)
+
+    monkeypatch.setattr(background_manager, "_run_background_summarization", run_after_release)
+    model = MockedModelProvider([{"role": "assistant", "content": [{"text": "Response 4"}]}])
+    agent = Agent(
+        model=model,
+        messages=_background_messages()[:5],
+        conversation_manager=background_manager,
+        callback_handler=None,
+    )
+
+    agent("Message 4")
+
+    assert background_manager._pending_summary is not None
+    assert background_manager._pending_summarized_messages == _background_messages()[:2]
+    assert agent.messages[-1] == {"role": "assistant", "content": [{"text": "Response 4"}]}
+
+    release.set()
+    assert background_manager._pending_summary.result(timeout=5)["content"] == [{"text": "Summary"}]
+
+
+def test_background_summary_below_threshold(background_manager):
+    agent = Agent(model=MockedModelProvider([]), messages=_background_messages()[:5], callback_handler=None)
+
+    background_manager.apply_management(agent)
+
+    assert background_manager._pending_summary is None
+
+
+def test_background_summary_discarded_when_conversation_changed(background_manager):
+    agent = Agent(model=MockedModelProvider([]), messages=_background_messages(), callback_handler=None)
+
+    background_manager.apply_management(agent)
+    background_manager._pending_summary.result(timeout=5)
+    agent.messages = _background_messages()[2:]
+
+    background_manager.apply_management(agent)
+
+    assert agent.messages == _background_messages()[2:]
+    assert background_manager.removed_message_count == 0
+    assert background_manager._pending_summary is None
+
+
+def test_reduce_context_uses_finished_background_summary(background_manager):
+    agent = Agent(model=MockedModelProvider([]), messages=_background_messages(), callback_handler=None)
+
+    background_manager.apply_management(agent)
+    background_manager._pending_summary.result(timeout=5)
+
+    with patch.object(background_manager, "_generate_summary") as generate_summary:
+        background_manager.reduce_context(agent)
+
+    generate_summary.assert_not_called()
+    assert agent.messages == [{"role": "user", "content": [{"text": "Summary"}]}, *_background_messages()[2:]]
+
+
+def test_background_summary_failure_keeps_conversation():
+    summarization_agent = Agent(model=MockedModelProvider([]), callback_handler=None)
+    manager = SummarizingConversationManager(
+        summary_ratio=0.4, preserve_recent_messages=2, summarization_agent=summarization_agent, background_threshold=7
+    )
+    agent = Agent(model=MockedModelProvider([]), messages=_background_messages(), callback_handler=None)
+    agent.messages.append({"role": "user", "content": [{"text": "Message 4"}]})
+
+    manager.apply_management(agent)
+    assert manager._pending_summary.exception(timeout=5) is not None
+    agent.messages.pop()
+
+    manager.apply_management(agent)
+
+    assert agent.messages == _background_messages()
+    assert manager._pending_summary is None
+
+
+def test_copy_does_not_share_background_summary(background_manager):
+    agent = Agent(model=MockedModelProvider([]), messages=_background_messages(), callback_handler=None)
+    background_manager.apply_management(agent)
+
+    copied = copy.copy(background_manager)
+
+    assert copied._pending_summary is None
+    assert copied.background_threshold == 6
+    assert background_manager._pending_summary is not None
+
+
+def test_init_invalid_background_threshold():
+    with pytest.raises(ValueError, match="background_threshold"):
+        SummarizingConversationManager(preserve_recent_messages=4, background_threshold=4)
@@ -0,0 +1,207 @@
+import asyncio
+import concurrent.futures
+import unittest.mock
+
+import pytest
+
+import strands
+from strands import Agent, AgentTemplate
+from strands.agent.conversation_manager import SlidingWindowConversationManager, SummarizingConversationManager
+from strands.experimental.tools import ToolProvider
+from strands.handlers.callback_handler import PrintingCallbackHandler, null_callback_handler
+from strands.hooks import AgentInitializedEvent, BeforeInvocationEvent, HookProvider
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+@strands.tool
+def add(a: int, b: int) -> int:
+    """Add two numbers.
+
+    Args:
+        a: First number.
+        b: Second number.
+    """
+    return a + b
+
+
+@strands.tool
+def subtract(a: int, b: int) -> int:
+    """Subtract two numbers.
+
+    Args:
+        a: First number.
+        b: Second number.
+    """
+    return a - b
+
+
+class RecordingHooks(HookProvider):
+    def __init__(self):
+        self.registries = []
+        self.initialized_agents = []
+        self.invocations = []
+
+    def register_hooks(self, registry, **kwargs):
+        self.registries.append(registry)
+        registry.add_callback(AgentInitializedEvent, lambda event: self.initialized_agents.append(event.agent))
+        registry.add_callback(BeforeInvocationEvent, lambda event: self.invocations.append(event.agent))
+
+
+class EchoSummaryModel(MockedModelProvider):
+    """Summarizes a conversation as the text of its first message."""
+
+    def __init__(self):
+        super().__init__([])
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        # Give concurrent summaries the chance to interleave
+        await asyncio.sleep(0.05)
+        summary = {"role": "assistant", "content": [{"text": f"summary of {messages[0]['content'][0]['text']}"}]}
+        for event in self.map_agent_message_to_events(summary):
+            yield event
+
+
+@pytest.fixture
+def model():
+    return MockedModelProvider([])
+
+
+def test_create_shares_prepared_parts(model):
+    template = AgentTemplate(model=model, tools=[add], system_prompt="You add numbers.", name="adder")
+
+    agent1 = template.create()
+    agent2 = template.create()
+
+    assert isinstance(agent1, Agent)
+    assert agent1.model is agent2.model is model
+    assert agent1.system_prompt == agent2.system_prompt == "You add numbers."
+    assert agent1.name == "adder"
+    assert agent1.tool_names == ["add"]
+    assert agent1.tool_registry.get_tool_spec_snapshot() is template.tool_registry.get_tool_spec_snapshot()
+    assert agent1.tool_registry.get_tool_spec_snapshot() is agent2.tool_registry.get_tool_spec_snapshot()
+
+
+def test_create_isolates_agents(model):
+    template = AgentTemplate(model=model, tools=[add], conversation_manager=SlidingWindowConversationManager(5))
+
+    agent1 = template.create(messages=[{"role": "user", "content": [{"text": "hi"}]}], state={"user": "a"})
+    agent2 = template.create(state={"user": "b"})
+
+    assert len(agent1.messages) == 1
+    assert agent2.messages == []
+    assert agent1.state.get("user") == "a"
+    assert agent2.state.get("user") == "b"
+    assert agent1.event_loop_metrics is not agent2.event_loop_metrics
+
+    assert agent1.conversation_manager is not agent2.conversation_manager
+    assert agent1.conversation_manager is not template.conversation_manager
+    assert agent1.conversation_manager.window_size == 5
+
+    agent1.tool_registry.register_tool(subtract)
+    assert agent1.tool_names == ["add", "subtract"]
+    assert agent2.tool_names == ["add"]
+    assert list(template.tool_registry.registry) == ["add"]
+
+
+def test_create_registers_hooks(model):
+    hooks = RecordingHooks()
+    template = AgentTemplate(model=model, hooks=[hooks])
+
+    agent1 = template.create()
+    agent2 = template.create()
+
+    assert hooks.registries == [agent1.hooks, agent2.hooks]
+    assert hooks.initialized_agents == [agent1, agent2]
+
+    # The template's callbacks run after the conversation manager's, as they do for hooks passed to Agent
+    tru_callbacks = list(agent1.hooks.get_callbacks_for(BeforeInvocationEvent(agent=agent1)))
+    tru_callbacks[-1](BeforeInvocationEvent(agent=agent1))
+    assert hooks.invocations == [agent1]
+
+
+def test_create_agent_invokes_tools():
+    model = MockedModelProvider(
+        [
+            {
+                "role": "assistant",
+                "content": [{"toolUse": {"toolUseId": "t1", "name": "add", "input": {"a": 1, "b": 2}}}],
+            },
+            {"role": "assistant", "content": [{"text": "3"}]},
+        ]
+    )
+    hooks = RecordingHooks()
+    template = AgentTemplate(model=model, tools=[add], hooks=[hooks], callback_handler=None)
+
+    agent = template.create()
+    result = agent("What is 1 + 2?")
+
+    assert str(result).strip() == "3"
+    assert agent.messages[2]["content"][0]["toolResult"]["content"] == [{"text": "3"}]
+    assert hooks.invocations == [agent]
+
+
+def test_create_callback_handler(model):
+    handler = unittest.mock.Mock()
+
+    assert isinstance(AgentTemplate(model=model).create().callback_handler, PrintingCallbackHandler)
+    assert AgentTemplate(model=model, callback_handler=None).create().callback_handler is null_callback_handler
+    assert (
+        AgentTemplate(model=model, callback_handler=None).create(callback_handler=handler).callback_handler is handler
+    )
+
+
+def test_create_session_manager_and_agent_id(model):
+    session_manager = unittest.mock.Mock()
+    template = AgentTemplate(model=model)
+
+    agent = template.create(agent_id="request-1", session_manager=session_manager)
+
+    assert agent.agent_id == "request-1"
+    assert agent._session_manager is session_manager
+    session_manager.register_hooks.assert_called_once_with(agent.hooks)
+
+
+def test_template_invalid_tool_input_streaming(model):
+    with pytest.raises(ValueError, match="tool_input_streaming"):
+        AgentTemplate(model=model, tool_input_streaming="eager")
+
+
+def test_template_cleanup_releases_tool_providers(model):
+    provider = unittest.mock.MagicMock(spec=ToolProvider)
+    provider.load_tools = unittest.mock.AsyncMock(return_value=[])
+    template = AgentTemplate(model=model, tools=[provider])
+
+    agent = template.create()
+    agent.cleanup()
+    provider.remove_consumer.assert_called_once_with(agent.tool_registry._registry_id)
+
+    template.cleanup()
+    provider.remove_consumer.assert_called_with(template.tool_registry._registry_id)
+
+
+def test_create_isolates_conversation_managers(model):
+    summarization_agent = Agent(model=EchoSummaryModel(), callback_handler=None)
+    conversation_manager = SummarizingConversationManager(
+        summary_ratio=0.5, preserve_recent_messages=2, summarization_agent=summarization_agent
+    )
+    template = AgentTemplate(model=model, conversation_manager=conversation_manager)
+
+    agents = []
+    for name in ("a", "b"):
+        messages = [
+            {"role": role, "content": [{"text": f"{name}{index}"}]}
+            for index, role in enumerate(["user", "assistant"] * 4)
+        ]
+        agents.append(template.create(messages=messages))
+
+    managers = [agent.conversation_manager for agent in agents]
+    assert managers[0].summarization_agent is not managers[1].summarization_agent
+    assert managers[0].summarization_agent is not summarization_agent
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        list(executor.map(lambda agent: agent.conversation_manager.reduce_context(agent), agents))
+
+    # Each agent's summary only covers its own conversation
+    assert agents[0].messages[0]["content"] == [{"text": "summary of a0"}]
+    assert agents[1].messages[0]["content"] == [{"text": "summary of b0"}]
+    assert summarization_agent.messages == []
@@ -0,0 +1,189 @@
+import unittest.mock
+
+import pytest
+
+from strands import tool
+from strands.agent.agent import Agent
+from strands.agent.conversation_manager.token_budget_conversation_manager import (
+    TokenBudgetConversationManager,
+    estimate_tokens,
+)
+from strands.telemetry.metrics import InputTokenEstimate
+from strands.types.exceptions import ContextWindowOverflowException
+from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def user(text):
+    return {"role": "user", "content": [{"text": text}]}
+
+
+def assistant(text):
+    return {"role": "assistant", "content": [{"text": text}]}
+
+
+@pytest.fixture
+def agent():
+    return Agent(model=MockedModelProvider([]), callback_handler=None)
+
+
+@pytest.fixture
+def conversation_manager(request):
+    params = {"max_tokens": 30, "tokenizer": count_words}
+    if hasattr(request, "param"):
+        params.update(request.param)
+
+    return TokenBudgetConversationManager(**params)
+
+
+@tool
+def lookup(key: str) -> str:
+    """Look up a key.
+
+    Args:
+        key: Key to look up.
+    """
+    return key
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_estimate_input_tokens(conversation_manager, agent):
+    agent.system_prompt = "be brief"
+    agent.messages = [
+        user("one two three"),
+        {"role": "assistant", "content": [{"toolUse": {"toolUseId": "t1", "name": "lookup", "input": {"a": 1}}}]},
+        {
+            "role": "user",
+            "content": [
+                {
+                    "toolResult": {
+                        "toolUseId": "t1",
+                        "status": "success",
+                        "content": [{"text": "four five"}, {"image": {"format": "png", "source": {"bytes": b"x"}}}],
+                    }
+                }
+            ],
+        },
+    ]
+
+    # 2 (system prompt) + 4 + 3 (message overhead and text) + 4 + 1 + 2 (name and input) + 4 + 2 + 1600 (image)
+    assert conversation_manager.estimate_input_tokens(agent) == 1622
+
+
+def test_estimate_input_tokens_includes_tool_specs(conversation_manager):
+    agent = Agent(model=MockedModelProvider([]), tools=[lookup], callback_handler=None)
+
+    assert conversation_manager.estimate_input_tokens(agent) > 0
+
+
+def test_estimate_input_tokens_reuses_unchanged_messages(agent):
+    tokenizer = unittest.mock.Mock(side_effect=count_words)
+    conversation_manager = TokenBudgetConversationManager(max_tokens=100, tokenizer=tokenizer)
+    agent.messages = [user("one two"), assistant("three")]
+
+    conversation_manager.estimate_input_tokens(agent)
+    agent.messages.append(user("four"))
+    agent.messages[1]["content"][0]["text"] = "three and more"
+    tokenizer.reset_mock()
+
+    assert conversation_manager.estimate_input_tokens(agent) == 4 + 2 + 4 + 3 + 4 + 1
+    assert tokenizer.call_args_list == [unittest.mock.call("three and more"), unittest.mock.call("four")]
+
+
+@pytest.mark.parametrize("conversation_manager", [{"max_tokens": 32}], indirect=True)
+def test_trims_oldest_messages_before_model_call(conversation_manager):
+    model = MockedModelProvider([assistant("done")])
+    messages = [user("one two three four five six"), assistant("seven eight nine ten"), user("a b c d")]
+    agent = Agent(model=model, messages=messages, conversation_manager=conversation_manager, callback_handler=None)
+
+    agent("e f g h i j")
+
+    # The oldest message is removed so the request fits in 32 tokens
+    assert agent.messages == [
+        assistant("seven eight nine ten"),
+        user("a b c d"),
+        user("e f g h i j"),
+        assistant("done"),
+    ]
+    assert conversation_manager.removed_message_count == 1
+    assert agent.event_loop_metrics.input_token_estimates == [InputTokenEstimate(estimated=26, actual=0)]
+
+
+@pytest.mark.parametrize("conversation_manager", [{"max_tokens": 50, "target_tokens": 15}], indirect=True)
+def test_trims_to_target_tokens(conversation_manager, agent):
+    agent.messages = [user("one two three"), assistant("four five six"), user("seven eight nine ten eleven")] * 2
+
+    conversation_manager.apply_management(agent)
+    assert len(agent.messages) == 6
+
+    agent.messages.append(assistant("twelve"))
+    conversation_manager.apply_management(agent)
+
+    assert agent.messages == [user("seven eight nine ten eleven"), assistant("twelve")]
+
+
+@pytest.mark.parametrize("conversation_manager", [{"max_tokens": 24}], indirect=True)
+def test_trim_keeps_tool_use_with_result(conversation_manager, agent):
+    agent.messages = [
+        user("one"),
+        {"role": "assistant", "content": [{"toolUse": {"toolUseId": "t1", "name": "lookup", "input": {}}}]},
+        {
+            "role": "user",
+            "content": [{"toolResult": {"toolUseId": "t1", "status": "success", "content": [{"text": "x " * 10}]}}],
+        },
+        assistant("done"),
+    ]
+
+    conversation_manager.apply_management(agent)
+
+    # Removing the tool use alone would leave an orphaned tool result, so both are removed
+    assert agent.messages == [assistant("done")]
+
+
+def test_trim_leaves_untrimmable_conversation(conversation_manager, agent):
+    agent.messages = [user("x " * 50)]
+
+    conversation_manager.apply_management(agent)
+
+    assert len(agent.messages) == 1
+    assert conversation_manager.removed_message_count == 0
+
+
+@pytest.mark.parametrize("conversation_manager", [{"max_tokens": 1000}], indirect=True)
+def test_reduce_context_halves_estimate(conversation_manager, agent):
+    agent.messages = [user("one two three"), assistant("four five six"), user("seven"), assistant("eight")]
+
+    conversation_manager.reduce_context(agent)
+
+    assert agent.messages == [user("seven"), assistant("eight")]
+
+
+def test_reduce_context_raises_when_untrimmable(conversation_manager, agent):
+    agent.messages = [user("one two three")]
+    exception = RuntimeError("overflow")
+
+    with pytest.raises(ContextWindowOverflowException) as exc_info:
+        conversation_manager.reduce_context(agent, e=exception)
+
+    assert exc_info.value.__cause__ is exception
+
+
+@pytest.mark.parametrize(
+    ("params", "match"),
+    [
+        ({"max_tokens": 0}, "max_tokens"),
+        ({"max_tokens": 10, "target_tokens": 0}, "target_tokens"),
+        ({"max_tokens": 10, "target_tokens": 11}, "target_tokens"),
+    ],
+)
+def test_invalid_budget(params, match):
+    with pytest.raises(ValueError, match=match):
+        TokenBudgetConversationManager(**params)
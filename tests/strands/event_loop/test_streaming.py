@@ -1,3 +1,4 @@
+import json
 import unittest.mock
 from typing import cast
 
@@ -1060,6 +1061,97 @@ async def test_process_stream_with_signature(agenerator, alist):
     assert message["content"][1]["text"] == "Sure! Let’s do it"
 
 
+@pytest.mark.parametrize("tool_input_streaming", ["string", "buffered", "parsed"])
+@pytest.mark.asyncio
+async def test_process_stream_tool_input_streaming(tool_input_streaming, agenerator, alist):
+    response = [
+        {"messageStart": {"role": "assistant"}},
+        {"contentBlockStart": {"start": {"toolUse": {"toolUseId": "t1", "name": "write"}}}},
+        {"contentBlockDelta": {"delta": {"toolUse": {"input": '{"path": "a.txt", '}}}},
+        {"contentBlockDelta": {"delta": {"toolUse": {"input": '"lines": [1, 2]'}}}},
+        {"contentBlockDelta": {"delta": {"toolUse": {"input": "}"}}}},
+        {"contentBlockStop": {}},
+        {"messageStop": {"stopReason": "tool_use"}},
+    ]
+
+    stream = strands.event_loop.streaming.process_stream(
+        agenerator(response), tool_input_streaming=tool_input_streaming
+    )
+    events = await alist(stream)
+
+    tool_use_events = [event for event in events if event.get("type") == "tool_use_stream"]
+    tru_partial_inputs = [event.get("partial_input") for event in tool_use_events]
+
+    exp_tool_use = {"toolUseId": "t1", "name": "write", "input": {"path": "a.txt", "lines": [1, 2]}}
+    if tool_input_streaming != "parsed":
+        assert all("partial_input" not in event for event in tool_use_events)
+    else:
+        # The partial input is updated in place, so every event references the final parse
+        assert tru_partial_inputs[-1] == exp_tool_use["input"]
+        assert tru_partial_inputs[0] is tru_partial_inputs[-1]
+
+    message = _get_message_from_event(cast(ModelStopReason, events[-1]))
+    assert message["content"] == [{"toolUse": exp_tool_use}]
+
+
+@pytest.mark.asyncio
+async def test_process_stream_tool_input_streaming_parsed_progress(agenerator, alist):
+    async def chunks():
+        yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": "t1", "name": "write"}}}}
+        for fragment in ['{"path": "a.t', 'xt", "lines": [1', ", 2]}"]:
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": fragment}}}}
+        yield {"contentBlockStop": {}}
+
+    tru_partial_inputs = []
+    async for event in strands.event_loop.streaming.process_stream(chunks(), tool_input_streaming="parsed"):
+        if "partial_input" in event:
+            tru_partial_inputs.append(json.loads(json.dumps(event["partial_input"])))
+
+    exp_partial_inputs = [
+        {},
+        {"path": "a.txt", "lines": []},
+        {"path": "a.txt", "lines": [1, 2]},
+    ]
+    assert tru_partial_inputs == exp_partial_inputs
+
+
+@pytest.mark.asyncio
+async def test_process_stream_tool_input_streaming_parsed_mutated_partial_input(agenerator, alist):
+    async def chunks():
+        yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": "t1", "name": "write"}}}}
+        for fragment in ['{"path": "a.txt", ', '"lines": [1, 2]}']:
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": fragment}}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "tool_use"}}
+
+    events = []
+    async for event in strands.event_loop.streaming.process_stream(chunks(), tool_input_streaming="parsed"):
+        if "partial_input" in event:
+            event["partial_input"]["path"] = "mutated.txt"
+            event["partial_input"].setdefault("lines", []).append(3)
+        events.append(event)
+
+    message = _get_message_from_event(cast(ModelStopReason, events[-1]))
+    assert message["content"][0]["toolUse"]["input"] == {"path": "a.txt", "lines": [1, 2]}
+
+
+@pytest.mark.parametrize("tool_input_streaming", ["buffered", "parsed"])
+@pytest.mark.asyncio
+async def test_process_stream_tool_input_streaming_invalid_input(tool_input_streaming, agenerator, alist):
+    response = [
+        {"contentBlockStart": {"start": {"toolUse": {"toolUseId": "t1", "name": "write"}}}},
+        {"contentBlockDelta": {"delta": {"toolUse": {"input": '{"path": '}}}},
+        {"contentBlockStop": {}},
+    ]
+
+    stream = strands.event_loop.streaming.process_stream(
+        agenerator(response), tool_input_streaming=tool_input_streaming
+    )
+    message = _get_message_from_event(cast(ModelStopReason, (await alist(stream))[-1]))
+
+    assert message["content"] == [{"toolUse": {"toolUseId": "t1", "name": "write", "input": {}}}]
+
+
 @pytest.mark.asyncio
 async def test_stream_messages(agenerator, alist):
     mock_model = unittest.mock.MagicMock()
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from strands.event_loop._tool_use_input import IncrementalJSONParser, ToolUseInputBuffer
+
+
+def feed(parser, text, size):
+    for i in range(0, len(text), size):
+        parser.feed(text[i : i + size])
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{}",
+        "[]",
+        '{"a": 1}',
+        ' {"a": [1, -2.5, 3e2, true, false, null], "b": {"c": {"d": []}}} ',
+        '{"s": "quote \\" backslash \\\\ slash \\/ controls \\b\\f\\n\\r\\t"}',
+        '{"unicode": "\\u00e9 \\ud83d\\ude00 é"}',
+        '"text"',
+        "-0.5",
+        "null",
+    ],
+)
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_incremental_json_parser(text, size):
+    parser = IncrementalJSONParser()
+    feed(parser, text, size)
+
+    assert parser.finish() == json.loads(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "{",
+        '{"a": 1,}',
+        '{"a" 1}',
+        '{"a": 01}',
+        '{"a": tru}',
+        '{"a": "\\x"}',
+        '{"a": "\\u12g4"}',
+        '{"a": "\x01"}',
+        "[1] 2",
+        '{"a": 1}}',
+        "[1, 2}",
+    ],
+)
+def test_incremental_json_parser_invalid(text):
+    parser = IncrementalJSONParser()
+    feed(parser, text, 2)
+
+    with pytest.raises(ValueError):
+        parser.finish()
+
+
+def test_incremental_json_parser_value():
+    parser = IncrementalJSONParser()
+
+    tru_values = []
+    for fragment in ['{"path": "/tm', 'p/x", "lines": [1', ", 2", "]", ', "mode": "w', '"}']:
+        parser.feed(fragment)
+        tru_values.append(json.loads(json.dumps(parser.value)))
+
+    exp_values = [
+        {},
+        {"path": "/tmp/x", "lines": []},
+        {"path": "/tmp/x", "lines": [1]},
+        {"path": "/tmp/x", "lines": [1, 2]},
+        {"path": "/tmp/x", "lines": [1, 2]},
+        {"path": "/tmp/x", "lines": [1, 2], "mode": "w"},
+    ]
+    assert tru_values == exp_values
+
+
+def test_incremental_json_parser_value_empty():
+    parser = IncrementalJSONParser()
+    parser.feed("  ")
+
+    assert parser.value is None
+
+
+@pytest.mark.parametrize(
+    ("fragments", "parse", "exp_partial_input", "exp_result"),
+    [
+        (['{"a"', ": 1}"], False, None, {"a": 1}),
+        (['{"a"', ": 1}"], True, {"a": 1}, {"a": 1}),
+        (["{", "oops"], True, None, {}),
+        ([], True, None, {}),
+    ],
+)
+def test_tool_use_input_buffer(fragments, parse, exp_partial_input, exp_result):
+    buffer = ToolUseInputBuffer(parse=parse)
+    for fragment in fragments:
+        buffer.append(fragment)
+
+    assert buffer.parses == parse
+    assert buffer.partial_input == exp_partial_input
+    assert buffer.text == "".join(fragments)
+    assert buffer.result() == exp_result
+
+
+def test_tool_use_input_buffer_falls_back_to_json_loads():
+    buffer = ToolUseInputBuffer(parse=True)
+    buffer.append('{"a": Infinity}')
+
+    assert buffer.partial_input is None
+    assert buffer.result() == {"a": float("inf")}
@@ -1,3 +1,4 @@
+import asyncio
 import unittest.mock
 
 import pytest
@@ -87,3 +88,86 @@ def test_hook_registry_invoke_callbacks_coroutine(registry, agent):
 
     with pytest.raises(RuntimeError, match=r"use invoke_callbacks_async to invoke async callback"):
         registry.invoke_callbacks(BeforeInvocationEvent(agent=agent))
+
+
+def test_hook_registry_has_callbacks_for(registry):
+    assert not registry.has_callbacks_for(BeforeInvocationEvent)
+
+    registry.add_callback(BeforeInvocationEvent, unittest.mock.Mock())
+
+    assert registry.has_callbacks_for(BeforeInvocationEvent)
+    assert not registry.has_callbacks_for(BeforeToolCallEvent)
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_invoke_callbacks_async_parallel_safe(registry, agent):
+    calls = []
+    both_started = asyncio.Event()
+
+    def make_observer(name):
+        async def observer(event):
+            calls.append(f"{name} start")
+            if len(calls) == 3:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            calls.append(f"{name} end")
+
+        return observer
+
+    registry.add_callback(BeforeInvocationEvent, lambda event: calls.append("first"))
+    registry.add_callback(BeforeInvocationEvent, make_observer("a"), parallel_safe=True)
+    registry.add_callback(BeforeInvocationEvent, make_observer("b"), parallel_safe=True)
+    registry.add_callback(BeforeInvocationEvent, lambda event: calls.append("last"))
+
+    await registry.invoke_callbacks_async(BeforeInvocationEvent(agent=agent))
+
+    # Both observers start before either ends, while the sequential callbacks keep their place
+    assert calls[:3] == ["first", "a start", "b start"]
+    assert sorted(calls[3:5]) == ["a end", "b end"]
+    assert calls[5:] == ["last"]
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_invoke_callbacks_async_parallel_safe_interrupts_and_errors(registry, agent):
+    event = BeforeToolCallEvent(
+        agent=agent,
+        selected_tool=None,
+        tool_use={"toolUseId": "test_tool_id", "name": "test_tool_name", "input": {}},
+        invocation_state={},
+    )
+
+    async def interrupt(event):
+        event.interrupt("test_name", "test reason")
+
+    callback = unittest.mock.AsyncMock()
+    registry.add_callback(BeforeToolCallEvent, interrupt, parallel_safe=True)
+    registry.add_callback(BeforeToolCallEvent, callback, parallel_safe=True)
+
+    _, tru_interrupts = await registry.invoke_callbacks_async(event)
+
+    assert [interrupt.name for interrupt in tru_interrupts] == ["test_name"]
+    callback.assert_awaited_once_with(event)
+
+    callback.side_effect = RuntimeError("failed")
+    with pytest.raises(RuntimeError, match="failed"):
+        await registry.invoke_callbacks_async(event)
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_dispatch_plan_updated_on_registration(registry, agent):
+    callback1 = unittest.mock.Mock()
+    callback2 = unittest.mock.AsyncMock()
+    event = BeforeInvocationEvent(agent=agent)
+
+    registry.add_callback(BeforeInvocationEvent, callback1)
+    registry.invoke_callbacks(event)
+
+    registry.add_callback(BeforeInvocationEvent, callback2)
+
+    with pytest.raises(RuntimeError, match=r"use invoke_callbacks_async to invoke async callback"):
+        registry.invoke_callbacks(event)
+
+    await registry.invoke_callbacks_async(event)
+
+    assert callback1.call_count == 2
+    callback2.assert_awaited_once_with(event)
@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import traceback
 import unittest.mock
 from unittest.mock import ANY
@@ -241,6 +242,31 @@ def test__init__default_read_timeout(bedrock_client):
         assert kwargs["config"].read_timeout == DEFAULT_READ_TIMEOUT
 
 
+def test__init__max_stream_workers_sizes_connection_pool(bedrock_client):
+    with unittest.mock.patch("strands.models.bedrock.boto3.Session") as mock_session_cls:
+        mock_session = mock_session_cls.return_value
+        model = BedrockModel(max_stream_workers=64)
+
+        _, kwargs = mock_session.client.call_args
+        assert kwargs["config"].max_pool_connections == 64
+        assert kwargs["config"].user_agent_extra == "strands-agents"
+        assert model.stream_executor_stats.max_workers == 64
+
+
+def test_close_shuts_down_stream_pool(bedrock_client):
+    model = BedrockModel(max_stream_workers=2)
+
+    with unittest.mock.patch.object(model._stream_pool, "shutdown") as mock_shutdown:
+        model.close()
+
+    mock_shutdown.assert_called_once()
+
+
+def test__init__invalid_max_stream_workers(bedrock_client):
+    with pytest.raises(ValueError, match="max_stream_workers"):
+        BedrockModel(max_stream_workers=0)
+
+
 def test__init__with_custom_boto_client_config_no_user_agent(bedrock_client):
     """Set user agent when boto_client_config is provided without user_agent_extra."""
     custom_config = BotocoreConfig(read_timeout=900)
@@ -307,6 +333,28 @@ def test_format_request_default(model, messages, model_id):
     assert tru_request == exp_request
 
 
+def test_format_request_reuses_formatted_messages(model, messages):
+    with unittest.mock.patch.object(
+        model, "_format_request_message_content", wraps=model._format_request_message_content
+    ) as format_content:
+        first = model._format_request(messages)["messages"]
+        messages.append({"role": "assistant", "content": [{"text": "answer"}]})
+        second = model._format_request(messages)["messages"]
+
+    assert format_content.call_count == 2
+    assert second[0] is first[0]
+    assert second[1] == {"role": "assistant", "content": [{"text": "answer"}]}
+
+
+def test_format_request_reformats_after_config_update(model, messages):
+    messages.append({"role": "assistant", "content": [{"reasoningContent": {"reasoningText": {"text": "hmm"}}}]})
+    assert len(model._format_request(messages)["messages"]) == 2
+
+    model.update_config(model_id="us.deepseek.r1-v1:0")
+
+    assert len(model._format_request(messages)["messages"]) == 1
+
+
 def test_format_request_additional_request_fields(model, messages, model_id, additional_request_fields):
     model.update_config(additional_request_fields=additional_request_fields)
     tru_request = model._format_request(messages)
@@ -658,6 +706,41 @@ async def test_stream(bedrock_client, model, messages, tool_spec, model_id, addi
     bedrock_client.converse_stream.assert_called_once_with(**request)
 
 
+@pytest.mark.asyncio
+async def test_stream_dedicated_thread_pool(bedrock_client, messages, alist):
+    thread_names = []
+
+    def stream_chunks():
+        for chunk in ["e1", "e2", "e3"]:
+            thread_names.append(threading.current_thread().name)
+            yield chunk
+
+    bedrock_client.converse_stream.side_effect = lambda **kwargs: {"stream": stream_chunks()}
+    model = BedrockModel(model_id="m1", max_stream_workers=2)
+
+    tru_chunks = await alist(model.stream(messages))
+    exp_chunks = ["e1", "e2", "e3"]
+    assert tru_chunks == exp_chunks
+    assert all(name.startswith("strands-bedrock-stream") for name in thread_names)
+
+    stats = model.stream_executor_stats
+    assert (stats.submitted, stats.active, stats.queued, stats.peak_active, stats.events) == (1, 0, 0, 1, 3)
+    assert 1 <= stats.wakeups <= 4
+    assert stats.saturation == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_default_executor_stats(bedrock_client, model, messages, alist):
+    bedrock_client.converse_stream.return_value = {"stream": ["e1", "e2"]}
+
+    await alist(model.stream(messages))
+
+    stats = model.stream_executor_stats
+    assert stats.max_workers is None
+    assert stats.saturation is None
+    assert (stats.submitted, stats.events) == (1, 2)
+
+
 @pytest.mark.asyncio
 async def test_stream_with_system_prompt_content(bedrock_client, model, messages, alist):
     """Test stream method with system_prompt_content parameter."""
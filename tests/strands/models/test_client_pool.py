@@ -0,0 +1,91 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from strands import EventLoopRunner
+from strands.models._client_pool import ClientPool
+
+
+class Client:
+    def __init__(self, events):
+        self.events = events
+        self.closed = False
+
+    async def __aenter__(self):
+        self.events.append("open")
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *args):
+        self.events.append("close")
+        self.closed = True
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def pool(events):
+    return ClientPool(lambda: Client(events))
+
+
+@pytest.mark.asyncio
+async def test_acquire_reuses_client_on_loop(pool, events):
+    first = await pool.acquire()
+    second = await pool.acquire()
+
+    assert first is second
+    assert not first.closed
+    assert events == ["open"]
+    assert len(pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_concurrent(pool, events):
+    clients = await asyncio.gather(*(pool.acquire() for _ in range(3)))
+
+    assert clients[0] is clients[1] is clients[2]
+    assert len(pool) == 1
+    assert events.count("open") == 3
+    assert events.count("close") == 2
+
+
+def test_acquire_closes_client_on_loop_shutdown(pool, events):
+    first = asyncio.run(pool.acquire())
+    second = asyncio.run(pool.acquire())
+
+    assert first is not second
+    assert first.closed and second.closed
+    assert events == ["open", "close", "open", "close"]
+    assert len(pool) == 0
+
+
+def test_acquire_with_event_loop_runner(pool, events):
+    runner = EventLoopRunner()
+    try:
+        first = runner.run(pool.acquire)
+        second = runner.run(pool.acquire)
+
+        assert first is second
+        assert not first.closed
+    finally:
+        runner.close()
+
+    assert first.closed
+    assert len(pool) == 0
+
+
+def test_acquire_discards_clients_of_closed_loops(pool, events):
+    loop = asyncio.new_event_loop()
+    with contextlib.closing(loop):
+        client = loop.run_until_complete(pool.acquire())
+
+    assert len(pool) == 1
+
+    asyncio.run(pool.acquire())
+
+    assert not client.closed
+    assert len(pool) == 0
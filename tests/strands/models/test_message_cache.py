@@ -0,0 +1,144 @@
+import unittest.mock
+
+import pytest
+
+from strands.models._message_cache import FormattedMessageCache, invalidate_formatted_messages
+
+
+@pytest.fixture
+def cache():
+    return FormattedMessageCache()
+
+
+@pytest.fixture
+def format_message():
+    return unittest.mock.Mock(side_effect=lambda message: {"formatted": [dict(block) for block in message["content"]]})
+
+
+@pytest.fixture
+def message():
+    return {
+        "role": "user",
+        "content": [
+            {"text": "hello"},
+            {"toolResult": {"toolUseId": "t1", "status": "success", "content": [{"json": {"a": [1, 2]}}]}},
+        ],
+    }
+
+
+def test_get_reuses_formatted_message(cache, format_message, message):
+    first = cache.get(message, format_message)
+    second = cache.get(message, format_message)
+
+    assert first is second
+    assert format_message.call_count == 1
+    assert len(cache) == 1
+
+
+def test_get_distinguishes_equal_messages(cache, format_message, message):
+    copy = {"role": "user", "content": list(message["content"])}
+
+    cache.get(message, format_message)
+    cache.get(copy, format_message)
+
+    assert format_message.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda message: message["content"].append({"text": "more"}),
+        lambda message: message["content"].pop(),
+        lambda message: message["content"][0].update(text="changed"),
+        lambda message: message["content"][1]["toolResult"].update(status="error"),
+        lambda message: message["content"][1]["toolResult"]["content"][0]["json"]["a"].append(3),
+        lambda message: message["content"][1]["toolResult"].update(content=[{"text": "too large"}]),
+        lambda message: message.update(content=[{"text": "redacted"}]),
+        lambda message: message["content"][0].update(image=message["content"][0].pop("text")),
+        lambda message: message["content"][1]["toolResult"]["content"][0]["json"]["a"].__setitem__(0, True),
+        lambda message: message["content"][1]["toolResult"]["content"][0]["json"]["a"].__setitem__(0, 1.0),
+    ],
+)
+def test_get_reformats_mutated_message(mutate, cache, format_message, message):
+    cache.get(message, format_message)
+    mutate(message)
+    cache.get(message, format_message)
+
+    assert format_message.call_count == 2
+
+
+def test_get_evicts_least_recently_used(format_message):
+    cache = FormattedMessageCache(max_entries=2)
+    messages = [{"role": "user", "content": [{"text": str(i)}]} for i in range(3)]
+
+    cache.get(messages[0], format_message)
+    cache.get(messages[1], format_message)
+    cache.get(messages[0], format_message)
+    cache.get(messages[2], format_message)
+    assert format_message.call_count == 3
+
+    cache.get(messages[0], format_message)
+    assert format_message.call_count == 3
+
+    cache.get(messages[1], format_message)
+    assert format_message.call_count == 4
+
+
+def test_get_all_keeps_messages_beyond_max_entries(format_message):
+    cache = FormattedMessageCache(max_entries=4)
+    messages = [{"role": "user", "content": [{"text": str(i)}]} for i in range(10)]
+
+    cache.get_all(messages, format_message)
+    assert cache.get_all(messages, format_message) == [{"formatted": message["content"]} for message in messages]
+    assert format_message.call_count == 10
+    assert len(cache) == 10
+
+    # A smaller request shrinks the cache back to max_entries, keeping the entries it used
+    cache.get_all(messages[-2:], format_message)
+    assert len(cache) == 4
+    cache.get_all(messages[-4:], format_message)
+    assert format_message.call_count == 10
+
+
+def test_get_all_drops_idle_entries(format_message):
+    cache = FormattedMessageCache(max_idle_requests=2)
+    messages = [{"role": "user", "content": [{"text": str(i)}]} for i in range(3)]
+
+    assert cache.get_all(messages, format_message) == [{"formatted": message["content"]} for message in messages]
+    cache.get_all(messages[1:], format_message)
+    assert len(cache) == 3
+
+    cache.get_all(messages[2:], format_message)
+    assert len(cache) == 2
+
+    cache.get_all([], format_message)
+    cache.get_all([], format_message)
+    assert len(cache) == 0
+    assert format_message.call_count == 3
+
+
+def test_discard(cache, format_message, message):
+    cache.get(message, format_message)
+    cache.discard(message)
+    cache.discard({"role": "user", "content": []})
+
+    assert len(cache) == 0
+
+
+def test_clear(cache, format_message, message):
+    cache.get(message, format_message)
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_invalidate_formatted_messages(format_message, message):
+    caches = [FormattedMessageCache(), FormattedMessageCache()]
+    other = {"role": "user", "content": [{"text": "other"}]}
+    for cache in caches:
+        cache.get(message, format_message)
+        cache.get(other, format_message)
+
+    invalidate_formatted_messages([message])
+
+    assert [len(cache) for cache in caches] == [1, 1]
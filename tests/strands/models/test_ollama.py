@@ -12,7 +12,9 @@ from strands.types.content import Messages
 @pytest.fixture
 def ollama_client():
     with unittest.mock.patch.object(strands.models.ollama.ollama, "AsyncClient") as mock_client_cls:
-        yield mock_client_cls.return_value
+        mock_client = mock_client_cls.return_value
+        mock_client.__aenter__.return_value = mock_client
+        yield mock_client
 
 
 @pytest.fixture
@@ -909,6 +909,25 @@ async def test_structured_output(openai_client, model, test_output_model_cls, al
     assert tru_result == exp_result
 
 
+@pytest.mark.asyncio
+async def test_structured_output_reuses_client_on_event_loop(openai_client, model, test_output_model_cls, alist):
+    messages = [{"role": "user", "content": [{"text": "Generate a person"}]}]
+
+    mock_choice = unittest.mock.Mock()
+    mock_choice.message.parsed = test_output_model_cls(name="John", age=30)
+    mock_response = unittest.mock.Mock()
+    mock_response.choices = [mock_choice]
+    openai_client.beta.chat.completions.parse = unittest.mock.AsyncMock(return_value=mock_response)
+
+    await alist(model.structured_output(test_output_model_cls, messages))
+    await alist(model.structured_output(test_output_model_cls, messages))
+
+    strands.models.openai.openai.AsyncOpenAI.assert_called_once_with()
+    openai_client.__aenter__.assert_awaited_once()
+    openai_client.__aexit__.assert_not_awaited()
+    assert openai_client.beta.chat.completions.parse.await_count == 2
+
+
 def test_config_validation_warns_on_unknown_keys(openai_client, captured_warnings):
     """Test that unknown config keys emit a warning."""
     OpenAIModel({"api_key": "test"}, model_id="test-model", invalid_param="test")
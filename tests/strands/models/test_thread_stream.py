@@ -0,0 +1,152 @@
+import asyncio
+import gc
+import threading
+
+import pytest
+
+from strands.models._thread_stream import StreamExecutorStats, StreamThreadPool, ThreadStreamChannel
+
+
+@pytest.mark.asyncio
+async def test_channel_drains_events_added_before_wakeup():
+    channel = ThreadStreamChannel(asyncio.get_running_loop())
+
+    def produce():
+        for event in range(100):
+            channel.put(event)
+        channel.close()
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    thread.join()
+
+    tru_batches = []
+    while batch := await channel.get_batch():
+        tru_batches.append(batch)
+
+    exp_batches = [list(range(100))]
+    assert tru_batches == exp_batches
+    assert (channel.events, channel.wakeups) == (100, 1)
+    assert await channel.get_batch() == []
+
+
+@pytest.mark.asyncio
+async def test_channel_wakes_consumer_for_events_added_after_drain():
+    channel = ThreadStreamChannel(asyncio.get_running_loop())
+    release = threading.Event()
+
+    def produce():
+        channel.put("a")
+        release.wait()
+        channel.put("b")
+        channel.close()
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+
+    assert await channel.get_batch() == ["a"]
+    release.set()
+    assert await channel.get_batch() == ["b"]
+    assert await channel.get_batch() == []
+    thread.join()
+
+
+@pytest.mark.asyncio
+async def test_pool_tracks_active_and_queued_streams():
+    pool = StreamThreadPool(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+        return threading.current_thread().name
+
+    first = asyncio.create_task(pool.run(block))
+    second = asyncio.create_task(pool.run(block))
+    await asyncio.to_thread(started.wait)
+
+    stats = pool.stats
+    assert (stats.active, stats.queued, stats.submitted, stats.saturation) == (1, 1, 2, 1.0)
+
+    release.set()
+    names = await asyncio.gather(first, second)
+    assert all(name.startswith("strands-model-stream") for name in names)
+
+    tru_stats = pool.stats
+    exp_stats = StreamExecutorStats(
+        max_workers=1,
+        peak_active=1,
+        peak_queued=tru_stats.peak_queued,
+        submitted=2,
+        total_queue_wait=tru_stats.total_queue_wait,
+    )
+    assert tru_stats == exp_stats
+    assert tru_stats.peak_queued in (1, 2)
+    assert tru_stats.average_queue_wait > 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_cancel_queued_stream():
+    pool = StreamThreadPool(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    ran = []
+
+    def block():
+        started.set()
+        release.wait()
+
+    first = asyncio.create_task(pool.run(block))
+    second = asyncio.create_task(pool.run(ran.append, "second"))
+    await asyncio.to_thread(started.wait)
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+    assert pool.stats.queued == 0
+
+    release.set()
+    await first
+    assert ran == []
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_propagates_exceptions():
+    pool = StreamThreadPool()
+
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        await pool.run(fail)
+
+    assert pool.stats.active == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_shutdown_releases_threads():
+    pool = StreamThreadPool(max_workers=1)
+    thread = await pool.run(threading.current_thread)
+
+    pool.shutdown()
+    await asyncio.to_thread(thread.join, 5)
+
+    assert not thread.is_alive()
+    with pytest.raises(RuntimeError):
+        await pool.run(threading.current_thread)
+
+
+@pytest.mark.asyncio
+async def test_pool_garbage_collection_shuts_down_executor():
+    pool = StreamThreadPool(max_workers=1)
+    executor = pool._executor
+    await pool.run(threading.current_thread)
+
+    del pool
+    gc.collect()
+
+    assert executor._shutdown
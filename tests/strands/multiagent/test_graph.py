@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
 import pytest
 
+from strands._async import EventLoopRunner
 from strands.agent import Agent, AgentResult
 from strands.agent.state import AgentState
 from strands.experimental.hooks.multiagent import BeforeNodeCallEvent
@@ -890,6 +891,22 @@ def test_graph_synchronous_execution(mock_strands_tracer, mock_use_span, mock_ag
     mock_use_span.assert_called_once()
 
 
+def test_graph_synchronous_execution_with_event_loop_runner(mock_strands_tracer, mock_use_span, mock_agents):
+    runner = EventLoopRunner()
+    builder = GraphBuilder()
+    builder.add_node(mock_agents["start_agent"], "start_agent")
+    builder.set_event_loop_runner(runner)
+
+    try:
+        graph = builder.build()
+        result = graph("Test synchronous execution")
+    finally:
+        runner.close()
+
+    assert graph.event_loop_runner is runner
+    assert result.status == Status.COMPLETED
+
+
 def test_graph_validate_unsupported_features():
     """Test Graph validation for session persistence and callbacks."""
     # Test with normal agent (should work)
@@ -2068,3 +2085,224 @@ async def test_graph_cancel_node(cancel_node, cancel_message):
     tru_status = graph.state.status
     exp_status = Status.FAILED
     assert tru_status == exp_status
+
+
+def create_gated_agent(name, events, wait_for=None, release=None):
+    """Create a mock Agent that waits for and sets asyncio events while streaming."""
+    agent = create_mock_agent(name, f"{name} response")
+
+    async def gated_stream(*args, **kwargs):
+        events.append(f"{name}_start")
+        if wait_for is not None:
+            await asyncio.wait_for(wait_for.wait(), timeout=1)
+        if release is not None:
+            release.set()
+        await asyncio.sleep(0)
+        events.append(f"{name}_end")
+        yield {"result": agent.return_value}
+
+    agent.stream_async = Mock(side_effect=gated_stream)
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_graph_dataflow_starts_nodes_without_waiting_for_unrelated_nodes(mock_strands_tracer, mock_use_span):
+    """Node d only depends on b, so it must run while a is still executing."""
+    events = []
+    d_done = asyncio.Event()
+
+    builder = GraphBuilder()
+    builder.add_node(create_gated_agent("a", events, wait_for=d_done), "a")
+    builder.add_node(create_gated_agent("b", events), "b")
+    builder.add_node(create_gated_agent("c", events), "c")
+    builder.add_node(create_gated_agent("d", events, release=d_done), "d")
+    builder.add_edge("a", "c")
+    builder.add_edge("b", "d")
+    graph = builder.set_scheduler("dataflow").build()
+
+    result = await graph.invoke_async("Test dataflow")
+
+    assert result.status == Status.COMPLETED
+    assert [node.node_id for node in result.execution_order] == ["b", "d", "a", "c"]
+    assert events.index("d_end") < events.index("a_end")
+
+
+@pytest.mark.asyncio
+async def test_graph_dataflow_joins_concurrent_dependencies(mock_strands_tracer, mock_use_span, alist):
+    events = []
+    agent_c = create_gated_agent("c", events)
+
+    builder = GraphBuilder()
+    builder.add_node(create_gated_agent("a", events), "a")
+    builder.add_node(create_gated_agent("b", events), "b")
+    builder.add_node(agent_c, "c")
+    builder.add_edge("a", "c")
+    builder.add_edge("b", "c")
+    graph = builder.set_scheduler("dataflow").build()
+
+    stream_events = await alist(graph.stream_async("Test join"))
+
+    assert agent_c.stream_async.call_count == 1
+    node_input = agent_c.stream_async.call_args.args[0]
+    assert {"text": "\nFrom a:"} in node_input
+    assert {"text": "\nFrom b:"} in node_input
+
+    tru_handoffs = [
+        (sorted(event["from_node_ids"]), event["to_node_ids"])
+        for event in stream_events
+        if event.get("type") == "multiagent_handoff"
+    ]
+    exp_handoffs = [(["a", "b"], ["c"])]
+    assert tru_handoffs == exp_handoffs
+    assert stream_events[-1]["result"].status == Status.COMPLETED
+
+
+@pytest.mark.parametrize("scheduler", ["batch", "dataflow"])
+@pytest.mark.asyncio
+async def test_graph_max_parallelism(scheduler, mock_strands_tracer, mock_use_span):
+    running = 0
+    max_running = 0
+
+    def create_counting_agent(name):
+        agent = create_mock_agent(name, f"{name} response")
+
+        async def counting_stream(*args, **kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            yield {"result": agent.return_value}
+
+        agent.stream_async = Mock(side_effect=counting_stream)
+        return agent
+
+    builder = GraphBuilder()
+    for name in ["a", "b", "c", "d", "e"]:
+        builder.add_node(create_counting_agent(name), name)
+    graph = builder.set_scheduler(scheduler).set_max_parallelism(2).build()
+
+    result = await graph.invoke_async("Test max parallelism")
+
+    assert result.status == Status.COMPLETED
+    assert result.completed_nodes == 5
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_graph_dataflow_fails_fast(mock_strands_tracer, mock_use_span):
+    events = []
+    failing_agent = create_mock_agent("failing", "Should fail")
+
+    async def failing_stream(*args, **kwargs):
+        raise ValueError("node failed")
+        yield  # pragma: no cover
+
+    failing_agent.stream_async = Mock(side_effect=failing_stream)
+    never_released = asyncio.Event()
+
+    builder = GraphBuilder()
+    builder.add_node(failing_agent, "failing")
+    builder.add_node(create_gated_agent("slow", events, wait_for=never_released), "slow")
+    graph = builder.set_scheduler("dataflow").build()
+
+    with pytest.raises(ValueError, match="node failed"):
+        await graph.invoke_async("Test failure")
+
+    assert graph.state.status == Status.FAILED
+    assert "slow_end" not in events
+
+
+@pytest.mark.asyncio
+async def test_graph_dataflow_execution_limits_with_cyclic_graph(mock_strands_tracer, mock_use_span):
+    builder = GraphBuilder()
+    builder.add_node(create_mock_agent("agent_a", "Response A"), "a")
+    builder.add_node(create_mock_agent("agent_b", "Response B"), "b")
+    builder.add_edge("a", "b")
+    builder.add_edge("b", "a")
+    builder.set_entry_point("a")
+    graph = builder.set_scheduler("dataflow").set_max_node_executions(5).reset_on_revisit().build()
+
+    result = await graph.invoke_async("Test cycle")
+
+    assert result.status == Status.FAILED
+    assert [node.node_id for node in result.execution_order] == ["a", "b", "a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_graph_dataflow_resumes_from_session(mock_strands_tracer, mock_use_span):
+    agent_a = create_mock_agent("agent_a", "Response A")
+    agent_b = create_mock_agent("agent_b", "Response B")
+
+    builder = GraphBuilder()
+    builder.add_node(agent_a, "a")
+    builder.add_node(agent_b, "b")
+    builder.add_edge("a", "b")
+    graph = builder.set_scheduler("dataflow").build()
+
+    graph.deserialize_state(
+        {
+            "status": "executing",
+            "completed_nodes": ["a"],
+            "failed_nodes": [],
+            "node_results": {"a": NodeResult(result=agent_a.return_value).to_dict()},
+            "current_task": "persisted task",
+            "execution_order": ["a"],
+            "next_nodes_to_execute": ["b"],
+        }
+    )
+    result = await graph.invoke_async("persisted task")
+
+    assert result.status == Status.COMPLETED
+    assert agent_a.stream_async.call_count == 0
+    assert agent_b.stream_async.call_count == 1
+    assert [node.node_id for node in result.execution_order] == ["a", "b"]
+
+
+def test_graph_scheduler_validation():
+    builder = GraphBuilder()
+    builder.add_node(create_mock_agent("agent_a"), "a")
+
+    with pytest.raises(ValueError, match="Scheduler 'eager' is not supported"):
+        builder.set_scheduler("eager").build()
+
+    builder.set_scheduler("dataflow")
+    with pytest.raises(ValueError, match="max_parallelism must be at least 1"):
+        builder.set_max_parallelism(0).build()
+
+    graph = builder.set_max_parallelism(4).build()
+    assert graph.scheduler == "dataflow"
+    assert graph.max_parallelism == 4
+
+    graph = builder.set_max_parallelism(None).build()
+    assert graph.max_parallelism is None
+
+
+def test_graph_find_newly_ready_nodes_only_checks_edges_of_completed_nodes():
+    conditions = []
+
+    def condition(name):
+        def check(state):
+            conditions.append(name)
+            return True
+
+        return check
+
+    builder = GraphBuilder()
+    for node_id in ["a", "b", "c", "d", "e"]:
+        builder.add_node(create_mock_agent(f"agent_{node_id}"), node_id)
+    builder.add_edge("a", "d", condition=condition("a->d"))
+    builder.add_edge("a", "c", condition=condition("a->c"))
+    builder.add_edge("b", "e", condition=condition("b->e"))
+    builder.set_entry_point("a")
+    builder.set_entry_point("b")
+    graph = builder.build()
+
+    tru_ready = [node.node_id for node in graph._find_newly_ready_nodes([graph.nodes["a"]])]
+    exp_ready = ["c", "d"]
+    assert tru_ready == exp_ready
+    assert sorted(conditions) == ["a->c", "a->d"]
+
+    assert {edge.from_node.node_id for edge in graph._incoming_edges[graph.nodes["d"]]} == {"a"}
+    assert {edge.to_node.node_id for edge in graph._outgoing_edges[graph.nodes["a"]]} == {"c", "d"}
+    assert graph._incoming_edges[graph.nodes["a"]] == []
@@ -501,3 +501,178 @@ def test_create_session_multi_agent_directory_structure(multi_agent_manager, sam
 
     assert os.path.exists(session_dir)
     assert os.path.exists(multi_agents_dir)
+
+
+@pytest.fixture
+def jsonl_manager(temp_dir):
+    """Create FileSessionManager storing messages in a segment log."""
+    return FileSessionManager(session_id="test", storage_dir=temp_dir, message_format="jsonl")
+
+
+def _create_messages(manager, session_id, agent_id, count):
+    for i in range(count):
+        message = SessionMessage(message={"role": "user", "content": [ContentBlock(text=f"Message {i}")]}, message_id=i)
+        manager.create_message(session_id, agent_id, message)
+
+
+def _texts(messages):
+    return [message.message["content"][0]["text"] for message in messages]
+
+
+def test_invalid_message_format(temp_dir):
+    with pytest.raises(ValueError, match="unsupported message format"):
+        FileSessionManager(session_id="test", storage_dir=temp_dir, message_format="xml")
+
+
+def test_jsonl_messages(jsonl_manager, sample_session, sample_agent):
+    jsonl_manager.create_session(sample_session)
+    jsonl_manager.create_agent(sample_session.session_id, sample_agent)
+    _create_messages(jsonl_manager, sample_session.session_id, sample_agent.agent_id, 10)
+
+    messages_dir = os.path.join(jsonl_manager._get_agent_path(sample_session.session_id, "test-agent"), "messages")
+    assert sorted(os.listdir(messages_dir)) == ["index", "segment_0.jsonl"]
+
+    tru_all = _texts(jsonl_manager.list_messages(sample_session.session_id, "test-agent"))
+    tru_page = _texts(jsonl_manager.list_messages(sample_session.session_id, "test-agent", limit=3, offset=5))
+    tru_past_end = jsonl_manager.list_messages(sample_session.session_id, "test-agent", offset=10)
+    tru_read = jsonl_manager.read_message(sample_session.session_id, "test-agent", 4)
+    tru_missing = jsonl_manager.read_message(sample_session.session_id, "test-agent", 999)
+
+    assert tru_all == [f"Message {i}" for i in range(10)]
+    assert tru_page == ["Message 5", "Message 6", "Message 7"]
+    assert tru_past_end == []
+    assert tru_read.message["content"][0]["text"] == "Message 4"
+    assert tru_missing is None
+
+
+def test_jsonl_update_message_and_compact(jsonl_manager, sample_agent):
+    session_id = jsonl_manager.session_id
+    jsonl_manager.create_agent(session_id, sample_agent)
+    _create_messages(jsonl_manager, session_id, sample_agent.agent_id, 3)
+
+    message = jsonl_manager.read_message(session_id, "test-agent", 1)
+    message.message["content"] = [ContentBlock(text="Updated content")]
+    jsonl_manager.update_message(session_id, "test-agent", message)
+
+    messages_dir = os.path.join(jsonl_manager._get_agent_path(session_id, "test-agent"), "messages")
+    size_before = os.path.getsize(os.path.join(messages_dir, "segment_0.jsonl"))
+
+    jsonl_manager.compact_messages("test-agent")
+
+    assert sorted(os.listdir(messages_dir)) == ["index", "segment_1.jsonl"]
+    assert os.path.getsize(os.path.join(messages_dir, "segment_1.jsonl")) < size_before
+
+    tru_texts = _texts(jsonl_manager.list_messages(session_id, "test-agent"))
+    assert tru_texts == ["Message 0", "Updated content", "Message 2"]
+
+    tru_message = jsonl_manager.read_message(session_id, "test-agent", 1)
+    assert tru_message.created_at == message.created_at
+
+
+def test_jsonl_create_message_out_of_order(jsonl_manager, sample_session, sample_agent):
+    jsonl_manager.create_session(sample_session)
+    jsonl_manager.create_agent(sample_session.session_id, sample_agent)
+    _create_messages(jsonl_manager, sample_session.session_id, sample_agent.agent_id, 3)
+
+    message = SessionMessage(message={"role": "user", "content": [ContentBlock(text="Hello")]}, message_id=1)
+    with pytest.raises(SessionException, match="increasing order"):
+        jsonl_manager.create_message(sample_session.session_id, "test-agent", message)
+
+
+def test_jsonl_uncommitted_index_record_ignored(jsonl_manager, sample_session, sample_agent):
+    jsonl_manager.create_session(sample_session)
+    jsonl_manager.create_agent(sample_session.session_id, sample_agent)
+    _create_messages(jsonl_manager, sample_session.session_id, sample_agent.agent_id, 2)
+
+    messages_dir = os.path.join(jsonl_manager._get_agent_path(sample_session.session_id, "test-agent"), "messages")
+    with open(os.path.join(messages_dir, "index"), "ab") as f:
+        f.write(b"\x00" * 10)
+
+    assert len(jsonl_manager.list_messages(sample_session.session_id, "test-agent")) == 2
+
+    message = SessionMessage(message={"role": "user", "content": [ContentBlock(text="Message 2")]}, message_id=2)
+    jsonl_manager.create_message(sample_session.session_id, "test-agent", message)
+
+    tru_texts = _texts(jsonl_manager.list_messages(sample_session.session_id, "test-agent"))
+    assert tru_texts == ["Message 0", "Message 1", "Message 2"]
+
+
+@pytest.mark.parametrize(("sync_messages", "exp_synced"), [(False, []), (True, ["segment_0.jsonl", "index"] * 2)])
+def test_jsonl_syncs_segment_before_index(temp_dir, sample_session, sample_agent, sync_messages, exp_synced):
+    jsonl_manager = FileSessionManager(
+        session_id="test", storage_dir=temp_dir, message_format="jsonl", sync_messages=sync_messages
+    )
+    jsonl_manager.create_session(sample_session)
+    jsonl_manager.create_agent(sample_session.session_id, sample_agent)
+    _create_messages(jsonl_manager, sample_session.session_id, sample_agent.agent_id, 1)
+
+    messages_dir = os.path.join(jsonl_manager._get_agent_path(sample_session.session_id, "test-agent"), "messages")
+    inodes = {os.stat(os.path.join(messages_dir, name)).st_ino: name for name in ("index", "segment_0.jsonl")}
+    synced = []
+    fsync = os.fsync
+
+    def record_fsync(fd):
+        synced.append(inodes.get(os.fstat(fd).st_ino))
+        fsync(fd)
+
+    message = SessionMessage(message={"role": "user", "content": [ContentBlock(text="Message 1")]}, message_id=1)
+    with patch("strands.session._message_log.os.fsync", side_effect=record_fsync):
+        jsonl_manager.create_message(sample_session.session_id, "test-agent", message)
+        jsonl_manager.update_message(sample_session.session_id, "test-agent", message)
+
+    assert synced == exp_synced
+
+
+def test_jsonl_interleaved_managers(temp_dir, sample_session, sample_agent):
+    manager1 = FileSessionManager(session_id=sample_session.session_id, storage_dir=temp_dir, message_format="jsonl")
+    manager1.create_agent(sample_session.session_id, sample_agent)
+    _create_messages(manager1, sample_session.session_id, sample_agent.agent_id, 1)
+
+    # Each manager caches the state of the log, which the other manager's writes invalidate
+    manager2 = FileSessionManager(session_id=sample_session.session_id, storage_dir=temp_dir, message_format="jsonl")
+    for message_id, manager in [(1, manager2), (2, manager1), (3, manager2)]:
+        message = SessionMessage(
+            message={"role": "user", "content": [ContentBlock(text=f"Message {message_id}")]}, message_id=message_id
+        )
+        manager.create_message(sample_session.session_id, "test-agent", message)
+
+    manager2.compact_messages("test-agent")
+    message = SessionMessage(message={"role": "user", "content": [ContentBlock(text="Message 4")]}, message_id=4)
+    manager1.create_message(sample_session.session_id, "test-agent", message)
+
+    tru_texts = _texts(manager2.list_messages(sample_session.session_id, "test-agent"))
+    assert tru_texts == [f"Message {i}" for i in range(5)]
+
+
+def test_jsonl_migrates_message_files(temp_dir, sample_session, sample_agent):
+    file_manager = FileSessionManager(session_id="test", storage_dir=temp_dir)
+    file_manager.create_session(sample_session)
+    file_manager.create_agent(sample_session.session_id, sample_agent)
+    _create_messages(file_manager, sample_session.session_id, sample_agent.agent_id, 12)
+
+    jsonl_manager = FileSessionManager(session_id="test", storage_dir=temp_dir, message_format="jsonl")
+    tru_texts = _texts(jsonl_manager.list_messages(sample_session.session_id, "test-agent", offset=9))
+
+    messages_dir = os.path.join(jsonl_manager._get_agent_path(sample_session.session_id, "test-agent"), "messages")
+    assert tru_texts == ["Message 9", "Message 10", "Message 11"]
+    assert sorted(os.listdir(messages_dir)) == ["index", "segment_0.jsonl"]
+
+
+def test_jsonl_agent_restore(temp_dir):
+    from strands.agent.agent import Agent
+    from tests.fixtures.mocked_model_provider import MockedModelProvider
+
+    model = MockedModelProvider([{"role": "assistant", "content": [{"text": "Hi"}]}])
+    agent = Agent(
+        agent_id="agent",
+        model=model,
+        session_manager=FileSessionManager(session_id="restore", storage_dir=temp_dir, message_format="jsonl"),
+    )
+    agent("Hello")
+
+    restored = Agent(
+        agent_id="agent",
+        session_manager=FileSessionManager(session_id="restore", storage_dir=temp_dir, message_format="jsonl"),
+    )
+
+    assert restored.messages == agent.messages
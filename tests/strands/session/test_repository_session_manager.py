@@ -1,5 +1,6 @@
 """Tests for AgentSessionManager."""
 
+import threading
 from unittest.mock import Mock
 
 import pytest
@@ -14,6 +15,7 @@ from strands.types.content import ContentBlock
 from strands.types.exceptions import SessionException
 from strands.types.session import Session, SessionAgent, SessionMessage, SessionType
 from tests.fixtures.mock_session_repository import MockedSessionRepository
+from tests.fixtures.mocked_model_provider import MockedModelProvider
 
 
 @pytest.fixture
@@ -595,3 +597,130 @@ def test_fix_broken_tool_use_does_not_affect_normal_conversations(session_manage
 
     # Should remain unchanged
     assert fixed_messages == messages
+
+
+class BlockingSessionRepository(MockedSessionRepository):
+    """Repository whose writes block until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.released = threading.Event()
+        self.released.set()
+        self.update_agent_count = 0
+
+    def create_message(self, session_id, agent_id, session_message):
+        self.released.wait()
+        super().create_message(session_id, agent_id, session_message)
+
+    def update_agent(self, session_id, session_agent):
+        self.released.wait()
+        self.update_agent_count += 1
+        super().update_agent(session_id, session_agent)
+
+
+@pytest.fixture
+def blocking_repository():
+    return BlockingSessionRepository()
+
+
+def test_init_invalid_write_behind_options(mock_repository):
+    with pytest.raises(ValueError, match="unsupported session write ordering"):
+        RepositorySessionManager(session_id="test-session", session_repository=mock_repository, ordering="any")
+
+    with pytest.raises(ValueError, match="unsupported session write durability"):
+        RepositorySessionManager(session_id="test-session", session_repository=mock_repository, durability="never")
+
+
+def test_write_behind_persists_by_end_of_invocation(blocking_repository):
+    session_manager = RepositorySessionManager(
+        session_id="test-session", session_repository=blocking_repository, write_behind=True
+    )
+    model = MockedModelProvider([{"role": "assistant", "content": [{"text": "Hi"}]}])
+    agent = Agent(agent_id="agent", model=model, session_manager=session_manager)
+
+    agent("Hello")
+
+    session_messages = blocking_repository.list_messages("test-session", "agent")
+    assert [message.to_message() for message in session_messages] == agent.messages
+    assert session_manager._write_queue.pending == 0
+
+
+@pytest.mark.parametrize(("ordering", "expected_count"), [("relaxed", 1), ("strict", 3)])
+def test_write_behind_ordering(blocking_repository, agent, ordering, expected_count):
+    session_manager = RepositorySessionManager(
+        session_id="test-session", session_repository=blocking_repository, write_behind=True, ordering=ordering
+    )
+    session_manager.initialize(agent)
+
+    blocking_repository.released.clear()
+    # The first write occupies the worker, so the syncs queued behind it can be coalesced
+    session_manager.append_message({"role": "user", "content": [{"text": "Hello"}]}, agent)
+    for value in range(3):
+        agent.state.set("value", value)
+        session_manager.sync_agent(agent)
+
+    blocking_repository.released.set()
+    session_manager.flush()
+
+    assert blocking_repository.update_agent_count == expected_count
+    assert blocking_repository.read_agent("test-session", agent.agent_id).state == {"value": 2}
+    assert blocking_repository.read_message("test-session", agent.agent_id, 1).message["content"] == [{"text": "Hello"}]
+
+
+def test_write_behind_eventual_durability(blocking_repository):
+    session_manager = RepositorySessionManager(
+        session_id="test-session", session_repository=blocking_repository, write_behind=True, durability="eventual"
+    )
+    model = MockedModelProvider([{"role": "assistant", "content": [{"text": "Hi"}]}])
+    agent = Agent(agent_id="agent", model=model, session_manager=session_manager)
+
+    blocking_repository.released.clear()
+    agent("Hello")
+
+    assert session_manager._write_queue.pending > 0
+
+    blocking_repository.released.set()
+    session_manager.close()
+
+    assert len(blocking_repository.list_messages("test-session", "agent")) == 2
+
+    with pytest.raises(SessionException, match="closed"):
+        session_manager.sync_agent(agent)
+
+
+def test_write_behind_failure_raised_on_flush(mock_repository, agent):
+    session_manager = RepositorySessionManager(
+        session_id="test-session", session_repository=mock_repository, write_behind=True
+    )
+    session_manager.initialize(agent)
+
+    mock_repository.update_agent = Mock(side_effect=RuntimeError("disk full"))
+    session_manager.sync_agent(agent)
+
+    with pytest.raises(SessionException, match="disk full"):
+        session_manager.flush()
+
+    session_manager.flush()
+
+
+def test_write_behind_snapshots_queued_messages(blocking_repository, agent):
+    session_manager = RepositorySessionManager(
+        session_id="test-session", session_repository=blocking_repository, write_behind=True
+    )
+    session_manager.initialize(agent)
+
+    blocking_repository.released.clear()
+    message = {"role": "user", "content": [{"text": "Hello"}]}
+    session_manager.append_message(message, agent)
+    queued_message = session_manager._latest_agent_message[agent.agent_id]
+    session_manager.redact_latest_message({"role": "user", "content": [{"text": "REDACTED"}]}, agent)
+
+    # Changes made before the worker writes are not persisted
+    message["content"][0]["text"] = "MUTATED"
+    blocking_repository.released.set()
+    session_manager.flush()
+
+    assert queued_message.redact_message is None
+    session_message = blocking_repository.read_message("test-session", agent.agent_id, 1)
+    assert session_message.message["content"] == [{"text": "Hello"}]
+    assert session_message.to_message()["content"] == [{"text": "REDACTED"}]
@@ -447,3 +447,126 @@ def test_update_nonexistent_multi_agent(s3_manager, sample_session):
     nonexistent_mock.id = "nonexistent"
     with pytest.raises(SessionException):
         s3_manager.update_multi_agent(sample_session.session_id, nonexistent_mock)
+
+
+@pytest.fixture
+def snapshot_manager(mocked_aws, s3_bucket):
+    """Create S3SessionManager writing a snapshot every 4 messages."""
+    yield S3SessionManager(
+        session_id="test", bucket=s3_bucket, prefix="sessions/", region_name="us-west-2", snapshot_interval=4
+    )
+
+
+def _create_messages(manager, session_id, agent_id, start, stop):
+    for i in range(start, stop):
+        message = SessionMessage({"role": "user", "content": [ContentBlock(text=f"Message {i}")]}, i)
+        manager.create_message(session_id, agent_id, message)
+
+
+def _texts(messages):
+    return [message.message["content"][0]["text"] for message in messages]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"max_read_workers": 0}, "max_read_workers"), ({"snapshot_interval": 0}, "snapshot_interval")],
+)
+def test_init_invalid_read_options(mocked_aws, s3_bucket, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        S3SessionManager(session_id="test", bucket=s3_bucket, region_name="us-west-2", **kwargs)
+
+
+def test_list_messages_parallel_preserves_order(s3_manager, sample_session, sample_agent):
+    s3_manager.create_session(sample_session)
+    s3_manager.create_agent(sample_session.session_id, sample_agent)
+    _create_messages(s3_manager, sample_session.session_id, sample_agent.agent_id, 0, 25)
+
+    s3_manager.max_read_workers = 4
+    result = s3_manager.list_messages(sample_session.session_id, sample_agent.agent_id, offset=3, limit=20)
+
+    assert _texts(result) == [f"Message {i}" for i in range(3, 23)]
+
+
+def _snapshot_message_ids(manager, session_id, agent_id):
+    return [
+        [message["message_id"] for message in manager._read_s3_object(key)["messages"]]
+        for _, _, key in manager._list_snapshot_keys(session_id, agent_id)
+    ]
+
+
+def test_list_messages_from_snapshot(snapshot_manager, s3_bucket, sample_agent):
+    session_id = snapshot_manager.session_id
+    snapshot_manager.create_agent(session_id, sample_agent)
+    _create_messages(snapshot_manager, session_id, sample_agent.agent_id, 0, 10)
+
+    # Each snapshot only holds the messages created since the previous one
+    assert _snapshot_message_ids(snapshot_manager, session_id, sample_agent.agent_id) == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+    restored_manager = S3SessionManager(
+        session_id="test", bucket=s3_bucket, prefix="sessions/", region_name="us-west-2", snapshot_interval=4
+    )
+    restored_manager._read_s3_object = Mock(wraps=restored_manager._read_s3_object)
+
+    result = restored_manager.list_messages(session_id, sample_agent.agent_id, offset=1)
+
+    assert _texts(result) == [f"Message {i}" for i in range(1, 10)]
+    read_keys = [call.args[0] for call in restored_manager._read_s3_object.call_args_list]
+    assert read_keys == [
+        restored_manager._get_snapshot_path(session_id, sample_agent.agent_id, 0, 3),
+        restored_manager._get_snapshot_path(session_id, sample_agent.agent_id, 4, 7),
+        restored_manager._get_message_path(session_id, sample_agent.agent_id, 8),
+        restored_manager._get_message_path(session_id, sample_agent.agent_id, 9),
+    ]
+
+    # The restored manager includes the messages not covered by a snapshot in the next one
+    _create_messages(restored_manager, session_id, sample_agent.agent_id, 10, 12)
+    assert _snapshot_message_ids(restored_manager, session_id, sample_agent.agent_id) == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9, 10, 11],
+    ]
+
+
+def test_snapshot_keeps_only_pending_messages(snapshot_manager, sample_agent):
+    session_id = snapshot_manager.session_id
+    snapshot_manager.create_agent(session_id, sample_agent)
+    _create_messages(snapshot_manager, session_id, sample_agent.agent_id, 0, 10)
+
+    pending_messages = snapshot_manager._pending_snapshot_messages[(session_id, sample_agent.agent_id)]
+    assert [message["message_id"] for message in pending_messages] == [8, 9]
+
+
+def test_snapshot_unknown_agent(snapshot_manager, s3_bucket, sample_agent):
+    session_id = snapshot_manager.session_id
+    snapshot_manager.create_agent(session_id, sample_agent)
+    _create_messages(snapshot_manager, session_id, sample_agent.agent_id, 0, 2)
+
+    # A manager that neither created nor restored the agent snapshots the messages it creates
+    other_manager = S3SessionManager(
+        session_id="test", bucket=s3_bucket, prefix="sessions/", region_name="us-west-2", snapshot_interval=4
+    )
+    _create_messages(other_manager, session_id, sample_agent.agent_id, 2, 6)
+
+    assert _snapshot_message_ids(other_manager, session_id, sample_agent.agent_id) == [[2, 3, 4, 5]]
+    result = other_manager.list_messages(session_id, sample_agent.agent_id)
+    assert _texts(result) == [f"Message {i}" for i in range(6)]
+
+
+@pytest.mark.parametrize("message_id", [2, 5])
+def test_update_message_in_snapshot(snapshot_manager, s3_bucket, sample_agent, message_id):
+    session_id = snapshot_manager.session_id
+    snapshot_manager.create_agent(session_id, sample_agent)
+    _create_messages(snapshot_manager, session_id, sample_agent.agent_id, 0, 6)
+
+    message = snapshot_manager.read_message(session_id, sample_agent.agent_id, message_id)
+    message.redact_message = {"role": "user", "content": [{"text": "redacted"}]}
+    snapshot_manager.update_message(session_id, sample_agent.agent_id, message)
+    _create_messages(snapshot_manager, session_id, sample_agent.agent_id, 6, 8)
+
+    restored_manager = S3SessionManager(
+        session_id="test", bucket=s3_bucket, prefix="sessions/", region_name="us-west-2", snapshot_interval=4
+    )
+    result = restored_manager.list_messages(session_id, sample_agent.agent_id)
+
+    assert len(result) == 8
+    assert result[message_id].to_message() == {"role": "user", "content": [{"text": "redacted"}]}
@@ -226,6 +226,9 @@ def test_tool_metrics_add_call(success, tool, tool_metrics, mock_get_meter_provi
         "success_count": success,
         "error_count": not success,
         "total_time": duration,
+        "total_queue_time": 0.0,
+        "cache_hit_count": 0,
+        "cache_miss_count": 0,
     }
 
     mock_get_meter_provider.return_value.get_meter.assert_called()
@@ -336,6 +339,34 @@ def test_event_loop_metrics_add_tool_usage(mock_time, trace, tool, event_loop_me
     assert tru_trace_attrs == exp_trace_attrs
 
 
+def test_event_loop_metrics_add_tool_cache_lookup(tool, event_loop_metrics, mock_get_meter_provider):
+    event_loop_metrics.add_tool_cache_lookup(tool, hit=False)
+    event_loop_metrics.add_tool_cache_lookup(tool, hit=True)
+    event_loop_metrics.add_tool_cache_lookup(tool, hit=True)
+
+    tool_metrics = event_loop_metrics.tool_metrics["tool1"]
+    assert (tool_metrics.cache_hit_count, tool_metrics.cache_miss_count) == (2, 1)
+    assert event_loop_metrics.get_summary()["tool_usage"]["tool1"]["execution_stats"]["cache_hit_rate"] == 2 / 3
+
+    metrics_client = event_loop_metrics._metrics_client
+    metrics_client.tool_cache_hit_count.add.assert_called_with(1, attributes={"tool_name": "tool1"})
+    metrics_client.tool_cache_miss_count.add.assert_called_with(1, attributes={"tool_name": "tool1"})
+
+
+def test_event_loop_metrics_add_tool_queue_wait(tool, event_loop_metrics, mock_get_meter_provider):
+    event_loop_metrics.add_tool_queue_wait(tool, 0.5, 3)
+    event_loop_metrics.add_tool_queue_wait(tool, 0.25, 1)
+
+    assert event_loop_metrics.tool_metrics["tool1"].total_queue_time == 0.75
+    assert event_loop_metrics.tool_metrics["tool1"].call_count == 0
+    assert event_loop_metrics.max_tool_queue_depth == 3
+
+    metrics_client = event_loop_metrics._metrics_client
+    attributes = {"tool_name": "tool1", "tool_use_id": "123"}
+    metrics_client.tool_queue_wait.record.assert_called_with(0.25, attributes=attributes)
+    metrics_client.tool_queue_depth.record.assert_called_with(1, attributes=attributes)
+
+
 def test_event_loop_metrics_update_usage(usage, event_loop_metrics, mock_get_meter_provider):
     event_loop_metrics.reset_usage_metrics()
     event_loop_metrics.start_cycle(attributes={"event_loop_cycle_id": "test-cycle"})
@@ -362,6 +393,22 @@ def test_event_loop_metrics_update_usage(usage, event_loop_metrics, mock_get_met
     metrics_client.event_loop_cache_write_input_tokens.record.assert_called()
 
 
+def test_event_loop_metrics_input_token_estimate(usage, event_loop_metrics, mock_get_meter_provider):
+    event_loop_metrics.reset_usage_metrics()
+
+    event_loop_metrics.set_input_token_estimate(5)
+    event_loop_metrics.update_usage(usage)
+    event_loop_metrics.update_usage(usage)
+
+    tru_estimates = event_loop_metrics.input_token_estimates
+    exp_estimates = [strands.telemetry.metrics.InputTokenEstimate(estimated=5, actual=3)]
+    assert tru_estimates == exp_estimates
+
+    metrics_client = event_loop_metrics._metrics_client
+    metrics_client.event_loop_estimated_input_tokens.record.assert_called_once_with(5)
+    metrics_client.event_loop_input_tokens_estimate_error.record.assert_called_once_with(2)
+
+
 def test_event_loop_metrics_update_metrics(metrics_with_ttfb, event_loop_metrics, mock_get_meter_provider):
     for _ in range(3):
         event_loop_metrics.update_metrics(metrics_with_ttfb)
@@ -377,6 +424,38 @@ def test_event_loop_metrics_update_metrics(metrics_with_ttfb, event_loop_metrics
     event_loop_metrics._metrics_client.model_time_to_first_token.record.assert_called_with(10)
 
 
+def test_event_loop_metrics_merge(usage, tool, event_loop_metrics, mock_get_meter_provider):
+    other = strands.telemetry.metrics.EventLoopMetrics()
+    for metrics in (event_loop_metrics, other):
+        metrics.reset_usage_metrics()
+        start_time, cycle_trace = metrics.start_cycle(attributes={"event_loop_cycle_id": "test-cycle"})
+        metrics.end_cycle(start_time, cycle_trace)
+        metrics.update_usage(usage)
+        metrics.update_metrics(Metrics(latencyMs=5))
+        metrics.add_tool_usage(
+            tool, 1.0, strands.telemetry.metrics.Trace("tool"), True, {"role": "user", "content": []}
+        )
+    other.add_tool_queue_wait(tool, 0.5, 4)
+
+    event_loop_metrics.merge(other)
+
+    assert event_loop_metrics.cycle_count == 2
+    assert len(event_loop_metrics.cycle_durations) == 2
+    assert len(event_loop_metrics.traces) == 2
+    assert event_loop_metrics.agent_invocations[1] is other.agent_invocations[0]
+    assert event_loop_metrics.accumulated_usage == Usage(
+        inputTokens=2, outputTokens=4, totalTokens=6, cacheWriteInputTokens=4
+    )
+    assert event_loop_metrics.accumulated_metrics == Metrics(latencyMs=10)
+    assert event_loop_metrics.max_tool_queue_depth == 4
+
+    tool_metrics = event_loop_metrics.tool_metrics["tool1"]
+    assert (tool_metrics.call_count, tool_metrics.success_count, tool_metrics.error_count) == (2, 2, 0)
+    assert tool_metrics.total_time == 2.0
+    assert tool_metrics.total_queue_time == 0.5
+    assert other.tool_metrics["tool1"].call_count == 1
+
+
 def test_event_loop_metrics_get_summary(trace, tool, event_loop_metrics, mock_get_meter_provider):
     duration = 1
     success = True
@@ -396,6 +475,7 @@ def test_event_loop_metrics_get_summary(trace, tool, event_loop_metrics, mock_ge
         },
         "agent_invocations": [],
         "average_cycle_time": 0,
+        "input_token_estimates": [],
         "tool_usage": {
             "tool1": {
                 "execution_stats": {
@@ -405,6 +485,10 @@ def test_event_loop_metrics_get_summary(trace, tool, event_loop_metrics, mock_ge
                     "success_count": 1,
                     "success_rate": 1,
                     "total_time": 1,
+                    "total_queue_time": 0.0,
+                    "cache_hit_count": 0,
+                    "cache_miss_count": 0,
+                    "cache_hit_rate": 0,
                 },
                 "tool_info": {
                     "input_params": {},
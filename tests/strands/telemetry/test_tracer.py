@@ -1,10 +1,14 @@
+import dataclasses
+import enum
 import json
 import os
+import uuid
 from datetime import date, datetime, timezone
 from unittest import mock
 
 import pytest
 from opentelemetry.trace import (
+    SpanContext,
     SpanKind,
     StatusCode,  # type: ignore
 )
@@ -1154,6 +1158,67 @@ def test_json_encoder_value_error():
     assert result == "<replaced>"
 
 
+def test_json_encoder_single_pass():
+    """Test that serializable values are encoded without per-value processing."""
+    encoder = JSONEncoder()
+    data = {"bytes": b"image", "timestamp": date(2025, 1, 1), "values": (1, "text", object())}
+
+    with mock.patch.object(encoder, "_process_value") as mock_process_value:
+        result = json.loads(encoder.encode(data))
+
+    mock_process_value.assert_not_called()
+    assert result == {"bytes": "<replaced>", "timestamp": "2025-01-01", "values": [1, "text", "<replaced>"]}
+
+
+def test_serialize_orjson():
+    """Test serializing with the orjson backend."""
+    orjson = pytest.importorskip("orjson")
+
+    data = {"text": "こんにちは", "bytes": b"image", "timestamp": date(2025, 1, 1), 1: [None, 2**100]}
+
+    with mock.patch("strands.telemetry.tracer._orjson", orjson):
+        assert json.loads(serialize(data)) == {
+            "text": "こんにちは",
+            "bytes": "<replaced>",
+            "timestamp": "2025-01-01",
+            "1": [None, 2**100],
+        }
+        assert serialize({"a": 1}) == '{"a":1}'
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_serialize_backends_convert_values_alike(backend):
+    """Test that both backends convert tuples, dataclasses, UUIDs, and enums the same way."""
+    orjson = pytest.importorskip("orjson") if backend == "orjson" else None
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+
+    class Color(enum.Enum):
+        RED = "red"
+
+    identifier = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    data = {
+        "tuple": (1, b"bytes", date(2025, 1, 1), (2, object())),
+        "dataclass": Point(1),
+        "uuid": identifier,
+        "enum": Color.RED,
+        "time": datetime(2025, 1, 1, 12, 30, 0, 500).time(),
+    }
+
+    with mock.patch("strands.telemetry.tracer._orjson", orjson):
+        result = json.loads(serialize(data))
+
+    assert result == {
+        "tuple": [1, "<replaced>", "2025-01-01", [2, "<replaced>"]],
+        "dataclass": "<replaced>",
+        "uuid": str(identifier),
+        "enum": "red",
+        "time": "<replaced>",
+    }
+
+
 def test_serialize_non_ascii_characters():
     """Test that non-ASCII characters are preserved in JSON serialization."""
 
@@ -1455,3 +1520,194 @@ def test_start_agent_span_includes_tool_definitions_when_enabled(monkeypatch):
     ]
     expected_json = serialize(expected_tool_details)
     assert attributes["gen_ai.tool.definitions"] == expected_json
+
+
+def _recording_span(span_id):
+    span = mock.MagicMock()
+    span.is_recording.return_value = True
+    span.get_span_context.return_value = SpanContext(trace_id=1, span_id=span_id, is_remote=False)
+    return span
+
+
+def test_start_model_invoke_span_incremental_messages(mock_tracer, monkeypatch):
+    monkeypatch.setenv("STRANDS_TRACE_MESSAGES", "incremental")
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    messages = [{"role": "user", "content": [{"text": "Hello"}]}]
+
+    first_span = _recording_span(span_id=1)
+    mock_tracer.start_span.return_value = first_span
+    tracer.start_model_invoke_span(messages=messages)
+
+    messages.append({"role": "assistant", "content": [{"text": "Hi"}]})
+    messages.append({"role": "user", "content": [{"text": "Bye"}]})
+
+    second_span = _recording_span(span_id=2)
+    mock_tracer.start_span.return_value = second_span
+    tracer.start_model_invoke_span(messages=messages)
+
+    assert first_span.add_event.call_args_list == [
+        mock.call("gen_ai.user.message", attributes={"content": json.dumps([{"text": "Hello"}])})
+    ]
+    first_span.set_attribute.assert_any_call("strands.messages.start_index", 0)
+
+    assert second_span.add_event.call_args_list == [
+        mock.call("gen_ai.assistant.message", attributes={"content": json.dumps([{"text": "Hi"}])}),
+        mock.call("gen_ai.user.message", attributes={"content": json.dumps([{"text": "Bye"}])}),
+    ]
+    second_span.set_attribute.assert_any_call("strands.messages.start_index", 1)
+    second_span.set_attribute.assert_any_call("strands.messages.total_count", 3)
+    second_span.set_attribute.assert_any_call("strands.messages.previous_span_id", "0000000000000001")
+
+
+def test_start_model_invoke_span_incremental_messages_history_reduced(mock_tracer, monkeypatch):
+    monkeypatch.setenv("STRANDS_TRACE_MESSAGES", "incremental")
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    messages = [
+        {"role": "user", "content": [{"text": "Hello"}]},
+        {"role": "assistant", "content": [{"text": "Hi"}]},
+    ]
+    mock_tracer.start_span.return_value = _recording_span(span_id=1)
+    tracer.start_model_invoke_span(messages=messages)
+
+    messages.pop(0)
+
+    span = _recording_span(span_id=2)
+    mock_tracer.start_span.return_value = span
+    tracer.start_model_invoke_span(messages=messages)
+
+    assert span.add_event.call_args_list == [
+        mock.call("gen_ai.assistant.message", attributes={"content": json.dumps([{"text": "Hi"}])})
+    ]
+    span.set_attribute.assert_any_call("strands.messages.start_index", 0)
+
+
+def test_start_model_invoke_span_incremental_messages_history_reduced_in_place(mock_tracer, monkeypatch):
+    monkeypatch.setenv("STRANDS_TRACE_MESSAGES", "incremental")
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    messages = [
+        {"role": "user", "content": [{"text": "1"}]},
+        {"role": "assistant", "content": [{"text": "2"}]},
+        {"role": "user", "content": [{"text": "3"}]},
+        {"role": "assistant", "content": [{"text": "4"}]},
+    ]
+    mock_tracer.start_span.return_value = _recording_span(span_id=1)
+    tracer.start_model_invoke_span(messages=messages)
+
+    messages[:] = messages[2:]
+    messages.append({"role": "user", "content": [{"text": "NEW-user"}]})
+    messages.append({"role": "assistant", "content": [{"text": "NEW-assistant"}]})
+
+    span = _recording_span(span_id=2)
+    mock_tracer.start_span.return_value = span
+    tracer.start_model_invoke_span(messages=messages)
+
+    assert span.add_event.call_args_list == [
+        mock.call("gen_ai.user.message", attributes={"content": json.dumps([{"text": "3"}])}),
+        mock.call("gen_ai.assistant.message", attributes={"content": json.dumps([{"text": "4"}])}),
+        mock.call("gen_ai.user.message", attributes={"content": json.dumps([{"text": "NEW-user"}])}),
+        mock.call("gen_ai.assistant.message", attributes={"content": json.dumps([{"text": "NEW-assistant"}])}),
+    ]
+    span.set_attribute.assert_any_call("strands.messages.start_index", 0)
+    assert mock.call("strands.messages.previous_span_id", mock.ANY) not in span.set_attribute.call_args_list
+
+
+def test_start_model_invoke_span_not_recording(mock_tracer):
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    span = mock.MagicMock()
+    span.is_recording.return_value = False
+    mock_tracer.start_span.return_value = span
+
+    with mock.patch("strands.telemetry.tracer.serialize") as mock_serialize:
+        tracer.start_model_invoke_span(messages=[{"role": "user", "content": [{"text": "Hello"}]}])
+
+    mock_serialize.assert_not_called()
+    span.add_event.assert_not_called()
+
+
+def test_start_model_invoke_span_max_message_size(mock_tracer, monkeypatch):
+    monkeypatch.setenv("STRANDS_TRACE_MAX_MESSAGE_SIZE", "35")
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    span = _recording_span(span_id=1)
+    mock_tracer.start_span.return_value = span
+    tracer.start_model_invoke_span(messages=[{"role": "user", "content": [{"text": "Hello world " * 3}]}])
+
+    span.add_event.assert_called_once_with(
+        "gen_ai.user.message",
+        attributes={"content": '[{"text": "Hello w...<truncated>"}]', "strands.truncated": True},
+    )
+
+
+def test_start_model_invoke_span_max_message_size_drops_blocks(mock_tracer, monkeypatch):
+    monkeypatch.setenv("STRANDS_TRACE_MAX_MESSAGE_SIZE", "10")
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    span = _recording_span(span_id=1)
+    mock_tracer.start_span.return_value = span
+    tracer.start_model_invoke_span(messages=[{"role": "user", "content": [{"text": "Hello world"}]}])
+
+    span.add_event.assert_called_once_with(
+        "gen_ai.user.message", attributes={"content": "[]", "strands.truncated": True}
+    )
+
+
+@pytest.mark.parametrize("max_size", [40, 60, 100])
+def test_start_model_invoke_span_max_message_size_keeps_valid_json(mock_tracer, monkeypatch, max_size):
+    monkeypatch.setenv("STRANDS_TRACE_MAX_MESSAGE_SIZE", str(max_size))
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    content = [{"text": "short"}, {"text": "a" * 200}, {"json": {"value": "b" * 50}}]
+    span = _recording_span(span_id=1)
+    mock_tracer.start_span.return_value = span
+    tracer.start_model_invoke_span(messages=[{"role": "user", "content": content}])
+
+    attributes = span.add_event.call_args.kwargs["attributes"]
+    assert attributes["strands.truncated"] is True
+    assert len(attributes["content"]) <= max_size
+
+    tru_content = json.loads(attributes["content"])
+    assert all(block in content or "...<truncated>" in json.dumps(block) for block in tru_content)
+
+
+def test_start_model_invoke_span_max_message_size_latest_conventions(mock_tracer, monkeypatch):
+    monkeypatch.setenv("OTEL_SEMCONV_STABILITY_OPT_IN", "gen_ai_latest_experimental")
+    monkeypatch.setenv("STRANDS_TRACE_MAX_MESSAGE_SIZE", "80")
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    span = _recording_span(span_id=1)
+    mock_tracer.start_span.return_value = span
+    tracer.start_model_invoke_span(messages=[{"role": "user", "content": [{"text": "Hello world " * 20}]}])
+
+    attributes = span.add_event.call_args.kwargs["attributes"]
+    assert attributes["strands.truncated"] is True
+    assert json.loads(attributes["gen_ai.input.messages"])[0]["parts"][0]["content"].endswith("...<truncated>")
+
+
+def test_start_model_invoke_span_max_message_size_not_exceeded(mock_tracer, monkeypatch):
+    monkeypatch.setenv("STRANDS_TRACE_MAX_MESSAGE_SIZE", "100")
+    tracer = Tracer()
+    tracer.tracer = mock_tracer
+
+    span = _recording_span(span_id=1)
+    mock_tracer.start_span.return_value = span
+    tracer.start_model_invoke_span(messages=[{"role": "user", "content": [{"text": "Hello"}]}])
+
+    span.add_event.assert_called_once_with("gen_ai.user.message", attributes={"content": '[{"text": "Hello"}]'})
+
+
+@pytest.mark.parametrize("value", ["invalid", "0"])
+def test_init_invalid_max_message_size(value, monkeypatch):
+    monkeypatch.setenv("STRANDS_TRACE_MAX_MESSAGE_SIZE", value)
+    assert Tracer().max_message_event_size is None
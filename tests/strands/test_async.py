@@ -1,8 +1,12 @@
 """Tests for _async module."""
 
+import asyncio
+import contextvars
+import threading
+
 import pytest
 
-from strands._async import run_async
+from strands._async import EventLoopRunner, run_async
 
 
 def test_run_async_with_return_value():
@@ -23,3 +27,95 @@ def test_run_async_exception_propagation():
 
     with pytest.raises(ValueError, match="test exception"):
         run_async(async_with_exception)
+
+
+def test_run_async_with_runner():
+    runner = EventLoopRunner()
+
+    async def get_thread():
+        return threading.current_thread()
+
+    try:
+        first = run_async(get_thread, runner)
+        second = run_async(get_thread, runner)
+    finally:
+        runner.close()
+
+    assert first is second
+    assert first.name == "strands-event-loop"
+
+
+def test_event_loop_runner_reuses_loop():
+    runner = EventLoopRunner()
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    try:
+        assert runner.run(get_loop) is runner.run(get_loop)
+    finally:
+        runner.close()
+
+
+def test_event_loop_runner_exception_propagation():
+    runner = EventLoopRunner()
+
+    async def async_with_exception():
+        raise ValueError("test exception")
+
+    try:
+        with pytest.raises(ValueError, match="test exception"):
+            runner.run(async_with_exception)
+    finally:
+        runner.close()
+
+
+def test_event_loop_runner_propagates_context():
+    runner = EventLoopRunner()
+    var = contextvars.ContextVar("var", default="unset")
+    var.set("caller")
+
+    async def get_var():
+        return var.get()
+
+    try:
+        assert runner.run(get_var) == "caller"
+    finally:
+        runner.close()
+
+
+def test_event_loop_runner_reentrant_call():
+    runner = EventLoopRunner()
+
+    async def inner():
+        return threading.current_thread()
+
+    async def outer():
+        return threading.current_thread(), runner.run(inner)
+
+    try:
+        outer_thread, inner_thread = runner.run(outer)
+    finally:
+        runner.close()
+
+    assert outer_thread is not inner_thread
+
+
+def test_event_loop_runner_close():
+    runner = EventLoopRunner()
+
+    async def async_with_value():
+        return 42
+
+    assert runner.run(async_with_value) == 42
+    runner.close()
+
+    assert runner.is_closed
+    with pytest.raises(RuntimeError, match="is closed"):
+        runner.run(async_with_value)
+
+
+def test_event_loop_runner_shared():
+    shared = EventLoopRunner.shared()
+
+    assert EventLoopRunner.shared() is shared
@@ -1,10 +1,16 @@
+import asyncio
+import re
+import unittest.mock
+
 import pytest
 
+import strands
 from strands.hooks import BeforeToolCallEvent
 from strands.interrupt import Interrupt
 from strands.tools.executors import ConcurrentToolExecutor
+from strands.tools.executors.concurrent import _TokenBucket
 from strands.tools.structured_output._structured_output_context import StructuredOutputContext
-from strands.types._events import ToolInterruptEvent, ToolResultEvent
+from strands.types._events import ToolInterruptEvent, ToolResultEvent, ToolStreamEvent
 
 
 @pytest.fixture
@@ -76,3 +82,194 @@ async def test_concurrent_executor_interrupt(
     tru_results = tool_results
     exp_results = [exp_events[1].tool_result]
     assert tru_results == exp_results
+
+
+@pytest.fixture
+def tracked_tool(tool_registry):
+    running = {"current": 0, "max": 0, "order": []}
+
+    @strands.tool(name="tracked_tool")
+    async def func(name: str) -> str:
+        running["current"] += 1
+        running["max"] = max(running["max"], running["current"])
+        running["order"].append(name)
+        await asyncio.sleep(0.01)
+        running["current"] -= 1
+        return name
+
+    tool_registry.register_tool(func)
+    return running
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executor_max_concurrency(
+    agent, tracked_tool, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context, alist
+):
+    executor = ConcurrentToolExecutor(max_concurrency=2)
+    tool_uses = [{"name": "tracked_tool", "toolUseId": str(i), "input": {"name": str(i)}} for i in range(5)]
+
+    stream = executor._execute(
+        agent, tool_uses, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+    )
+    await alist(stream)
+
+    assert tracked_tool["max"] == 2
+    assert sorted(result["toolUseId"] for result in tool_results) == ["0", "1", "2", "3", "4"]
+    assert agent.event_loop_metrics.add_tool_queue_wait.call_count == 5
+
+    queue_depths = [call.args[2] for call in agent.event_loop_metrics.add_tool_queue_wait.call_args_list]
+    assert queue_depths == [1, 1, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executor_tool_concurrency(
+    agent, tracked_tool, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context, alist
+):
+    executor = ConcurrentToolExecutor(tool_concurrency={"tracked_tool": 1})
+    tool_uses = [{"name": "tracked_tool", "toolUseId": str(i), "input": {"name": str(i)}} for i in range(3)]
+    tool_uses.append({"name": "weather_tool", "toolUseId": "weather", "input": {}})
+
+    stream = executor._execute(
+        agent, tool_uses, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+    )
+    await alist(stream)
+
+    assert tracked_tool["max"] == 1
+    assert len(tool_results) == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executor_priority(
+    agent, tracked_tool, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context, alist
+):
+    executor = ConcurrentToolExecutor(max_concurrency=1, priority=lambda tool_use: -int(tool_use["toolUseId"]))
+    tool_uses = [{"name": "tracked_tool", "toolUseId": str(i), "input": {"name": str(i)}} for i in range(3)]
+
+    stream = executor._execute(
+        agent, tool_uses, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+    )
+    await alist(stream)
+
+    assert tracked_tool["order"] == ["2", "1", "0"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executor_no_limits_skips_queue_metrics(
+    executor, agent, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context, alist
+):
+    tool_uses = [{"name": "weather_tool", "toolUseId": "1", "input": {}}]
+
+    stream = executor._execute(
+        agent, tool_uses, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+    )
+    await alist(stream)
+
+    agent.event_loop_metrics.add_tool_queue_wait.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    bucket = _TokenBucket(rate=2)
+    now = {"value": 0.0}
+    sleeps = []
+
+    async def mock_sleep(delay):
+        sleeps.append(delay)
+        now["value"] += delay
+
+    with (
+        unittest.mock.patch.object(
+            strands.tools.executors.concurrent.time, "monotonic", side_effect=lambda: now["value"]
+        ),
+        unittest.mock.patch.object(strands.tools.executors.concurrent.asyncio, "sleep", side_effect=mock_sleep),
+    ):
+        bucket._updated_at = 0.0
+        for _ in range(3):
+            await bucket.acquire()
+
+    assert sleeps == [0.5]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"max_concurrency": 0}, "max_concurrency=<0> | must be at least 1"),
+        ({"tool_concurrency": {"tool": 0}}, "tool_name=<tool>, limit=<0> | tool concurrency must be at least 1"),
+        ({"tool_rate_limits": {"tool": 0}}, "tool_name=<tool>, rate=<0> | tool rate limit must be positive"),
+    ],
+)
+def test_concurrent_executor_invalid_limits(kwargs, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        ConcurrentToolExecutor(**kwargs)
+
+
+@pytest.fixture
+def counting_tool(tool_registry):
+    produced = {"count": 0}
+
+    @strands.tool(name="counting_tool")
+    async def func(prefix: str, count: int):
+        for i in range(count):
+            produced["count"] += 1
+            yield f"{prefix}{i}"
+
+        yield f"{prefix} done"
+
+    tool_registry.register_tool(func)
+    return produced
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executor_stream_buffer_preserves_per_tool_order(
+    agent, counting_tool, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context, alist
+):
+    executor = ConcurrentToolExecutor(stream_buffer_size=4)
+    tool_uses = [
+        {"name": "counting_tool", "toolUseId": "a", "input": {"prefix": "a", "count": 20}},
+        {"name": "counting_tool", "toolUseId": "b", "input": {"prefix": "b", "count": 20}},
+    ]
+
+    stream = executor._execute(
+        agent, tool_uses, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+    )
+    events = await alist(stream)
+
+    for prefix in ["a", "b"]:
+        tru_data = [
+            event["tool_stream_event"]["data"]
+            for event in events
+            if isinstance(event, ToolStreamEvent) and event.tool_use_id == prefix
+        ]
+        exp_data = [f"{prefix}{i}" for i in range(20)] + [f"{prefix} done"]
+        assert tru_data == exp_data
+
+    assert sorted(result["toolUseId"] for result in tool_results) == ["a", "b"]
+    assert {result["content"][0]["text"] for result in tool_results} == {"a done", "b done"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executor_stream_buffer_backpressure(
+    agent, counting_tool, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+):
+    executor = ConcurrentToolExecutor(stream_buffer_size=2)
+    tool_uses = [{"name": "counting_tool", "toolUseId": "a", "input": {"prefix": "a", "count": 50}}]
+
+    stream = executor._execute(
+        agent, tool_uses, tool_results, cycle_trace, cycle_span, invocation_state, structured_output_context
+    )
+    await anext(stream)
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert counting_tool["count"] <= 4
+
+    async for _ in stream:
+        pass
+
+    assert counting_tool["count"] == 50
+    assert len(tool_results) == 1
+
+
+def test_concurrent_executor_invalid_stream_buffer_size():
+    with pytest.raises(ValueError, match=re.escape("stream_buffer_size=<0> | must be at least 1")):
+        ConcurrentToolExecutor(stream_buffer_size=0)
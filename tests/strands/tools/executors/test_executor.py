@@ -479,3 +479,55 @@ async def test_executor_stream_updates_invocation_state_with_agent(
     # Verify that the invocation_state was updated with the agent
     assert "agent" in empty_invocation_state
     assert empty_invocation_state["agent"] is agent
+
+
+@pytest.mark.asyncio
+async def test_executor_stream_uses_tool_cache(executor, agent, tool_results, invocation_state, hook_events, alist):
+    calls = []
+
+    @strands.tool(name="lookup_tool", cache=True)
+    def lookup_tool(key: str) -> str:
+        calls.append(key)
+        return f"value of {key}"
+
+    agent.tool_registry.register_tool(lookup_tool)
+
+    for tool_use_id in ("1", "2"):
+        tool_use: ToolUse = {"name": "lookup_tool", "toolUseId": tool_use_id, "input": {"key": "a"}}
+        await alist(executor._stream(agent, tool_use, tool_results, invocation_state))
+
+    assert calls == ["a"]
+    assert tool_results == [
+        {"toolUseId": "1", "status": "success", "content": [{"text": "value of a"}]},
+        {"toolUseId": "2", "status": "success", "content": [{"text": "value of a"}]},
+    ]
+
+    after_events = [event for event in hook_events if isinstance(event, AfterToolCallEvent)]
+    assert [event.cache_hit for event in after_events] == [False, True]
+    assert len([event for event in hook_events if isinstance(event, BeforeToolCallEvent)]) == 2
+
+    agent.event_loop_metrics.add_tool_cache_lookup.assert_has_calls(
+        [
+            unittest.mock.call({"name": "lookup_tool", "toolUseId": "1", "input": {"key": "a"}}, False),
+            unittest.mock.call({"name": "lookup_tool", "toolUseId": "2", "input": {"key": "a"}}, True),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_executor_stream_does_not_cache_errors(executor, agent, tool_results, invocation_state, alist):
+    calls = []
+
+    @strands.tool(name="failing_tool", cache=True)
+    def failing_tool() -> str:
+        calls.append(1)
+        raise RuntimeError("failed")
+
+    agent.tool_registry.register_tool(failing_tool)
+    tool_use: ToolUse = {"name": "failing_tool", "toolUseId": "1", "input": {}}
+
+    await alist(executor._stream(agent, tool_use, tool_results, invocation_state))
+    await alist(executor._stream(agent, tool_use, tool_results, invocation_state))
+
+    assert len(calls) == 2
+    assert [result["status"] for result in tool_results] == ["error", "error"]
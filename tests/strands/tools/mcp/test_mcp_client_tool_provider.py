@@ -1,11 +1,14 @@
 """Unit tests for MCPClient ToolProvider functionality."""
 
+import asyncio
 import re
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 from mcp.types import Tool as MCPTool
 
+from strands.tools.cache import ToolCache
 from strands.tools.mcp import MCPClient
 from strands.tools.mcp.mcp_agent_tool import MCPAgentTool
 from strands.tools.mcp.mcp_client import ToolFilters
@@ -113,6 +116,31 @@ async def test_load_tools_raises_exception_on_client_start_failure(mock_transpor
             await client.load_tools()
 
 
+@pytest.mark.asyncio
+async def test_load_tools_of_several_clients_concurrently(mock_transport):
+    """Test that clients start and list tools off the event loop, so several clients load concurrently."""
+    clients = [MCPClient(mock_transport), MCPClient(mock_transport)]
+    # Each blocking call waits for the other client, which only works if they run at the same time
+    start_barrier = threading.Barrier(2, timeout=5)
+    list_barrier = threading.Barrier(2, timeout=5)
+
+    def list_tools(tool):
+        def list_tools_sync(*args, **kwargs):
+            list_barrier.wait()
+            return PaginatedList([tool])
+
+        return list_tools_sync
+
+    for i, client in enumerate(clients):
+        client.start = MagicMock(side_effect=start_barrier.wait)
+        client.list_tools_sync = MagicMock(side_effect=list_tools(create_mock_tool(f"tool{i}")))
+
+    tools = await asyncio.gather(*(client.load_tools() for client in clients))
+
+    assert [[tool.tool_name for tool in client_tools] for client_tools in tools] == [["tool0"], ["tool1"]]
+    assert all(client._tool_provider_started for client in clients)
+
+
 @pytest.mark.asyncio
 async def test_load_tools_caches_tools(mock_transport, mock_agent_tool):
     """Test that load_tools caches tools and doesn't reload them."""
@@ -824,3 +852,30 @@ def test_list_tools_sync_callable_filter_override(mock_transport):
         # Should only include short tool (name length <= 10)
         assert len(result) == 1
         assert result[0] is mock_agent_tool1
+
+
+def test_list_tools_sync_assigns_tool_caches(mock_transport):
+    """Test that tool caches are assigned by the tool's name on the server."""
+    cache = ToolCache()
+    client = MCPClient(mock_transport, prefix="prefix", tool_caches={"cached_tool": cache})
+    client._tool_provider_started = True
+
+    mock_thread = MagicMock()
+    mock_thread.is_alive.return_value = True
+    client._background_thread = mock_thread
+
+    mock_list_tools_result = MagicMock()
+    mock_list_tools_result.tools = [
+        MCPTool(name="cached_tool", inputSchema={"type": "object"}),
+        MCPTool(name="other_tool", inputSchema={"type": "object"}),
+    ]
+    mock_list_tools_result.nextCursor = None
+
+    with patch.object(client, "_invoke_on_background_thread") as mock_invoke:
+        mock_invoke.return_value.result.return_value = mock_list_tools_result
+        tools = client.list_tools_sync()
+
+    assert [(tool.tool_name, tool.cache) for tool in tools] == [
+        ("prefix_cached_tool", cache),
+        ("prefix_other_tool", None),
+    ]
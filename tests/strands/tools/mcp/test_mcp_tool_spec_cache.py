@@ -0,0 +1,175 @@
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp import ListToolsResult
+from mcp.types import CallToolResult as MCPCallToolResult
+from mcp.types import Implementation, ServerNotification, ToolListChangedNotification
+from mcp.types import TextContent as MCPTextContent
+from mcp.types import Tool as MCPTool
+
+from strands.tools.mcp import MCPClient, MCPToolSpecCache
+from strands.types.exceptions import MCPClientInitializationError
+
+
+def mcp_tool(name):
+    return MCPTool(name=name, description=f"{name} tool", inputSchema={"type": "object", "properties": {}})
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def transport_callable():
+    transport_cm = AsyncMock()
+    transport_cm.__aenter__.return_value = (AsyncMock(), AsyncMock())
+    return MagicMock(return_value=transport_cm)
+
+
+@pytest.fixture
+def mock_session():
+    mock_session = AsyncMock()
+    mock_session.initialize.return_value = MagicMock(serverInfo=Implementation(name="github", version="2.0"))
+    mock_session.list_tools.return_value = ListToolsResult(tools=[mcp_tool("search"), mcp_tool("fetch")])
+    mock_session.call_tool.return_value = MCPCallToolResult(content=[MCPTextContent(type="text", text="found")])
+
+    mock_session_cm = AsyncMock()
+    mock_session_cm.__aenter__.return_value = mock_session
+
+    with patch("strands.tools.mcp.mcp_client.ClientSession", return_value=mock_session_cm):
+        yield mock_session
+
+
+@pytest.fixture
+def cache(request, tmp_path):
+    params = getattr(request, "param", {})
+    return MCPToolSpecCache(tmp_path, "github", **params)
+
+
+def test_save_and_load(cache):
+    cache.save([mcp_tool("search")], Implementation(name="github", version="2.0"))
+
+    entry = cache.load()
+
+    assert entry.tools == [mcp_tool("search")]
+    assert (entry.server_name, entry.server_version) == ("github", "2.0")
+    assert entry.saved_at == pytest.approx(time.time(), abs=5)
+
+
+def test_load_missing_or_unreadable(cache):
+    assert cache.load() is None
+
+    cache.path.write_text("{not json")
+    assert cache.load() is None
+
+
+def test_load_ignores_other_server_version(tmp_path):
+    MCPToolSpecCache(tmp_path, "github").save([mcp_tool("search")], Implementation(name="github", version="1.0"))
+
+    assert MCPToolSpecCache(tmp_path, "github", server_version="1.0").load() is not None
+    assert MCPToolSpecCache(tmp_path, "github", server_version="2.0").load() is None
+
+
+@pytest.mark.parametrize("cache", [{"max_age": 60}], indirect=True)
+def test_load_ignores_expired_tools(cache):
+    cache.save([mcp_tool("search")])
+    data = json.loads(cache.path.read_text())
+    data["saved_at"] -= 120
+    cache.path.write_text(json.dumps(data))
+
+    assert cache.load() is None
+
+
+def test_invalid_cache_options(tmp_path):
+    with pytest.raises(ValueError, match="server_id=../github"):
+        MCPToolSpecCache(tmp_path, "../github")
+    with pytest.raises(ValueError, match="max_age=<0>"):
+        MCPToolSpecCache(tmp_path, "github", max_age=0)
+
+
+@pytest.mark.asyncio
+async def test_load_tools_saves_listed_tools(transport_callable, mock_session, cache):
+    mock_session.list_tools.side_effect = [
+        ListToolsResult(tools=[mcp_tool("search")], nextCursor="page2"),
+        ListToolsResult(tools=[mcp_tool("fetch")]),
+    ]
+    client = MCPClient(transport_callable, prefix="gh", tool_spec_cache=cache)
+
+    tools = await client.load_tools()
+    client.stop(None, None, None)
+
+    # The prefix is applied to the loaded tools, while the cache keeps the names used by the server
+    assert [tool.tool_name for tool in tools] == ["gh_search", "gh_fetch"]
+    entry = cache.load()
+    assert [tool.name for tool in entry.tools] == ["search", "fetch"]
+    assert entry.server_version == "2.0"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache", [{"revalidate": False}], indirect=True)
+async def test_load_tools_from_cache_connects_on_first_call(transport_callable, mock_session, cache):
+    cache.save([mcp_tool("search"), mcp_tool("fetch")])
+    client = MCPClient(transport_callable, tool_filters={"allowed": ["search"]}, tool_spec_cache=cache)
+    client.add_consumer("agent")
+
+    tools = await client.load_tools()
+
+    assert [tool.tool_name for tool in tools] == ["search"]
+    transport_callable.assert_not_called()
+
+    result = await client.call_tool_async("t1", "search", {})
+
+    assert result["status"] == "success"
+    transport_callable.assert_called_once()
+    mock_session.list_tools.assert_not_called()
+
+    client.remove_consumer("agent")
+    assert not client._is_session_active()
+
+
+@pytest.mark.asyncio
+async def test_load_tools_from_cache_revalidates_in_background(transport_callable, mock_session, cache):
+    cache.save([mcp_tool("search")], Implementation(name="github", version="1.0"))
+    client = MCPClient(transport_callable, tool_spec_cache=cache)
+    client.add_consumer("agent")
+
+    tools = await client.load_tools()
+    assert [tool.tool_name for tool in tools] == ["search"]
+
+    wait_for(lambda: cache.load().server_version == "2.0")
+
+    assert [tool.name for tool in cache.load().tools] == ["search", "fetch"]
+    # Tools loaded from now on use the revalidated list
+    assert [tool.tool_name for tool in await client.load_tools()] == ["search", "fetch"]
+
+    client.remove_consumer("agent")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache", [{"revalidate": False}], indirect=True)
+async def test_removed_consumer_does_not_connect(transport_callable, mock_session, cache):
+    cache.save([mcp_tool("search")])
+    client = MCPClient(transport_callable, tool_spec_cache=cache)
+    client.add_consumer("agent")
+    await client.load_tools()
+
+    client.remove_consumer("agent")
+
+    with pytest.raises(MCPClientInitializationError, match="not running"):
+        client.call_tool_sync("t1", "search", {})
+    transport_callable.assert_not_called()
+
+
+def test_tool_list_changed_refreshes_cache(transport_callable, mock_session, cache):
+    notification = ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed"))
+
+    with MCPClient(transport_callable, tool_spec_cache=cache) as client:
+        client._invoke_on_background_thread(client._handle_error_message(notification)).result()
+        wait_for(lambda: cache.load() is not None)
+
+    assert [tool.name for tool in cache.load().tools] == ["search", "fetch"]
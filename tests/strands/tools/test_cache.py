@@ -0,0 +1,177 @@
+import os
+import threading
+import unittest.mock
+from pathlib import Path
+
+import pytest
+
+from strands.tools.cache import DiskToolCacheBackend, MemoryToolCacheBackend, ToolCache, ToolCacheEntry
+
+
+def result(text, status="success"):
+    return {"toolUseId": "t1", "status": status, "content": [{"text": text}]}
+
+
+@pytest.fixture(params=["memory", "disk"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryToolCacheBackend(max_entries=2)
+    return DiskToolCacheBackend(tmp_path / "cache", max_entries=2)
+
+
+def test_cache_hit_and_miss(backend):
+    cache = ToolCache(backend=backend)
+
+    assert cache.get("lookup", {"a": 1, "b": 2}) is None
+
+    cache.put("lookup", {"a": 1, "b": 2}, result("one"))
+
+    # The input is canonicalized, so key order does not matter
+    assert cache.get("lookup", {"b": 2, "a": 1}) == result("one")
+    assert cache.get("lookup", {"a": 2, "b": 2}) is None
+    assert cache.get("search", {"a": 1, "b": 2}) is None
+
+
+def test_cache_returns_copies():
+    cache = ToolCache()
+    cached = result("one")
+    cache.put("lookup", {}, cached)
+    cached["content"].append({"text": "changed"})
+
+    cache.get("lookup", {})["content"].append({"text": "changed"})
+
+    assert cache.get("lookup", {}) == result("one")
+
+
+def test_cache_skips_error_results(backend):
+    cache = ToolCache(backend=backend)
+
+    cache.put("lookup", {}, result("failed", status="error"))
+
+    assert cache.get("lookup", {}) is None
+
+
+def test_cache_ttl(backend):
+    cache = ToolCache(ttl=10, backend=backend)
+
+    with unittest.mock.patch("strands.tools.cache.time.time", return_value=100):
+        cache.put("lookup", {}, result("one"))
+    with unittest.mock.patch("strands.tools.cache.time.time", return_value=109):
+        assert cache.get("lookup", {}) == result("one")
+    with unittest.mock.patch("strands.tools.cache.time.time", return_value=110):
+        assert cache.get("lookup", {}) is None
+
+    assert list(backend.keys()) == []
+
+
+def test_cache_evicts_least_recently_used(backend):
+    cache = ToolCache(backend=backend)
+
+    cache.put("lookup", {"key": 1}, result("one"))
+    cache.put("lookup", {"key": 2}, result("two"))
+    if isinstance(backend, DiskToolCacheBackend):
+        # Order the files explicitly, since quick writes may share a modification time
+        for key, mtime in ((1, 1), (2, 2)):
+            os.utime(backend.directory / f"{ToolCache.key('lookup', {'key': key})}.json", (mtime, mtime))
+
+    assert cache.get("lookup", {"key": 1}) == result("one")
+    cache.put("lookup", {"key": 3}, result("three"))
+
+    assert cache.get("lookup", {"key": 1}) == result("one")
+    assert cache.get("lookup", {"key": 2}) is None
+    assert cache.get("lookup", {"key": 3}) == result("three")
+
+
+def test_cache_invalidate(backend):
+    cache = ToolCache(backend=backend)
+    cache.put("lookup", {"key": 1}, result("one"))
+    cache.put("search", {"key": 1}, result("found"))
+
+    cache.invalidate("lookup", {"key": 1})
+    assert cache.get("lookup", {"key": 1}) is None
+    assert cache.get("search", {"key": 1}) == result("found")
+
+    cache.put("lookup", {"key": 1}, result("one"))
+    cache.invalidate("search")
+    assert cache.get("search", {"key": 1}) is None
+    assert cache.get("lookup", {"key": 1}) == result("one")
+
+    cache.clear()
+    assert cache.get("lookup", {"key": 1}) is None
+
+
+def test_disk_cache_persists(tmp_path):
+    ToolCache(backend=DiskToolCacheBackend(tmp_path)).put("lookup", {}, result("one"))
+
+    assert ToolCache(backend=DiskToolCacheBackend(tmp_path)).get("lookup", {}) == result("one")
+
+
+def test_disk_cache_skips_unserializable_results(tmp_path):
+    backend = DiskToolCacheBackend(tmp_path)
+
+    backend.set("lookup.key", ToolCacheEntry({"toolUseId": "t1", "status": "success", "content": [{"image": b"x"}]}))
+
+    assert backend.get("lookup.key") is None
+
+
+def test_disk_cache_lists_directory_only_when_full(tmp_path):
+    backend = DiskToolCacheBackend(tmp_path, max_entries=20)
+    cache = ToolCache(backend=backend)
+
+    with unittest.mock.patch.object(Path, "glob", autospec=True, side_effect=Path.glob) as glob:
+        for key in range(20):
+            cache.put("lookup", {"key": key}, result(str(key)))
+        # Counted once, then tracked in memory
+        assert glob.call_count == 1
+
+        cache.put("lookup", {"key": 0}, result("zero"))
+        cache.put("lookup", {"key": 20}, result("20"))
+        assert glob.call_count == 2
+
+        cache.put("lookup", {"key": 21}, result("21"))
+        cache.put("lookup", {"key": 22}, result("22"))
+        assert glob.call_count == 2
+
+    assert len(list(backend.keys())) == 20
+
+
+def test_disk_cache_removes_temporary_file_on_write_error(tmp_path):
+    backend = DiskToolCacheBackend(tmp_path)
+
+    with unittest.mock.patch("strands.tools.cache.os.replace", side_effect=OSError("disk full")):
+        backend.set("lookup.key", ToolCacheEntry(result("one")))
+
+    assert list(tmp_path.iterdir()) == []
+    assert backend.get("lookup.key") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("backend", "in_thread"), [("memory", False), ("disk", True)], indirect=["backend"])
+async def test_cache_async_uses_thread_for_blocking_backends(backend, in_thread):
+    cache = ToolCache(backend=backend)
+    threads = []
+    get = backend.get
+
+    def record_thread(key):
+        threads.append(threading.current_thread())
+        return get(key)
+
+    backend.get = record_thread
+
+    await cache.put_async("lookup", {}, result("one"))
+
+    assert await cache.get_async("lookup", {}) == result("one")
+    assert (threads[0] is not threading.current_thread()) == in_thread
+
+
+@pytest.mark.parametrize(
+    ("create", "match"),
+    [
+        (lambda tmp_path: ToolCache(ttl=0), "ttl"),
+        (lambda tmp_path: MemoryToolCacheBackend(max_entries=0), "max_entries"),
+        (lambda tmp_path: DiskToolCacheBackend(tmp_path, max_entries=0), "max_entries"),
+    ],
+)
+def test_invalid_cache_options(create, match, tmp_path):
+    with pytest.raises(ValueError, match=match):
+        create(tmp_path)
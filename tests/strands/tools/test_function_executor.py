@@ -0,0 +1,193 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+import time
+import unittest.mock
+
+import pytest
+
+import strands
+from strands.tools._function_executor import _pool_max_workers, _pools, shutdown_pools
+
+
+@strands.tool(executor="process", max_workers=1)
+def process_pid() -> int:
+    """Get the process id."""
+    return os.getpid()
+
+
+@strands.tool(executor="process", pool="test-process")
+def process_unpicklable_result() -> str:
+    """Return a result that cannot be pickled."""
+    return lambda: "result"  # type: ignore[return-value]
+
+
+@pytest.fixture(autouse=True)
+def pools():
+    yield
+    shutdown_pools()
+
+
+@pytest.fixture
+def agent():
+    return unittest.mock.Mock()
+
+
+def tool_use(name):
+    return {"toolUseId": "t1", "name": name, "input": {}}
+
+
+context_value = contextvars.ContextVar("context_value", default="unset")
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_runs_on_named_pool(agent, alist):
+    @strands.tool(executor="thread", max_workers=2)
+    def thread_name() -> str:
+        """Get the thread name."""
+        return threading.current_thread().name
+
+    events = await alist(thread_name.stream(tool_use("thread_name"), {"agent": agent}))
+
+    assert events[-1].tool_result["content"] == [{"text": unittest.mock.ANY}]
+    assert events[-1].tool_result["content"][0]["text"].startswith("strands-tool-thread_name")
+    assert _pools[("thread", "thread_name")]._max_workers == 2
+    agent.event_loop_metrics.add_tool_queue_wait.assert_called_once_with(tool_use("thread_name"), unittest.mock.ANY)
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_records_queue_time(agent):
+    @strands.tool(executor="thread", pool="test-queue", max_workers=1)
+    def slow() -> None:
+        """Sleep."""
+        time.sleep(0.05)
+
+    async def call():
+        return [event async for event in slow.stream(tool_use("slow"), {"agent": agent})]
+
+    await asyncio.gather(call(), call())
+
+    # The second call waits for the only worker while the first one sleeps
+    queue_times = sorted(call.args[1] for call in agent.event_loop_metrics.add_tool_queue_wait.call_args_list)
+    assert queue_times[1] >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_custom_executor(agent, alist):
+    executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="custom")
+
+    @strands.tool(executor=executor)
+    def thread_name() -> str:
+        """Get the thread name."""
+        return threading.current_thread().name
+
+    events = await alist(thread_name.stream(tool_use("thread_name"), {"agent": agent}))
+    executor.shutdown()
+
+    assert events[-1].tool_result["content"][0]["text"].startswith("custom")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", concurrent.futures.ThreadPoolExecutor(1)])
+async def test_thread_executor_copies_context(executor, agent, alist):
+    @strands.tool(executor=executor)
+    def read_context() -> str:
+        """Read the context variable."""
+        return context_value.get()
+
+    token = context_value.set("parent")
+    try:
+        events = await alist(read_context.stream(tool_use("read_context"), {"agent": agent}))
+    finally:
+        context_value.reset(token)
+
+    assert events[-1].tool_result["content"] == [{"text": "parent"}]
+
+
+@pytest.mark.asyncio
+async def test_process_executor(agent, alist):
+    events = await alist(process_pid.stream(tool_use("process_pid"), {"agent": agent}))
+
+    assert events[-1].tool_result["status"] == "success"
+    assert events[-1].tool_result["content"][0]["text"] != str(os.getpid())
+    assert process_pid() == os.getpid()
+    agent.event_loop_metrics.add_tool_queue_wait.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_executor_unpicklable_result(alist):
+    events = await alist(process_unpicklable_result.stream(tool_use("process_unpicklable_result"), {}))
+
+    assert events[-1].tool_result["status"] == "error"
+    assert "cannot be pickled" in events[-1].tool_result["content"][0]["text"]
+
+
+def test_process_executor_invalid_functions():
+    def local() -> None:
+        """Local function."""
+
+    async def coroutine() -> None:
+        """Async function."""
+
+    with pytest.raises(ValueError, match="defined at module level"):
+        strands.tool(executor="process")(local)
+    with pytest.raises(ValueError, match="synchronous functions"):
+        strands.tool(executor="thread")(coroutine)
+    with pytest.raises(ValueError, match="tool context"):
+        strands.tool(executor="process", context=True)(local)
+
+
+def uses_agent(agent) -> None:
+    """Use the agent."""
+
+
+def uses_context(tool_context) -> None:
+    """Use the tool context."""
+
+
+def test_process_executor_rejects_unpicklable_parameters():
+    executor = concurrent.futures.ProcessPoolExecutor(1)
+
+    with pytest.raises(ValueError, match="tool context"):
+        strands.tool(executor=executor, context=True)(uses_context)
+    with pytest.raises(ValueError, match="agent"):
+        strands.tool(executor="process")(uses_agent)
+    with pytest.raises(ValueError, match="agent"):
+        strands.tool(executor=executor)(uses_agent)
+
+    executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("params", "match"),
+    [
+        ({"pool": "pool"}, "require an executor"),
+        ({"executor": "fiber"}, "executor=<fiber>"),
+        ({"executor": "thread", "max_workers": 0}, "max_workers"),
+        ({"executor": concurrent.futures.ThreadPoolExecutor(), "max_workers": 1}, "only apply to executor names"),
+    ],
+)
+def test_invalid_executor_options(params, match):
+    def func() -> None:
+        """Function."""
+
+    with pytest.raises(ValueError, match=match):
+        strands.tool(**params)(func)
+
+
+def test_pool_max_workers_conflict():
+    def first() -> None:
+        """First."""
+
+    def second() -> None:
+        """Second."""
+
+    strands.tool(executor="thread", pool="test-shared", max_workers=2)(first)
+    strands.tool(executor="thread", pool="test-shared")(second)
+
+    with pytest.raises(ValueError, match="already registered with max_workers=2"):
+        strands.tool(executor="thread", pool="test-shared", max_workers=3)(second)
+
+    assert _pool_max_workers[("thread", "test-shared")] == 2
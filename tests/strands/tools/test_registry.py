@@ -127,6 +127,22 @@ def test_process_tools_flattens_lists_and_tuples_and_sets():
     assert tru_tool_names == exp_tool_names
 
 
+def test_process_tools_nested_generators():
+    def function() -> str:
+        return "done"
+
+    tool_a = tool(name="tool_a")(function)
+    tool_b = tool(name="tool_b")(function)
+    tool_c = tool(name="tool_c")(function)
+
+    registry = ToolRegistry()
+
+    tru_tool_names = registry.process_tools(t for t in [(t for t in [tool_a, tool_b]), iter([tool_c])])
+    exp_tool_names = ["tool_a", "tool_b", "tool_c"]
+    assert tru_tool_names == exp_tool_names
+    assert list(registry.registry) == exp_tool_names
+
+
 def test_register_tool_duplicate_name_without_hot_reload():
     """Test that registering a tool with duplicate name raises ValueError when hot reload is not supported."""
     # Create mock tools that don't support hot reload
@@ -603,3 +619,100 @@ def test_tool_registry_replace_non_dynamic_with_dynamic():
 
     assert registry.registry["my_tool"] == new_tool
     assert registry.dynamic_tools["my_tool"] == new_tool
+
+
+def test_tool_registry_tool_spec_snapshot_cached():
+    @tool
+    def tool_1(a: int) -> int:
+        """Tool 1."""
+        return a
+
+    registry = ToolRegistry()
+    registry.register_tool(tool_1)
+
+    snapshot = registry.get_tool_spec_snapshot()
+
+    assert registry.get_tool_spec_snapshot() is snapshot
+    assert snapshot.version == registry.version
+    assert [spec["name"] for spec in snapshot.tool_specs] == ["tool_1"]
+    assert snapshot.tool_config == {
+        "tools": [{"toolSpec": snapshot.tools_config["tool_1"]}],
+        "toolChoice": {"auto": {}},
+    }
+    assert registry.get_all_tool_specs() == list(snapshot.tool_specs)
+    assert registry.get_all_tools_config() == snapshot.tools_config
+
+
+def test_tool_registry_tool_spec_snapshot_invalidated():
+    @tool
+    def tool_1(a: int) -> int:
+        """Tool 1."""
+        return a
+
+    @tool(name="tool_1")
+    def tool_1_replacement(b: str) -> str:
+        """Tool 1 replacement."""
+        return b
+
+    @tool
+    def tool_2(a: int) -> int:
+        """Tool 2."""
+        return a
+
+    registry = ToolRegistry()
+    registry.register_tool(tool_1)
+    snapshot = registry.get_tool_spec_snapshot()
+
+    registry.replace(tool_1_replacement)
+    replaced = registry.get_tool_spec_snapshot()
+    assert replaced is not snapshot
+    assert replaced.tools_config["tool_1"]["description"] == "Tool 1 replacement."
+
+    registry.register_dynamic_tool(tool_2)
+    assert list(registry.get_tool_spec_snapshot().tools_config) == ["tool_1", "tool_2"]
+
+    registry.unregister_dynamic_tool("tool_2")
+    assert list(registry.get_tool_spec_snapshot().tools_config) == ["tool_1"]
+
+
+def test_tool_registry_unregister_dynamic_tool_missing():
+    registry = ToolRegistry()
+    version = registry.version
+
+    registry.unregister_dynamic_tool("missing")
+
+    assert registry.version == version
+
+
+def test_tool_registry_copy():
+    @strands.tool
+    def tool_a() -> str:
+        """Tool A."""
+        return "a"
+
+    @strands.tool
+    def tool_b() -> str:
+        """Tool B."""
+        return "b"
+
+    provider = MagicMock(spec=ToolProvider)
+    provider.load_tools = AsyncMock(return_value=[])
+
+    registry = ToolRegistry()
+    registry.process_tools([tool_a, provider])
+    snapshot = registry.get_tool_spec_snapshot()
+
+    copied = registry.copy()
+
+    assert copied.registry == registry.registry
+    assert copied.get_tool_spec_snapshot() is snapshot
+    assert copied._registry_id != registry._registry_id
+    provider.add_consumer.assert_called_with(copied._registry_id)
+
+    copied.register_tool(tool_b)
+    assert "tool_b" in copied.registry
+    assert "tool_b" not in registry.registry
+    assert registry.get_tool_spec_snapshot() is snapshot
+
+    copied.cleanup()
+    provider.remove_consumer.assert_called_once_with(copied._registry_id)
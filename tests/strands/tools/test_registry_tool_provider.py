@@ -1,11 +1,12 @@
 """Unit tests for ToolRegistry ToolProvider functionality."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
 from strands.experimental.tools.tool_provider import ToolProvider
-from strands.tools.registry import ToolRegistry
+from strands.tools.registry import ToolProviderStartup, ToolRegistry
 from tests.fixtures.mock_agent_tool import MockAgentTool
 
 
@@ -67,8 +68,8 @@ class TestToolRegistryToolProvider:
 
         registry = ToolRegistry()
 
-        # Mock run_async to return the tools directly
-        mock_run_async.return_value = [mock_tool1, mock_tool2]
+        # Mock run_async to return the tools of each provider directly
+        mock_run_async.return_value = [[mock_tool1, mock_tool2]]
 
         tool_names = registry.process_tools([provider])
 
@@ -99,13 +100,13 @@ class TestToolRegistryToolProvider:
 
         registry = ToolRegistry()
 
-        # Mock run_async to return appropriate tools for each call
-        mock_run_async.side_effect = [[mock_tool1], [mock_tool2]]
+        # Mock run_async to return appropriate tools for each provider
+        mock_run_async.return_value = [[mock_tool1], [mock_tool2]]
 
         tool_names = registry.process_tools([provider1, provider2])
 
-        # Verify run_async was called twice
-        assert mock_run_async.call_count == 2
+        # Verify the providers were loaded together in one call
+        assert mock_run_async.call_count == 1
 
         # Verify all tools were registered
         assert "provider1_tool" in tool_names
@@ -128,7 +129,7 @@ class TestToolRegistryToolProvider:
 
         registry = ToolRegistry()
 
-        mock_run_async.return_value = [provider_tool]
+        mock_run_async.return_value = [[provider_tool]]
 
         tool_names = registry.process_tools([regular_tool, provider])
 
@@ -147,7 +148,7 @@ class TestToolRegistryToolProvider:
 
         registry = ToolRegistry()
 
-        mock_run_async.return_value = []
+        mock_run_async.return_value = [[]]
 
         tool_names = registry.process_tools([provider])
 
@@ -201,8 +202,8 @@ class TestToolRegistryToolProvider:
         registry = ToolRegistry()
 
         mock_run_async.side_effect = [
-            [mock_agent_tool("tool1")],
-            [mock_agent_tool("tool2")],
+            [[mock_agent_tool("tool1")]],
+            [[mock_agent_tool("tool2")]],
         ]
 
         # Process first provider
@@ -326,3 +327,85 @@ class TestToolRegistryToolProvider:
         # Both providers should have had remove_consumer called
         assert provider1.remove_consumer_called
         assert provider2.remove_consumer_called
+
+    def test_process_tools_starts_providers_concurrently(self, mock_agent_tool):
+        """Test that providers load concurrently and their startups are recorded."""
+        provider1_started = asyncio.Event()
+        provider2_started = asyncio.Event()
+
+        class WaitingProvider(MockToolProvider):
+            def __init__(self, tools, started, other_started):
+                super().__init__(tools)
+                self.started = started
+                self.other_started = other_started
+
+            async def load_tools(self):
+                # Loading one provider at a time would time out waiting for the other one
+                self.started.set()
+                await asyncio.wait_for(self.other_started.wait(), timeout=5)
+                return self._tools
+
+        provider1 = WaitingProvider([mock_agent_tool("tool1")], provider1_started, provider2_started)
+        provider2 = WaitingProvider([mock_agent_tool("tool2")], provider2_started, provider1_started)
+
+        registry = ToolRegistry()
+        tool_names = registry.process_tools([provider1, [mock_agent_tool("regular_tool"), provider2]])
+
+        # Tools are registered in the order of the tools list
+        assert tool_names == ["tool1", "regular_tool", "tool2"]
+        assert list(registry.registry) == ["tool1", "regular_tool", "tool2"]
+        assert {startup.provider for startup in registry.provider_startups} == {provider1, provider2}
+        assert all(startup.tool_count == 1 and startup.error is None for startup in registry.provider_startups)
+
+    def test_process_tools_fail_fast_cancels_loading_providers(self, mock_agent_tool):
+        """Test that the first provider failure cancels the providers still loading."""
+        error = RuntimeError("connection refused")
+
+        class FailingProvider(MockToolProvider):
+            async def load_tools(self):
+                raise error
+
+        class SlowProvider(MockToolProvider):
+            async def load_tools(self):
+                await asyncio.sleep(5)
+                return self._tools
+
+        failing_provider = FailingProvider()
+        slow_provider = SlowProvider([mock_agent_tool("slow_tool")])
+
+        registry = ToolRegistry()
+        with pytest.raises(ValueError, match="connection refused"):
+            registry.process_tools([slow_provider, failing_provider])
+
+        assert not registry.registry
+        # Both providers are tracked so cleanup releases them
+        assert registry._tool_providers == [slow_provider, failing_provider]
+        errors = {startup.provider: startup.error for startup in registry.provider_startups}
+        assert errors[failing_provider] is error
+        assert isinstance(errors[slow_provider], asyncio.CancelledError)
+
+    def test_process_tools_partial_skips_failed_providers(self, mock_agent_tool):
+        """Test that the partial policy registers the tools of the providers that loaded."""
+
+        class FailingProvider(MockToolProvider):
+            async def load_tools(self):
+                raise RuntimeError("connection refused")
+
+        failing_provider = FailingProvider()
+        provider = MockToolProvider([mock_agent_tool("tool1")])
+
+        registry = ToolRegistry()
+        tool_names = registry.process_tools([failing_provider, provider], provider_failure_policy="partial")
+
+        assert tool_names == ["tool1"]
+        assert registry._tool_providers == [provider]
+        assert failing_provider.remove_consumer_id == registry._registry_id
+        assert not provider.remove_consumer_called
+        startups = {startup.provider: startup for startup in registry.provider_startups}
+        assert startups[provider] == ToolProviderStartup(provider, startups[provider].duration, 1)
+        assert str(startups[failing_provider].error) == "connection refused"
+
+    def test_process_tools_invalid_provider_failure_policy(self):
+        """Test that an unknown provider failure policy is rejected."""
+        with pytest.raises(ValueError, match="provider_failure_policy=<ignore>"):
+            ToolRegistry().process_tools([], provider_failure_policy="ignore")